@@ -28,13 +28,14 @@
 from __future__ import annotations
 
 import argparse
+import contextlib
 import csv
 import json
 import sys
 from dataclasses import dataclass, asdict
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Iterable, Optional
+from typing import Iterable, Iterator, Optional
 
 # Add project root to path for imports
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
@@ -45,11 +46,23 @@
 try:
     # Optional import; coverage will work without UA counts if unavailable
     from db.bulk_index import count_unique_artworks as db_count_unique_artworks
+    from db.bulk_index import iter_basic_lands as db_iter_basic_lands
+    from db.bulk_index import iter_non_basic_lands as db_iter_non_basic_lands
+    from db.bulk_index import read_session as db_read_session
 except Exception:
 
     def db_count_unique_artworks(*args, **kwargs) -> int:  # type: ignore
         return 0
 
+    def db_read_session(*args, **kwargs):  # type: ignore
+        return contextlib.nullcontext()
+
+    def db_iter_basic_lands(*args, **kwargs) -> Iterator[dict]:  # type: ignore
+        return iter(())
+
+    def db_iter_non_basic_lands(*args, **kwargs) -> Iterator[dict]:  # type: ignore
+        return iter(())
+
 
 @dataclass
 class LandEntry:
@@ -83,25 +96,12 @@ def _iter_land_entries(kind: str, set_filter: Optional[str]) -> Iterable[dict]:
     """
     set_norm = set_filter.lower() if set_filter else None
 
-    def _db_call() -> list[dict]:
-        entries: list[dict] = []
+    def _db_stream() -> Iterator[dict]:
+        # Streamed in fetch batches so all lands are never in memory at once
         if kind in {"basic", "all"}:
-            entries.extend(
-                create_pdf.db_query_basic_lands(
-                    limit=None,
-                    lang_filter=None,
-                    set_filter=set_norm,
-                )
-            )
+            yield from db_iter_basic_lands(set_filter=set_norm)
         if kind in {"nonbasic", "all"}:
-            entries.extend(
-                create_pdf.db_query_non_basic_lands(
-                    limit=None,
-                    lang_filter=None,
-                    set_filter=set_norm,
-                )
-            )
-        return entries
+            yield from db_iter_non_basic_lands(set_filter=set_norm)
 
     def _json_fallback() -> list[dict]:
         index = create_pdf._load_bulk_index()
@@ -120,18 +120,22 @@ def _json_fallback() -> list[dict]:
             results.append(entry)
         return results
 
-    entries = create_pdf._db_first_fetch(
-        "coverage land entries",
-        _db_call,
-        _json_fallback,
-        allow_empty=True,
-    )
+    if create_pdf._db_index_available():
+        streamed = 0
+        try:
+            for entry in _db_stream():
+                streamed += 1
+                type_line = (entry.get("type_line") or "").lower()
+                if "land" in type_line:
+                    yield entry
+            return
+        except Exception as exc:
+            if streamed:
+                # Entries already yielded can't be retracted; don't mix sources
+                raise
+            print(f"Warning: coverage land entries DB fetch failed: {exc}")
 
-    for entry in entries:
-        type_line = (entry.get("type_line") or "").lower()
-        if "land" not in type_line:
-            continue
-        yield entry
+    yield from _json_fallback()
 
 
 def _local_art_paths(entry: dict) -> list[str]:
@@ -163,44 +167,48 @@ def compute_coverage(
     ua_cache_all: dict[str, int] = {}
     ua_cache_by_set: dict[tuple[str, str], int] = {}
 
-    for entry in _iter_land_entries(kind, set_filter):
-        total += 1
-        local_paths = _local_art_paths(entry)
-        # Unique artwork counts (optional, guarded by cache)
-        oid = entry.get("oracle_id") or None
-        ua_all = 0
-        ua_in_set = 0
-        if oid:
-            if oid in ua_cache_all:
-                ua_all = ua_cache_all[oid]
-            else:
-                ua_all = db_count_unique_artworks(oracle_id=oid)
-                ua_cache_all[oid] = ua_all
-            key = (oid, (entry.get("set") or "").lower())
-            if key in ua_cache_by_set:
-                ua_in_set = ua_cache_by_set[key]
-            else:
-                ua_in_set = db_count_unique_artworks(oracle_id=oid, set_filter=key[1])
-                ua_cache_by_set[key] = ua_in_set
-
-        land = LandEntry(
-            id=str(entry.get("id") or ""),
-            name=str(entry.get("name") or ""),
-            set=(entry.get("set") or "").lower(),
-            collector_number=str(entry.get("collector_number") or ""),
-            is_basic_land=bool(entry.get("is_basic_land")),
-            local_paths=local_paths,
-            oracle_id=entry.get("oracle_id"),
-            ua_all=ua_all,
-            ua_in_set=ua_in_set,
-        )
-        if land.has_art:
-            covered += 1
-        per_set.setdefault(land.set, {"total": 0, "covered": 0})
-        per_set[land.set]["total"] += 1
-        if land.has_art:
-            per_set[land.set]["covered"] += 1
-        rows.append(land)
+    # One pooled connection for the per-oracle unique-art counts
+    with db_read_session() as ua_conn:
+        for entry in _iter_land_entries(kind, set_filter):
+            total += 1
+            local_paths = _local_art_paths(entry)
+            # Unique artwork counts (optional, guarded by cache)
+            oid = entry.get("oracle_id") or None
+            ua_all = 0
+            ua_in_set = 0
+            if oid:
+                if oid in ua_cache_all:
+                    ua_all = ua_cache_all[oid]
+                else:
+                    ua_all = db_count_unique_artworks(oracle_id=oid, conn=ua_conn)
+                    ua_cache_all[oid] = ua_all
+                key = (oid, (entry.get("set") or "").lower())
+                if key in ua_cache_by_set:
+                    ua_in_set = ua_cache_by_set[key]
+                else:
+                    ua_in_set = db_count_unique_artworks(
+                        oracle_id=oid, set_filter=key[1], conn=ua_conn
+                    )
+                    ua_cache_by_set[key] = ua_in_set
+
+            land = LandEntry(
+                id=str(entry.get("id") or ""),
+                name=str(entry.get("name") or ""),
+                set=(entry.get("set") or "").lower(),
+                collector_number=str(entry.get("collector_number") or ""),
+                is_basic_land=bool(entry.get("is_basic_land")),
+                local_paths=local_paths,
+                oracle_id=entry.get("oracle_id"),
+                ua_all=ua_all,
+                ua_in_set=ua_in_set,
+            )
+            if land.has_art:
+                covered += 1
+            per_set.setdefault(land.set, {"total": 0, "covered": 0})
+            per_set[land.set]["total"] += 1
+            if land.has_art:
+                per_set[land.set]["covered"] += 1
+            rows.append(land)
 
     summary = {
         "kind": kind,
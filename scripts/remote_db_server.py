@@ -22,6 +22,7 @@
 sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
 
 from bulk_paths import bulk_db_path, get_bulk_data_directory
+from db.bulk_index import print_stats
 
 app = Flask(__name__)
 
@@ -246,36 +247,22 @@ def parse_deck():
 
 @app.route("/api/stats")
 def get_stats():
-    """Get database statistics."""
-    conn = get_db()
-    cursor = conn.cursor()
-
-    # Total cards
-    cursor.execute("SELECT COUNT(*) FROM prints")
-    total_cards = cursor.fetchone()[0]
-
-    # Unique card names
-    cursor.execute("SELECT COUNT(DISTINCT name) FROM prints")
-    unique_names = cursor.fetchone()[0]
-
-    # Sets
-    cursor.execute("SELECT COUNT(DISTINCT set_code) FROM prints")
-    total_sets = cursor.fetchone()[0]
-
-    # Languages
-    cursor.execute(
-        "SELECT lang, COUNT(*) as count FROM prints GROUP BY lang ORDER BY count DESC"
-    )
-    languages = [{"lang": row[0], "count": row[1]} for row in cursor.fetchall()]
-
-    conn.close()
+    """Get database statistics (served from the precomputed print_stats table)."""
+    stats = print_stats(DB_PATH)
+    languages = [
+        {"lang": lang, "count": count} for lang, count in stats["by_lang"].items()
+    ]
 
     return jsonify(
         {
-            "total_cards": total_cards,
-            "unique_names": unique_names,
-            "total_sets": total_sets,
+            "total_cards": stats["total"],
+            "unique_names": stats["distinct_names"],
+            "total_sets": stats["distinct_sets"],
             "languages": languages,
+            "rarities": stats["by_rarity"],
+            "types": stats["by_type"],
+            "token_subtypes": stats["by_token_subtype"],
+            "sets": stats["by_set"],
             "database_size_mb": os.path.getsize(DB_PATH) / (1024 * 1024),
         }
     )
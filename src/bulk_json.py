@@ -0,0 +1,243 @@
+"""Constant-memory reader for Scryfall bulk JSON files.
+
+Bulk dumps are multi-GB JSON arrays. Loading them with `json.load` builds
+every card as a Python object before the first one is used; the reader here
+decodes one value at a time from the (optionally gzipped) text stream, so
+memory stays bounded by the largest single card.
+
+Accepted layouts, matching what the older loaders tolerated:
+- a top-level array (`[{...}, {...}]`), pretty-printed or one card per line
+- an object wrapper whose `data` or `cards` key holds the array
+- NDJSON / concatenated objects, with stray `[`, `]` and trailing commas
+- a leading UTF-8 BOM
+
+Malformed values are skipped up to the next newline, like the NDJSON
+fallback did.
+"""
+
+from __future__ import annotations
+
+import gzip
+import json
+import os
+from typing import IO, Any, Dict, Iterator, Optional
+
+READ_CHUNK_CHARS = 1 << 20
+# Give up on a value that is still incomplete after this many characters
+MAX_VALUE_CHARS = 64 << 20
+
+WRAPPER_KEYS = ("data", "cards")
+
+_WHITESPACE = " \t\r\n\ufeff"
+_DELIMITERS = " \t\r\n,]}"
+
+
+def open_bulk_text(path: str) -> IO[str]:
+    """Open a bulk file as UTF-8 text, decompressing when it is gzipped."""
+    with open(path, "rb") as probe:
+        magic = probe.read(2)
+    if magic == b"\x1f\x8b":
+        return gzip.open(path, "rt", encoding="utf-8")
+    return open(path, "rt", encoding="utf-8")
+
+
+class _Reader:
+    """Sliding text buffer over a stream with incremental JSON decoding."""
+
+    def __init__(self, handle: IO[str], chunk_size: int):
+        self.handle = handle
+        self.chunk_size = chunk_size
+        self.buffer = ""
+        self.pos = 0
+        self.eof = False
+        self.skipped = 0
+        self._decoder = json.JSONDecoder()
+
+    def _fill(self) -> bool:
+        if self.eof:
+            return False
+        chunk = self.handle.read(self.chunk_size)
+        if not chunk:
+            self.eof = True
+            return False
+        # Drop the consumed prefix so the buffer only holds unread text
+        self.buffer = self.buffer[self.pos :] + chunk
+        self.pos = 0
+        return True
+
+    def peek(self) -> Optional[str]:
+        """Skip whitespace and return the next character (None at end of input)."""
+        while True:
+            buffer = self.buffer
+            pos = self.pos
+            end = len(buffer)
+            while pos < end and buffer[pos] in _WHITESPACE:
+                pos += 1
+            self.pos = pos
+            if pos < end:
+                return buffer[pos]
+            if not self._fill():
+                return None
+
+    def advance(self) -> None:
+        self.pos += 1
+
+    def value(self) -> Any:
+        """Decode the next complete JSON value, reading more input as needed."""
+        while True:
+            try:
+                obj, end = self._decoder.raw_decode(self.buffer, self.pos)
+            except json.JSONDecodeError as exc:
+                # JSON strings cannot hold raw newlines, so a failure with a
+                # newline still ahead is malformed input, not a value cut off
+                # at the end of the buffer.
+                incomplete = self.buffer.find("\n", exc.pos) < 0
+                if (
+                    incomplete
+                    and len(self.buffer) - self.pos < MAX_VALUE_CHARS
+                    and self._fill()
+                ):
+                    continue
+                raise
+            # Numbers and literals are only complete once a delimiter follows
+            # ("1" may be the start of "1.5" in the next chunk)
+            if (
+                not isinstance(obj, (dict, list, str))
+                and (end == len(self.buffer) or self.buffer[end] not in _DELIMITERS)
+                and self.buffer.find("\n", end) < 0
+                and self._fill()
+            ):
+                continue
+            self.pos = end
+            return obj
+
+    def buffered_value(self) -> tuple[bool, Any]:
+        """Decode the next value if it is already complete in the buffer."""
+        try:
+            obj, end = self._decoder.raw_decode(self.buffer, self.pos)
+        except json.JSONDecodeError:
+            return False, None
+        if not isinstance(obj, (dict, list, str)):
+            return False, None
+        self.pos = end
+        return True, obj
+
+    def resync(self) -> None:
+        """Skip past the next newline after a malformed value."""
+        self.skipped += 1
+        while True:
+            newline = self.buffer.find("\n", self.pos)
+            if newline >= 0:
+                self.pos = newline + 1
+                return
+            self.pos = len(self.buffer)
+            if not self._fill():
+                return
+
+
+def _iter_array(reader: _Reader) -> Iterator[Dict[str, Any]]:
+    """Yield object elements of the array whose `[` was just consumed."""
+    while True:
+        ch = reader.peek()
+        if ch is None:
+            return
+        if ch == "]":
+            reader.advance()
+            return
+        if ch == ",":
+            reader.advance()
+            continue
+        try:
+            item = reader.value()
+        except json.JSONDecodeError:
+            reader.resync()
+            continue
+        if isinstance(item, dict):
+            yield item
+
+
+def _iter_object(reader: _Reader) -> Iterator[Dict[str, Any]]:
+    """Stream a top-level object whose `{` was just consumed.
+
+    A `data`/`cards` array inside it is streamed element by element; any
+    other object is yielded whole once it closes.
+    """
+    fields: Dict[str, Any] = {}
+    streamed = False
+    while True:
+        ch = reader.peek()
+        if ch is None:
+            return
+        if ch == "}":
+            reader.advance()
+            break
+        if ch == ",":
+            reader.advance()
+            continue
+        key = reader.value()
+        if reader.peek() != ":" or not isinstance(key, str):
+            raise json.JSONDecodeError("Expecting ':' delimiter", reader.buffer, reader.pos)
+        reader.advance()
+        if reader.peek() == "[" and key in WRAPPER_KEYS and not streamed:
+            reader.advance()
+            streamed = True
+            yield from _iter_array(reader)
+        else:
+            fields[key] = reader.value()
+    if not streamed and fields:
+        yield fields
+
+
+def _unwrap(obj: Dict[str, Any]) -> Iterator[Dict[str, Any]]:
+    for key in WRAPPER_KEYS:
+        items = obj.get(key)
+        if isinstance(items, list):
+            for item in items:
+                if isinstance(item, dict):
+                    yield item
+            return
+    if obj:
+        yield obj
+
+
+def iter_json_objects(
+    handle: IO[str], chunk_size: int = READ_CHUNK_CHARS
+) -> Iterator[Dict[str, Any]]:
+    """Yield every card object from a text stream, one at a time."""
+    reader = _Reader(handle, chunk_size)
+    while True:
+        ch = reader.peek()
+        if ch is None:
+            return
+        if ch in ",]":
+            reader.advance()
+            continue
+        if ch == "[":
+            reader.advance()
+            yield from _iter_array(reader)
+            continue
+        try:
+            if ch == "{":
+                # Objects that fit in the buffer (NDJSON cards, small wrappers)
+                # decode in one call; larger ones are walked key by key.
+                complete, obj = reader.buffered_value()
+                if complete:
+                    yield from _unwrap(obj)
+                    continue
+                reader.advance()
+                yield from _iter_object(reader)
+            else:
+                reader.value()  # stray scalar at top level
+        except json.JSONDecodeError:
+            reader.resync()
+
+
+def iter_bulk_json(path: str, chunk_size: int = READ_CHUNK_CHARS) -> Iterator[Dict[str, Any]]:
+    """Yield card objects from a bulk JSON file (gzipped or plain).
+
+    Missing files yield nothing.
+    """
+    if not os.path.exists(path):
+        return
+    with open_bulk_text(path) as handle:
+        yield from iter_json_objects(handle, chunk_size)
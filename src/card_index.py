@@ -0,0 +1,591 @@
+"""Memory-mapped card index built from the Scryfall all-cards dump.
+
+The JSON fallback used to load `all-cards_index.json`, a single document
+holding every print plus the lookup maps, which cost seconds and over a
+gigabyte of RAM per process. This module writes the same data as a flat
+binary file that is opened with `mmap` and read on demand:
+
+- an interned string table; every field value is a reference into it, so
+  repeated values (sets, legalities, artists, frames) are stored once
+- fixed-width records, one per print, holding one string reference per field
+- sorted key arrays (print ids, `slug|set|number` keys, name slugs, token
+  subtypes) that are binary searched without decoding anything else
+
+`CardIndex` exposes the sections through read-only mappings with the same
+shape as the old JSON document (`index["entries"].get(card_id)`,
+`index.get("cards_by_name", {}).get(slug, [])`, ...), so callers do not need
+to know which format they are reading. Entries are decoded into plain
+dicts only when they are looked up or iterated.
+"""
+
+from __future__ import annotations
+
+import json
+import mmap
+import os
+import struct
+import sys
+import threading
+from array import array
+from bisect import bisect_left, bisect_right
+from collections.abc import ItemsView, Mapping, Sequence, ValuesView
+from typing import Any, Dict, Iterator, List, Optional
+
+MAGIC = b"PMCIDX\x00\x00"
+FORMAT_VERSION = 1
+
+# Field order of each fixed-width record; the file stores its own copy so
+# readers never depend on this tuple matching the writer's.
+ENTRY_FIELDS = (
+    "id",
+    "name",
+    "name_slug",
+    "set",
+    "collector_number",
+    "type_line",
+    "image_url",
+    "oracle_id",
+    "mana_value",
+    "all_parts",
+    "is_basic_land",
+    "is_token",
+    "token_subtype",
+    "token_subtype_slug",
+    "legalities",
+    "lang",
+    "full_art",
+    "frame_effects",
+    "frame",
+    "mana_cost",
+    "colors",
+    "color_identity",
+    "power",
+    "toughness",
+    "rarity",
+    "artist",
+    "flavor_text",
+    "set_name",
+    "card_faces",
+    "layout",
+    "border_color",
+    "reserved",
+    "reprint",
+    "oracle_text",
+    "keywords",
+)
+
+SECTIONS = (
+    "metadata",
+    "fields",
+    "records",
+    "string_offsets",
+    "strings",
+    "id_order",
+    "cards_by_key",
+    "cards_by_name",
+    "tokens_by_subtype",
+    "tokens_by_name",
+    "basic_land_ids",
+    "token_ids",
+)
+
+_HEADER = struct.Struct("<8sIIII")  # magic, version, little_endian, fields, records
+_SECTION = struct.Struct("<QQ")  # offset, length
+_ALIGN = 8
+
+# String references 0-2 are fixed so the common scalars never touch the table
+_CONSTANTS = (None, False, True)
+_TAG_STR = ord("s")
+_ENCODER = json.JSONEncoder(ensure_ascii=False, separators=(",", ":"))
+_DECODER = json.JSONDecoder()
+# Decoded JSON values kept per index; containers are cached only when flat
+# and handed out as copies
+_DECODE_CACHE_SIZE = 1 << 16
+_MISSING = object()
+
+
+class CardIndexError(ValueError):
+    """Raised when an index file is missing, truncated or from another format."""
+
+
+def _u32(values: Any = ()) -> array:
+    return array("I", values)
+
+
+class CardIndexWriter:
+    """Accumulates entries and writes them as a `CardIndex` file.
+
+    Later entries with an already-seen id replace the earlier one in place,
+    matching the `entries[card_id] = entry` behaviour of the JSON builder.
+    """
+
+    def __init__(self, fields: tuple = ENTRY_FIELDS):
+        self.fields = tuple(fields)
+        self._field_count = len(self.fields)
+        self._id_field = self.fields.index("id")
+        self._text_ids: Dict[str, int] = {}
+        self._json_ids: Dict[bytes, int] = {}
+        self._values: List[bytes] = []
+        for constant in _CONSTANTS:
+            self._store(b"j" + _ENCODER.encode(constant).encode("utf-8"))
+        self._records = _u32()
+        self._positions: Dict[str, int] = {}
+        self._cards_by_key: Dict[str, int] = {}
+        self._cards_by_name = _u32()
+        self._tokens_by_subtype = _u32()
+        self._tokens_by_name = _u32()
+        self._basic_land_ids = _u32()
+        self._token_ids = _u32()
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def _store(self, raw: bytes) -> int:
+        self._values.append(raw)
+        return len(self._values) - 1
+
+    def _intern(self, value: Any) -> int:
+        if value is None:
+            return 0
+        if value is False:
+            return 1
+        if value is True:
+            return 2
+        if isinstance(value, str):
+            sid = self._text_ids.get(value)
+            if sid is None:
+                sid = self._text_ids[value] = self._store(b"s" + value.encode("utf-8"))
+            return sid
+        raw = b"j" + _ENCODER.encode(value).encode("utf-8")
+        sid = self._json_ids.get(raw)
+        if sid is None:
+            sid = self._json_ids[raw] = self._store(raw)
+        return sid
+
+    def add(self, entry: Dict[str, Any]) -> None:
+        card_id = entry["id"]
+        intern = self._intern
+        get = entry.get
+        record = _u32([intern(get(field)) for field in self.fields])
+        position = self._positions.get(card_id)
+        if position is None:
+            position = len(self._positions)
+            self._positions[card_id] = position
+            self._records.extend(record)
+        else:
+            start = position * self._field_count
+            self._records[start : start + self._field_count] = record
+
+        name_slug = entry.get("name_slug") or ""
+        key = f"{name_slug}|{entry.get('set') or ''}|{entry.get('collector_number') or ''}"
+        self._cards_by_key[key] = position
+        name_sid = self._intern(name_slug)
+        self._cards_by_name.extend((name_sid, position))
+
+        if entry.get("is_basic_land"):
+            self._basic_land_ids.append(position)
+        if entry.get("is_token"):
+            self._token_ids.append(position)
+            subtype_slug = entry.get("token_subtype_slug")
+            if subtype_slug:
+                self._tokens_by_subtype.extend((self._intern(subtype_slug), position))
+            self._tokens_by_name.extend((name_sid, position))
+
+    def _sorted_pairs(self, pairs: array) -> array:
+        """Stable-sort (string ref, record) pairs by the referenced string."""
+        values = self._values
+        order = sorted(range(len(pairs) // 2), key=lambda i: values[pairs[2 * i]])
+        out = _u32()
+        for i in order:
+            out.append(pairs[2 * i])
+            out.append(pairs[2 * i + 1])
+        return out
+
+    def write(self, path: str, metadata: Optional[Dict[str, Any]] = None) -> None:
+        """Write the index atomically (temp file + rename)."""
+        values = self._values
+        records = self._records
+        count = len(self._positions)
+        field_count = self._field_count
+        id_field = self._id_field
+
+        id_order = _u32(
+            sorted(
+                range(count),
+                key=lambda r: values[records[r * field_count + id_field]],
+            )
+        )
+        key_pairs = _u32()
+        for key, position in self._cards_by_key.items():
+            key_pairs.extend((self._intern(key), position))
+        key_pairs = self._sorted_pairs(key_pairs)
+
+        offsets = array("Q", [0])
+        total = 0
+        for raw in values:
+            total += len(raw)
+            offsets.append(total)
+
+        payloads = {
+            "metadata": json.dumps(metadata or {}, ensure_ascii=False).encode("utf-8"),
+            "fields": json.dumps(list(self.fields)).encode("utf-8"),
+            "records": records,
+            "string_offsets": offsets,
+            "strings": values,
+            "id_order": id_order,
+            "cards_by_key": key_pairs,
+            "cards_by_name": self._sorted_pairs(self._cards_by_name),
+            "tokens_by_subtype": self._sorted_pairs(self._tokens_by_subtype),
+            "tokens_by_name": self._sorted_pairs(self._tokens_by_name),
+            "basic_land_ids": self._basic_land_ids,
+            "token_ids": self._token_ids,
+        }
+
+        # Unique per writer, so concurrent rebuilds never share a temp file
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        try:
+            self._write_sections(tmp_path, payloads, field_count, count)
+        except BaseException:
+            if os.path.exists(tmp_path):
+                os.remove(tmp_path)
+            raise
+        os.replace(tmp_path, path)
+
+    @staticmethod
+    def _write_sections(
+        tmp_path: str, payloads: Dict[str, Any], field_count: int, count: int
+    ) -> None:
+        with open(tmp_path, "wb") as handle:
+            table_size = _HEADER.size + _SECTION.size * len(SECTIONS)
+            handle.write(b"\0" * table_size)
+            table = []
+            for name in SECTIONS:
+                offset = handle.tell()
+                padding = -offset % _ALIGN
+                handle.write(b"\0" * padding)
+                offset += padding
+                payload = payloads[name]
+                if isinstance(payload, list):
+                    for raw in payload:
+                        handle.write(raw)
+                else:
+                    handle.write(payload.tobytes() if isinstance(payload, array) else payload)
+                table.append((offset, handle.tell() - offset))
+            handle.seek(0)
+            handle.write(
+                _HEADER.pack(
+                    MAGIC,
+                    FORMAT_VERSION,
+                    int(sys.byteorder == "little"),
+                    field_count,
+                    count,
+                )
+            )
+            for offset, length in table:
+                handle.write(_SECTION.pack(offset, length))
+
+
+class _SortedKeys(Sequence):
+    """Key bytes of a sorted array, indexable by `bisect`."""
+
+    def __init__(self, index: "CardIndex", count: int, sid_at):
+        self._text = index._raw_text
+        self._count = count
+        self._sid_at = sid_at
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __getitem__(self, i: int) -> bytes:  # type: ignore[override]
+        return self._text(self._sid_at(i))
+
+
+class _Entries(Mapping):
+    """card id -> entry dict, decoded on access."""
+
+    def __init__(self, index: "CardIndex"):
+        self._index = index
+        order = index._section("id_order", "I")
+        records = index._records
+        stride = index._field_count
+        id_field = index._id_field
+        self._order = order
+        self._keys = _SortedKeys(
+            index, len(order), lambda i: records[order[i] * stride + id_field]
+        )
+
+    def _position(self, card_id: Any) -> Optional[int]:
+        if not isinstance(card_id, str):
+            return None
+        key = card_id.encode("utf-8")
+        i = bisect_left(self._keys, key)
+        if i < len(self._keys) and self._keys[i] == key:
+            return self._order[i]
+        return None
+
+    def __getitem__(self, card_id: str) -> Dict[str, Any]:
+        position = self._position(card_id)
+        if position is None:
+            raise KeyError(card_id)
+        return self._index._entry(position)
+
+    def __contains__(self, card_id: object) -> bool:
+        return self._position(card_id) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        index = self._index
+        for position in range(index._count):
+            yield index._field(position, index._id_field)
+
+    def __len__(self) -> int:
+        return self._index._count
+
+    def values(self) -> "_EntryValues":
+        return _EntryValues(self)
+
+    def items(self) -> "_EntryItems":
+        return _EntryItems(self)
+
+
+class _EntryValues(ValuesView):
+    def __iter__(self) -> Iterator[Dict[str, Any]]:
+        index = self._mapping._index
+        for position in range(index._count):
+            yield index._entry(position)
+
+
+class _EntryItems(ItemsView):
+    def __iter__(self):
+        index = self._mapping._index
+        for position in range(index._count):
+            entry = index._entry(position)
+            yield entry["id"], entry
+
+
+class _KeyMap(Mapping):
+    """Sorted (key, record) pairs mapping a string key to one card id."""
+
+    def __init__(self, index: "CardIndex", name: str):
+        self._index = index
+        pairs = index._section(name, "I")
+        self._pairs = pairs
+        self._keys = _SortedKeys(index, len(pairs) // 2, lambda i: pairs[2 * i])
+
+    def _bounds(self, key: Any) -> tuple[int, int]:
+        if not isinstance(key, str):
+            return 0, 0
+        raw = key.encode("utf-8")
+        return bisect_left(self._keys, raw), bisect_right(self._keys, raw)
+
+    def _id(self, i: int) -> str:
+        index = self._index
+        return index._field(self._pairs[2 * i + 1], index._id_field)
+
+    def __getitem__(self, key: str) -> str:
+        lo, hi = self._bounds(key)
+        if lo == hi:
+            raise KeyError(key)
+        return self._id(hi - 1)
+
+    def __contains__(self, key: object) -> bool:
+        lo, hi = self._bounds(key)
+        return lo < hi
+
+    def __iter__(self) -> Iterator[str]:
+        previous = None
+        for i in range(len(self._keys)):
+            raw = self._keys[i]
+            if raw != previous:
+                previous = raw
+                yield raw.decode("utf-8")
+
+    def __len__(self) -> int:
+        return sum(1 for _ in self)
+
+
+class _MultiMap(_KeyMap):
+    """Sorted (key, record) pairs mapping a string key to a list of card ids."""
+
+    def __getitem__(self, key: str) -> List[str]:  # type: ignore[override]
+        lo, hi = self._bounds(key)
+        if lo == hi:
+            raise KeyError(key)
+        return [self._id(i) for i in range(lo, hi)]
+
+
+class _IdList(Sequence):
+    """Card ids of an array of records, in dump order."""
+
+    def __init__(self, index: "CardIndex", name: str):
+        self._index = index
+        self._positions = index._section(name, "I")
+
+    def __len__(self) -> int:
+        return len(self._positions)
+
+    def __getitem__(self, i):  # type: ignore[override]
+        index = self._index
+        if isinstance(i, slice):
+            return [index._field(p, index._id_field) for p in self._positions[i]]
+        return index._field(self._positions[i], index._id_field)
+
+
+class CardIndex(Mapping):
+    """Read-only view of an index file with the old JSON document's shape."""
+
+    def __init__(self, path: str):
+        self.path = path
+        try:
+            with open(path, "rb") as handle:
+                self._mmap = mmap.mmap(handle.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError as exc:  # empty file
+            raise CardIndexError(f"{path}: {exc}") from exc
+        self._view = memoryview(self._mmap)
+        self._views: List[memoryview] = [self._view]
+        self._oracle: Optional[Dict[str, dict]] = None
+        self._decoded: Dict[int, Any] = {}
+        try:
+            self._read_header()
+        except Exception:
+            self.close()
+            raise
+
+    @classmethod
+    def open(cls, path: str) -> "CardIndex":
+        return cls(path)
+
+    def _read_header(self) -> None:
+        size = len(self._mmap)
+        table_size = _HEADER.size + _SECTION.size * len(SECTIONS)
+        if size < table_size:
+            raise CardIndexError(f"{self.path}: truncated header")
+        magic, version, little_endian, field_count, count = _HEADER.unpack_from(self._mmap, 0)
+        if magic != MAGIC or version != FORMAT_VERSION:
+            raise CardIndexError(f"{self.path}: not a version {FORMAT_VERSION} card index")
+        if bool(little_endian) != (sys.byteorder == "little"):
+            raise CardIndexError(f"{self.path}: written on a different byte order")
+        self._sections = {}
+        for i, name in enumerate(SECTIONS):
+            offset, length = _SECTION.unpack_from(self._mmap, _HEADER.size + i * _SECTION.size)
+            if offset + length > size:
+                raise CardIndexError(f"{self.path}: truncated section {name}")
+            self._sections[name] = (offset, length)
+
+        self.fields = tuple(json.loads(self._section_bytes("fields")))
+        if len(self.fields) != field_count or "id" not in self.fields:
+            raise CardIndexError(f"{self.path}: field table does not match header")
+        self.metadata: Dict[str, Any] = json.loads(self._section_bytes("metadata"))
+        self._field_count = field_count
+        self._id_field = self.fields.index("id")
+        self._count = count
+        self._records = self._section("records", "I")
+        self._offsets = self._section("string_offsets", "Q")
+        self._strings_start = self._sections["strings"][0]
+        if len(self._records) != count * field_count:
+            raise CardIndexError(f"{self.path}: record table size mismatch")
+
+        self._contents: Dict[str, Any] = {
+            "metadata": self.metadata,
+            "entries": _Entries(self),
+            "cards_by_key": _KeyMap(self, "cards_by_key"),
+            "cards_by_name": _MultiMap(self, "cards_by_name"),
+            "basic_land_ids": _IdList(self, "basic_land_ids"),
+            "token_ids": _IdList(self, "token_ids"),
+            "tokens_by_subtype": _MultiMap(self, "tokens_by_subtype"),
+            "tokens_by_name": _MultiMap(self, "tokens_by_name"),
+        }
+
+    def _section_bytes(self, name: str) -> bytes:
+        offset, length = self._sections[name]
+        return self._mmap[offset : offset + length]
+
+    def _section(self, name: str, fmt: str) -> memoryview:
+        offset, length = self._sections[name]
+        view = self._view[offset : offset + length].cast(fmt)
+        self._views.append(view)
+        return view
+
+    # Mapping over the top-level sections ("entries", "cards_by_name", ...)
+    def __getitem__(self, name: str) -> Any:
+        return self._contents[name]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._contents)
+
+    def __len__(self) -> int:
+        return len(self._contents)
+
+    def __enter__(self) -> "CardIndex":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        self._contents = {}
+        for view in reversed(self._views):
+            view.release()
+        self._mmap.close()
+
+    def attach_oracle(self, oracle_entries: Dict[str, dict], updated_at: Any) -> bool:
+        """Overlay oracle-cards data on decoded entries.
+
+        Replaces the old rewrite of the whole JSON file: entries with a known
+        `oracle_id` gain `oracle_text`, `oracle_keywords`,
+        `oracle_color_identity` and `oracle_mana_cost` as they are decoded.
+        """
+        self._oracle = oracle_entries
+        self.metadata["oracle_attached"] = updated_at
+        return bool(oracle_entries)
+
+    def _raw_text(self, sid: int) -> bytes:
+        start = self._strings_start
+        return self._mmap[start + self._offsets[sid] + 1 : start + self._offsets[sid + 1]]
+
+    def _value(self, sid: int) -> Any:
+        if sid < 3:
+            return _CONSTANTS[sid]
+        start = self._strings_start + self._offsets[sid]
+        end = self._strings_start + self._offsets[sid + 1]
+        mm = self._mmap
+        if mm[start] == _TAG_STR:
+            return mm[start + 1 : end].decode("utf-8")
+        cached = self._decoded.get(sid, _MISSING)
+        if cached is not _MISSING:
+            # Only immutable scalars, tuples (flat lists) and flat dicts are cached
+            if isinstance(cached, tuple):
+                return list(cached)
+            if isinstance(cached, dict):
+                return cached.copy()
+            return cached
+        value = _DECODER.decode(mm[start + 1 : end].decode("utf-8"))
+        if isinstance(value, list):
+            if any(isinstance(item, (list, dict)) for item in value):
+                return value
+            cached = tuple(value)
+        elif isinstance(value, dict):
+            if any(isinstance(item, (list, dict)) for item in value.values()):
+                return value
+            cached = value.copy()
+        else:
+            cached = value
+        if len(self._decoded) < _DECODE_CACHE_SIZE:
+            self._decoded[sid] = cached
+        return value
+
+    def _field(self, position: int, field: int) -> Any:
+        return self._value(self._records[position * self._field_count + field])
+
+    def _entry(self, position: int) -> Dict[str, Any]:
+        start = position * self._field_count
+        sids = self._records[start : start + self._field_count].tolist()
+        value = self._value
+        entry = {name: value(sid) for name, sid in zip(self.fields, sids)}
+        if self._oracle is not None:
+            oracle_info = self._oracle.get(entry.get("oracle_id") or "")
+            if oracle_info:
+                entry["oracle_text"] = oracle_info.get("oracle_text")
+                entry["oracle_keywords"] = oracle_info.get("keywords")
+                entry["oracle_color_identity"] = oracle_info.get("color_identity")
+                entry["oracle_mana_cost"] = oracle_info.get("mana_cost")
+        return entry
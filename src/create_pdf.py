@@ -6,17 +6,16 @@
 import random
 import contextlib
 import io
-from collections import Counter, defaultdict
+from collections import Counter, OrderedDict, defaultdict
 import re
 import shutil
 import ssl
 import subprocess
 import sys
-import threading
 import time
 import webbrowser
 from datetime import datetime, timezone
-from concurrent.futures import ThreadPoolExecutor, as_completed, Future
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Callable, Sequence, TypeVar, TypedDict, cast
 from urllib.error import HTTPError, URLError
@@ -32,6 +31,14 @@
 except Exception:  # Python 3.9/3.10 without NotRequired
     NotRequired = object  # type: ignore[misc,assignment]
 from utilities import CardSize, PaperSize, EXTRANEOUS_FILES, generate_pdf
+from pdf.card_cache import DEFAULT_CACHE_DIR as CARD_CACHE_DIR
+from bulk_json import iter_json_objects, open_bulk_text
+from card_index import CardIndex, CardIndexError, CardIndexWriter
+from net.bulk_download import BulkDownloader, BulkDownloadError
+from net.downloader import DownloadEngine
+from net.http_cache import HttpCache, get_http_cache
+from net.ratelimit import HostRateLimiter, get_rate_limiter, retry_after_seconds
+from net.network import RetryConfig
 from bulk_paths import (
     bulk_file_path,
     ensure_bulk_data_directory,
@@ -560,12 +567,20 @@ def _run_smoke_tests() -> None:
 
 SCRYFALL_API_BASE = "https://api.scryfall.com"
 SCRYFALL_USER_AGENT = "ProxyMachine/1.0 (patrick)"
-SCRYFALL_REQUEST_DELAY = 0.11
 SCRYFALL_MAX_WORKERS = int(os.environ.get("PM_MAX_WORKERS", "8"))
+# Concurrent image connections per CDN host, independent of the worker count
+SCRYFALL_PER_HOST_CONNECTIONS = int(os.environ.get("PM_PER_HOST_CONNECTIONS", "8"))
+# Parallel range requests per bulk data download
+BULK_DOWNLOAD_CONNECTIONS = int(os.environ.get("PM_BULK_CONNECTIONS", "4"))
 SCRYFALL_PROGRESS_INTERVAL = 100
 
 IMAGE_EXTENSIONS = {".png", ".jpg", ".jpeg", ".webp"}
 
+# Related card ids looked up per query when expanding a fetch via all_parts
+RELATED_FETCH_CHUNK = 500
+# Image URLs remembered for deduping a streamed fetch
+RECENT_URL_WINDOW = 10_000
+
 
 class DownloadJob(TypedDict):
     card_id: str | None
@@ -575,6 +590,7 @@ class DownloadJob(TypedDict):
     image_url: str
     destination: Path
     base_stem: str
+    presence_key: str
     land_type: NotRequired[str]
 
 
@@ -587,29 +603,16 @@ class DownloadJob(TypedDict):
 _PROGRESS_LAST_LEN = 0
 
 
-class RateLimiter:
-    def __init__(self, min_interval: float) -> None:
-        self.min_interval = min_interval
-        self._lock = threading.Lock()
-        self._next_time = 0.0
-
-    def wait(self) -> None:
-        with self._lock:
-            now = time.monotonic()
-            wait_time = max(0.0, self._next_time - now)
-            self._next_time = max(self._next_time, now) + self.min_interval
-        if wait_time > 0:
-            time.sleep(wait_time)
-
-
-_SCRYFALL_RATE_LIMITER = RateLimiter(SCRYFALL_REQUEST_DELAY)
+# Shared with every other proxy-machine process; see net/ratelimit.py for per-host rates
+_SCRYFALL_RATE_LIMITER = get_rate_limiter()
 
 # Bulk data paths now resolved via bulk_paths helpers
 BULK_DATA_DIRECTORY = str(get_bulk_data_directory())
 BULK_DEFAULT_ID = "all-cards"
 BULK_DATA_FILENAME = f"{BULK_DEFAULT_ID}.json.gz"
 BULK_DATA_PATH = str(bulk_file_path(BULK_DATA_FILENAME))
-BULK_INDEX_PATH = str(bulk_file_path(f"{BULK_DEFAULT_ID}_index.json"))
+BULK_INDEX_PATH = str(bulk_file_path(f"{BULK_DEFAULT_ID}_index.bin"))
+LEGACY_BULK_INDEX_JSON_PATH = str(bulk_file_path(f"{BULK_DEFAULT_ID}_index.json"))
 BULK_METADATA_PATH = str(bulk_file_path("metadata.json"))
 BULK_REFRESH_SECONDS = 7 * 24 * 60 * 60  # one week
 
@@ -622,7 +625,7 @@ def wait(self) -> None:
     project_root_directory, "magic-the-gathering", "shared", "deck-reports"
 )
 
-_BULK_INDEX_CACHE: dict[str, object] | None = None
+_BULK_INDEX_CACHE: CardIndex | None = None
 _ORACLE_DATA_CACHE: dict[str, dict] | None = None
 _NOTIFICATION_CACHE: dict[str, object] | None = None
 
@@ -864,65 +867,43 @@ def _ensure_unique_pdf_path(path: str) -> str:
     return candidate
 
 
-def _download_stream(
-    url: str,
-    destination: str,
-    *,
-    rate_limiter: RateLimiter | None = _SCRYFALL_RATE_LIMITER,
-) -> None:
-    if rate_limiter is not None:
-        rate_limiter.wait()
-
-    req = Request(url, headers={"User-Agent": SCRYFALL_USER_AGENT})
-
-    with urlopen(req) as response:
-        total_length = response.headers.get("Content-Length")
-        total_bytes = int(total_length) if total_length is not None else None
-
-        chunk_size = 1024 * 256  # 256 KB chunks
-        bytes_written = 0
-
-        if total_bytes:
-            click.echo(f"Downloading (~{total_bytes / (1024 * 1024):.1f} MB)...")
-
-        with open(destination, "wb") as file_handle:
-            if total_bytes:
-                with click.progressbar(
-                    length=total_bytes, label="Downloading bulk data"
-                ) as bar:
-                    while True:
-                        chunk = response.read(chunk_size)
-                        if not chunk:
-                            break
-                        file_handle.write(chunk)
-                        bytes_written += len(chunk)
-                        bar.update(len(chunk))
-            else:
-                while True:
-                    chunk = response.read(chunk_size)
-                    if not chunk:
-                        break
-                    file_handle.write(chunk)
-                    bytes_written += len(chunk)
-
-        if total_bytes and bytes_written < total_bytes:
-            click.echo(
-                "Warning: Download completed but fewer bytes were written than expected."
-            )
+def _download_stream(url: str, destination: str) -> None:
+    # Bulk files live on Scryfall's data host, not the rate-limited API. Parts are
+    # fetched in parallel and checkpointed, so an interrupted run resumes.
+    with contextlib.ExitStack() as stack:
+        bar = None
+
+        def report(done: int, total: int | None) -> None:
+            nonlocal bar
+            if not total:
+                return
+            if bar is None:
+                click.echo(f"Downloading (~{total / (1024 * 1024):.1f} MB)...")
+                bar = stack.enter_context(
+                    click.progressbar(length=total, label="Downloading bulk data")
+                )
+            bar.update(done - bar.pos)
+
+        try:
+            result = BulkDownloader(
+                connections=BULK_DOWNLOAD_CONNECTIONS, user_agent=SCRYFALL_USER_AGENT
+            ).download(url, Path(destination), progress=report)
+        except (BulkDownloadError, requests.RequestException) as error:
+            raise click.ClickException(
+                f"Bulk download failed ({error}). Rerun to resume where it stopped."
+            ) from error
+
+    if result.resumed_bytes:
+        click.echo(f"Resumed {result.resumed_bytes / (1024 * 1024):.1f} MB from a previous run.")
 
 
 def _iter_bulk_cards(path: str, *, expect_array: bool = False):
-    """Enhanced bulk card iterator with comprehensive validation and error handling.
-
-    Features:
-    - Magic byte detection for file format validation
-    - Robust gzip/uncompressed handling
-    - JSON schema validation
-    - Detailed error reporting
-    - Progress monitoring for large files
-    """
-    import gzip
+    """Stream validated card objects from a bulk data file.
 
+    Cards are decoded one at a time from the gzip (or plain) stream by
+    bulk_json, so memory stays flat no matter how large the dump is. Cards
+    without an id are counted and skipped.
+    """
     if not os.path.exists(path):
         raise click.ClickException(f"Bulk data file not found: {path}")
 
@@ -931,185 +912,47 @@ def _iter_bulk_cards(path: str, *, expect_array: bool = False):
         click.echo("Warning: Bulk data file is empty")
         return
 
-    # Enhanced file format detection using magic bytes
-    def _detect_file_format(file_path: str) -> str:
-        """Detect file format using magic bytes."""
-        try:
-            with open(file_path, "rb") as f:
-                magic = f.read(2)
-                if magic == b"\x1f\x8b":
-                    return "gzip"
-                elif magic.startswith(b"[") or magic.startswith(b"{"):
-                    return "json"
-                else:
-                    # Try to read as text to see if it's JSON
-                    f.seek(0)
-                    try:
-                        first_bytes = f.read(10).decode("utf-8", errors="ignore")
-                        if first_bytes.strip().startswith(("[", "{")):
-                            return "json"
-                    except UnicodeDecodeError:
-                        pass
-                    return "unknown"
-        except (OSError, IOError) as e:
-            raise click.ClickException(f"Cannot read file for format detection: {e}")
-
-    file_format = _detect_file_format(path)
-
     # Only show format details for large files to avoid spam
     if file_size > 1000000:  # 1MB+
+        with open(path, "rb") as f:
+            file_format = "gzip" if f.read(2) == b"\x1f\x8b" else "json"
         click.echo(f"Enhanced validation: {file_format} format ({file_size:,} bytes)")
 
-    # Enhanced file openers with proper error handling
-    def _get_gzip_opener():
-        return gzip.open(path, "rt", encoding="utf-8")
-
-    def _get_text_opener():
-        return open(path, "r", encoding="utf-8")
-
-    # Choose opener based on detected format
-    openers = []
-    if file_format == "gzip":
-        openers = [
-            _get_gzip_opener,
-            _get_text_opener,
-        ]  # Try gzip first, fallback to text
-    elif file_format == "json":
-        openers = [
-            _get_text_opener,
-            _get_gzip_opener,
-        ]  # Try text first, fallback to gzip
-    else:
-        openers = [_get_gzip_opener, _get_text_opener]  # Try both
-
     cards_processed = 0
     validation_errors = 0
 
-    for opener_idx, open_fn in enumerate(openers):
-        try:
-            with open_fn() as file_handle:
-                # Validate file is readable
-                try:
-                    first_char = file_handle.read(1)
-                    file_handle.seek(0)
-                except UnicodeDecodeError as e:
-                    if opener_idx == 0:
-                        continue  # Try next opener
-                    else:
-                        raise click.ClickException(f"File encoding error: {e}")
-
-                if not first_char:
-                    return
-
-                # Enhanced JSON array handling
-                if expect_array or first_char == "[":
-                    try:
-                        data = json.load(file_handle)
-                        if not isinstance(data, list):
-                            raise click.ClickException(
-                                f"Expected JSON array, got {type(data).__name__}"
-                            )
-
-                        total_cards = len(data)
-                        if total_cards > 100000:
-                            click.echo(
-                                f"Processing {total_cards:,} cards from JSON array..."
-                            )
-
-                        for idx, card in enumerate(data):
-                            if not isinstance(card, dict):
-                                validation_errors += 1
-                                continue
-
-                            # Basic card validation
-                            if not card.get("id"):
-                                validation_errors += 1
-                                continue
-
-                            cards_processed += 1
-
-                            # Progress reporting for large datasets
-                            if cards_processed % 100000 == 0:
-                                progress_pct = (idx / total_cards) * 100
-                                click.echo(
-                                    f"Enhanced validation progress: {cards_processed:,} cards ({progress_pct:.1f}%)"
-                                )
-
-                            yield card
-
-                        if validation_errors > 0:
-                            click.echo(
-                                f"Enhanced validation: {validation_errors} errors in {cards_processed:,} cards"
-                            )
-
-                    except json.JSONDecodeError as e:
-                        if opener_idx == 0:
-                            continue  # Try next opener
-                        else:
-                            raise click.ClickException(f"Invalid JSON format: {e}")
-                    return
-
-                # Enhanced line-by-line processing (JSONL format)
-                line_number = 0
-
-                for line in file_handle:
-                    line_number += 1
-                    line = line.strip()
-
-                    if not line:
-                        continue
-
-                    try:
-                        card = json.loads(line)
-                    except json.JSONDecodeError:
-                        validation_errors += 1
-                        if validation_errors <= 5:  # Only show first 5 errors
-                            click.echo(
-                                f"Enhanced validation warning: JSON error on line {line_number}"
-                            )
-                        continue
-
-                    if not isinstance(card, dict):
-                        validation_errors += 1
-                        continue
-
-                    # Basic card validation
-                    if not card.get("id"):
-                        validation_errors += 1
-                        continue
-
-                    cards_processed += 1
+    try:
+        with open_bulk_text(path) as file_handle:
+            if expect_array:
+                head = file_handle.read(4096).lstrip("\ufeff \t\r\n")
+                file_handle.seek(0)
+                if head and not head.startswith("["):
+                    raise click.ClickException(
+                        f"Expected JSON array in bulk data file: {path}"
+                    )
 
-                    # Progress reporting for large files
-                    if cards_processed % 100000 == 0:
-                        click.echo(
-                            f"Enhanced validation progress: {cards_processed:,} cards processed"
-                        )
+            for card in iter_json_objects(file_handle):
+                # Basic card validation
+                if not card.get("id"):
+                    validation_errors += 1
+                    continue
 
-                    yield card
+                cards_processed += 1
 
-                if validation_errors > 0:
+                # Progress reporting for large files
+                if cards_processed % 100000 == 0:
                     click.echo(
-                        f"Enhanced validation complete: {validation_errors} errors in {cards_processed:,} cards"
+                        f"Enhanced validation progress: {cards_processed:,} cards processed"
                     )
 
-                return
-
-        except gzip.BadGzipFile as e:
-            if opener_idx == 0 and file_format == "gzip":
-                continue  # Try uncompressed format
-            else:
-                raise click.ClickException(f"Invalid gzip file: {e}")
-        except (OSError, IOError) as e:
-            if opener_idx == 0:
-                continue  # Try alternative format
-            else:
-                raise click.ClickException(f"Cannot read file: {e}")
+                yield card
+    except (OSError, EOFError, UnicodeDecodeError) as e:
+        raise click.ClickException(f"Cannot read bulk data file: {e}")
 
-    # If we get here, all openers failed
-    raise click.ClickException(
-        "Enhanced validation failed: Unable to read bulk data file with any supported format"
-    )
+    if validation_errors > 0:
+        click.echo(
+            f"Enhanced validation complete: {validation_errors} errors in {cards_processed:,} cards"
+        )
 
 
 def _fetch_remote_bulk_metadata(bulk_id: str) -> dict:
@@ -1165,14 +1008,8 @@ def _build_bulk_index(
     remote_meta: dict,
     oracle_entries: dict[str, dict] | None = None,
     oracle_meta: dict | None = None,
-) -> dict:
-    entries: dict[str, dict] = {}
-    cards_by_key: dict[str, str] = {}
-    cards_by_name: dict[str, list[str]] = {}
-    basic_land_ids: list[str] = []
-    token_ids: list[str] = []
-    tokens_by_subtype: dict[str, list[str]] = {}
-    tokens_by_name: dict[str, list[str]] = {}
+) -> CardIndex:
+    writer = CardIndexWriter()
 
     for card in _iter_bulk_cards(bulk_path):
         card_id = card.get("id")
@@ -1186,7 +1023,6 @@ def _build_bulk_index(
         image_url = _extract_image_url(card)
 
         name_slug = _slugify(name)
-        key = f"{name_slug}|{set_code}|{collector_number}"
 
         is_basic_land = "Basic Land" in type_line
         is_token = "Token" in type_line or card.get("layout") == "token"
@@ -1237,41 +1073,25 @@ def _build_bulk_index(
             "keywords": card.get("keywords") or [],
         }
 
-        entries[card_id] = entry
-        cards_by_key[key] = card_id
-        cards_by_name.setdefault(name_slug, []).append(card_id)
+        writer.add(entry)
 
-        if is_basic_land:
-            basic_land_ids.append(card_id)
-
-        if is_token:
-            token_ids.append(card_id)
-            if token_subtype_slug:
-                tokens_by_subtype.setdefault(token_subtype_slug, []).append(card_id)
-            tokens_by_name.setdefault(name_slug, []).append(card_id)
-
-    index = {
-        "metadata": {
-            "generated_at": datetime.now(timezone.utc)
-            .isoformat(timespec="seconds")
-            .replace("+00:00", "Z"),
-            "bulk_updated_at": remote_meta.get("updated_at"),
-            "source_download": remote_meta.get("download_uri"),
-            "schema_version": 5,
-        },
-        "entries": entries,
-        "cards_by_key": cards_by_key,
-        "cards_by_name": cards_by_name,
-        "basic_land_ids": basic_land_ids,
-        "token_ids": token_ids,
-        "tokens_by_subtype": tokens_by_subtype,
-        "tokens_by_name": tokens_by_name,
+    metadata = {
+        "generated_at": datetime.now(timezone.utc)
+        .isoformat(timespec="seconds")
+        .replace("+00:00", "Z"),
+        "bulk_updated_at": remote_meta.get("updated_at"),
+        "source_download": remote_meta.get("download_uri"),
+        "schema_version": 5,
     }
+    writer.write(BULK_INDEX_PATH, metadata)
+    del writer
+    # The JSON index this file replaces is over a gigabyte; drop it
+    if os.path.exists(LEGACY_BULK_INDEX_JSON_PATH):
+        os.remove(LEGACY_BULK_INDEX_JSON_PATH)
 
+    index = CardIndex.open(BULK_INDEX_PATH)
     if oracle_entries is not None and oracle_meta is not None:
-        _augment_index_with_oracle(index, oracle_entries, oracle_meta)
-
-    _write_json_file(BULK_INDEX_PATH, index)
+        index.attach_oracle(oracle_entries, oracle_meta.get("updated_at"))
     return index
 
 
@@ -1358,36 +1178,7 @@ def _load_oracle_data(force_refresh: bool = False) -> tuple[dict[str, dict], dic
     return _ORACLE_DATA_CACHE, remote_meta
 
 
-def _augment_index_with_oracle(
-    index: dict, oracle_entries: dict[str, dict], oracle_meta: dict
-) -> bool:
-    entries = index.get("entries", {})
-    updated_any = False
-
-    for entry in entries.values():
-        oracle_id = entry.get("oracle_id")
-        if not oracle_id:
-            continue
-
-        oracle_info = oracle_entries.get(oracle_id)
-        if not oracle_info:
-            continue
-
-        entry["oracle_text"] = oracle_info.get("oracle_text")
-        entry["oracle_keywords"] = oracle_info.get("keywords")
-        entry["oracle_color_identity"] = oracle_info.get("color_identity")
-        entry["oracle_mana_cost"] = oracle_info.get("mana_cost")
-        updated_any = True
-
-    metadata = index.setdefault("metadata", {})
-    metadata["oracle_attached"] = oracle_meta.get("updated_at")
-
-    return updated_any
-
-
-def _load_bulk_index(force_refresh: bool = False) -> dict:
-    global _BULK_INDEX_CACHE
-
+def _load_bulk_index(force_refresh: bool = False) -> CardIndex:
     # Fast path: if cached and not forcing refresh, return immediately
     if _BULK_INDEX_CACHE is not None and not force_refresh:
         return _BULK_INDEX_CACHE  # type: ignore[return-value]
@@ -1455,35 +1246,41 @@ def _load_bulk_index(force_refresh: bool = False) -> dict:
         index = _build_bulk_index(
             BULK_DATA_PATH, remote_meta, oracle_entries, oracle_meta
         )
-        _BULK_INDEX_CACHE = index
-        return index
+        return _cache_bulk_index(index)
 
     if _BULK_INDEX_CACHE is not None and not force_refresh:
         return _BULK_INDEX_CACHE
 
     try:
-        index = _read_json_file(BULK_INDEX_PATH)
-    except (OSError, json.JSONDecodeError):
+        index = CardIndex.open(BULK_INDEX_PATH)
+    except (OSError, CardIndexError):
         click.echo("Bulk index corrupt; rebuilding...")
         index = _build_bulk_index(
             BULK_DATA_PATH, remote_meta, oracle_entries, oracle_meta
         )
     else:
         meta = index.get("metadata", {})
-        oracle_attached = meta.get("oracle_attached")
         schema_version = int(meta.get("schema_version") or 1)
         if schema_version < 5:
             click.echo("Bulk index schema outdated; rebuilding...")
+            index.close()
             index = _build_bulk_index(
                 BULK_DATA_PATH, remote_meta, oracle_entries, oracle_meta
             )
         else:
-            # Ensure oracle augmentation is up to date
-            if oracle_attached != oracle_meta.get("updated_at"):
-                if _augment_index_with_oracle(index, oracle_entries, oracle_meta):
-                    _write_json_file(BULK_INDEX_PATH, index)
+            # Oracle text is overlaid at read time, so a newer oracle dump
+            # never requires rewriting the index
+            index.attach_oracle(oracle_entries, oracle_meta.get("updated_at"))
+
+    return _cache_bulk_index(index)
 
-    _BULK_INDEX_CACHE = index
+
+def _cache_bulk_index(index: CardIndex) -> CardIndex:
+    """Make `index` the cached bulk index, closing the one it replaces."""
+    global _BULK_INDEX_CACHE
+    previous, _BULK_INDEX_CACHE = _BULK_INDEX_CACHE, index
+    if previous is not None and previous is not index:
+        previous.close()
     return index
 
 
@@ -3494,28 +3291,51 @@ def _title_from_slug(slug: str) -> str:
     return slug.replace("-", " ").replace("_", " ").title()
 
 
+def _decode_http_payload(payload: bytes, as_json: bool) -> bytes | dict:
+    if as_json:
+        return json.loads(payload.decode("utf-8"))
+    return payload
+
+
 def _http_get(
     url: str,
     *,
     as_json: bool = False,
-    rate_limiter: RateLimiter | None = _SCRYFALL_RATE_LIMITER,
+    rate_limiter: HostRateLimiter | None = _SCRYFALL_RATE_LIMITER,
+    cache: HttpCache | None = None,
 ) -> bytes | dict:
+    http_cache = cache or get_http_cache()
+    cached = http_cache.lookup(url) if http_cache.enabled else None
+    if cached is not None and http_cache.is_fresh(cached):
+        return _decode_http_payload(cached.content, as_json)
+
+    headers = {"User-Agent": SCRYFALL_USER_AGENT, **http_cache.validators(cached)}
     last_error: Exception | None = None
 
     for attempt in range(5):
         try:
             if rate_limiter is not None:
-                rate_limiter.wait()
-            req = Request(url, headers={"User-Agent": SCRYFALL_USER_AGENT})
+                rate_limiter.acquire(url)
+            req = Request(url, headers=headers)
             with urlopen(req) as response:
                 payload = response.read()
-                if as_json:
-                    return json.loads(payload.decode("utf-8"))
-                return payload
+                if http_cache.enabled:
+                    http_cache.store(url, payload, response.headers)
+            if rate_limiter is not None:
+                rate_limiter.reward(url)
+            return _decode_http_payload(payload, as_json)
         except HTTPError as error:
             last_error = error
+            if error.code == 304 and cached is not None:
+                http_cache.touch(url)
+                return _decode_http_payload(cached.content, as_json)
             if error.code == 429 and attempt < 4:
-                time.sleep(1.5 * (attempt + 1))
+                retry_after = retry_after_seconds(error.headers.get("Retry-After"))
+                if rate_limiter is not None:
+                    # The limiter holds every process until Retry-After passes
+                    rate_limiter.penalize(url, retry_after)
+                else:
+                    time.sleep(retry_after if retry_after is not None else 1.5 * (attempt + 1))
                 continue
             break
         except URLError as error:
@@ -3528,6 +3348,10 @@ def _http_get(
             last_error = error
             time.sleep(0.5 * (attempt + 1))
 
+    # Unreachable rather than refused: a stale copy beats failing outright
+    if cached is not None and not isinstance(last_error, HTTPError):
+        return _decode_http_payload(cached.content, as_json)
+
     raise click.ClickException(f"Unable to reach Scryfall ({last_error}).")
 
 
@@ -3551,23 +3375,29 @@ def _scryfall_json(path_or_url: str, params: dict[str, str] | None = None) -> di
     return data
 
 
-def _download_image(url: str, destination: Path) -> None:
-    destination.parent.mkdir(parents=True, exist_ok=True)
+def _new_download_engine(max_workers: int | None = None) -> DownloadEngine:
+    return DownloadEngine(
+        max_workers or SCRYFALL_MAX_WORKERS,
+        per_host=SCRYFALL_PER_HOST_CONNECTIONS,
+        user_agent=SCRYFALL_USER_AGENT,
+        # Five attempts in all, matching what _http_get gave image downloads
+        config=RetryConfig(max_retries=4),
+    )
+
+
+# Shared by single-image callers so each thread keeps its keep-alive session
+_IMAGE_DOWNLOADER = _new_download_engine()
+
+
+def _download_image(
+    url: str, destination: Path, *, engine: DownloadEngine | None = None
+) -> None:
     # Image fetches go to Scryfall's CDN; bypass the API rate limiter and rely on
-    # capped thread concurrency for politeness and throughput.
-    tmp_path = destination.with_suffix(destination.suffix + ".part")
+    # the engine's per-host connection cap for politeness and throughput.
     try:
-        binary = _http_get(url, rate_limiter=None)
-        with tmp_path.open("wb") as handle:
-            handle.write(binary)  # type: ignore[arg-type]
-        # Atomic replace
-        tmp_path.replace(destination)
-    finally:
-        try:
-            if tmp_path.exists():
-                tmp_path.unlink()
-        except OSError:
-            pass
+        (engine or _IMAGE_DOWNLOADER).download(url, destination)
+    except requests.RequestException as error:
+        raise click.ClickException(f"Unable to download {url} ({error}).") from error
 
 
 def _token_subtype_from_type_line(type_line: str) -> str:
@@ -4351,6 +4181,12 @@ def attach_profile_flags(command):
     show_default=True,
     help="Reduce artifacts produced by rounded corners in card images.",
 )
+@click.option(
+    "--mirror_bleed",
+    default=False,
+    is_flag=True,
+    help="Mirror the card edges into the print bleed instead of repeating the outermost pixels.",
+)
 @click.option(
     "--ppi",
     default=600,
@@ -4365,6 +4201,19 @@ def attach_profile_flags(command):
     show_default=True,
     help="File compression. A higher value corresponds to better quality and larger file size.",
 )
+@click.option(
+    "--workers",
+    default=1,
+    type=click.IntRange(min=0),
+    show_default=True,
+    help="Compose sheets in parallel worker processes. 0 uses every CPU core.",
+)
+@click.option(
+    "--card_cache/--no-card_cache",
+    default=True,
+    show_default=True,
+    help="Reuse pre-scaled card images from .cache/card_tiles across runs.",
+)
 @click.option(
     "--load_offset",
     default=False,
@@ -4708,8 +4557,11 @@ def cli(
     only_fronts,
     crop,
     extend_corners,
+    mirror_bleed,
     ppi,
     quality,
+    workers,
+    card_cache,
     skip,
     load_offset,
     name,
@@ -5332,6 +5184,9 @@ def cli(
         skip,
         load_offset,
         name,
+        mirror_bleed=mirror_bleed,
+        workers=workers,
+        card_cache_dir=CARD_CACHE_DIR if card_cache else None,
     )
 
     if output_images:
@@ -6089,33 +5944,9 @@ def _fetch_cards_universal(
         )
         return (0, 0, 0, ["Database not available"])
 
-    # Use optimized query that pushes filters to SQL
-    from db.bulk_index import query_cards_optimized
-
-    filtered_entries = query_cards_optimized(
-        limit=limit,
-        db_path=str(BULK_DB_PATH),
-        card_type=card_type,
-        is_token=is_token,
-        is_basic_land=is_basic_land,
-        name_filter=name_filter,
-        type_line_contains=type_line_contains,
-        subtype_filter=subtype_filter,
-        lang_filter=target_langs if len(target_langs) > 1 else target_langs[0],
-        set_filter=set_filter,
-        artist_filter=artist_filter,
-        rarity_filter=rarity_filter,
-        colors_filter=colors_filter,
-        layout_filter=layout_filter,
-        frame_filter=frame_filter,
-        border_color_filter=border_color_filter,
-        fullart_only=fullart_only,
-    )
-
-    if memory_monitor.enabled:
-        memory_monitor.log_memory(
-            f"after loading {len(filtered_entries)} filtered entries from database"
-        )
+    # Use optimized query that pushes filters to SQL; rows are streamed so
+    # only one fetch batch of entries is in memory at a time
+    from db.bulk_index import iter_cards_optimized
 
     if progress:
         filter_desc = []
@@ -6135,307 +5966,298 @@ def _fetch_cards_universal(
         click.echo(
             f"Applied filters to {card_type}: {', '.join(filter_desc) if filter_desc else 'none'}"
         )
-        click.echo(
-            f"Found {len(filtered_entries)} potential card(s) in the local bulk index."
-        )
-
-    if memory_monitor.enabled:
-        memory_monitor.log_memory(f"after filtering to {len(filtered_entries)} entries")
-
-    # Expand with related cards using all_parts
-    if include_related and filtered_entries and _db_index_available() and BULK_DB_PATH:
-        try:
-            from pathlib import Path as PathLib
-            from tools.resolve_card_relationships import (
-                expand_card_list_with_relationships,
-            )
-
-            initial_count = len(filtered_entries)
-            initial_ids = [
-                str(entry.get("id")) for entry in filtered_entries if entry.get("id")
-            ]
-
-            if initial_ids:
-                expanded_ids = expand_card_list_with_relationships(
-                    initial_ids,
-                    PathLib(BULK_DB_PATH),
-                    include_tokens=(card_type == "token" or bool(is_token)),
-                    verbose=progress,
-                )
-
-                # Fetch additional related cards
-                additional_ids = expanded_ids - set(initial_ids)
-                if additional_ids:
-                    from db.bulk_index import _get_connection
-
-                    conn = _get_connection(str(BULK_DB_PATH))
-                    cur = conn.cursor()
-
-                    placeholders = ",".join(["?" for _ in additional_ids])
-                    cur.execute(
-                        f"SELECT * FROM prints WHERE id IN ({placeholders})",
-                        list(additional_ids),
-                    )
-                    rows = cur.fetchall()
-                    columns = [description[0] for description in cur.description]
-
-                    for row in rows:
-                        additional_entry = dict(zip(columns, row))
 
-                        # Apply same filters to related cards
-                        if additional_entry.get("lang", "en") not in target_langs:
-                            continue
-                        if (
-                            set_filter
-                            and additional_entry.get("set", "").lower()
-                            != set_filter.lower()
-                        ):
-                            continue
-                        if fullart_only:
-                            art_type = _derive_art_type(additional_entry)
-                            if not (art_type == "fullart" or "fullart" in art_type):
-                                continue
+    entry_count = 0
+    related_count = 0
+    expand_related = bool(include_related and _db_index_available() and BULK_DB_PATH)
 
-                        # When fetching tokens, ensure additional cards are also tokens
-                        if card_type == "token" or is_token:
-                            additional_type_line = additional_entry.get(
-                                "type_line", ""
-                            ).lower()
-                            if "token" not in additional_type_line:
-                                continue
+    def _matching_entries():
+        nonlocal entry_count
+        for entry in iter_cards_optimized(
+            limit=limit,
+            db_path=str(BULK_DB_PATH),
+            card_type=card_type,
+            is_token=is_token,
+            is_basic_land=is_basic_land,
+            name_filter=name_filter,
+            type_line_contains=type_line_contains,
+            subtype_filter=subtype_filter,
+            lang_filter=target_langs if len(target_langs) > 1 else target_langs[0],
+            set_filter=set_filter,
+            artist_filter=artist_filter,
+            rarity_filter=rarity_filter,
+            colors_filter=colors_filter,
+            layout_filter=layout_filter,
+            frame_filter=frame_filter,
+            border_color_filter=border_color_filter,
+            fullart_only=fullart_only,
+        ):
+            entry_count += 1
+            yield entry
 
-                        filtered_entries.append(additional_entry)
+        if memory_monitor.enabled:
+            memory_monitor.log_memory(
+                f"after streaming {entry_count} filtered entries from database"
+            )
+        if progress:
+            click.echo(
+                f"Found {entry_count} potential card(s) in the local bulk index."
+            )
 
-                    conn.close()
+    def _related_entries(chunk_ids: list[str]):
+        """Related cards via all_parts (MDFCs, meld, etc.) for one chunk of ids."""
+        nonlocal related_count
+        from tools.resolve_card_relationships import (
+            expand_card_list_with_relationships,
+        )
 
-                    if progress:
-                        added_count = len(filtered_entries) - initial_count
-                        click.echo(
-                            f"Expanded from {initial_count} to {len(filtered_entries)} cards (+{added_count})"
-                        )
-        except Exception as e:
-            if progress:
-                click.echo(f"Warning: Could not expand relationships: {e}")
+        expanded_ids = expand_card_list_with_relationships(
+            chunk_ids,
+            Path(BULK_DB_PATH),
+            include_tokens=(card_type == "token" or bool(is_token)),
+        )
 
-    # Prepare download jobs
-    download_jobs = []
-    seen_urls: set[str] = set()
+        # Fetch additional related cards
+        known_ids = set(chunk_ids)
+        additional_ids = sorted(cid for cid in expanded_ids if cid not in known_ids)
+        for start in range(0, len(additional_ids), RELATED_FETCH_CHUNK):
+            for additional_entry in iter_cards_optimized(
+                db_path=str(BULK_DB_PATH),
+                card_ids=additional_ids[start : start + RELATED_FETCH_CHUNK],
+            ):
+                # Apply same filters to related cards
+                if additional_entry.get("lang", "en") not in target_langs:
+                    continue
+                if (
+                    set_filter
+                    and (additional_entry.get("set_code") or "").lower()
+                    != set_filter.lower()
+                ):
+                    continue
+                if fullart_only:
+                    art_type = _derive_art_type(additional_entry)
+                    if not (art_type == "fullart" or "fullart" in art_type):
+                        continue
 
-    if progress:
-        click.echo("Preparing download jobs...")
+                # When fetching tokens, ensure additional cards are also tokens
+                if card_type == "token" or is_token:
+                    additional_type_line = (
+                        additional_entry.get("type_line") or ""
+                    ).lower()
+                    if "token" not in additional_type_line:
+                        continue
 
-    processed_count = 0
-    for entry in filtered_entries:
-        processed_count += 1
-        if progress and processed_count % 100 == 0:
-            click.echo(f"  Prepared {processed_count}/{len(filtered_entries)} jobs...")
+                related_count += 1
+                yield additional_entry
 
-        card_id = entry.get("id", "")
-        card_name = entry.get("name", "unknown")
-        set_code = entry.get("set_code", "unk")
+    def _entries_with_related():
+        """Stream matches, following each RELATED_FETCH_CHUNK of them with their
+        related cards, so only one chunk of ids is held at a time."""
+        nonlocal expand_related
+        chunk_ids: list[str] = []
 
-        collector_number = entry.get("collector_number", "0")
+        def _expand_chunk():
+            nonlocal expand_related
+            try:
+                yield from _related_entries(chunk_ids)
+            except Exception as e:
+                expand_related = False
+                if progress:
+                    click.echo(f"Warning: Could not expand relationships: {e}")
+
+        for entry in _matching_entries():
+            yield entry
+            if expand_related and entry.get("id"):
+                chunk_ids.append(str(entry.get("id")))
+                if len(chunk_ids) >= RELATED_FETCH_CHUNK:
+                    yield from _expand_chunk()
+                    chunk_ids = []
+        if expand_related and chunk_ids:
+            yield from _expand_chunk()
+
+        if expand_related and entry_count and progress:
+            click.echo(
+                f"Expanded from {entry_count} to {entry_count + related_count} cards (+{related_count})"
+            )
 
-        # Get image URL
-        image_url = entry.get("image_url", "")
+    # Recently queued image URLs; files already written are caught by the
+    # presence index and destination checks, so this only needs to cover
+    # duplicates close together in the stream
+    recent_urls: OrderedDict[str, None] = OrderedDict()
+    queued = 0
 
-        if not image_url:
-            skipped += 1
-            skipped_details.append(
-                f"no image URL: {card_name} ({set_code} #{collector_number})"
-            )
-            continue
+    def _download_jobs():
+        """Turn streamed entries into download jobs one at a time."""
+        nonlocal skipped, queued
+        for entry in _entries_with_related():
+            card_id = entry.get("id", "")
+            card_name = entry.get("name", "unknown")
+            set_code = entry.get("set_code", "unk")
 
-        # Dedupe by URL
-        if image_url in seen_urls:
-            skipped += 1
-            continue
-        seen_urls.add(image_url)
+            collector_number = entry.get("collector_number", "0")
 
-        # Determine filename
-        entry_enriched = _enrich_entry_with_art_meta(dict(entry))
-        land_type: str | None = None
-        if card_type in {"basic_land", "nonbasic_land"}:
-            base_stem = _land_base_stem(entry_enriched)
-            extension = _extension_from_url(image_url, ".png")
-            land_type = _classify_land_type(
-                entry_enriched.get("name", ""),
-                entry_enriched.get("type_line", ""),
-                entry_enriched.get("oracle_text", ""),
-            )
+            # Get image URL
+            image_url = entry.get("image_url", "")
 
-            # Check if this land already exists using presence index
-            if land_type:
-                land_bucket = land_type
-            else:
-                land_bucket = "uncategorized"
+            if not image_url:
+                skipped += 1
+                skipped_details.append(
+                    f"no image URL: {card_name} ({set_code} #{collector_number})"
+                )
+                continue
 
-            land_presence = presence.get(land_bucket, set())
-            if base_stem in land_presence:
+            # Dedupe by URL
+            if image_url in recent_urls:
                 skipped += 1
-                if dry_run and progress:
-                    click.echo(f"  [SKIP] {base_stem} already present in {land_bucket}")
                 continue
+            recent_urls[image_url] = None
+            if len(recent_urls) > RECENT_URL_WINDOW:
+                recent_urls.popitem(last=False)
+
+            # Determine filename
+            entry_enriched = _enrich_entry_with_art_meta(dict(entry))
+            land_type: str | None = None
+            if card_type in {"basic_land", "nonbasic_land"}:
+                base_stem = _land_base_stem(entry_enriched)
+                extension = _extension_from_url(image_url, ".png")
+                land_type = _classify_land_type(
+                    entry_enriched.get("name", ""),
+                    entry_enriched.get("type_line", ""),
+                    entry_enriched.get("oracle_text", ""),
+                )
 
-            destination = _unique_land_destination(
-                output_path,
-                land_type,
-                base_stem,
-                extension,
-            )
-        else:
-            directory: Path
-            token_subtype_slug: str = "misc"  # Default value for linting
-            if card_type == "token" or is_token:
-                base_stem = _token_base_stem(entry_enriched)
-                # Token organization by subtype/set structure
-                # Extract token subtype from type_line if not already present
-                token_subtype = entry_enriched.get("token_subtype")
-                if not token_subtype:
-                    type_line = entry_enriched.get("type_line", "")
-                    token_subtype = _token_subtype_from_type_line(type_line)
-
-                token_subtype_slug = entry_enriched.get(
-                    "token_subtype_slug"
-                ) or _slugify(token_subtype or "misc")
-                classification = token_subtype_slug
-                directory = output_path / token_subtype_slug
-            else:
-                base_stem = _card_base_stem(entry_enriched)
-                if card_type in {"instant", "sorcery"}:
-                    classification = _classify_spell_path(entry_enriched)
-                    directory = output_path / classification
-                elif card_type == "artifact":
-                    classification = _classify_artifact_path(entry_enriched)
-                    directory = output_path / classification
-                elif card_type == "enchantment":
-                    classification = _classify_enchantment_path(entry_enriched)
-                    directory = output_path / classification
+                # Check if this land already exists using presence index
+                if land_type:
+                    presence_key = land_type
                 else:
-                    classification = set_code
-                    directory = output_path / classification
+                    presence_key = "uncategorized"
 
-            # Check presence based on card type
-            if card_type == "token" or is_token:
-                # Token presence uses simple structure: subtype -> stems
-                # token_subtype_slug was defined in the token classification branch above
-                subtype_presence = presence.get(token_subtype_slug, set())
-                if base_stem in subtype_presence:
+                if base_stem in presence.get(presence_key, set()):
                     skipped += 1
                     if dry_run and progress:
-                        click.echo(
-                            f"  [SKIP] {base_stem} already present in {token_subtype_slug}"
-                        )
+                        click.echo(f"  [SKIP] {base_stem} already present in {presence_key}")
                     continue
+
+                destination = _unique_land_destination(
+                    output_path,
+                    land_type,
+                    base_stem,
+                    extension,
+                )
             else:
-                # Non-token presence uses flat structure
-                presence_key = directory.relative_to(output_path).as_posix()
-                stem_presence = presence.get(presence_key, set())
-                if base_stem in stem_presence:
+                directory: Path
+                if card_type == "token" or is_token:
+                    base_stem = _token_base_stem(entry_enriched)
+                    # Token organization by subtype/set structure
+                    # Extract token subtype from type_line if not already present
+                    token_subtype = entry_enriched.get("token_subtype")
+                    if not token_subtype:
+                        type_line = entry_enriched.get("type_line", "")
+                        token_subtype = _token_subtype_from_type_line(type_line)
+
+                    token_subtype_slug = entry_enriched.get(
+                        "token_subtype_slug"
+                    ) or _slugify(token_subtype or "misc")
+                    directory = output_path / token_subtype_slug
+                    # Token presence uses simple structure: subtype -> stems
+                    presence_key = token_subtype_slug
+                else:
+                    base_stem = _card_base_stem(entry_enriched)
+                    if card_type in {"instant", "sorcery"}:
+                        classification = _classify_spell_path(entry_enriched)
+                    elif card_type == "artifact":
+                        classification = _classify_artifact_path(entry_enriched)
+                    elif card_type == "enchantment":
+                        classification = _classify_enchantment_path(entry_enriched)
+                    else:
+                        classification = set_code
+                    directory = output_path / classification
+                    # Non-token presence uses flat structure
+                    presence_key = directory.relative_to(output_path).as_posix()
+
+                if base_stem in presence.get(presence_key, set()):
                     skipped += 1
                     if dry_run and progress:
-                        click.echo(
-                            f"  [SKIP] {base_stem} already present in {presence_key}"
-                        )
+                        click.echo(f"  [SKIP] {base_stem} already present in {presence_key}")
                     continue
 
-            if not dry_run:
-                directory.mkdir(parents=True, exist_ok=True)
-
-            destination = directory / f"{base_stem}.png"
+                if not dry_run:
+                    directory.mkdir(parents=True, exist_ok=True)
 
-        # Check if already exists
-        if destination.exists():
-            skipped += 1
-            if dry_run and progress:
-                click.echo(f"  [SKIP] {destination} (already exists)")
-            continue
+                destination = directory / f"{base_stem}.png"
 
-        job: DownloadJob = {
-            "card_id": card_id,
-            "name": card_name,
-            "set_code": set_code,
-            "collector_number": collector_number,
-            "image_url": image_url,
-            "destination": destination,
-            "base_stem": base_stem,
-        }
+            # Check if already exists
+            if destination.exists():
+                skipped += 1
+                if dry_run and progress:
+                    click.echo(f"  [SKIP] {destination} (already exists)")
+                continue
 
-        if land_type is not None:
-            job["land_type"] = land_type
+            job: DownloadJob = {
+                "card_id": card_id,
+                "name": card_name,
+                "set_code": set_code,
+                "collector_number": collector_number,
+                "image_url": image_url,
+                "destination": destination,
+                "base_stem": base_stem,
+                "presence_key": presence_key,
+            }
 
-        download_jobs.append(job)
+            if land_type is not None:
+                job["land_type"] = land_type
 
-    if progress:
-        click.echo(
-            f"Prepared {len(download_jobs)} download jobs (skipped {skipped} already present)"
-        )
+            # Claim the stem now so a later duplicate is skipped while this
+            # one is still downloading; released again if the download fails
+            presence.setdefault(presence_key, set()).add(base_stem)
+            queued += 1
+            yield job
 
     if dry_run:
-        return (0, skipped, len(filtered_entries), skipped_details)
-
-    # Download images
-    if download_jobs:
+        for _job in _download_jobs():
+            pass
         if progress:
-            click.echo(
-                f"Starting downloads with {min(8, len(download_jobs))} workers..."
-            )
-
-        from concurrent.futures import ThreadPoolExecutor, as_completed
+            click.echo(f"Would download {queued} card(s) (skipped {skipped} already present)")
+        return (0, skipped, entry_count + related_count, skipped_details)
 
-        total = len(download_jobs)
-
-        def report_progress():
-            if progress and processed % 50 == 0:
-                label = f"Progress: processed {processed}/{total} cards (saved {saved}, skipped {skipped})"
-                _render_progress(label, final=False)
+    # Jobs are prepared as rows stream in and submitted as workers free up,
+    # so neither entries nor jobs accumulate for the whole result
+    workers = max(1, SCRYFALL_MAX_WORKERS)
+    if progress:
+        click.echo(f"Starting downloads with {workers} workers...")
 
-        future_to_job: dict[Future[None], DownloadJob] = {}
-        with ThreadPoolExecutor(max_workers=8) as executor:
-            for job in download_jobs:
-                destination = job["destination"]
-                destination.parent.mkdir(parents=True, exist_ok=True)
-                future = executor.submit(_download_image, job["image_url"], destination)
-                future_to_job[future] = job
+    def report_progress():
+        if progress and processed % 50 == 0:
+            label = f"Progress: processed {processed}/{queued} cards (saved {saved}, skipped {skipped})"
+            _render_progress(label, final=False)
 
-            for future in as_completed(future_to_job):
-                job = future_to_job[future]
-                card_id = job["card_id"]
-                entry_name = job["name"] or "Unknown"
-                try:
-                    future.result()
-                except click.ClickException as error:
-                    skipped += 1
-                    if card_id:
-                        skipped_retry_ids.add(card_id)
-                    if job["destination"].exists():
-                        try:
-                            job["destination"].unlink()
-                        except OSError:
-                            pass
-                    skipped_details.append(
-                        f"download failed: {entry_name} ({job['set_code']} #{job['collector_number']}) - {error}"
-                    )
-                except Exception as error:
-                    skipped += 1
-                    if card_id:
-                        skipped_retry_ids.add(card_id)
-                    if job["destination"].exists():
-                        try:
-                            job["destination"].unlink()
-                        except OSError:
-                            pass
-                    skipped_details.append(
-                        f"download failed: {entry_name} ({job['set_code']} #{job['collector_number']}) - {error}"
-                    )
-                else:
-                    if card_id and card_id in skipped_retry_ids:
-                        skipped_retry_ids.discard(card_id)
-                    presence.setdefault(job["set_code"], set()).add(job["base_stem"])
-                    saved += 1
-                finally:
-                    processed += 1
-                    report_progress()
+    with _new_download_engine(workers) as engine:
+        results = engine.download_many(
+            (job["image_url"], job["destination"], job) for job in _download_jobs()
+        )
+        for job, error in results:
+            card_id = job["card_id"]
+            entry_name = job["name"] or "Unknown"
+            if error is not None:
+                skipped += 1
+                if card_id:
+                    skipped_retry_ids.add(card_id)
+                presence.get(job["presence_key"], set()).discard(job["base_stem"])
+                if job["destination"].exists():
+                    try:
+                        job["destination"].unlink()
+                    except OSError:
+                        pass
+                skipped_details.append(
+                    f"download failed: {entry_name} ({job['set_code']} #{job['collector_number']}) - {error}"
+                )
+            else:
+                if card_id and card_id in skipped_retry_ids:
+                    skipped_retry_ids.discard(card_id)
+                saved += 1
+            processed += 1
+            report_progress()
+    total = queued
 
     # Persist skipped IDs for retry
     if card_type == "basic_land" and skipped_retry_ids:
@@ -6445,7 +6267,7 @@ def report_progress():
         label = f"Progress: processed {processed}/{total} cards (saved {saved}, skipped {skipped})"
         _render_progress(label, final=True)
 
-    return saved, skipped, len(filtered_entries), skipped_details
+    return saved, skipped, entry_count + related_count, skipped_details
 
 
 def _extension_from_url(url: str, default: str = ".png") -> str:
@@ -10908,7 +10730,7 @@ def _download_deck_from_url(url: str) -> tuple[str, str]:
     if "moxfield" in host:
         deck_id = parsed.path.rstrip("/").split("/")[-1]
         api_url = f"https://api.moxfield.com/v2/decks/all/{deck_id}"
-        data = _http_get(api_url, as_json=True, rate_limiter=None)
+        data = _http_get(api_url, as_json=True)
         if not isinstance(data, dict):
             raise click.ClickException("Unexpected response from Moxfield API.")
         deck_name = data.get("name") or deck_id
@@ -10933,7 +10755,7 @@ def _download_deck_from_url(url: str) -> tuple[str, str]:
                 "Could not determine Archidekt deck ID from URL."
             )
         api_url = f"https://archidekt.com/api/decks/{deck_id}/"
-        data = _http_get(api_url, as_json=True, rate_limiter=None)
+        data = _http_get(api_url, as_json=True)
         if not isinstance(data, dict):
             raise click.ClickException("Unexpected response from Archidekt API.")
         deck_name = data.get("name") or deck_id
@@ -10955,7 +10777,7 @@ def _download_deck_from_url(url: str) -> tuple[str, str]:
         # TappedOut provides a text export endpoint
         export_url = f"https://tappedout.net/mtg-decks/{deck_slug}/?fmt=txt"
         try:
-            response = _http_get(export_url, rate_limiter=None)
+            response = _http_get(export_url)
             if isinstance(response, bytes):
                 deck_text = response.decode("utf-8")
             else:
@@ -10994,7 +10816,7 @@ def _download_deck_from_url(url: str) -> tuple[str, str]:
         # MTGGoldfish provides a download endpoint
         download_url = f"https://www.mtggoldfish.com/deck/download/{deck_id}"
         try:
-            response = _http_get(download_url, rate_limiter=None)
+            response = _http_get(download_url)
             if isinstance(response, bytes):
                 deck_text = response.decode("utf-8")
             else:
@@ -41,16 +41,28 @@
 import scryfall_enrich
 
 # User authentication database
+from bulk_paths import bulk_db_path
 from db import users as user_db
+from db.pagination import (
+    DEFAULT_PAGE_SIZE,
+    InvalidCursor,
+    clamp_page_size,
+    page_sorted,
+)
+from db.query_cache import database_generation
 
 try:
-    # Optional DB helper for UA counts
+    # Optional DB helpers for UA counts and paged listings
     from db.bulk_index import count_unique_artworks as db_count_unique_artworks  # type: ignore
+    from db.bulk_index import page_unique_artworks as db_page_unique_artworks  # type: ignore
 except Exception:  # pragma: no cover
 
     def db_count_unique_artworks(*args, **kwargs) -> int:  # type: ignore
         return 0
 
+    def db_page_unique_artworks(*args, **kwargs) -> tuple[list[dict], None]:  # type: ignore
+        return [], None
+
 
 app = Flask(__name__, template_folder="templates")
 app.secret_key = os.environ.get("FLASK_SECRET_KEY", os.urandom(24).hex())
@@ -458,7 +470,7 @@ def _resolve_oracle_ids(name: str, set_code: str | None = None) -> list[str]:
         return oracle_ids
 
     index = create_pdf._load_bulk_index()
-    entries = index.get("entries", {}) if isinstance(index, dict) else {}
+    entries = index.get("entries", {}) if index is not None else {}
     if not entries:
         return oracle_ids
 
@@ -520,15 +532,9 @@ def _token_pack_task(
 def _land_coverage_task(
     buffer: io.StringIO, kind: str, set_code: str | None, out_dir: str | None
 ) -> None:
-    import importlib.util
-
-    cov_path = os.path.join(os.path.dirname(__file__), "coverage.py")
-    spec = importlib.util.spec_from_file_location("pm_coverage", cov_path)
-    if spec is None or spec.loader is None:
+    pm_cov = _coverage_module()
+    if pm_cov is None:
         raise RuntimeError("Unable to load coverage tool module.")
-    assert spec is not None and spec.loader is not None
-    pm_cov = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
-    spec.loader.exec_module(pm_cov)  # type: ignore[attr-defined]
 
     rows, summary = pm_cov.compute_coverage(kind, set_code)
     # Write outputs using coverage helper (land-coverage category)
@@ -2188,39 +2194,113 @@ def download():
     return send_file(abs_path, as_attachment=True)
 
 
+_COVERAGE_MODULE = None
+_COVERAGE_MODULE_LOCK = threading.Lock()
+
+
+def _coverage_module():
+    """Load the coverage tool module once; None if it cannot be loaded."""
+    global _COVERAGE_MODULE
+    with _COVERAGE_MODULE_LOCK:
+        if _COVERAGE_MODULE is None:
+            import importlib.util
+
+            cov_path = os.path.join(os.path.dirname(__file__), "coverage.py")
+            spec = importlib.util.spec_from_file_location("pm_cov", cov_path)
+            if spec is None or spec.loader is None:
+                return None
+            module = importlib.util.module_from_spec(spec)
+            spec.loader.exec_module(module)  # type: ignore[attr-defined]
+            _COVERAGE_MODULE = module
+        return _COVERAGE_MODULE
+
+
+# Coverage rows are cached per (kind, set) so paging through them does not
+# recompute the report. Entries are dropped when the bulk database is rebuilt;
+# the TTL bounds how stale the local-art columns can get.
+COVERAGE_CACHE_TTL = 300
+_COVERAGE_CACHE: dict[tuple[str, str | None], dict] = {}
+_COVERAGE_CACHE_LOCK = threading.Lock()
+
+
+def _coverage_sort_key(row) -> tuple[str, str, str, str]:
+    return (row.name, row.set, row.collector_number, row.id)
+
+
+def _cached_coverage(kind: str, set_code: str | None, missing_only: bool):
+    """Return ``(rows, keys, summary)`` for a coverage listing.
+
+    Rows are sorted by `_coverage_sort_key` and `keys` holds those sort keys
+    for `page_sorted`. Returns None if the coverage module cannot be loaded.
+    """
+    pm_cov = _coverage_module()
+    if pm_cov is None:
+        return None
+    cache_key = (kind, (set_code or "").lower() or None)
+    generation = database_generation(str(bulk_db_path()))
+    now = time.time()
+    with _COVERAGE_CACHE_LOCK:
+        entry = _COVERAGE_CACHE.get(cache_key)
+    if (
+        entry is None
+        or entry["generation"] != generation
+        or now - entry["computed_at"] > COVERAGE_CACHE_TTL
+    ):
+        rows, summary = pm_cov.compute_coverage(kind, set_code)
+        rows.sort(key=_coverage_sort_key)
+        missing = [r for r in rows if not r.has_art]
+        entry = {
+            "generation": generation,
+            "computed_at": now,
+            "summary": summary,
+            "all": (rows, [_coverage_sort_key(r) for r in rows]),
+            "missing": (missing, [_coverage_sort_key(r) for r in missing]),
+        }
+        with _COVERAGE_CACHE_LOCK:
+            _COVERAGE_CACHE[cache_key] = entry
+    rows, keys = entry["missing" if missing_only else "all"]
+    return rows, keys, entry["summary"]
+
+
+def _coverage_item(r) -> dict:
+    return {
+        "id": r.id,
+        "name": r.name,
+        "set": r.set,
+        "collector_number": r.collector_number,
+        "kind": r.kind,
+        "has_art": r.has_art,
+        "local_paths": r.local_paths,
+        "oracle_id": r.oracle_id,
+        "ua_all": r.ua_all,
+        "ua_in_set": r.ua_in_set,
+    }
+
+
+def _page_size_arg(default: int = DEFAULT_PAGE_SIZE) -> int:
+    try:
+        return clamp_page_size(int(request.args.get("page_size") or default))
+    except ValueError:
+        return default
+
+
 @app.route("/coverage", methods=["GET"])
 def coverage_view():
     kind = (request.args.get("kind") or "nonbasic").lower()
     set_code = request.args.get("set")
     missing_only = request.args.get("missing_only") == "1"
-    # Pagination
-    try:
-        page = max(1, int(request.args.get("page") or "1"))
-    except ValueError:
-        page = 1
-    try:
-        page_size = max(1, int(request.args.get("page_size") or "50"))
-    except ValueError:
-        page_size = 50
+    cursor = request.args.get("cursor") or None
+    page_size = _page_size_arg()
 
-    # Load coverage module dynamically
-    import importlib.util
-
-    cov_path = os.path.join(os.path.dirname(__file__), "coverage.py")
-    spec = importlib.util.spec_from_file_location("pm_cov", cov_path)
-    if spec is None or spec.loader is None:
+    cached = _cached_coverage(kind, set_code, missing_only)
+    if cached is None:
         abort(500)
-    assert spec is not None and spec.loader is not None
-    pm_cov = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
-    spec.loader.exec_module(pm_cov)  # type: ignore[attr-defined]
-
-    rows, summary = pm_cov.compute_coverage(kind, set_code)
-    if missing_only:
-        rows = [r for r in rows if not r.has_art]
+    rows, keys, summary = cached
+    try:
+        start, end, next_cursor = page_sorted(keys, cursor, page_size)
+    except InvalidCursor:
+        abort(400)
     total_rows = len(rows)
-    total_pages = (total_rows + page_size - 1) // page_size if page_size else 1
-    start = (page - 1) * page_size
-    end = start + page_size
     page_rows = rows[start:end]
 
     # Simple inline template for drilldown
@@ -2236,7 +2316,6 @@ def coverage_view():
       </select>
       Set: <input type="text" name="set" value="{{ set_code or '' }}">
       Missing only? <input type="checkbox" name="missing_only" value="1" {% if missing_only %}checked{% endif %}>
-      Page: <input type="number" name="page" min="1" value="{{ page }}">
       Page size: <input type="number" name="page_size" min="1" value="{{ page_size }}">
       <button type="submit">Run</button>
       <a href="{{ url_for('index') }}">Back</a>
@@ -2247,7 +2326,7 @@ def coverage_view():
       |
       <a href="{{ url_for('coverage_csv', kind=kind, set=set_code or '', missing_only='1' if missing_only else '0') }}" target="_blank">CSV</a>
     </p>
-    <p>Showing {{ page }} / {{ total_pages }} pages ({{ page_size }} per page), total rows: {{ total_rows }}</p>
+    <p>Showing rows {{ start + 1 if page_rows else 0 }}–{{ end }} ({{ page_size }} per page), total rows: {{ total_rows }}</p>
     <table border="1" cellpadding="4">
       <tr><th>Name</th><th>Set</th><th>Collector</th><th>Kind</th><th>Has Art</th><th>UA (all)</th><th>UA (set)</th><th>Local Paths</th></tr>
       {% for r in page_rows %}
@@ -2264,11 +2343,11 @@ def coverage_view():
       {% endfor %}
     </table>
     <p>
-      {% if page > 1 %}
-        <a href="{{ url_for('coverage_view', kind=kind, set=set_code or '', missing_only='1' if missing_only else '0', page=page-1, page_size=page_size) }}">&laquo; Prev</a>
+      {% if cursor %}
+        <a href="{{ url_for('coverage_view', kind=kind, set=set_code or '', missing_only='1' if missing_only else '0', page_size=page_size) }}">&laquo; First</a>
       {% endif %}
-      {% if page < total_pages %}
-        <a href="{{ url_for('coverage_view', kind=kind, set=set_code or '', missing_only='1' if missing_only else '0', page=page+1, page_size=page_size) }}">Next &raquo;</a>
+      {% if next_cursor %}
+        <a href="{{ url_for('coverage_view', kind=kind, set=set_code or '', missing_only='1' if missing_only else '0', cursor=next_cursor, page_size=page_size) }}">Next &raquo;</a>
       {% endif %}
     </p>
     """
@@ -2279,15 +2358,16 @@ class Obj(dict):
 
     return render_template_string(
         tmpl,
-        rows=rows,
         page_rows=page_rows,
         summary=Obj(summary),
         kind=kind,
         set_code=set_code,
         missing_only=missing_only,
-        page=page,
+        cursor=cursor,
+        next_cursor=next_cursor,
+        start=start,
+        end=end,
         page_size=page_size,
-        total_pages=total_pages,
         total_rows=total_rows,
     )
 
@@ -2295,40 +2375,32 @@ class Obj(dict):
 @app.route("/api/coverage", methods=["GET"])
 @csrf_exempt
 def api_coverage():
+    """Coverage rows as JSON.
+
+    Without `cursor` or `page_size` every row is returned. With either, one
+    page is returned along with `next_cursor` (null on the last page).
+    """
     kind = (request.args.get("kind") or "nonbasic").lower()
     set_code = request.args.get("set") or None
     missing_only = request.args.get("missing_only") in {"1", "true", "yes"}
-    # Load coverage module dynamically
-    import importlib.util
-
-    cov_path = os.path.join(os.path.dirname(__file__), "coverage.py")
-    spec = importlib.util.spec_from_file_location("pm_cov", cov_path)
-    if spec is None or spec.loader is None:
+    cursor = request.args.get("cursor") or None
+    cached = _cached_coverage(kind, set_code, missing_only)
+    if cached is None:
         return jsonify({"error": "module_load_failed"}), 500
-    assert spec is not None and spec.loader is not None
-    pm_cov = importlib.util.module_from_spec(spec)  # type: ignore[arg-type]
-    spec.loader.exec_module(pm_cov)  # type: ignore[attr-defined]
-    rows, summary = pm_cov.compute_coverage(kind, set_code)
-    if missing_only:
-        rows = [r for r in rows if not r.has_art]
-    # Serialize rows
-    items = []
-    for r in rows:
-        items.append(
-            {
-                "id": r.id,
-                "name": r.name,
-                "set": r.set,
-                "collector_number": r.collector_number,
-                "kind": r.kind,
-                "has_art": r.has_art,
-                "local_paths": r.local_paths,
-                "oracle_id": r.oracle_id,
-                "ua_all": r.ua_all,
-                "ua_in_set": r.ua_in_set,
-            }
-        )
-    return jsonify({"summary": summary, "rows": items})
+    rows, keys, summary = cached
+    if cursor is None and not request.args.get("page_size"):
+        return jsonify({"summary": summary, "rows": [_coverage_item(r) for r in rows]})
+    try:
+        start, end, next_cursor = page_sorted(keys, cursor, _page_size_arg())
+    except InvalidCursor:
+        return jsonify({"error": "invalid_cursor"}), 400
+    return jsonify(
+        {
+            "summary": summary,
+            "rows": [_coverage_item(r) for r in rows[start:end]],
+            "next_cursor": next_cursor,
+        }
+    )
 
 
 @app.route("/coverage_csv", methods=["GET"])
@@ -2336,18 +2408,10 @@ def coverage_csv():
     kind = (request.args.get("kind") or "nonbasic").lower()
     set_code = request.args.get("set") or None
     missing_only = request.args.get("missing_only") in {"1", "true", "yes"}
-    # Load coverage module dynamically
-    import importlib.util
-
-    cov_path = os.path.join(os.path.dirname(__file__), "coverage.py")
-    spec = importlib.util.spec_from_file_location("pm_cov", cov_path)
-    if spec is None or spec.loader is None:
+    cached = _cached_coverage(kind, set_code, missing_only)
+    if cached is None:
         return jsonify({"error": "module_load_failed"}), 500
-    pm_cov = importlib.util.module_from_spec(spec)
-    spec.loader.exec_module(pm_cov)  # type: ignore[attr-defined]
-    rows, summary = pm_cov.compute_coverage(kind, set_code)
-    if missing_only:
-        rows = [r for r in rows if not r.has_art]
+    rows, _keys, _summary = cached
     # Build CSV in-memory
     import csv as _csv
     import io as _io
@@ -2388,8 +2452,11 @@ def coverage_csv():
     return Response(csv_bytes, mimetype="text/csv", headers=headers)
 
 
-@app.route("/unique_art", methods=["GET"])
-def unique_art_view():
+def _unique_art_page() -> tuple[list[dict], str | None, int]:
+    """Run the unique-art search described by the request arguments.
+
+    Returns ``(rows, next_cursor, page_size)``; raises `InvalidCursor`.
+    """
     name = (request.args.get("name") or "").strip()
     oracle_id = (request.args.get("oracle_id") or "").strip() or None
     illustration_id = (request.args.get("illustration_id") or "").strip() or None
@@ -2399,15 +2466,11 @@ def unique_art_view():
     frame = (request.args.get("frame") or "").strip() or None
     effect = (request.args.get("effect") or "").strip() or None
     fa_param = request.args.get("full_art")
-    full_art = None
-    if fa_param == "1":
-        full_art = True
-    elif fa_param == "0":
-        full_art = False
+    full_art = True if fa_param == "1" else False if fa_param == "0" else None
     try:
-        limit = int(request.args.get("limit") or "50")
+        limit = clamp_page_size(int(request.args.get("limit") or DEFAULT_PAGE_SIZE))
     except ValueError:
-        limit = 50
+        limit = DEFAULT_PAGE_SIZE
 
     # Resolve oracle_id(s) from name if provided and oracle_id missing
     oracle_ids: list[str] = []
@@ -2415,42 +2478,46 @@ def unique_art_view():
         oracle_ids = _resolve_oracle_ids(name, set_code)
     elif oracle_id:
         oracle_ids = [oracle_id]
+    # Fallback: if name provided but no oracle_id resolved, use name as name_filter
+    name_filter = name_contains if oracle_ids else name_contains or (name or None)
 
-    # Query unique artworks (prefers oracle_id; falls back to illustration_id/name filter)
-    rows: list[dict] = []
     try:
-        if oracle_ids:
-            for oid in oracle_ids:
-                arts = create_pdf.db_query_unique_artworks(
-                    oracle_id=oid,
-                    illustration_id=illustration_id,
-                    set_filter=set_code,
-                    limit=limit,
-                    name_filter=name_contains,
-                    artist_filter=artist,
-                    frame_filter=frame,
-                    frame_effect_contains=effect,
-                    full_art=full_art,
-                )
-                for a in arts:
-                    rows.append(a)
-        else:
-            # Fallback: if name provided but no oracle_id resolved, use name as name_filter
-            fallback_name_filter = name_contains or (name if name else None)
-            arts = create_pdf.db_query_unique_artworks(
-                oracle_id=None,
-                illustration_id=illustration_id,
-                set_filter=set_code,
-                limit=limit,
-                name_filter=fallback_name_filter,
-                artist_filter=artist,
-                frame_filter=frame,
-                frame_effect_contains=effect,
-                full_art=full_art,
-            )
-            rows.extend(arts)
+        rows, next_cursor = db_page_unique_artworks(
+            limit,
+            request.args.get("cursor") or None,
+            oracle_ids=oracle_ids or None,
+            illustration_id=illustration_id,
+            set_filter=set_code,
+            name_filter=name_filter,
+            artist_filter=artist,
+            frame_filter=frame,
+            frame_effect_contains=effect,
+            full_art=full_art,
+        )
+    except InvalidCursor:
+        raise
     except Exception:
-        rows = []
+        rows, next_cursor = [], None
+    return rows, next_cursor, limit
+
+
+@app.route("/unique_art", methods=["GET"])
+def unique_art_view():
+    name = (request.args.get("name") or "").strip()
+    oracle_id = (request.args.get("oracle_id") or "").strip() or None
+    illustration_id = (request.args.get("illustration_id") or "").strip() or None
+    set_code = (request.args.get("set") or "").strip().lower() or None
+    cursor = request.args.get("cursor") or None
+    try:
+        rows, next_cursor, limit = _unique_art_page()
+    except InvalidCursor:
+        abort(400)
+    args = request.args.to_dict()
+    args.pop("cursor", None)
+    first_url = url_for("unique_art_view", **args) if cursor else None
+    next_url = (
+        url_for("unique_art_view", **args, cursor=next_cursor) if next_cursor else None
+    )
 
     # Inline template for unique artworks
     tmpl = """
@@ -2462,7 +2529,7 @@ def unique_art_view():
       Oracle ID: <input type=\"text\" name=\"oracle_id\" value=\"{{ oracle_id or '' }}\">\n
       Illustration ID: <input type=\"text\" name=\"illustration_id\" value=\"{{ illustration_id or '' }}\">\n
       Set: <input type=\"text\" name=\"set\" value=\"{{ set_code or '' }}\">\n
-      Limit: <input type=\"number\" name=\"limit\" min=\"0\" value=\"{{ limit }}\">\n
+      Limit: <input type=\"number\" name=\"limit\" min=\"1\" value=\"{{ limit }}\">\n
       <button type=\"submit\">Search</button>
       <a href=\"{{ url_for('index') }}\">Back</a>
     </form>
@@ -2481,6 +2548,10 @@ def unique_art_view():
       </tr>
       {% endfor %}
     </table>
+    <p>
+      {% if first_url %}<a href=\"{{ first_url }}\">&laquo; First</a>{% endif %}
+      {% if next_url %}<a href=\"{{ next_url }}\">Next &raquo;</a>{% endif %}
+    </p>
     """
     return render_template_string(
         tmpl,
@@ -2490,6 +2561,8 @@ def unique_art_view():
         illustration_id=illustration_id,
         set_code=set_code,
         limit=limit,
+        first_url=first_url,
+        next_url=next_url,
     )
 
 
@@ -2511,60 +2584,16 @@ def api_search():
 @app.route("/api/unique_art", methods=["GET"])
 @csrf_exempt
 def api_unique_art():
-    name = (request.args.get("name") or "").strip()
-    oracle_id = (request.args.get("oracle_id") or "").strip() or None
-    illustration_id = (request.args.get("illustration_id") or "").strip() or None
-    set_code = (request.args.get("set") or "").strip().lower() or None
-    name_contains = (request.args.get("name_contains") or "").strip() or None
-    artist = (request.args.get("artist") or "").strip() or None
-    frame = (request.args.get("frame") or "").strip() or None
-    effect = (request.args.get("effect") or "").strip() or None
-    fa_param = request.args.get("full_art")
-    full_art = True if fa_param == "1" else False if fa_param == "0" else None
-    try:
-        limit = int(request.args.get("limit") or "50")
-    except ValueError:
-        limit = 50
+    """Unique artworks ordered by (name, id), one page per request.
 
-    oracle_ids: list[str] = []
-    if not oracle_id and name:
-        oracle_ids = _resolve_oracle_ids(name, set_code)
-    elif oracle_id:
-        oracle_ids = [oracle_id]
-
-    rows: list[dict] = []
+    `limit` is the page size; pass the returned `next_cursor` as `cursor`
+    to fetch the following page (null on the last page).
+    """
     try:
-        if oracle_ids:
-            for oid in oracle_ids:
-                arts = create_pdf.db_query_unique_artworks(
-                    oracle_id=oid,
-                    illustration_id=illustration_id,
-                    set_filter=set_code,
-                    limit=limit,
-                    name_filter=name_contains,
-                    artist_filter=artist,
-                    frame_filter=frame,
-                    frame_effect_contains=effect,
-                    full_art=full_art,
-                )
-                rows.extend(arts)
-        else:
-            # Fallback: if name provided but no oracle_id resolved, use name as name_filter
-            fallback_name_filter = name_contains or (name if name else None)
-            rows = create_pdf.db_query_unique_artworks(
-                oracle_id=None,
-                illustration_id=illustration_id,
-                set_filter=set_code,
-                limit=limit,
-                name_filter=fallback_name_filter,
-                artist_filter=artist,
-                frame_filter=frame,
-                frame_effect_contains=effect,
-                full_art=full_art,
-            )
-    except Exception:
-        rows = []
-    return jsonify({"count": len(rows), "items": rows})
+        rows, next_cursor, _limit = _unique_art_page()
+    except InvalidCursor:
+        return jsonify({"error": "invalid_cursor"}), 400
+    return jsonify({"count": len(rows), "items": rows, "next_cursor": next_cursor})
 
 
 @app.route("/api/unique_art/counts", methods=["GET"])
@@ -2745,14 +2774,17 @@ def _bulk_db_info() -> dict:
     try:
         import sqlite3
         from db.bulk_index import DB_PATH as BULK_DB_PATH  # type: ignore
+        from db.bulk_index import print_stats  # type: ignore
 
         info["db_path"] = BULK_DB_PATH
         if os.path.exists(BULK_DB_PATH):
+            # Precomputed aggregates; no scan of prints per request
+            stats = print_stats(BULK_DB_PATH)
+            info["prints"] = stats["total"]
+            info["stats"] = stats
             conn = sqlite3.connect(BULK_DB_PATH)
             try:
                 cur = conn.cursor()
-                cur.execute("SELECT COUNT(*) FROM prints")
-                info["prints"] = int(cur.fetchone()[0])
                 cur.execute("SELECT COUNT(*) FROM unique_artworks")
                 info["unique_artworks"] = int(cur.fetchone()[0])
                 # Schema version (stored in meta table if present)
@@ -2789,8 +2821,8 @@ def _bulk_db_info() -> dict:
         imeta = {}
         try:
             if os.path.exists(create_pdf.BULK_INDEX_PATH):
-                idx = create_pdf._read_json_file(create_pdf.BULK_INDEX_PATH)
-                imeta = idx.get("metadata", {})
+                with create_pdf.CardIndex.open(create_pdf.BULK_INDEX_PATH) as idx:
+                    imeta = dict(idx.metadata)
         except Exception:
             imeta = {}
 
@@ -2874,6 +2906,9 @@ def admin_db_maintenance():
     <title>DB Maintenance</title>
     <h1>DB Maintenance</h1>
     <p>prints={{ info.prints }}, unique_artworks={{ info.unique_artworks }}, schema_version={{ info.schema_version or '—' }}, fts5={{ 'yes' if info.fts5 else 'no' }}</p>
+    {% if info.stats %}
+    <p>names={{ info.stats.distinct_names }}, sets={{ info.stats.distinct_sets }}, languages={% for lang, n in info.stats.by_lang.items() %}{{ lang }}:{{ n }}{% if not loop.last %} {% endif %}{% endfor %}</p>
+    {% endif %}
     <p><a href="{{ url_for('index') }}">Back</a></p>
     <p>Tip: pass allow_download=1 to permit network downloads when not offline.</p>
     """
@@ -2919,6 +2954,21 @@ def api_rulings():
     )
 
 
+# Fields the card search UI renders; everything else stays unselected
+_SEARCH_CARD_COLUMNS = (
+    "name",
+    "image_url",
+    "rarity",
+    "set",
+    "set_name",
+    "type_line",
+    "mana_cost",
+    "cmc",
+    "colors",
+    "oracle_text",
+)
+
+
 @app.route("/api/search/cards", methods=["GET"])
 @csrf_exempt
 def api_search_cards():
@@ -2931,7 +2981,9 @@ def api_search_cards():
     - rarity: Rarity filter (common, uncommon, rare, mythic)
     - cmc: Converted mana cost (exact match)
     - set: Set code filter (e.g., "znr", "mh2")
-    - limit: Maximum results (default 50, max 200)
+    - limit: Page size (default 50, max 200)
+    - cursor: `next_cursor` from the previous page; results are ordered by
+      name and resume after that card
     """
     query = (request.args.get("q") or "").strip()
     colors_str = (request.args.get("colors") or "").strip().upper()
@@ -2939,11 +2991,12 @@ def api_search_cards():
     rarity = (request.args.get("rarity") or "").strip().lower()
     cmc_str = request.args.get("cmc")
     set_code = (request.args.get("set") or "").strip().lower() or None
+    cursor = request.args.get("cursor") or None
 
     try:
-        limit = min(int(request.args.get("limit") or "50"), 200)
+        limit = clamp_page_size(int(request.args.get("limit") or DEFAULT_PAGE_SIZE))
     except ValueError:
-        limit = 50
+        limit = DEFAULT_PAGE_SIZE
 
     # Parse colors string into list (e.g., "WUB" -> ["W", "U", "B"])
     colors_filter = list(colors_str) if colors_str else None
@@ -2968,8 +3021,9 @@ def api_search_cards():
                 "db_missing": True
             })
 
-        results = bulk_index.query_cards(
-            limit=limit,
+        results, next_cursor = bulk_index.page_cards(
+            limit,
+            cursor,
             name_filter=query if query else None,
             type_filter=card_type if card_type else None,
             rarity_filter=rarity if rarity else None,
@@ -2978,6 +3032,7 @@ def api_search_cards():
             colors_filter=colors_filter,
             exclude_tokens=True,
             lang_filter="en",
+            columns=_SEARCH_CARD_COLUMNS,
         )
 
         # Format results for frontend
@@ -2999,8 +3054,10 @@ def api_search_cards():
                 }
             )
 
-        return jsonify({"cards": cards, "count": len(cards)})
+        return jsonify({"cards": cards, "count": len(cards), "next_cursor": next_cursor})
 
+    except InvalidCursor:
+        return jsonify({"cards": [], "count": 0, "error": "invalid_cursor"}), 400
     except Exception as e:
         # Fallback to empty results on error
         return jsonify({"cards": [], "count": 0, "error": str(e)})
@@ -4008,6 +4065,8 @@ class Obj(dict):
             <table>
                 <tr><th>Metric</th><th>Value</th></tr>
                 <tr><td>Total Prints</td><td>{{ db_info.prints or 0 }}</td></tr>
+                <tr><td>Unique Names</td><td>{{ db_info.stats.distinct_names if db_info.stats else 0 }}</td></tr>
+                <tr><td>Sets</td><td>{{ db_info.stats.distinct_sets if db_info.stats else 0 }}</td></tr>
                 <tr><td>Unique Artworks</td><td>{{ db_info.unique_artworks or 0 }}</td></tr>
                 <tr><td>Schema Version</td><td>{{ db_info.schema_version or 'N/A' }}</td></tr>
                 <tr><td>FTS5 Enabled</td><td><span class="status {{ 'status-ok' if db_info.fts5 else 'status-warn' }}">{{ 'Yes' if db_info.fts5 else 'No' }}</span></td></tr>
@@ -2,65 +2,42 @@
 Bulk index builder and query interface for Scryfall data.
 """
 
+import functools
 import gzip
+import hashlib
 import json
+import multiprocessing
 import os
+import queue
 import sqlite3
+import threading
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime, timezone
-from typing import Any, Dict, Iterable
+from typing import Any, Dict, Iterable, Iterator
 
+from bulk_json import iter_bulk_json, open_bulk_text
 from bulk_paths import bulk_db_path, bulk_file_path, get_bulk_data_directory
+from db.connection_pool import get_read_pool
+from db.pagination import (
+    clamp_page_size,
+    decode_cursor,
+    keyset_clause,
+    split_page,
+)
 
-# Disk-based caching for query results
-try:
-    from diskcache import Cache
-    from functools import wraps
+from db.query_cache import cached_query, get_cache, stamp_generation
 
-    query_cache = Cache(".cache/db_queries", size_limit=100_000_000)  # 100MB cache
-    CACHE_ENABLED = True
-
-    def cached_query(expire=3600):
-        """Decorator to cache query results for specified time (default 1 hour)."""
-
-        def decorator(func):
-            @wraps(func)
-            def wrapper(*args, **kwargs):
-                # Create cache key from function name and arguments
-                cache_key = (
-                    f"{func.__name__}:{repr(args)}:{repr(sorted(kwargs.items()))}"
-                )
-
-                # Check cache first
-                if cache_key in query_cache:
-                    return query_cache.get(cache_key)
-
-                # Execute query
-                result = func(*args, **kwargs)
-
-                # Store in cache
-                query_cache.set(cache_key, result, expire=expire)
-
-                return result
-
-            return wrapper
-
-        return decorator
-
-except ImportError:
-    query_cache = None  # type: ignore
-    CACHE_ENABLED = False
-
-    def cached_query(expire=3600):
-        """No-op decorator when caching unavailable."""
-
-        def decorator(func):
-            return func
-
-        return decorator
+# Results are shared across processes via diskcache when it is installed and
+# keyed by the database generation, so rebuilds invalidate them immediately
+query_cache = get_cache()
+CACHE_ENABLED = query_cache.persistent
 
 
 # Expected schema version - must match database
-EXPECTED_SCHEMA_VERSION = 6  # Added card_relationships table
+EXPECTED_SCHEMA_VERSION = 8  # Added lowercase search columns and prints_trigram
 
 # Paths are resolved via bulk_paths to support legacy layouts during migration
 BULK_DIR = str(get_bulk_data_directory())
@@ -93,7 +70,7 @@ def _get_unique_artwork_path() -> str:
 # These are now functions - use _get_all_cards_path() and _get_oracle_path() directly
 # Legacy constants removed to avoid stale paths at module load time
 
-SCHEMA_VERSION = 6  # Added card_relationships table
+SCHEMA_VERSION = 8  # Added lowercase search columns and prints_trigram
 
 
 def _get_connection(db_path: str) -> sqlite3.Connection:
@@ -106,6 +83,33 @@ def _get_connection(db_path: str) -> sqlite3.Connection:
     return conn
 
 
+@contextmanager
+def read_session(db_path: str = DB_PATH) -> Iterator[sqlite3.Connection | None]:
+    """Hold one pooled read connection across several queries.
+
+    Pass the yielded connection as `conn=` to the query functions to skip
+    the per-call pool round trip, e.g. in a loop over thousands of cards.
+    Yields None when the database does not exist yet.
+    """
+    if not os.path.exists(db_path):
+        yield None
+        return
+    with get_read_pool(db_path).connection() as conn:
+        yield conn
+
+
+@contextmanager
+def _read_connection(
+    db_path: str, conn: sqlite3.Connection | None
+) -> Iterator[sqlite3.Connection]:
+    """Use the caller's connection if given, else borrow one from the pool."""
+    if conn is not None:
+        yield conn
+        return
+    with get_read_pool(db_path).connection() as pooled:
+        yield pooled
+
+
 def _slugify(text: str | None) -> str:
     if not text:
         return ""
@@ -127,86 +131,8 @@ def _slugify(text: str | None) -> str:
 
 
 def _iter_json_gz(path: str) -> Iterable[Dict[str, Any]]:
-    if not os.path.exists(path):
-        return
-
-    def _iter_from_handle(f) -> Iterable[Dict[str, Any]]:
-        # Peek a small chunk to detect format, tolerating leading whitespace/BOM
-        head = f.read(4096)
-        f.seek(0)
-        if not head:
-            return
-        first_non_ws = None
-        for ch in head:
-            if ch == "\ufeff":
-                continue
-            if ch.isspace():
-                continue
-            first_non_ws = ch
-            break
-        if first_non_ws == "[":
-            try:
-                data = json.load(f)
-            except json.JSONDecodeError:
-                f.seek(0)
-            else:
-                if isinstance(data, list):
-                    for item in data:
-                        if isinstance(item, dict):
-                            yield item
-                return
-        if first_non_ws == "{":
-            # Object wrapper, e.g., {"data": [...]}
-            try:
-                data = json.load(f)
-                if isinstance(data, dict):
-                    arr = data.get("data") or data.get("cards")
-                    if isinstance(arr, list):
-                        for item in arr:
-                            if isinstance(item, dict):
-                                yield item
-                        return
-                    if data:
-                        yield data  # type: ignore[generator-type]
-                        return
-                elif isinstance(data, list):
-                    for item in data:
-                        if isinstance(item, dict):
-                            yield item
-                    return
-            except json.JSONDecodeError:
-                f.seek(0)
-        # NDJSON fallback
-        for line in f:
-            line = line.strip()
-            if not line:
-                continue
-            if line in {"[", "]", "]]"}:
-                continue
-            if line.endswith(","):
-                line = line[:-1].strip()
-            if not line:
-                continue
-            try:
-                obj = json.loads(line)
-            except json.JSONDecodeError:
-                continue
-            if isinstance(obj, dict):
-                yield obj
-
-    # Try gzip first, then fall back to plain text if gzip fails
-    try:
-        with gzip.open(path, "rt", encoding="utf-8") as f:
-            yield from _iter_from_handle(f)
-            return
-    except OSError:
-        pass
-    try:
-        with open(path, "rt", encoding="utf-8") as f:
-            yield from _iter_from_handle(f)
-            return
-    except OSError:
-        return
+    """Stream card objects from a bulk file with bounded memory (see bulk_json)."""
+    return iter_bulk_json(path)
 
 
 def _ensure_schema(conn: sqlite3.Connection) -> None:
@@ -258,7 +184,12 @@ def _ensure_schema(conn: sqlite3.Connection) -> None:
           promo INTEGER NOT NULL DEFAULT 0,
           textless INTEGER NOT NULL DEFAULT 0,
           power TEXT,
-          toughness TEXT
+          toughness TEXT,
+          color_mask INTEGER NOT NULL DEFAULT 0,
+          name_lower TEXT,
+          type_line_lower TEXT,
+          artist_lower TEXT,
+          content_hash TEXT
         );
         """
     )
@@ -288,6 +219,12 @@ def _ensure_schema(conn: sqlite3.Connection) -> None:
         ("all_parts", "TEXT", None),  # JSON array of related cards/tokens
         ("power", "TEXT", None),
         ("toughness", "TEXT", None),
+        ("color_mask", "INTEGER NOT NULL DEFAULT 0", 0),  # COLOR_BITS of colors
+        # Unicode-lowercased copies for substring search (SQLite lower() is ASCII-only)
+        ("name_lower", "TEXT", None),
+        ("type_line_lower", "TEXT", None),
+        ("artist_lower", "TEXT", None),
+        ("content_hash", "TEXT", None),  # Row digest for incremental imports
     ]
     for col, decl, _default in desired:
         if col not in cols:
@@ -304,6 +241,12 @@ def _ensure_schema(conn: sqlite3.Connection) -> None:
     cur.execute("CREATE INDEX IF NOT EXISTS idx_prints_cmc ON prints(cmc);")
     cur.execute("CREATE INDEX IF NOT EXISTS idx_prints_layout ON prints(layout);")
     cur.execute("CREATE INDEX IF NOT EXISTS idx_prints_frame ON prints(frame);")
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_prints_is_token ON prints(is_token);")
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_prints_color_mask ON prints(color_mask);"
+    )
+    # Sort key of the keyset-paginated card search (page_cards)
+    cur.execute("CREATE INDEX IF NOT EXISTS idx_prints_name_id ON prints(name, id);")
     # Unique artworks table (from unique-artwork bulk dump)
     cur.execute(
         """
@@ -330,6 +273,10 @@ def _ensure_schema(conn: sqlite3.Connection) -> None:
     cur.execute(
         "CREATE INDEX IF NOT EXISTS idx_artworks_illustration ON unique_artworks(illustration_id);"
     )
+    cur.execute(
+        "CREATE INDEX IF NOT EXISTS idx_artworks_name_id "
+        "ON unique_artworks(coalesce(name,''), id);"
+    )
 
     # Source files tracking for incremental updates (ETag-based)
     cur.execute(
@@ -386,6 +333,50 @@ def _ensure_schema(conn: sqlite3.Connection) -> None:
         "CREATE INDEX IF NOT EXISTS idx_relationships_type ON card_relationships(relationship_type);"
     )
 
+    # Normalized keyword and legality lookups (derived from prints JSON columns)
+    # Keywords are stored lowercased; legalities omit the implied 'not_legal'
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS print_keywords (
+          print_id TEXT NOT NULL,
+          keyword TEXT NOT NULL,
+          PRIMARY KEY (keyword, print_id)
+        ) WITHOUT ROWID;
+        """
+    )
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS print_legalities (
+          print_id TEXT NOT NULL,
+          format TEXT NOT NULL,
+          status TEXT NOT NULL,
+          PRIMARY KEY (format, status, print_id)
+        ) WITHOUT ROWID;
+        """
+    )
+
+    # Materialized print counts for the stats pages, kept current by every
+    # build and incremental update (see _populate_print_stats)
+    cur.execute(
+        "SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name='print_stats';"
+    )
+    had_stats = bool(cur.fetchone()[0])
+    cur.execute(
+        """
+        CREATE TABLE IF NOT EXISTS print_stats (
+          dimension TEXT NOT NULL,
+          value TEXT NOT NULL,
+          count INTEGER NOT NULL,
+          PRIMARY KEY (dimension, value)
+        ) WITHOUT ROWID;
+        """
+    )
+    _register_stat_functions(conn)
+    if not had_stats:
+        # Upgraded DBs need a baseline before incremental updates adjust it
+        cur.execute("INSERT INTO print_stats (dimension, value, count) " + _stats_sql() + ";")
+        _refresh_stats_summary(cur)
+
     # Asset metadata for quality scoring and duplicate detection
     cur.execute(
         """
@@ -429,6 +420,26 @@ def _ensure_schema(conn: sqlite3.Connection) -> None:
     except sqlite3.DatabaseError:
         # FTS5 not available in this SQLite build; proceed without it
         pass
+    # Trigram index for substring filters (FTS5 trigram needs SQLite 3.34+)
+    cur.execute(
+        "SELECT COUNT(*) FROM sqlite_master WHERE type='table' AND name='prints_trigram';"
+    )
+    had_trigram = bool(cur.fetchone()[0])
+    try:
+        cur.execute(
+            f"""
+            CREATE VIRTUAL TABLE IF NOT EXISTS prints_trigram USING fts5(
+              {_TRIGRAM_COLUMNS},
+              content='prints', content_rowid='rowid', tokenize='trigram'
+            );
+            """
+        )
+        if not had_trigram:
+            # Index rows already in an upgraded DB so incremental deletes stay consistent
+            cur.execute("INSERT INTO prints_trigram(prints_trigram) VALUES('rebuild');")
+    except sqlite3.DatabaseError:
+        # Substring filters fall back to LIKE over the lowercase columns
+        pass
     cur.execute(
         "INSERT OR REPLACE INTO metadata(key,value) VALUES(?,?)",
         ("schema_version", str(SCHEMA_VERSION)),
@@ -452,6 +463,42 @@ def _load_oracle_map() -> dict[str, dict]:
     return oracle
 
 
+_RELATIONSHIP_INSERT_SQL = (
+    "INSERT OR IGNORE INTO card_relationships "
+    "(source_card_id, related_card_id, relationship_type, related_card_name) "
+    "VALUES (?,?,?,?)"
+)
+
+
+def _relationship_rows(card_id: str, all_parts_json: str | None) -> Iterator[tuple]:
+    """Yield card_relationships rows for one print's all_parts JSON."""
+    try:
+        all_parts = json.loads(all_parts_json) if all_parts_json else []
+    except json.JSONDecodeError:
+        return
+
+    if not isinstance(all_parts, list):
+        return
+
+    for part in all_parts:
+        if not isinstance(part, dict):
+            continue
+
+        related_id = part.get("id")
+        related_name = part.get("name", "")
+        component = part.get("component", "")
+
+        # Skip if no ID or component
+        if not related_id or not component:
+            continue
+
+        # Skip self-references
+        if related_id == card_id:
+            continue
+
+        yield (card_id, related_id, component, related_name)
+
+
 def _populate_card_relationships(conn: sqlite3.Connection) -> None:
     """Populate card_relationships table from all_parts field in prints table.
 
@@ -471,49 +518,17 @@ def _populate_card_relationships(conn: sqlite3.Connection) -> None:
     batch_size = 1000
     total_relationships = 0
 
-    for row in cur.fetchall():
-        card_id, all_parts_json = row
-
-        try:
-            all_parts = json.loads(all_parts_json)
-        except json.JSONDecodeError:
-            continue
-
-        if not isinstance(all_parts, list):
-            continue
-
-        for part in all_parts:
-            if not isinstance(part, dict):
-                continue
-
-            related_id = part.get("id")
-            related_name = part.get("name", "")
-            component = part.get("component", "")
-
-            # Skip if no ID or component
-            if not related_id or not component:
-                continue
+    for card_id, all_parts_json in cur.fetchall():
+        relationship_batch.extend(_relationship_rows(card_id, all_parts_json))
 
-            # Skip self-references
-            if related_id == card_id:
-                continue
-
-            relationship_batch.append((card_id, related_id, component, related_name))
-
-            if len(relationship_batch) >= batch_size:
-                cur.executemany(
-                    "INSERT OR IGNORE INTO card_relationships (source_card_id, related_card_id, relationship_type, related_card_name) VALUES (?,?,?,?)",
-                    relationship_batch,
-                )
-                total_relationships += len(relationship_batch)
-                relationship_batch.clear()
+        if len(relationship_batch) >= batch_size:
+            cur.executemany(_RELATIONSHIP_INSERT_SQL, relationship_batch)
+            total_relationships += len(relationship_batch)
+            relationship_batch.clear()
 
     # Flush remaining
     if relationship_batch:
-        cur.executemany(
-            "INSERT OR IGNORE INTO card_relationships (source_card_id, related_card_id, relationship_type, related_card_name) VALUES (?,?,?,?)",
-            relationship_batch,
-        )
+        cur.executemany(_RELATIONSHIP_INSERT_SQL, relationship_batch)
         total_relationships += len(relationship_batch)
 
     conn.commit()
@@ -532,7 +547,583 @@ def _populate_card_relationships(conn: sqlite3.Connection) -> None:
         print(f"      {rel_type}: {rel_count:,}")
 
 
-def build_db_from_bulk_json(db_path: str = DB_PATH) -> None:
+# Bit per WUBRG color; prints.color_mask is the OR of a print's colors
+COLOR_BITS = {"W": 1, "U": 2, "B": 4, "R": 8, "G": 16}
+_ALL_COLORS_MASK = sum(COLOR_BITS.values())
+
+
+def color_mask(colors: Iterable[str] | None) -> int:
+    """Return the COLOR_BITS mask for a list of color letters (unknown letters ignored)."""
+    mask = 0
+    for color in colors or ():
+        mask |= COLOR_BITS.get(str(color).upper(), 0)
+    return mask
+
+
+def _color_filter_masks(colors_filter: Iterable[str]) -> list[int]:
+    """Return every color_mask value that satisfies a colors filter.
+
+    Each requested color must be present ("C" means colorless), so the
+    filter matches the supersets of the requested mask. An unsatisfiable
+    filter (unknown letters, or colorless combined with a color) yields [].
+    """
+    wanted = 0
+    colorless = False
+    for color in colors_filter:
+        color = str(color).upper()
+        if color == "C":
+            colorless = True
+        elif color in COLOR_BITS:
+            wanted |= COLOR_BITS[color]
+        else:
+            return []
+    if colorless:
+        return [0] if wanted == 0 else []
+    return [m for m in range(_ALL_COLORS_MASK + 1) if m & wanted == wanted]
+
+
+# Side-table rows derived from the prints JSON columns with json_each; the
+# `{where}` slot restricts them to a subset of prints (e.g. the delta ids)
+_KEYWORD_FACETS_SQL = (
+    "SELECT p.id, lower(j.value) FROM prints p, json_each(p.keywords) j "
+    "WHERE json_valid(p.keywords) AND j.type = 'text' {where}"
+)
+_LEGALITY_FACETS_SQL = (
+    "SELECT p.id, j.key, j.value FROM prints p, json_each(p.legalities) j "
+    "WHERE json_valid(p.legalities) AND j.type = 'text' "
+    "AND j.value <> 'not_legal' {where}"
+)
+
+
+def _populate_print_facets(conn: sqlite3.Connection) -> None:
+    """Rebuild print_keywords and print_legalities from the prints table."""
+    cur = conn.cursor()
+    cur.execute("DELETE FROM print_keywords;")
+    cur.execute("DELETE FROM print_legalities;")
+    cur.execute(
+        "INSERT OR IGNORE INTO print_keywords (print_id, keyword) "
+        + _KEYWORD_FACETS_SQL.format(where="")
+        + ";"
+    )
+    cur.execute(
+        "INSERT OR IGNORE INTO print_legalities (print_id, format, status) "
+        + _LEGALITY_FACETS_SQL.format(where="")
+        + ";"
+    )
+    conn.commit()
+
+    cur.execute("SELECT COUNT(*) FROM print_keywords;")
+    keywords = cur.fetchone()[0]
+    cur.execute("SELECT COUNT(*) FROM print_legalities;")
+    legalities = cur.fetchone()[0]
+    print(f"    Populated {keywords:,} print keywords and {legalities:,} legalities")
+
+
+# Precedence when a type line names several card types (creature artifacts
+# are creatures); the names match constants.CARD_TYPES
+_TYPE_BUCKETS = (
+    "creature",
+    "planeswalker",
+    "instant",
+    "sorcery",
+    "artifact",
+    "enchantment",
+)
+
+
+def _type_bucket(type_line: str | None, is_token: int, is_basic_land: int) -> str:
+    """Single dashboard type bucket for a print."""
+    if is_token:
+        return "token"
+    if is_basic_land:
+        return "basic_land"
+    lowered = (type_line or "").lower()
+    for bucket in _TYPE_BUCKETS:
+        if bucket in lowered:
+            return bucket
+    return "nonbasic_land" if "land" in lowered else "other"
+
+
+def _register_stat_functions(conn: sqlite3.Connection) -> None:
+    """Expose the Python bucketing used by print_stats to SQL."""
+    conn.create_function("pm_type_bucket", 3, _type_bucket, deterministic=True)
+    conn.create_function(
+        "pm_token_subtype", 1, _token_subtype_from_type_line, deterministic=True
+    )
+
+
+# (dimension, grouping expression, row filter) for each print_stats bucket;
+# 'name' counts back the distinct-name summary
+_STAT_DIMENSIONS = (
+    ("total", "''", ""),
+    ("set", "p.set_code", ""),
+    ("lang", "p.lang", ""),
+    ("rarity", "coalesce(p.rarity,'')", ""),
+    ("type", "pm_type_bucket(p.type_line, p.is_token, p.is_basic_land)", ""),
+    ("token_subtype", "pm_token_subtype(p.type_line)", "AND p.is_token=1"),
+    ("name", "p.name", ""),
+)
+# Summary rows derived from how many distinct values a dimension has
+_STAT_DISTINCT = ("name", "set")
+
+
+def _stats_sql(where: str = "") -> str:
+    """SELECT of (dimension, value, n) aggregate rows over prints, narrowed by `where`."""
+    return " UNION ALL ".join(
+        f"SELECT '{dimension}' AS dimension, {expression} AS value, COUNT(*) AS n "
+        "FROM prints p "
+        f"WHERE 1=1 {extra} {where} GROUP BY 2"
+        for dimension, expression, extra in _STAT_DIMENSIONS
+    )
+
+
+def _refresh_stats_summary(cur: sqlite3.Cursor) -> None:
+    cur.execute("DELETE FROM print_stats WHERE dimension='distinct';")
+    cur.execute(
+        "INSERT INTO print_stats (dimension, value, count) "
+        "SELECT 'distinct', dimension, COUNT(*) FROM print_stats "
+        f"WHERE dimension IN ({','.join('?' * len(_STAT_DISTINCT))}) GROUP BY dimension;",
+        _STAT_DISTINCT,
+    )
+
+
+def _populate_print_stats(conn: sqlite3.Connection) -> None:
+    """Rebuild the print_stats aggregates from the prints table."""
+    cur = conn.cursor()
+    cur.execute("DELETE FROM print_stats;")
+    cur.execute(
+        "INSERT INTO print_stats (dimension, value, count) " + _stats_sql() + ";"
+    )
+    _refresh_stats_summary(cur)
+    conn.commit()
+
+    cur.execute("SELECT COUNT(*) FROM print_stats;")
+    print(f"    Populated {cur.fetchone()[0]:,} aggregate rows")
+
+
+def _apply_delta_stats(cur: sqlite3.Cursor, sign: int) -> None:
+    """Add (sign=1) or subtract (sign=-1) the delta prints from print_stats.
+
+    Call with -1 before delta rows are rewritten or deleted and with 1 after
+    they are written; `_refresh_stats_summary` then updates the totals.
+    """
+    cur.execute(
+        "INSERT INTO print_stats (dimension, value, count) "
+        f"SELECT dimension, value, {sign} * n FROM ({_stats_sql(_DELTA_FILTER)}) WHERE true "
+        "ON CONFLICT(dimension, value) DO UPDATE SET count = count + excluded.count;"
+    )
+    cur.execute("DELETE FROM print_stats WHERE count <= 0;")
+
+
+# Full-rebuild pipeline tuning: cards per worker batch and rows per write transaction
+BUILD_BATCH_SIZE = 2000
+BUILD_COMMIT_ROWS = 100_000
+
+_PRINTS_COLUMNS = (
+    "id",
+    "name",
+    "name_slug",
+    "set_code",
+    "collector_number",
+    "type_line",
+    "is_basic_land",
+    "is_token",
+    "image_url",
+    "oracle_id",
+    "color_identity",
+    "keywords",
+    "oracle_text",
+    "frame",
+    "frame_effects",
+    "full_art",
+    "lang",
+    "artist",
+    "rarity",
+    "cmc",
+    "mana_cost",
+    "colors",
+    "border_color",
+    "layout",
+    "released_at",
+    "set_name",
+    "prices",
+    "legalities",
+    "produced_mana",
+    "illustration_id",
+    "promo",
+    "textless",
+    "all_parts",
+    "power",
+    "toughness",
+    "color_mask",
+    "name_lower",
+    "type_line_lower",
+    "artist_lower",
+    "content_hash",
+)
+
+# Lookup and diff columns derived from the public ones; kept out of entries
+_PRINTS_INTERNAL_COLUMNS = (
+    "color_mask",
+    "name_lower",
+    "type_line_lower",
+    "artist_lower",
+    "content_hash",
+)
+_PRINTS_PUBLIC_COLUMNS = tuple(
+    column for column in _PRINTS_COLUMNS if column not in _PRINTS_INTERNAL_COLUMNS
+)
+
+_PRINTS_INSERT_SQL = (
+    f"INSERT OR REPLACE INTO prints ({', '.join(_PRINTS_COLUMNS)}) "
+    f"VALUES ({','.join('?' * len(_PRINTS_COLUMNS))})"
+)
+
+# Upsert keeps the rowid stable so prints_fts can be patched in place
+_PRINTS_UPSERT_SQL = (
+    f"INSERT INTO prints ({', '.join(_PRINTS_COLUMNS)}) "
+    f"VALUES ({','.join('?' * len(_PRINTS_COLUMNS))}) "
+    "ON CONFLICT(id) DO UPDATE SET "
+    + ", ".join(f"{col}=excluded.{col}" for col in _PRINTS_COLUMNS[1:])
+)
+
+
+def _card_to_row(card: Dict[str, Any], oracle_map: dict[str, dict]) -> tuple | None:
+    """Transform one all-cards entry into a prints row (None when it has no id)."""
+    cid = card.get("id")
+    if not cid:
+        return None
+    name = (card.get("name") or "").strip()
+    name_slug = _slugify(name)
+    set_code = (card.get("set") or "").lower()
+    collector = str(card.get("collector_number") or "").strip()
+    type_line = card.get("type_line") or ""
+    # Add a check for the "layout" key in the card data
+    layout = (card.get("layout") or "").lower()
+    is_token = 1 if (layout == "token" or card.get("component") == "token") else 0
+    is_basic = 1 if "basic land" in type_line.lower() else 0
+
+    image_url = None
+    uris = card.get("image_uris") or {}
+    if isinstance(uris, dict):
+        image_url = uris.get("png") or uris.get("normal") or uris.get("large")
+    # Prefer the Land face for double-faced cards (DFC) when present
+    faces = card.get("card_faces") or []
+    land_face = None
+    if isinstance(faces, list) and faces:
+        for face in faces:
+            if isinstance(face, dict):
+                f_type = (face.get("type_line") or "").lower()
+                if "land" in f_type:
+                    land_face = face
+                    break
+    if land_face:
+        # Use the land face art, falling back to front if URLs missing
+        f_uris = (
+            land_face.get("image_uris") if isinstance(land_face, dict) else None
+        )
+        if isinstance(f_uris, dict):
+            image_url = f_uris.get("png") or f_uris.get("normal") or image_url
+        # Also use the land face name for better folder/file naming
+        lf_name = (land_face.get("name") or "").strip()
+        if lf_name:
+            name = lf_name
+            name_slug = _slugify(name)
+
+    oracle_id = card.get("oracle_id")
+    o = oracle_map.get(oracle_id or "")
+    color_identity = json.dumps(o.get("color_identity") if o else [])
+    keywords = json.dumps(o.get("keywords") if o else [])
+    oracle_text = o.get("oracle_text") if o else None
+    frame = card.get("frame")
+    frame_effects = json.dumps(card.get("frame_effects") or [])
+    full_art = 1 if card.get("full_art") else 0
+
+    lang = card.get("lang", "en")
+    artist = card.get("artist")
+    rarity = card.get("rarity")
+    cmc = card.get("cmc", 0.0)
+    mana_cost = card.get("mana_cost")
+    colors = json.dumps(card.get("colors") or [])
+    colors_mask = color_mask(card.get("colors"))
+    border_color = card.get("border_color")
+    layout = card.get("layout")
+    released_at = card.get("released_at")
+    set_name = card.get("set_name")
+    prices = json.dumps(card.get("prices") or {})
+    legalities = json.dumps(card.get("legalities") or {})
+    produced_mana = json.dumps(card.get("produced_mana") or [])
+    illustration_id = card.get("illustration_id")
+    promo = 1 if card.get("promo") else 0
+    textless = 1 if card.get("textless") else 0
+    all_parts = json.dumps(card.get("all_parts") or [])
+
+    # Power/toughness (primarily for creature tokens)
+    power = card.get("power")
+    toughness = card.get("toughness")
+
+    row = (
+        cid,
+        name,
+        name_slug,
+        set_code,
+        collector,
+        type_line,
+        is_basic,
+        is_token,
+        image_url,
+        oracle_id,
+        color_identity,
+        keywords,
+        oracle_text,
+        frame,
+        frame_effects,
+        full_art,
+        lang,
+        artist,
+        rarity,
+        cmc,
+        mana_cost,
+        colors,
+        border_color,
+        layout,
+        released_at,
+        set_name,
+        prices,
+        legalities,
+        produced_mana,
+        illustration_id,
+        promo,
+        textless,
+        all_parts,
+        power,
+        toughness,
+        colors_mask,
+        name.lower(),
+        type_line.lower(),
+        artist.lower() if artist else None,
+    )
+    # Digest of every derived column, so oracle text changes count as well
+    content_hash = hashlib.blake2b(repr(row).encode(), digest_size=16).hexdigest()
+    return row + (content_hash,)
+
+
+def _decode_card_line(line: str) -> Dict[str, Any] | None:
+    """Decode one line of a one-card-per-line dump (Scryfall layout or NDJSON).
+
+    Returns None for blank and bracket lines; raises ValueError when the line
+    is not valid JSON.
+    """
+    line = line.strip().lstrip("\ufeff")
+    if line.endswith(","):
+        line = line[:-1].rstrip()
+    if not line or line in {"[", "]", "]]"}:
+        return None
+    obj = json.loads(line)
+    return obj if isinstance(obj, dict) else None
+
+
+def _iter_card_batches(
+    path: str, batch_size: int, damage: dict | None = None
+) -> Iterator[list[Any]]:
+    """Stream a bulk file as batches of cards for the transform workers.
+
+    Scryfall dumps hold one card per line, so raw lines are handed on and the
+    workers share the JSON decoding. Any other layout falls back to the dicts
+    produced by _iter_json_gz. A Scryfall dump that opens with "[" but does
+    not end with "]" sets damage["truncated"].
+    """
+    if not os.path.exists(path):
+        return
+
+    with open_bulk_text(path) as f:
+        batch: list[Any] = []
+        opened = False
+        for line in f:
+            stripped = line.strip().lstrip("\ufeff")
+            if not stripped:
+                continue
+            if stripped == "[":
+                opened = True
+                continue
+            try:
+                first = _decode_card_line(stripped)
+            except ValueError:
+                first = None
+            if first is None or "id" not in first:
+                break
+            batch.append(stripped)
+            last = stripped
+            for rest in f:
+                batch.append(rest)
+                if not rest.isspace():
+                    last = rest
+                if len(batch) >= batch_size:
+                    yield batch
+                    batch = []
+            if opened and damage is not None and last.strip() not in {"]", "]]"}:
+                damage["truncated"] = True
+            if batch:
+                yield batch
+            return
+
+    batch = []
+    for card in _iter_json_gz(path):
+        batch.append(card)
+        if len(batch) >= batch_size:
+            yield batch
+            batch = []
+    if batch:
+        yield batch
+
+
+def _read_ahead(batches: Iterator[list[Any]], depth: int) -> Iterator[list[Any]]:
+    """Run the streaming/decompression stage on its own thread."""
+    buffer: queue.Queue = queue.Queue(maxsize=depth)
+    done = object()
+    stop = threading.Event()
+    failure: list[BaseException] = []
+
+    def put(item: Any) -> None:
+        while not stop.is_set():
+            try:
+                buffer.put(item, timeout=0.1)
+                return
+            except queue.Full:
+                continue
+
+    def produce() -> None:
+        try:
+            for batch in batches:
+                if stop.is_set():
+                    return
+                put(batch)
+        except BaseException as exc:  # re-raised on the consumer side
+            failure.append(exc)
+        finally:
+            put(done)
+
+    reader = threading.Thread(target=produce, name="bulk-reader", daemon=True)
+    reader.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is done:
+                break
+            yield item
+    finally:
+        stop.set()
+        reader.join()
+    if failure:
+        raise failure[0]
+
+
+def _cards_to_rows(batch: list[Any], oracle_map: dict[str, dict]) -> tuple[list[tuple], int]:
+    """Transform a batch into prints rows, counting lines that failed to decode."""
+    rows = []
+    undecodable = 0
+    for item in batch:
+        if isinstance(item, str):
+            try:
+                card = _decode_card_line(item)
+            except ValueError:
+                undecodable += 1
+                continue
+        else:
+            card = item
+        if card is None:
+            continue
+        row = _card_to_row(card, oracle_map)
+        if row is not None:
+            rows.append(row)
+    return rows, undecodable
+
+
+# Per-process oracle map for build workers
+_worker_oracle_map: dict[str, dict] = {}
+
+
+def _init_build_worker(oracle_map: dict[str, dict]) -> None:
+    global _worker_oracle_map
+    _worker_oracle_map = oracle_map
+
+
+def _transform_batch_in_worker(batch: list[Any]) -> tuple[list[tuple], int]:
+    return _cards_to_rows(batch, _worker_oracle_map)
+
+
+def _iter_print_rows(
+    path: str,
+    oracle_map: dict[str, dict],
+    workers: int = 1,
+    batch_size: int = BUILD_BATCH_SIZE,
+    damage: dict | None = None,
+) -> Iterator[list[tuple]]:
+    """Yield prints rows in file order, one list per batch.
+
+    A reader thread streams and decompresses the bulk file while `workers`
+    processes decode and transform batches. With one worker the transform
+    runs in-process.
+
+    Lines that fail to decode are skipped. Once the rows are exhausted,
+    `damage` holds their count under "undecodable" and "truncated" when the
+    dump lacks its closing "]"; it stays empty for a clean dump.
+    """
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+
+    def tally(result: tuple[list[tuple], int]) -> list[tuple]:
+        rows, undecodable = result
+        if undecodable and damage is not None:
+            damage["undecodable"] = damage.get("undecodable", 0) + undecodable
+        return rows
+
+    batches = _read_ahead(_iter_card_batches(path, batch_size, damage), depth=workers * 2)
+    if workers == 1:
+        for batch in batches:
+            yield tally(_cards_to_rows(batch, oracle_map))
+        return
+
+    # spawn: the builder may run next to threads (reader stage, dashboard)
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=context,
+        initializer=_init_build_worker,
+        initargs=(oracle_map,),
+    ) as executor:
+        pending: deque = deque()
+        for batch in batches:
+            pending.append(executor.submit(_transform_batch_in_worker, batch))
+            if len(pending) >= workers * 2:
+                yield tally(pending.popleft().result())
+        while pending:
+            yield tally(pending.popleft().result())
+
+
+def _drop_prints_indexes(conn: sqlite3.Connection) -> list[str]:
+    """Drop secondary indexes on prints and return their SQL for recreation."""
+    cur = conn.cursor()
+    cur.execute(
+        "SELECT name, sql FROM sqlite_master "
+        "WHERE type='index' AND tbl_name='prints' AND sql IS NOT NULL;"
+    )
+    indexes = cur.fetchall()
+    for name, _sql in indexes:
+        cur.execute(f'DROP INDEX IF EXISTS "{name}";')
+    conn.commit()
+    return [sql for _name, sql in indexes]
+
+
+def build_db_from_bulk_json(db_path: str = DB_PATH, workers: int = 0) -> None:
+    """Rebuild the prints database from the all-cards and oracle bulk dumps.
+
+    Args:
+        db_path: SQLite database to (re)build
+        workers: Transform worker processes (0 = one per CPU)
+    """
+    if workers <= 0:
+        workers = os.cpu_count() or 1
     print("Building bulk database from JSON data...")
     os.makedirs(BULK_DIR, exist_ok=True)
 
@@ -559,173 +1150,69 @@ def build_db_from_bulk_json(db_path: str = DB_PATH) -> None:
         oracle_count = len(oracle_map)
         print(f"    Loaded {oracle_count:,} oracle entries")
 
-        batch: list[tuple] = []
-        batch_size = 500  # Reduced from 1000 for lower memory usage
-
-        def flush() -> None:
-            if not batch:
-                return
-            cur.executemany(
-                """
-                INSERT OR REPLACE INTO prints (
-                  id, name, name_slug, set_code, collector_number, type_line,
-                  is_basic_land, is_token, image_url, oracle_id,
-                  color_identity, keywords, oracle_text, frame, frame_effects, full_art, lang,
-                  artist, rarity, cmc, mana_cost, colors, border_color, layout,
-                  released_at, set_name, prices, legalities, produced_mana,
-                  illustration_id, promo, textless, all_parts,
-                  power, toughness
-                ) VALUES (?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?,?)
-                """,
-                batch,
-            )
-            conn.commit()
-            batch.clear()
-
-        print("  Processing card data from all-cards bulk JSON...")
+        print(f"  Processing card data from all-cards bulk JSON ({workers} workers)...")
         total_cards = 0
         progress_interval = 10000  # Report progress every 10k cards
-
-        for card in _iter_json_gz(_get_all_cards_path()):
-            cid = card.get("id")
-            if not cid:
-                continue
-            total_cards += 1
+        next_report = progress_interval
+
+        # Load into a bare table inside large transactions; the rebuild
+        # starts from scratch, so durability mid-load buys nothing.
+        cur.execute("PRAGMA synchronous = OFF;")
+        cur.execute("PRAGMA temp_store = MEMORY;")
+        cur.execute("PRAGMA cache_size = -262144;")  # 256MB
+        index_sql = _drop_prints_indexes(conn)
+
+        started = time.perf_counter()
+        pending_rows = 0
+        for rows in _iter_print_rows(_get_all_cards_path(), oracle_map, workers):
+            cur.executemany(_PRINTS_INSERT_SQL, rows)
+            total_cards += len(rows)
+            pending_rows += len(rows)
+            if pending_rows >= BUILD_COMMIT_ROWS:
+                conn.commit()
+                pending_rows = 0
 
             # Progress reporting
-            if total_cards % progress_interval == 0:
-                print(f"    Processed {total_cards:,} cards...")
-            name = (card.get("name") or "").strip()
-            name_slug = _slugify(name)
-            set_code = (card.get("set") or "").lower()
-            collector = str(card.get("collector_number") or "").strip()
-            type_line = card.get("type_line") or ""
-            # Add a check for the "layout" key in the card data
-            layout = (card.get("layout") or "").lower()
-            is_token = (
-                1 if (layout == "token" or card.get("component") == "token") else 0
-            )
-            is_basic = 1 if "basic land" in type_line.lower() else 0
-
-            image_url = None
-            uris = card.get("image_uris") or {}
-            if isinstance(uris, dict):
-                image_url = uris.get("png") or uris.get("normal") or uris.get("large")
-            # Prefer the Land face for double-faced cards (DFC) when present
-            faces = card.get("card_faces") or []
-            land_face = None
-            if isinstance(faces, list) and faces:
-                for face in faces:
-                    if isinstance(face, dict):
-                        f_type = (face.get("type_line") or "").lower()
-                        if "land" in f_type:
-                            land_face = face
-                            break
-            if land_face:
-                # Use the land face art, falling back to front if URLs missing
-                f_uris = (
-                    land_face.get("image_uris") if isinstance(land_face, dict) else None
-                )
-                if isinstance(f_uris, dict):
-                    image_url = f_uris.get("png") or f_uris.get("normal") or image_url
-                # Also use the land face name for better folder/file naming
-                lf_name = (land_face.get("name") or "").strip()
-                if lf_name:
-                    name = lf_name
-                    name_slug = _slugify(name)
-
-            oracle_id = card.get("oracle_id")
-            o = oracle_map.get(oracle_id or "")
-            color_identity = json.dumps(o.get("color_identity") if o else [])
-            keywords = json.dumps(o.get("keywords") if o else [])
-            oracle_text = o.get("oracle_text") if o else None
-            frame = card.get("frame")
-            frame_effects = json.dumps(card.get("frame_effects") or [])
-            full_art = 1 if card.get("full_art") else 0
-
-            lang = card.get("lang", "en")
-            artist = card.get("artist")
-            rarity = card.get("rarity")
-            cmc = card.get("cmc", 0.0)
-            mana_cost = card.get("mana_cost")
-            colors = json.dumps(card.get("colors") or [])
-            border_color = card.get("border_color")
-            layout = card.get("layout")
-            released_at = card.get("released_at")
-            set_name = card.get("set_name")
-            prices = json.dumps(card.get("prices") or {})
-            legalities = json.dumps(card.get("legalities") or {})
-            produced_mana = json.dumps(card.get("produced_mana") or [])
-            illustration_id = card.get("illustration_id")
-            promo = 1 if card.get("promo") else 0
-            textless = 1 if card.get("textless") else 0
-            all_parts = json.dumps(card.get("all_parts") or [])
-
-            # Power/toughness (primarily for creature tokens)
-            power = card.get("power")
-            toughness = card.get("toughness")
-
-            batch.append(
-                (
-                    cid,
-                    name,
-                    name_slug,
-                    set_code,
-                    collector,
-                    type_line,
-                    is_basic,
-                    is_token,
-                    image_url,
-                    oracle_id,
-                    color_identity,
-                    keywords,
-                    oracle_text,
-                    frame,
-                    frame_effects,
-                    full_art,
-                    lang,
-                    artist,
-                    rarity,
-                    cmc,
-                    mana_cost,
-                    colors,
-                    border_color,
-                    layout,
-                    released_at,
-                    set_name,
-                    prices,
-                    legalities,
-                    produced_mana,
-                    illustration_id,
-                    promo,
-                    textless,
-                    all_parts,
-                    power,
-                    toughness,
-                )
-            )
-            if len(batch) >= batch_size:
-                flush()
-        flush()
-        print(f"    Completed processing {total_cards:,} cards")
+            if total_cards >= next_report:
+                rate = total_cards / max(time.perf_counter() - started, 1e-9)
+                print(f"    Processed {total_cards:,} cards... ({rate:,.0f} cards/s)")
+                next_report = (total_cards // progress_interval + 1) * progress_interval
+        conn.commit()
+        elapsed = time.perf_counter() - started
+        cards_per_sec = total_cards / elapsed if elapsed > 0 else 0.0
+
+        print(
+            f"    Completed processing {total_cards:,} cards "
+            f"in {elapsed:.1f}s ({cards_per_sec:,.0f} cards/s)"
+        )
+        print(f"  Rebuilding {len(index_sql)} prints indexes...")
+        for sql in index_sql:
+            cur.execute(sql)
+        conn.commit()
+        cur.execute("PRAGMA synchronous = NORMAL;")
 
         # Rebuild FTS over prints
-        print("  Building full-text search index...")
-        try:
-            cur.execute("DELETE FROM prints_fts;")
-            cur.execute(
-                "INSERT INTO prints_fts(rowid,name,oracle_text,type_line,set_code,name_slug) "
-                "SELECT rowid,name,oracle_text,type_line,set_code,name_slug FROM prints;"
-            )
-            conn.commit()
-        except sqlite3.DatabaseError:
-            # FTS not available or disabled, continue without failing build
-            pass
+        print("  Building full-text search indexes...")
+        for table in ("prints_fts", "prints_trigram"):
+            try:
+                # External-content tables must be rebuilt through the FTS5 command;
+                # a plain DELETE reads the new prints rows and corrupts the index.
+                cur.execute(f"INSERT INTO {table}({table}) VALUES('rebuild');")
+                conn.commit()
+            except sqlite3.DatabaseError:
+                # FTS not available or disabled, continue without failing build
+                pass
 
         # Populate card relationships from all_parts
         print("  Populating card relationships...")
         _populate_card_relationships(conn)
 
+        print("  Populating keyword and legality lookups...")
+        _populate_print_facets(conn)
+
+        print("  Populating aggregate statistics...")
+        _populate_print_stats(conn)
+
         # All artwork data is now included in all-cards.json.gz
         # No separate unique artwork processing needed
 
@@ -737,7 +1224,10 @@ def flush() -> None:
             "INSERT OR REPLACE INTO metadata(key,value) VALUES(?,?)",
             ("build_info", json.dumps(meta)),
         )
+        _record_source_files(conn, _source_fingerprints())
+        previous_generation = stamp_generation(conn)
         conn.commit()
+        get_cache().evict_generation(previous_generation)
         # Simple build summary
         cur.execute("SELECT COUNT(*) FROM prints;")
         count = cur.fetchone()[0]
@@ -752,6 +1242,7 @@ def flush() -> None:
         print("Database build completed successfully!")
         print("  Summary:")
         print(f"    Cards processed: {total_cards:,}")
+        print(f"    Throughput: {cards_per_sec:,.0f} cards/s")
         print(f"    Oracle entries: {oracle_count:,}")
         print(f"    Database rows: {count:,}")
         print(f"    Data sources: all-cards.gz={a_sz:,}B, oracle.gz={o_sz:,}B")
@@ -790,18 +1281,316 @@ def _peek(path: str) -> str:
         conn.close()
 
 
-def verify(db_path: str = DB_PATH) -> int:
-    """Return 0 if the DB looks healthy, non-zero otherwise.
+def _file_sha256(path: str) -> str:
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
 
-    Checks:
-    - DB exists and is readable
-    - schema_version matches SCHEMA_VERSION
-    - prints table has rows
-    - FTS table presence
-    - Bulk JSON files present (warn-only if missing)
-    """
-    if not os.path.exists(db_path):
-        print("DB not found. Build it first.")
+
+def _source_fingerprints() -> dict[str, tuple[str, str]]:
+    """Return {name: (sha256, last_modified)} for the bulk files an import reads."""
+    fingerprints = {}
+    for name, path in (
+        ("all-cards", _get_all_cards_path()),
+        ("oracle-cards", _get_oracle_path()),
+    ):
+        if os.path.exists(path):
+            modified = datetime.fromtimestamp(os.path.getmtime(path), timezone.utc)
+            fingerprints[name] = (
+                _file_sha256(path),
+                modified.strftime("%Y-%m-%dT%H:%M:%SZ"),
+            )
+    return fingerprints
+
+
+def _record_source_files(
+    conn: sqlite3.Connection, fingerprints: dict[str, tuple[str, str]]
+) -> None:
+    imported_at = datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ")
+    conn.executemany(
+        "INSERT OR REPLACE INTO source_files(name, etag, last_modified, sha256, imported_at) "
+        "VALUES (?, NULL, ?, ?, ?)",
+        [
+            (name, modified, sha256, imported_at)
+            for name, (sha256, modified) in fingerprints.items()
+        ],
+    )
+
+
+def _sources_unchanged(
+    conn: sqlite3.Connection, fingerprints: dict[str, tuple[str, str]]
+) -> bool:
+    """True when every bulk file matches the checksum recorded at the last import."""
+    cur = conn.cursor()
+    cur.execute("SELECT name, sha256 FROM source_files;")
+    recorded = dict(cur.fetchall())
+    return bool(fingerprints) and all(
+        recorded.get(name) == sha256 for name, (sha256, _modified) in fingerprints.items()
+    )
+
+
+def _fts_tables(conn: sqlite3.Connection) -> list[tuple[str, str]]:
+    """Return (table, columns) for each external-content FTS index on prints."""
+    cur = conn.cursor()
+    cur.execute("SELECT name FROM sqlite_master WHERE type='table';")
+    present = {row[0] for row in cur.fetchall()}
+    return [
+        (table, columns)
+        for table, columns in (
+            ("prints_fts", _FTS_COLUMNS),
+            ("prints_trigram", _TRIGRAM_COLUMNS),
+        )
+        if table in present
+    ]
+
+
+_ALL_PARTS_INDEX = _PRINTS_COLUMNS.index("all_parts")
+
+_FTS_COLUMNS = "name,oracle_text,type_line,set_code,name_slug"
+_TRIGRAM_COLUMNS = "name_lower,type_line_lower,artist_lower"
+
+
+def _stage_delta_ids(cur: sqlite3.Cursor, ids: Iterable[str]) -> None:
+    """Load ids into the delta_ids temp table used by the set-based patches."""
+    cur.execute("CREATE TEMP TABLE IF NOT EXISTS delta_ids (id TEXT PRIMARY KEY);")
+    cur.execute("DELETE FROM delta_ids;")
+    cur.executemany("INSERT OR IGNORE INTO delta_ids(id) VALUES (?)", ((i,) for i in ids))
+
+
+def _fts_remove_delta(cur: sqlite3.Cursor, fts_tables: list[tuple[str, str]]) -> None:
+    # External-content FTS5 needs the old values to drop a row from the index
+    for table, columns in fts_tables:
+        cur.execute(
+            f"INSERT INTO {table}({table},rowid,{columns}) "
+            f"SELECT 'delete',rowid,{columns} FROM prints "
+            "WHERE id IN (SELECT id FROM delta_ids);"
+        )
+
+
+def _fts_insert_delta(cur: sqlite3.Cursor, fts_tables: list[tuple[str, str]]) -> None:
+    for table, columns in fts_tables:
+        cur.execute(
+            f"INSERT INTO {table}(rowid,{columns}) "
+            f"SELECT rowid,{columns} FROM prints "
+            "WHERE id IN (SELECT id FROM delta_ids);"
+        )
+
+
+_DELTA_FILTER = "AND p.id IN (SELECT id FROM delta_ids)"
+
+
+def _remove_delta_facets(cur: sqlite3.Cursor) -> None:
+    # Keyed by the stored JSON values, so every delete is a primary key lookup
+    cur.execute(
+        "DELETE FROM print_keywords WHERE (print_id, keyword) IN ("
+        + _KEYWORD_FACETS_SQL.format(where=_DELTA_FILTER)
+        + ");"
+    )
+    cur.execute(
+        "DELETE FROM print_legalities WHERE (print_id, format, status) IN ("
+        + _LEGALITY_FACETS_SQL.format(where=_DELTA_FILTER)
+        + ");"
+    )
+
+
+def _insert_delta_facets(cur: sqlite3.Cursor) -> None:
+    cur.execute(
+        "INSERT OR IGNORE INTO print_keywords (print_id, keyword) "
+        + _KEYWORD_FACETS_SQL.format(where=_DELTA_FILTER)
+        + ";"
+    )
+    cur.execute(
+        "INSERT OR IGNORE INTO print_legalities (print_id, format, status) "
+        + _LEGALITY_FACETS_SQL.format(where=_DELTA_FILTER)
+        + ";"
+    )
+
+
+def _upsert_prints(
+    conn: sqlite3.Connection, rows: list[tuple], fts_tables: list[tuple[str, str]]
+) -> None:
+    """Upsert changed prints, patching prints_fts and the derived tables for their ids."""
+    if not rows:
+        return
+    cur = conn.cursor()
+    _stage_delta_ids(cur, (row[0] for row in rows))
+    _fts_remove_delta(cur, fts_tables)
+    _remove_delta_facets(cur)
+    _apply_delta_stats(cur, -1)
+    cur.executemany(_PRINTS_UPSERT_SQL, rows)
+    _fts_insert_delta(cur, fts_tables)
+    _apply_delta_stats(cur, 1)
+    cur.execute(
+        "DELETE FROM card_relationships WHERE source_card_id IN (SELECT id FROM delta_ids);"
+    )
+    cur.executemany(
+        _RELATIONSHIP_INSERT_SQL,
+        [rel for row in rows for rel in _relationship_rows(row[0], row[_ALL_PARTS_INDEX])],
+    )
+    _insert_delta_facets(cur)
+    conn.commit()
+
+
+def _delete_prints(
+    conn: sqlite3.Connection, ids: list[str], fts_tables: list[tuple[str, str]]
+) -> None:
+    """Delete prints that vanished from the bulk dump, with their FTS and derived rows."""
+    cur = conn.cursor()
+    for start in range(0, len(ids), BUILD_COMMIT_ROWS):
+        _stage_delta_ids(cur, ids[start : start + BUILD_COMMIT_ROWS])
+        _fts_remove_delta(cur, fts_tables)
+        _remove_delta_facets(cur)
+        _apply_delta_stats(cur, -1)
+        cur.execute("DELETE FROM prints WHERE id IN (SELECT id FROM delta_ids);")
+        cur.execute(
+            "DELETE FROM card_relationships "
+            "WHERE source_card_id IN (SELECT id FROM delta_ids);"
+        )
+        conn.commit()
+
+
+def update_db_from_bulk_json(db_path: str = DB_PATH, workers: int = 0) -> None:
+    """Apply the current bulk dumps to an existing database incrementally.
+
+    Incoming cards are diffed against each print's content_hash: only new or
+    changed prints are upserted, prints missing from the dump are deleted
+    (unless the dump is truncated or has lines that fail to decode),
+    and the FTS indexes, card_relationships, print_keywords,
+    print_legalities and print_stats are patched for just those ids. Any
+    change gives the database a new cache generation, invalidating cached
+    query results.
+    Falls back to a full build when the database does not exist yet.
+
+    Args:
+        db_path: SQLite database to update
+        workers: Transform worker processes (0 = one per CPU)
+    """
+    if not os.path.exists(db_path):
+        print("No existing database; running a full build instead.")
+        build_db_from_bulk_json(db_path, workers=workers)
+        return
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+    print("Updating bulk database from JSON data...")
+
+    fingerprints = _source_fingerprints()
+    if "all-cards" not in fingerprints:
+        print("⚠️  all-cards bulk file not found; nothing to import.")
+        return
+
+    conn = _get_connection(db_path)
+    try:
+        _ensure_schema(conn)
+        if _sources_unchanged(conn, fingerprints):
+            print("  Bulk files unchanged since the last import; nothing to do.")
+            return
+        cur = conn.cursor()
+
+        print("  Loading oracle data...")
+        oracle_map = _load_oracle_map()
+        print(f"    Loaded {len(oracle_map):,} oracle entries")
+
+        cur.execute("SELECT id, content_hash FROM prints;")
+        stored = dict(cur.fetchall())
+        print(f"    Loaded {len(stored):,} stored prints")
+        fts_tables = _fts_tables(conn)
+
+        print(f"  Diffing card data against stored prints ({workers} workers)...")
+        total_cards = added = changed = 0
+        progress_interval = 10000
+        next_report = progress_interval
+        pending: list[tuple] = []
+        missing = object()
+        damage: dict = {}
+        started = time.perf_counter()
+        for rows in _iter_print_rows(_get_all_cards_path(), oracle_map, workers, damage=damage):
+            total_cards += len(rows)
+            for row in rows:
+                previous = stored.pop(row[0], missing)
+                if previous == row[-1]:
+                    continue
+                if previous is missing:
+                    added += 1
+                else:
+                    changed += 1
+                pending.append(row)
+            if len(pending) >= BUILD_COMMIT_ROWS:
+                _upsert_prints(conn, pending, fts_tables)
+                pending = []
+
+            if total_cards >= next_report:
+                rate = total_cards / max(time.perf_counter() - started, 1e-9)
+                print(f"    Processed {total_cards:,} cards... ({rate:,.0f} cards/s)")
+                next_report = (total_cards // progress_interval + 1) * progress_interval
+
+        if total_cards == 0:
+            # An empty or unreadable dump must never wipe the database
+            print("⚠️  No cards parsed from all-cards bulk file; database left unchanged.")
+            return
+
+        _upsert_prints(conn, pending, fts_tables)
+        if damage:
+            # A damaged dump does not list every live print, so nothing it
+            # leaves out may be deleted; the sources stay unrecorded to retry
+            problems = []
+            if damage.get("undecodable"):
+                problems.append(f"{damage['undecodable']:,} lines failed to decode")
+            if damage.get("truncated"):
+                problems.append("missing closing ]")
+            print(
+                f"⚠️  all-cards bulk file is damaged ({', '.join(problems)}); "
+                f"kept {len(stored):,} prints it does not list."
+            )
+            removed = []
+        else:
+            removed = list(stored)
+        _delete_prints(conn, removed, fts_tables)
+        _refresh_stats_summary(cur)
+        elapsed = time.perf_counter() - started
+        cards_per_sec = total_cards / elapsed if elapsed > 0 else 0.0
+
+        meta = {
+            "built_at": datetime.now(timezone.utc).strftime("%Y-%m-%dT%H:%M:%SZ"),
+            "mode": "incremental",
+            "added": added,
+            "changed": changed,
+            "removed": len(removed),
+        }
+        cur.execute(
+            "INSERT OR REPLACE INTO metadata(key,value) VALUES(?,?)",
+            ("build_info", json.dumps(meta)),
+        )
+        if not damage:
+            _record_source_files(conn, fingerprints)
+        previous_generation = stamp_generation(conn)
+        conn.commit()
+        get_cache().evict_generation(previous_generation)
+
+        print("Database update completed successfully!")
+        print("  Summary:")
+        print(f"    Cards processed: {total_cards:,} ({cards_per_sec:,.0f} cards/s)")
+        print(f"    Added: {added:,}")
+        print(f"    Changed: {changed:,}")
+        print(f"    Removed: {len(removed):,}")
+        print(f"    Unchanged: {total_cards - added - changed:,}")
+    finally:
+        conn.close()
+
+
+def verify(db_path: str = DB_PATH) -> int:
+    """Return 0 if the DB looks healthy, non-zero otherwise.
+
+    Checks:
+    - DB exists and is readable
+    - schema_version matches SCHEMA_VERSION
+    - prints table has rows
+    - FTS table presence
+    - Bulk JSON files present (warn-only if missing)
+    """
+    if not os.path.exists(db_path):
+        print("DB not found. Build it first.")
         return 2
     conn = _get_connection(db_path)
     try:
@@ -907,6 +1696,59 @@ def _row_to_art(entry: tuple) -> Dict[str, Any]:
     }
 
 
+def _unique_art_clauses(
+    oracle_id: str | Iterable[str] | None,
+    illustration_id: str | None,
+    set_filter: str | None,
+    name_filter: str | None,
+    artist_filter: str | None,
+    frame_filter: str | None,
+    frame_effect_contains: str | None,
+    full_art: bool | None,
+) -> tuple[list[str], list[Any]]:
+    """WHERE clauses and parameters shared by the unique_artworks queries.
+
+    `oracle_id` may be a single id or a list of ids.
+    """
+    clauses = ["1=1"]
+    params: list[Any] = []
+    if isinstance(oracle_id, str):
+        clauses.append("oracle_id=?")
+        params.append(oracle_id)
+    elif oracle_id:
+        oracle_ids = list(oracle_id)
+        clauses.append(f"oracle_id IN ({','.join('?' * len(oracle_ids))})")
+        params.extend(oracle_ids)
+    if illustration_id:
+        clauses.append("illustration_id=?")
+        params.append(illustration_id)
+    if set_filter:
+        clauses.append("set_code=?")
+        params.append((set_filter or "").lower())
+    if name_filter:
+        clauses.append("name_slug LIKE ?")
+        params.append(f"%{_slugify(name_filter)}%")
+    if artist_filter:
+        clauses.append("lower(coalesce(artist,'')) LIKE ?")
+        params.append(f"%{(artist_filter or '').strip().lower()}%")
+    if frame_filter:
+        clauses.append("frame=?")
+        params.append(frame_filter)
+    if frame_effect_contains:
+        clauses.append("lower(coalesce(frame_effects,'')) LIKE ?")
+        params.append(f"%{(frame_effect_contains or '').strip().lower()}%")
+    if full_art is not None:
+        clauses.append("full_art=?")
+        params.append(1 if full_art else 0)
+    return clauses, params
+
+
+_UNIQUE_ART_SELECT = (
+    "SELECT id,oracle_id,illustration_id,name,name_slug,set_code,collector_number,type_line,"
+    "image_url,artist,frame,frame_effects,full_art FROM unique_artworks WHERE "
+)
+
+
 def query_unique_artworks(
     oracle_id: str | None = None,
     illustration_id: str | None = None,
@@ -919,50 +1761,82 @@ def query_unique_artworks(
     frame_filter: str | None = None,
     frame_effect_contains: str | None = None,
     full_art: bool | None = None,
+    conn: sqlite3.Connection | None = None,
 ) -> list[Dict[str, Any]]:
-    if not os.path.exists(db_path):
+    if conn is None and not os.path.exists(db_path):
         return []
-    conn = _get_connection(db_path)
-    try:
+    with _read_connection(db_path, conn) as conn:
         cur = conn.cursor()
-        clauses = ["1=1"]
-        params: list[Any] = []
-        if oracle_id:
-            clauses.append("oracle_id=?")
-            params.append(oracle_id)
-        if illustration_id:
-            clauses.append("illustration_id=?")
-            params.append(illustration_id)
-        if set_filter:
-            clauses.append("set_code=?")
-            params.append((set_filter or "").lower())
-        if name_filter:
-            clauses.append("name_slug LIKE ?")
-            params.append(f"%{_slugify(name_filter)}%")
-        if artist_filter:
-            clauses.append("lower(coalesce(artist,'')) LIKE ?")
-            params.append(f"%{(artist_filter or '').strip().lower()}%")
-        if frame_filter:
-            clauses.append("frame=?")
-            params.append(frame_filter)
-        if frame_effect_contains:
-            clauses.append("lower(coalesce(frame_effects,'')) LIKE ?")
-            params.append(f"%{(frame_effect_contains or '').strip().lower()}%")
-        if full_art is not None:
-            clauses.append("full_art=?")
-            params.append(1 if full_art else 0)
-        sql = (
-            "SELECT id,oracle_id,illustration_id,name,name_slug,set_code,collector_number,type_line,"
-            "image_url,artist,frame,frame_effects,full_art FROM unique_artworks WHERE "
-            + " AND ".join(clauses)
+        clauses, params = _unique_art_clauses(
+            oracle_id,
+            illustration_id,
+            set_filter,
+            name_filter,
+            artist_filter,
+            frame_filter,
+            frame_effect_contains,
+            full_art,
         )
+        sql = _UNIQUE_ART_SELECT + " AND ".join(clauses)
         if limit and limit > 0:
             sql += " LIMIT ?"
             params.append(limit)
         cur.execute(sql, tuple(params))
         return [_row_to_art(r) for r in cur.fetchall()]
-    finally:
-        conn.close()
+
+
+# Keyset sort for paged unique artworks; matches idx_artworks_name_id
+_UNIQUE_ART_PAGE_KEY = ("coalesce(name,'')", "id")
+
+
+def page_unique_artworks(
+    page_size: int | None = None,
+    cursor: str | None = None,
+    db_path: str = DB_PATH,
+    *,
+    oracle_ids: Iterable[str] | None = None,
+    illustration_id: str | None = None,
+    set_filter: str | None = None,
+    name_filter: str | None = None,
+    artist_filter: str | None = None,
+    frame_filter: str | None = None,
+    frame_effect_contains: str | None = None,
+    full_art: bool | None = None,
+    conn: sqlite3.Connection | None = None,
+) -> tuple[list[Dict[str, Any]], str | None]:
+    """One page of unique artworks ordered by (name, id).
+
+    Returns ``(rows, next_cursor)``; pass `next_cursor` back for the next
+    page, which resumes after the last row instead of skipping an OFFSET.
+    `next_cursor` is None on the last page. Raises `InvalidCursor` for
+    cursors from another listing.
+    """
+    page_size = clamp_page_size(page_size)
+    after = decode_cursor(cursor, len(_UNIQUE_ART_PAGE_KEY))
+    if conn is None and not os.path.exists(db_path):
+        return [], None
+    with _read_connection(db_path, conn) as conn:
+        clauses, params = _unique_art_clauses(
+            list(oracle_ids) if oracle_ids else None,
+            illustration_id,
+            set_filter,
+            name_filter,
+            artist_filter,
+            frame_filter,
+            frame_effect_contains,
+            full_art,
+        )
+        if after is not None:
+            clauses.append(keyset_clause(_UNIQUE_ART_PAGE_KEY))
+            params.extend(after)
+        sql = (
+            _UNIQUE_ART_SELECT
+            + " AND ".join(clauses)
+            + f" ORDER BY {', '.join(_UNIQUE_ART_PAGE_KEY)} LIMIT ?"
+        )
+        params.append(page_size + 1)
+        rows = [_row_to_art(r) for r in conn.execute(sql, tuple(params)).fetchall()]
+    return split_page(rows, page_size, lambda art: (art["name"] or "", art["id"]))
 
 
 def count_unique_artworks(
@@ -976,44 +1850,77 @@ def count_unique_artworks(
     frame_filter: str | None = None,
     frame_effect_contains: str | None = None,
     full_art: bool | None = None,
+    conn: sqlite3.Connection | None = None,
 ) -> int:
-    if not os.path.exists(db_path):
+    if conn is None and not os.path.exists(db_path):
         return 0
-    conn = _get_connection(db_path)
-    try:
+    with _read_connection(db_path, conn) as conn:
         cur = conn.cursor()
-        clauses = ["1=1"]
-        params: list[Any] = []
-        if oracle_id:
-            clauses.append("oracle_id=?")
-            params.append(oracle_id)
-        if illustration_id:
-            clauses.append("illustration_id=?")
-            params.append(illustration_id)
-        if set_filter:
-            clauses.append("set_code=?")
-            params.append((set_filter or "").lower())
-        if name_filter:
-            clauses.append("name_slug LIKE ?")
-            params.append(f"%{_slugify(name_filter)}%")
-        if artist_filter:
-            clauses.append("lower(coalesce(artist,'')) LIKE ?")
-            params.append(f"%{(artist_filter or '').strip().lower()}%")
-        if frame_filter:
-            clauses.append("frame=?")
-            params.append(frame_filter)
-        if frame_effect_contains:
-            clauses.append("lower(coalesce(frame_effects,'')) LIKE ?")
-            params.append(f"%{(frame_effect_contains or '').strip().lower()}%")
-        if full_art is not None:
-            clauses.append("full_art=?")
-            params.append(1 if full_art else 0)
+        clauses, params = _unique_art_clauses(
+            oracle_id,
+            illustration_id,
+            set_filter,
+            name_filter,
+            artist_filter,
+            frame_filter,
+            frame_effect_contains,
+            full_art,
+        )
         sql = "SELECT COUNT(*) FROM unique_artworks WHERE " + " AND ".join(clauses)
         cur.execute(sql, tuple(params))
         row = cur.fetchone()
         return int(row[0]) if row and row[0] is not None else 0
-    finally:
-        conn.close()
+
+
+# print_stats dimensions reported by `print_stats` as by_<dimension> maps
+STATS_DIMENSIONS = ("set", "lang", "rarity", "type", "token_subtype")
+
+
+def print_stats(
+    db_path: str = DB_PATH, *, conn: sqlite3.Connection | None = None
+) -> Dict[str, Any]:
+    """Print counts for the stats pages, read from the print_stats aggregates.
+
+    Returns ``total``, ``distinct_names``, ``distinct_sets`` and a
+    ``by_<dimension>`` count map for each of STATS_DIMENSIONS. Databases
+    built before print_stats existed are aggregated on the fly instead.
+    """
+    stats: Dict[str, Any] = {"total": 0, "distinct_names": 0, "distinct_sets": 0}
+    stats.update({f"by_{dimension}": {} for dimension in STATS_DIMENSIONS})
+    if conn is None and not os.path.exists(db_path):
+        return stats
+    with _read_connection(db_path, conn) as conn:
+        cur = conn.cursor()
+        cur.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='print_stats';"
+        )
+        if cur.fetchone():
+            cur.execute(
+                "SELECT dimension, value, count FROM print_stats "
+                "WHERE dimension <> 'name' ORDER BY dimension, count DESC, value;"
+            )
+            rows = cur.fetchall()
+        else:
+            _register_stat_functions(conn)
+            cur.execute(
+                f"SELECT dimension, value, n FROM ({_stats_sql()}) "
+                "ORDER BY dimension, n DESC, value;"
+            )
+            rows = cur.fetchall()
+            distinct: Dict[str, int] = {}
+            for dimension, _value, _count in rows:
+                if dimension in _STAT_DISTINCT:
+                    distinct[dimension] = distinct.get(dimension, 0) + 1
+            rows = [row for row in rows if row[0] != "name"]
+            rows += [("distinct", dimension, n) for dimension, n in distinct.items()]
+    for dimension, value, count in rows:
+        if dimension == "total":
+            stats["total"] = count
+        elif dimension == "distinct":
+            stats[f"distinct_{value}s"] = count
+        elif dimension in STATS_DIMENSIONS:
+            stats[f"by_{dimension}"][value] = count
+    return stats
 
 
 def query_oracle_fts(
@@ -1022,15 +1929,18 @@ def query_oracle_fts(
     include_tokens: bool = False,
     limit: int | None = None,
     db_path: str = DB_PATH,
+    *,
+    conn: sqlite3.Connection | None = None,
+    columns: Iterable[str] | None = None,
 ) -> list[Dict[str, Any]]:
     """FTS5-backed search over prints if available; falls back to LIKE query.
 
     Matches against name, oracle_text, and type_line.
     """
-    if not os.path.exists(db_path):
+    if conn is None and not os.path.exists(db_path):
         return []
-    conn = _get_connection(db_path)
-    try:
+    projection = _columns_key(columns)
+    with _read_connection(db_path, conn) as conn:
         cur = conn.cursor()
         # Verify FTS table exists
         try:
@@ -1039,7 +1949,15 @@ def query_oracle_fts(
         except sqlite3.DatabaseError:
             has_fts = False
         if not has_fts:
-            return query_oracle_text(query, set_filter, include_tokens, limit, db_path)
+            return query_oracle_text(
+                query,
+                set_filter,
+                include_tokens,
+                limit,
+                db_path,
+                conn=conn,
+                columns=columns,
+            )
 
         where_clauses = ["prints.rowid = prints_fts.rowid"]
         params: list[Any] = []
@@ -1053,8 +1971,7 @@ def query_oracle_fts(
             where_clauses.append("prints.set_code=?")
             params.append((set_filter or "").lower())
         sql = (
-            "SELECT prints.id,prints.name,prints.name_slug,prints.set_code,prints.collector_number,"
-            "prints.type_line,prints.is_basic_land,prints.is_token,prints.image_url,prints.oracle_id,prints.color_identity,prints.keywords,prints.oracle_text,prints.lang "
+            f"SELECT {_entry_select(projection, 'prints')} "
             "FROM prints JOIN prints_fts ON prints.rowid=prints_fts.rowid WHERE "
             + " AND ".join(where_clauses)
         )
@@ -1062,9 +1979,7 @@ def query_oracle_fts(
             sql += " LIMIT ?"
             params.append(limit)
         cur.execute(sql, tuple(params))
-        return [_row_to_entry(r) for r in cur.fetchall()]
-    finally:
-        conn.close()
+        return [_row_to_entry(r, projection) for r in cur.fetchall()]
 
 
 def _token_subtype_from_type_line(type_line: str) -> str:
@@ -1075,126 +1990,235 @@ def _token_subtype_from_type_line(type_line: str) -> str:
     return (type_line or "Token").replace("Token", "").strip() or "Token"
 
 
-def _row_to_entry(row: tuple) -> Dict[str, Any]:
-    (
-        cid,
-        name,
-        name_slug,
-        set_code,
-        collector,
-        type_line,
-        is_basic,
-        is_token,
-        image_url,
-        oracle_id,
-        color_identity,
-        keywords,
-        oracle_text,
-        frame,
-        frame_effects,
-        full_art,
-        lang,
-        artist,
-        rarity,
-        cmc,
-        mana_cost,
-        colors,
-        border_color,
-        layout,
-        released_at,
-        set_name,
-        prices,
-        legalities,
-        produced_mana,
-        illustration_id,
-        promo,
-        textless,
-        all_parts,
-    ) = row
-    try:
-        ci = json.loads(color_identity) if color_identity else []
-    except Exception:
-        ci = []
-    try:
-        kw = json.loads(keywords) if keywords else []
-    except Exception:
-        kw = []
-    # Parse JSON fields safely
-    try:
-        colors_list = json.loads(colors) if colors else []
-    except Exception:
-        colors_list = []
-    try:
-        prices_dict = json.loads(prices) if prices else {}
-    except Exception:
-        prices_dict = {}
-    try:
-        legalities_dict = json.loads(legalities) if legalities else {}
-    except Exception:
-        legalities_dict = {}
-    try:
-        produced_mana_list = json.loads(produced_mana) if produced_mana else []
-    except Exception:
-        produced_mana_list = []
+class LazyEntry(dict):
+    """Print entry whose JSON columns are decoded on first access.
 
-    # Parse frame_effects JSON field
-    try:
-        frame_effects_list = json.loads(frame_effects) if frame_effects else []
-    except Exception:
-        frame_effects_list = []
+    Behaves like the plain dict `_row_to_entry` used to build: indexing,
+    `get`, iteration, `items()`, `json.dumps`, pickling and `dict(entry)`
+    all see decoded values. Rows that are only filtered or shown by name
+    never pay for parsing prices, legalities or all_parts. Keys filled from
+    the same column share one decoded value, as keywords and
+    oracle_keywords always have.
+    """
 
-    # Parse all_parts JSON field
-    try:
-        all_parts_list = json.loads(all_parts) if all_parts else []
-    except Exception:
-        all_parts_list = []
+    __slots__ = ("_pending",)
 
-    entry: Dict[str, Any] = {
-        "id": cid,
-        "name": name,
-        "name_slug": name_slug,
-        "set": set_code,
-        "set_code": set_code,
-        "collector_number": collector,
-        "type_line": type_line,
-        "is_basic_land": bool(is_basic),
-        "is_token": bool(is_token),
-        "image_url": image_url,
-        "oracle_id": oracle_id,
-        "color_identity": ci,
-        "keywords": kw,
-        "oracle_keywords": kw,
-        "oracle_text": oracle_text,
-        "frame": frame,
-        "frame_effects": frame_effects_list,
-        "full_art": bool(full_art),
-        "lang": lang,
-        "artist": artist,
-        "rarity": rarity,
-        "cmc": cmc,
-        "mana_cost": mana_cost,
-        "colors": colors_list,
-        "border_color": border_color,
-        "layout": layout,
-        "released_at": released_at,
-        "set_name": set_name,
-        "prices": prices_dict,
-        "legalities": legalities_dict,
-        "produced_mana": produced_mana_list,
-        "illustration_id": illustration_id,
-        "promo": bool(promo),
-        "textless": bool(textless),
-        "all_parts": all_parts_list,
-    }
-    if bool(is_token):
-        subtype = _token_subtype_from_type_line(type_line or "Token")
-        entry["token_subtype"] = subtype
-        entry["token_subtype_slug"] = _slugify(subtype)
-    return entry
+    def __init__(
+        self, values: Dict[str, Any], pending: Dict[str, tuple[type, tuple[str, ...]]]
+    ):
+        super().__init__(values)
+        self._pending = pending
+
+    def _resolve(self, key: str) -> Any:
+        default, keys = self._pending[key]
+        try:
+            value = json.loads(dict.__getitem__(self, key))
+        except Exception:
+            value = default()
+        for alias in keys:
+            if self._pending.pop(alias, None) is not None:
+                dict.__setitem__(self, alias, value)
+        return value
+
+    def _resolve_all(self) -> None:
+        for key in list(self._pending):
+            if key in self._pending:
+                self._resolve(key)
+
+    def __getitem__(self, key: str) -> Any:
+        if key in self._pending:
+            return self._resolve(key)
+        return dict.__getitem__(self, key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        if key in self._pending:
+            return self._resolve(key)
+        return dict.get(self, key, default)
+
+    # Overriding __iter__ makes dict(entry) and {**entry} go through
+    # keys()/__getitem__ instead of copying the raw storage.
+    def __iter__(self) -> Iterator[str]:
+        return dict.__iter__(self)
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        self._pending.pop(key, None)
+        dict.__setitem__(self, key, value)
+
+    def __delitem__(self, key: str) -> None:
+        self._pending.pop(key, None)
+        dict.__delitem__(self, key)
+
+    def __eq__(self, other: object) -> bool:
+        self._resolve_all()
+        if isinstance(other, LazyEntry):
+            other._resolve_all()
+        return dict.__eq__(self, other)
+
+    def __ne__(self, other: object) -> bool:
+        return not self == other
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def __repr__(self) -> str:
+        self._resolve_all()
+        return dict.__repr__(self)
+
+    def __reduce__(self):
+        return (dict, (self.copy(),))
+
+    def __or__(self, other):
+        self._resolve_all()
+        return dict.__or__(self, other)
+
+    def __ior__(self, other):
+        self._resolve_all()
+        return dict.__ior__(self, other)
+
+    def items(self):  # type: ignore[override]
+        self._resolve_all()
+        return dict.items(self)
+
+    def values(self):  # type: ignore[override]
+        self._resolve_all()
+        return dict.values(self)
+
+    def copy(self) -> Dict[str, Any]:  # type: ignore[override]
+        self._resolve_all()
+        return dict.copy(self)
+
+    def pop(self, key: str, *default: Any) -> Any:
+        if key in self._pending:
+            self._resolve(key)
+        return dict.pop(self, key, *default)
+
+    def popitem(self):
+        self._resolve_all()
+        return dict.popitem(self)
+
+    def setdefault(self, key: str, default: Any = None) -> Any:
+        if key in self._pending:
+            return self._resolve(key)
+        return dict.setdefault(self, key, default)
+
+    def update(self, *args: Any, **kwargs: Any) -> None:
+        self._resolve_all()
+        dict.update(self, *args, **kwargs)
+
+
+# prints column -> entry keys it fills, and how the value is converted:
+# None (as stored), bool, or a JSON type (list/dict, decoded lazily)
+_ENTRY_SCHEMA: tuple[tuple[str, tuple[str, ...], type | None], ...] = (
+    ("id", ("id",), None),
+    ("name", ("name",), None),
+    ("name_slug", ("name_slug",), None),
+    ("set_code", ("set", "set_code"), None),
+    ("collector_number", ("collector_number",), None),
+    ("type_line", ("type_line",), None),
+    ("is_basic_land", ("is_basic_land",), bool),
+    ("is_token", ("is_token",), bool),
+    ("image_url", ("image_url",), None),
+    ("oracle_id", ("oracle_id",), None),
+    ("color_identity", ("color_identity",), list),
+    ("keywords", ("keywords", "oracle_keywords"), list),
+    ("oracle_text", ("oracle_text",), None),
+    ("frame", ("frame",), None),
+    ("frame_effects", ("frame_effects",), list),
+    ("full_art", ("full_art",), bool),
+    ("lang", ("lang",), None),
+    ("artist", ("artist",), None),
+    ("rarity", ("rarity",), None),
+    ("cmc", ("cmc",), None),
+    ("mana_cost", ("mana_cost",), None),
+    ("colors", ("colors",), list),
+    ("border_color", ("border_color",), None),
+    ("layout", ("layout",), None),
+    ("released_at", ("released_at",), None),
+    ("set_name", ("set_name",), None),
+    ("prices", ("prices",), dict),
+    ("legalities", ("legalities",), dict),
+    ("produced_mana", ("produced_mana",), list),
+    ("illustration_id", ("illustration_id",), None),
+    ("promo", ("promo",), bool),
+    ("textless", ("textless",), bool),
+    ("all_parts", ("all_parts",), list),
+)
+_TOKEN_SUBTYPE_KEYS = ("token_subtype", "token_subtype_slug")
+ENTRY_KEYS = frozenset(
+    [key for _column, keys, _kind in _ENTRY_SCHEMA for key in keys] + list(_TOKEN_SUBTYPE_KEYS)
+)
+
+
+@functools.lru_cache(maxsize=64)
+def _entry_projection(
+    columns: tuple[str, ...] | None,
+) -> tuple[tuple[tuple[str, tuple[str, ...], type | None], ...], bool]:
+    """Schema rows needed for the requested entry keys (None = all).
+
+    `id` is always included; token subtypes pull in type_line and is_token.
+    """
+    if columns is None:
+        return _ENTRY_SCHEMA, True
+    unknown = sorted(set(columns) - ENTRY_KEYS)
+    if unknown:
+        raise ValueError(f"Unknown entry columns: {', '.join(unknown)}")
+    wanted = set(columns) | {"id"}
+    with_subtype = bool(wanted & set(_TOKEN_SUBTYPE_KEYS))
+    if with_subtype:
+        wanted |= {"type_line", "is_token"}
+    return (
+        tuple(spec for spec in _ENTRY_SCHEMA if wanted & set(spec[1])),
+        with_subtype,
+    )
 
 
-@cached_query(expire=3600)  # Cache for 1 hour
-def query_basic_lands(
+def _entry_select(columns: tuple[str, ...] | None, table: str | None = None) -> str:
+    """Comma-separated SELECT list for `_row_to_entry(row, columns)`."""
+    schema, _with_subtype = _entry_projection(columns)
+    prefix = f"{table}." if table else ""
+    return ",".join(prefix + column for column, _keys, _kind in schema)
+
+
+def _row_to_entry(row: tuple, columns: tuple[str, ...] | None = None) -> LazyEntry:
+    """Build an entry from a row selected with `_entry_select(columns)`."""
+    schema, with_subtype = _entry_projection(columns)
+    values: Dict[str, Any] = {}
+    pending: Dict[str, tuple[type, tuple[str, ...]]] = {}
+    for value, (_column, keys, kind) in zip(row, schema):
+        if kind is bool:
+            value = bool(value)
+        elif kind is not None:
+            if not value:
+                value = kind()
+            else:
+                for key in keys:
+                    pending[key] = (kind, keys)
+        for key in keys:
+            values[key] = value
+    if with_subtype and values.get("is_token"):
+        subtype = _token_subtype_from_type_line(values.get("type_line") or "Token")
+        values["token_subtype"] = subtype
+        values["token_subtype_slug"] = _slugify(subtype)
+    return LazyEntry(values, pending)
+
+
+def _columns_key(columns: Iterable[str] | None) -> tuple[str, ...] | None:
+    return tuple(columns) if columns is not None else None
+
+
+# Rows fetched per round trip by the iter_* streaming queries
+STREAM_BATCH_SIZE = 1000
+
+
+def _stream(cur: sqlite3.Cursor, batch_size: int) -> Iterator[tuple]:
+    """Yield a cursor's rows while holding at most `batch_size` of them."""
+    while True:
+        rows = cur.fetchmany(max(1, batch_size))
+        if not rows:
+            return
+        yield from rows
+
+
+def iter_basic_lands(
     limit: int | None = None,
     db_path: str = DB_PATH,
     *,
@@ -1206,11 +2230,15 @@ def query_basic_lands(
     layout_filter: str | None = None,
     frame_filter: str | None = None,
     fullart_only: bool = False,
-) -> list[Dict[str, Any]]:
-    if not os.path.exists(db_path):
-        return []
-    conn = _get_connection(db_path)
-    try:
+    conn: sqlite3.Connection | None = None,
+    columns: Iterable[str] | None = None,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """Stream basic land entries, fetching `batch_size` rows per round trip."""
+    if conn is None and not os.path.exists(db_path):
+        return
+    projection = _columns_key(columns)
+    with _read_connection(db_path, conn) as conn:
         cur = conn.cursor()
         clauses = ["is_basic_land=1", "image_url IS NOT NULL"]
         params: list = []
@@ -1230,8 +2258,7 @@ def query_basic_lands(
             clauses.append("set_code=?")
             params.append(set_filter.lower())
         if artist_filter:
-            clauses.append("artist LIKE ?")
-            params.append(f"%{artist_filter}%")
+            _append_contains(conn, clauses, params, "artist", artist_filter)
         if rarity_filter:
             clauses.append("rarity=?")
             params.append(rarity_filter)
@@ -1248,23 +2275,24 @@ def query_basic_lands(
             clauses.append("full_art=1")
 
         sql = (
-            "SELECT id,name,name_slug,set_code,collector_number,type_line,is_basic_land,is_token,"
-            "image_url,oracle_id,color_identity,keywords,oracle_text,frame,frame_effects,full_art,lang,"
-            "artist,rarity,cmc,mana_cost,colors,border_color,layout,released_at,set_name,"
-            "prices,legalities,produced_mana,illustration_id,promo,textless,all_parts "
-            "FROM prints WHERE " + " AND ".join(clauses)
+            f"SELECT {_entry_select(projection)} FROM prints WHERE "
+            + " AND ".join(clauses)
         )
         if limit and limit > 0:
             sql += " LIMIT ?"
             params.append(limit)
         cur.execute(sql, params)
-        return [_row_to_entry(r) for r in cur.fetchall()]
-    finally:
-        conn.close()
+        try:
+            for r in _stream(cur, batch_size):
+                yield _row_to_entry(r, projection)
+        finally:
+            # Runs when a caller abandons the stream too, before the pooled
+            # connection is handed back with a half-read cursor on it
+            cur.close()
 
 
-@cached_query(expire=3600)  # Cache for 1 hour
-def query_non_basic_lands(
+@cached_query()
+def query_basic_lands(
     limit: int | None = None,
     db_path: str = DB_PATH,
     *,
@@ -1276,14 +2304,53 @@ def query_non_basic_lands(
     layout_filter: str | None = None,
     frame_filter: str | None = None,
     fullart_only: bool = False,
+    conn: sqlite3.Connection | None = None,
+    columns: Iterable[str] | None = None,
 ) -> list[Dict[str, Any]]:
-    if not os.path.exists(db_path):
-        return []
-    conn = _get_connection(db_path)
-    try:
+    """`iter_basic_lands` collected into a list; cached per database generation."""
+    return list(
+        iter_basic_lands(
+            limit,
+            db_path,
+            lang_filter=lang_filter,
+            set_filter=set_filter,
+            artist_filter=artist_filter,
+            rarity_filter=rarity_filter,
+            cmc_filter=cmc_filter,
+            layout_filter=layout_filter,
+            frame_filter=frame_filter,
+            fullart_only=fullart_only,
+            conn=conn,
+            columns=columns,
+        )
+    )
+
+
+def iter_non_basic_lands(
+    limit: int | None = None,
+    db_path: str = DB_PATH,
+    *,
+    lang_filter: str | list[str] | None = None,
+    set_filter: str | None = None,
+    artist_filter: str | None = None,
+    rarity_filter: str | None = None,
+    cmc_filter: float | None = None,
+    layout_filter: str | None = None,
+    frame_filter: str | None = None,
+    fullart_only: bool = False,
+    conn: sqlite3.Connection | None = None,
+    columns: Iterable[str] | None = None,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """Stream non-basic land entries, fetching `batch_size` rows per round trip."""
+    if conn is None and not os.path.exists(db_path):
+        return
+    projection = _columns_key(columns)
+    with _read_connection(db_path, conn) as conn:
         cur = conn.cursor()
-        clauses = ["is_basic_land=0", "lower(type_line) LIKE '%land%'"]
+        clauses = ["is_basic_land=0"]
         params: list = []
+        _append_contains(conn, clauses, params, "type_line", "land")
 
         # Add filtering clauses
         if lang_filter:
@@ -1300,8 +2367,7 @@ def query_non_basic_lands(
             clauses.append("set_code=?")
             params.append(set_filter.lower())
         if artist_filter:
-            clauses.append("artist LIKE ?")
-            params.append(f"%{artist_filter}%")
+            _append_contains(conn, clauses, params, "artist", artist_filter)
         if rarity_filter:
             clauses.append("rarity=?")
             params.append(rarity_filter)
@@ -1318,22 +2384,119 @@ def query_non_basic_lands(
             clauses.append("full_art=1")
 
         sql = (
-            "SELECT id,name,name_slug,set_code,collector_number,type_line,is_basic_land,is_token,"
-            "image_url,oracle_id,color_identity,keywords,oracle_text,frame,frame_effects,full_art,lang,"
-            "artist,rarity,cmc,mana_cost,colors,border_color,layout,released_at,set_name,"
-            "prices,legalities,produced_mana,illustration_id,promo,textless,all_parts "
-            "FROM prints WHERE " + " AND ".join(clauses)
+            f"SELECT {_entry_select(projection)} FROM prints WHERE "
+            + " AND ".join(clauses)
         )
         if limit and limit > 0:
             sql += " LIMIT ?"
             params.append(limit)
         cur.execute(sql, params)
-        return [_row_to_entry(r) for r in cur.fetchall()]
-    finally:
-        conn.close()
+        try:
+            for r in _stream(cur, batch_size):
+                yield _row_to_entry(r, projection)
+        finally:
+            cur.close()
 
 
-def query_cards_optimized(
+@cached_query()
+def query_non_basic_lands(
+    limit: int | None = None,
+    db_path: str = DB_PATH,
+    *,
+    lang_filter: str | list[str] | None = None,
+    set_filter: str | None = None,
+    artist_filter: str | None = None,
+    rarity_filter: str | None = None,
+    cmc_filter: float | None = None,
+    layout_filter: str | None = None,
+    frame_filter: str | None = None,
+    fullart_only: bool = False,
+    conn: sqlite3.Connection | None = None,
+    columns: Iterable[str] | None = None,
+) -> list[Dict[str, Any]]:
+    """`iter_non_basic_lands` collected into a list; cached per database generation."""
+    return list(
+        iter_non_basic_lands(
+            limit,
+            db_path,
+            lang_filter=lang_filter,
+            set_filter=set_filter,
+            artist_filter=artist_filter,
+            rarity_filter=rarity_filter,
+            cmc_filter=cmc_filter,
+            layout_filter=layout_filter,
+            frame_filter=frame_filter,
+            fullart_only=fullart_only,
+            conn=conn,
+            columns=columns,
+        )
+    )
+
+
+# Shorter substrings have no trigram to look up and would scan prints_trigram
+_TRIGRAM_MIN_CHARS = 3
+
+
+def _contains_clause(conn: sqlite3.Connection, column: str, text: str) -> tuple[str, str]:
+    """Return (clause, parameter) for a case-insensitive substring filter.
+
+    `column` is name, type_line or artist. Filters go through the
+    prints_trigram index when it exists and the needle is long enough, and
+    otherwise LIKE over the stored lowercase column.
+    """
+    needle = text.lower()
+    pattern = f"%{needle}%"
+    if len(needle) >= _TRIGRAM_MIN_CHARS:
+        cur = conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type='table' AND name='prints_trigram';"
+        )
+        if cur.fetchone():
+            return (
+                f"rowid IN (SELECT rowid FROM prints_trigram WHERE {column}_lower LIKE ?)",
+                pattern,
+            )
+    return f"{column}_lower LIKE ?", pattern
+
+
+def _append_contains(
+    conn: sqlite3.Connection, clauses: list[str], params: list, column: str, text: str
+) -> None:
+    clause, param = _contains_clause(conn, column, text)
+    clauses.append(clause)
+    params.append(param)
+
+
+def _append_facet_filters(
+    clauses: list[str],
+    params: list,
+    colors_filter: str | Iterable[str] | None,
+    keyword_filter: str | Iterable[str] | None,
+    format_filter: str | None,
+) -> None:
+    """Append indexed color_mask / print_keywords / print_legalities clauses."""
+    if colors_filter:
+        masks = _color_filter_masks(
+            colors_filter.upper() if isinstance(colors_filter, str) else colors_filter
+        )
+        if masks:
+            clauses.append(f"color_mask IN ({','.join('?' * len(masks))})")
+            params.extend(masks)
+        else:
+            clauses.append("0=1")
+    if keyword_filter:
+        keywords = [keyword_filter] if isinstance(keyword_filter, str) else keyword_filter
+        for keyword in keywords:
+            clauses.append("id IN (SELECT print_id FROM print_keywords WHERE keyword=?)")
+            params.append(keyword.strip().lower())
+    if format_filter:
+        clauses.append(
+            "id IN (SELECT print_id FROM print_legalities "
+            "WHERE format=? AND status IN ('legal','restricted'))"
+        )
+        params.append(format_filter.strip().lower())
+
+
+def iter_cards_optimized(
     limit: int | None = None,
     db_path: str = DB_PATH,
     *,
@@ -1347,23 +2510,38 @@ def query_cards_optimized(
     set_filter: str | None = None,
     artist_filter: str | None = None,
     rarity_filter: str | None = None,
-    colors_filter: str | None = None,
+    colors_filter: str | list[str] | None = None,
+    keyword_filter: str | list[str] | None = None,
+    format_filter: str | None = None,
     layout_filter: str | None = None,
     frame_filter: str | None = None,
     border_color_filter: str | None = None,
     fullart_only: bool = False,
     card_ids: list[str] | None = None,
-) -> list[Dict[str, Any]]:
+    conn: sqlite3.Connection | None = None,
+    columns: Iterable[str] | None = None,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> Iterator[Dict[str, Any]]:
     """Optimized card query with SQL-level filtering.
 
     Pushes all filters to SQL WHERE clause to minimize memory usage.
-    Returns only matching cards instead of loading all 508k cards.
+    Returns only matching cards instead of loading all 508k cards, and
+    streams them `batch_size` rows at a time so callers that consume rows
+    incrementally never hold the whole result.
+    Rows are raw prints columns; `columns` limits which ones are selected
+    and defaults to every public column.
     """
-    if not os.path.exists(db_path):
-        return []
+    if columns is not None:
+        unknown = sorted(set(columns) - set(_PRINTS_COLUMNS))
+        if unknown:
+            raise ValueError(f"Unknown prints columns: {', '.join(unknown)}")
+    else:
+        columns = _PRINTS_PUBLIC_COLUMNS
+    select = ",".join(columns)
+    if conn is None and not os.path.exists(db_path):
+        return
 
-    conn = _get_connection(db_path)
-    try:
+    with _read_connection(db_path, conn) as conn:
         cur = conn.cursor()
         clauses = []
         params: list = []
@@ -1372,13 +2550,13 @@ def query_cards_optimized(
         if card_type == "basic_land":
             clauses.append("is_basic_land=1")
         elif card_type == "nonbasic_land":
-            clauses.append("is_basic_land=0 AND lower(type_line) LIKE '%land%'")
+            clauses.append("is_basic_land=0")
+            _append_contains(conn, clauses, params, "type_line", "land")
         elif card_type == "token":
             clauses.append("is_token=1")
         elif card_type != "any":
             # Specific card type (creature, planeswalker, etc.)
-            clauses.append("lower(type_line) LIKE ?")
-            params.append(f"%{card_type.lower()}%")
+            _append_contains(conn, clauses, params, "type_line", card_type)
 
         # Token/land filtering
         if is_token is not None:
@@ -1399,30 +2577,26 @@ def query_cards_optimized(
                 clauses.append("lang=?")
                 params.append(lang_filter)
 
-        # Set filtering
+        # Set filtering (set_code is stored lowercased, so idx_prints_set applies)
         if set_filter:
-            clauses.append("lower(set_code)=?")
+            clauses.append("set_code=?")
             params.append(set_filter.lower())
 
         # Name filtering
         if name_filter:
-            clauses.append("lower(name) LIKE ?")
-            params.append(f"%{name_filter.lower()}%")
+            _append_contains(conn, clauses, params, "name", name_filter)
 
         # Type line filtering
         if type_line_contains:
-            clauses.append("lower(type_line) LIKE ?")
-            params.append(f"%{type_line_contains.lower()}%")
+            _append_contains(conn, clauses, params, "type_line", type_line_contains)
 
         # Subtype filtering
         if subtype_filter:
-            clauses.append("lower(type_line) LIKE ?")
-            params.append(f"%{subtype_filter.lower()}%")
+            _append_contains(conn, clauses, params, "type_line", subtype_filter)
 
         # Artist filtering
         if artist_filter:
-            clauses.append("lower(artist) LIKE ?")
-            params.append(f"%{artist_filter.lower()}%")
+            _append_contains(conn, clauses, params, "artist", artist_filter)
 
         # Rarity filtering
         if rarity_filter:
@@ -1448,6 +2622,11 @@ def query_cards_optimized(
         if fullart_only:
             clauses.append("full_art=1")
 
+        # Color, keyword and format filtering
+        _append_facet_filters(
+            clauses, params, colors_filter, keyword_filter, format_filter
+        )
+
         # Specific card IDs
         if card_ids:
             placeholders = ",".join(["?" for _ in card_ids])
@@ -1456,20 +2635,139 @@ def query_cards_optimized(
 
         # Build query
         where_clause = " AND ".join(clauses) if clauses else "1=1"
-        query = f"SELECT * FROM prints WHERE {where_clause}"
+        query = f"SELECT {select} FROM prints WHERE {where_clause}"
 
         if limit:
             query += f" LIMIT {limit}"
 
         cur.execute(query, params)
-        rows = cur.fetchall()
 
         # Convert to dict format
         columns = [desc[0] for desc in cur.description]
-        return [dict(zip(columns, row)) for row in rows]
+        try:
+            for row in _stream(cur, batch_size):
+                yield dict(zip(columns, row))
+        finally:
+            cur.close()
 
-    finally:
-        conn.close()
+
+def query_cards_optimized(
+    limit: int | None = None,
+    db_path: str = DB_PATH,
+    *,
+    card_type: str = "any",
+    is_token: bool | None = None,
+    is_basic_land: bool | None = None,
+    name_filter: str | None = None,
+    type_line_contains: str | None = None,
+    subtype_filter: str | None = None,
+    lang_filter: str | list[str] | None = None,
+    set_filter: str | None = None,
+    artist_filter: str | None = None,
+    rarity_filter: str | None = None,
+    colors_filter: str | list[str] | None = None,
+    keyword_filter: str | list[str] | None = None,
+    format_filter: str | None = None,
+    layout_filter: str | None = None,
+    frame_filter: str | None = None,
+    border_color_filter: str | None = None,
+    fullart_only: bool = False,
+    card_ids: list[str] | None = None,
+    conn: sqlite3.Connection | None = None,
+    columns: Iterable[str] | None = None,
+) -> list[Dict[str, Any]]:
+    """`iter_cards_optimized` collected into a list."""
+    return list(
+        iter_cards_optimized(
+            limit,
+            db_path,
+            card_type=card_type,
+            is_token=is_token,
+            is_basic_land=is_basic_land,
+            name_filter=name_filter,
+            type_line_contains=type_line_contains,
+            subtype_filter=subtype_filter,
+            lang_filter=lang_filter,
+            set_filter=set_filter,
+            artist_filter=artist_filter,
+            rarity_filter=rarity_filter,
+            colors_filter=colors_filter,
+            keyword_filter=keyword_filter,
+            format_filter=format_filter,
+            layout_filter=layout_filter,
+            frame_filter=frame_filter,
+            border_color_filter=border_color_filter,
+            fullart_only=fullart_only,
+            card_ids=card_ids,
+            conn=conn,
+            columns=columns,
+        )
+    )
+
+
+def _card_filter_clauses(
+    conn: sqlite3.Connection,
+    *,
+    name_filter: str | None,
+    type_filter: str | None,
+    lang_filter: str | None,
+    set_filter: str | None,
+    artist_filter: str | None,
+    rarity_filter: str | None,
+    cmc_filter: float | None,
+    layout_filter: str | None,
+    frame_filter: str | None,
+    fullart_only: bool,
+    exclude_tokens: bool,
+    exclude_lands: bool,
+    colors_filter: list[str] | None,
+    keyword_filter: str | list[str] | None,
+    format_filter: str | None,
+    card_ids: list[str] | None,
+) -> tuple[list[str], list]:
+    """WHERE clauses and parameters shared by `query_cards` and `page_cards`."""
+    clauses = ["1=1"]  # Base clause
+    params: list = []
+
+    # Add filtering clauses
+    if name_filter:
+        _append_contains(conn, clauses, params, "name", name_filter)
+    if type_filter:
+        _append_contains(conn, clauses, params, "type_line", type_filter)
+    if lang_filter:
+        clauses.append("lang=?")
+        params.append(lang_filter)
+    if set_filter:
+        clauses.append("set_code=?")
+        params.append(set_filter.lower())
+    if artist_filter:
+        _append_contains(conn, clauses, params, "artist", artist_filter)
+    if rarity_filter:
+        clauses.append("rarity=?")
+        params.append(rarity_filter)
+    if cmc_filter is not None:
+        clauses.append("cmc=?")
+        params.append(cmc_filter)
+    if layout_filter:
+        clauses.append("layout=?")
+        params.append(layout_filter)
+    if frame_filter:
+        clauses.append("frame=?")
+        params.append(frame_filter)
+    if fullart_only:
+        clauses.append("full_art=1")
+    if card_ids:
+        placeholders = ",".join("?" for _ in card_ids)
+        clauses.append(f"id IN ({placeholders})")
+        params.extend(card_ids)
+    if exclude_tokens:
+        clauses.append("is_token=0")
+    if exclude_lands:
+        clauses.append("is_basic_land=0 AND type_line_lower NOT LIKE '%land%'")
+    _append_facet_filters(
+        clauses, params, colors_filter, keyword_filter, format_filter
+    )
+    return clauses, params
 
 
 def query_cards(
@@ -1489,94 +2787,145 @@ def query_cards(
     exclude_tokens: bool = False,
     exclude_lands: bool = False,
     colors_filter: list[str] | None = None,
+    keyword_filter: str | list[str] | None = None,
+    format_filter: str | None = None,
     card_ids: list[str] | None = None,
+    conn: sqlite3.Connection | None = None,
+    columns: Iterable[str] | None = None,
 ) -> list[Dict[str, Any]]:
-    """Query cards with comprehensive filtering options."""
-    if not os.path.exists(db_path):
+    """Query cards with comprehensive filtering options.
+
+    `colors_filter` requires every listed color ("C" for colorless),
+    `keyword_filter` every listed keyword, and `format_filter` legal or
+    restricted status in that format; all three use the indexed side tables.
+    """
+    if conn is None and not os.path.exists(db_path):
         return []
-    conn = _get_connection(db_path)
-    try:
+    projection = _columns_key(columns)
+    with _read_connection(db_path, conn) as conn:
         cur = conn.cursor()
-        clauses = ["1=1"]  # Base clause
-        params: list = []
-
-        # Add filtering clauses
-        if name_filter:
-            clauses.append("name LIKE ?")
-            params.append(f"%{name_filter}%")
-        if type_filter:
-            clauses.append("lower(type_line) LIKE ?")
-            params.append(f"%{type_filter.lower()}%")
-        if lang_filter:
-            clauses.append("lang=?")
-            params.append(lang_filter)
-        if set_filter:
-            clauses.append("set_code=?")
-            params.append(set_filter.lower())
-        if artist_filter:
-            clauses.append("artist LIKE ?")
-            params.append(f"%{artist_filter}%")
-        if rarity_filter:
-            clauses.append("rarity=?")
-            params.append(rarity_filter)
-        if cmc_filter is not None:
-            clauses.append("cmc=?")
-            params.append(cmc_filter)
-        if layout_filter:
-            clauses.append("layout=?")
-            params.append(layout_filter)
-        if frame_filter:
-            clauses.append("frame=?")
-            params.append(frame_filter)
-        if fullart_only:
-            clauses.append("full_art=1")
-        if card_ids:
-            placeholders = ",".join("?" for _ in card_ids)
-            clauses.append(f"id IN ({placeholders})")
-            params.extend(card_ids)
-        if exclude_tokens:
-            clauses.append("is_token=0")
-        if exclude_lands:
-            clauses.append("is_basic_land=0 AND lower(type_line) NOT LIKE '%land%'")
-        if colors_filter:
-            # Colors stored as JSON array, check if any requested color is present
-            # Handle colorless (C) specially - colorless cards have empty colors array
-            for color in colors_filter:
-                if color == "C":
-                    # Colorless: empty array or null
-                    clauses.append("(colors = '[]' OR colors IS NULL OR colors = '')")
-                else:
-                    clauses.append("colors LIKE ?")
-                    params.append(f'%"{color}"%')
+        clauses, params = _card_filter_clauses(
+            conn,
+            name_filter=name_filter,
+            type_filter=type_filter,
+            lang_filter=lang_filter,
+            set_filter=set_filter,
+            artist_filter=artist_filter,
+            rarity_filter=rarity_filter,
+            cmc_filter=cmc_filter,
+            layout_filter=layout_filter,
+            frame_filter=frame_filter,
+            fullart_only=fullart_only,
+            exclude_tokens=exclude_tokens,
+            exclude_lands=exclude_lands,
+            colors_filter=colors_filter,
+            keyword_filter=keyword_filter,
+            format_filter=format_filter,
+            card_ids=card_ids,
+        )
 
         sql = (
-            "SELECT id,name,name_slug,set_code,collector_number,type_line,is_basic_land,is_token,"
-            "image_url,oracle_id,color_identity,keywords,oracle_text,frame,frame_effects,full_art,lang,"
-            "artist,rarity,cmc,mana_cost,colors,border_color,layout,released_at,set_name,"
-            "prices,legalities,produced_mana,illustration_id,promo,textless,all_parts "
-            "FROM prints WHERE " + " AND ".join(clauses)
+            f"SELECT {_entry_select(projection)} FROM prints WHERE "
+            + " AND ".join(clauses)
         )
         if limit and limit > 0:
             sql += " LIMIT ?"
             params.append(limit)
         cur.execute(sql, params)
-        return [_row_to_entry(r) for r in cur.fetchall()]
-    finally:
-        conn.close()
+        return [_row_to_entry(r, projection) for r in cur.fetchall()]
 
 
-@cached_query(expire=3600)  # Cache for 1 hour
-def query_tokens(
+# Keyset sort for paged card search; matches idx_prints_name_id
+_CARD_PAGE_KEY = ("name", "id")
+
+
+def page_cards(
+    page_size: int | None = None,
+    cursor: str | None = None,
+    db_path: str = DB_PATH,
+    *,
+    name_filter: str | None = None,
+    type_filter: str | None = None,
+    lang_filter: str | None = None,
+    set_filter: str | None = None,
+    artist_filter: str | None = None,
+    rarity_filter: str | None = None,
+    cmc_filter: float | None = None,
+    layout_filter: str | None = None,
+    frame_filter: str | None = None,
+    fullart_only: bool = False,
+    exclude_tokens: bool = False,
+    exclude_lands: bool = False,
+    colors_filter: list[str] | None = None,
+    keyword_filter: str | list[str] | None = None,
+    format_filter: str | None = None,
+    conn: sqlite3.Connection | None = None,
+    columns: Iterable[str] | None = None,
+) -> tuple[list[Dict[str, Any]], str | None]:
+    """One page of `query_cards` results ordered by (name, id).
+
+    Returns ``(entries, next_cursor)``; pass `next_cursor` back for the next
+    page, which resumes after the last row instead of skipping an OFFSET.
+    `next_cursor` is None on the last page. Raises `InvalidCursor` for
+    cursors from another listing.
+    """
+    page_size = clamp_page_size(page_size)
+    after = decode_cursor(cursor, len(_CARD_PAGE_KEY))
+    if conn is None and not os.path.exists(db_path):
+        return [], None
+    projection = _columns_key(columns)
+    if projection is not None:
+        # The cursor is built from the sort key of the page's last row
+        projection = tuple(dict.fromkeys(projection + _CARD_PAGE_KEY))
+    with _read_connection(db_path, conn) as conn:
+        clauses, params = _card_filter_clauses(
+            conn,
+            name_filter=name_filter,
+            type_filter=type_filter,
+            lang_filter=lang_filter,
+            set_filter=set_filter,
+            artist_filter=artist_filter,
+            rarity_filter=rarity_filter,
+            cmc_filter=cmc_filter,
+            layout_filter=layout_filter,
+            frame_filter=frame_filter,
+            fullart_only=fullart_only,
+            exclude_tokens=exclude_tokens,
+            exclude_lands=exclude_lands,
+            colors_filter=colors_filter,
+            keyword_filter=keyword_filter,
+            format_filter=format_filter,
+            card_ids=None,
+        )
+        if after is not None:
+            clauses.append(keyset_clause(_CARD_PAGE_KEY))
+            params.extend(after)
+        sql = (
+            f"SELECT {_entry_select(projection)} FROM prints WHERE "
+            + " AND ".join(clauses)
+            + f" ORDER BY {', '.join(_CARD_PAGE_KEY)} LIMIT ?"
+        )
+        params.append(page_size + 1)
+        rows = [_row_to_entry(r, projection) for r in conn.execute(sql, params).fetchall()]
+    return split_page(rows, page_size, lambda entry: (entry["name"], entry["id"]))
+
+
+def iter_tokens(
     name_filter: str | None = None,
     subtype_filter: str | None = None,
     set_filter: str | None = None,
     limit: int | None = None,
     db_path: str = DB_PATH,
-) -> list[Dict[str, Any]]:
-    if not os.path.exists(db_path):
-        return []
-    conn = _get_connection(db_path)
-    try:
+    *,
+    conn: sqlite3.Connection | None = None,
+    columns: Iterable[str] | None = None,
+    batch_size: int = STREAM_BATCH_SIZE,
+) -> Iterator[Dict[str, Any]]:
+    """Stream token entries, fetching `batch_size` rows per round trip."""
+    if conn is None and not os.path.exists(db_path):
+        return
+    projection = _columns_key(columns)
+    with _read_connection(db_path, conn) as conn:
         cur = conn.cursor()
         clauses = ["is_token=1"]
         params: list[Any] = []
@@ -1591,19 +2940,43 @@ def query_tokens(
             clauses.append("set_code=?")
             params.append((set_filter or "").lower())
         sql = (
-            "SELECT id,name,name_slug,set_code,collector_number,type_line,is_basic_land,is_token,"
-            "image_url,oracle_id,color_identity,keywords,oracle_text,frame,frame_effects,full_art,lang,"
-            "artist,rarity,cmc,mana_cost,colors,border_color,layout,released_at,set_name,"
-            "prices,legalities,produced_mana,illustration_id,promo,textless,all_parts FROM prints WHERE "
+            f"SELECT {_entry_select(projection)} FROM prints WHERE "
             + " AND ".join(clauses)
         )
         if limit and limit > 0:
             sql += " LIMIT ?"
             params.append(limit)
         cur.execute(sql, tuple(params))
-        return [_row_to_entry(r) for r in cur.fetchall()]
-    finally:
-        conn.close()
+        try:
+            for r in _stream(cur, batch_size):
+                yield _row_to_entry(r, projection)
+        finally:
+            cur.close()
+
+
+@cached_query()
+def query_tokens(
+    name_filter: str | None = None,
+    subtype_filter: str | None = None,
+    set_filter: str | None = None,
+    limit: int | None = None,
+    db_path: str = DB_PATH,
+    *,
+    conn: sqlite3.Connection | None = None,
+    columns: Iterable[str] | None = None,
+) -> list[Dict[str, Any]]:
+    """`iter_tokens` collected into a list; cached per database generation."""
+    return list(
+        iter_tokens(
+            name_filter,
+            subtype_filter,
+            set_filter,
+            limit,
+            db_path,
+            conn=conn,
+            columns=columns,
+        )
+    )
 
 
 def query_tokens_by_keyword(
@@ -1611,37 +2984,37 @@ def query_tokens_by_keyword(
     set_filter: str | None = None,
     limit: int | None = None,
     db_path: str = DB_PATH,
+    *,
+    conn: sqlite3.Connection | None = None,
+    columns: Iterable[str] | None = None,
 ) -> list[Dict[str, Any]]:
-    if not os.path.exists(db_path):
+    if conn is None and not os.path.exists(db_path):
         return []
-    conn = _get_connection(db_path)
-    try:
+    projection = _columns_key(columns)
+    with _read_connection(db_path, conn) as conn:
         cur = conn.cursor()
         clauses = ["is_token=1"]
         params: list[Any] = []
         kw_norm = (keyword or "").strip().lower()
-        # keywords column is JSON array text; simplest robust path is to search oracle_text and keywords text blob
+        # Exact keywords come from print_keywords; the oracle text match covers
+        # mechanics that are not keyword abilities (e.g. "treasure")
         clauses.append(
-            "(lower(coalesce(oracle_text,'')) LIKE ? OR lower(coalesce(keywords,'')) LIKE ?)"
+            "(id IN (SELECT print_id FROM print_keywords WHERE keyword=?) "
+            "OR lower(coalesce(oracle_text,'')) LIKE ?)"
         )
-        params.extend([f"%{kw_norm}%", f"%{kw_norm}%"])
+        params.extend([kw_norm, f"%{kw_norm}%"])
         if set_filter:
             clauses.append("set_code=?")
             params.append((set_filter or "").lower())
         sql = (
-            "SELECT id,name,name_slug,set_code,collector_number,type_line,is_basic_land,is_token,"
-            "image_url,oracle_id,color_identity,keywords,oracle_text,frame,frame_effects,full_art,lang,"
-            "artist,rarity,cmc,mana_cost,colors,border_color,layout,released_at,set_name,"
-            "prices,legalities,produced_mana,illustration_id,promo,textless,all_parts FROM prints WHERE "
+            f"SELECT {_entry_select(projection)} FROM prints WHERE "
             + " AND ".join(clauses)
         )
         if limit and limit > 0:
             sql += " LIMIT ?"
             params.append(limit)
         cur.execute(sql, tuple(params))
-        return [_row_to_entry(r) for r in cur.fetchall()]
-    finally:
-        conn.close()
+        return [_row_to_entry(r, projection) for r in cur.fetchall()]
 
 
 def query_oracle_text(
@@ -1650,11 +3023,14 @@ def query_oracle_text(
     include_tokens: bool = False,
     limit: int | None = None,
     db_path: str = DB_PATH,
+    *,
+    conn: sqlite3.Connection | None = None,
+    columns: Iterable[str] | None = None,
 ) -> list[Dict[str, Any]]:
-    if not os.path.exists(db_path):
+    if conn is None and not os.path.exists(db_path):
         return []
-    conn = _get_connection(db_path)
-    try:
+    projection = _columns_key(columns)
+    with _read_connection(db_path, conn) as conn:
         cur = conn.cursor()
         clauses = []
         params: list[Any] = []
@@ -1669,19 +3045,14 @@ def query_oracle_text(
             clauses.append("set_code=?")
             params.append((set_filter or "").lower())
         sql = (
-            "SELECT id,name,name_slug,set_code,collector_number,type_line,is_basic_land,is_token,"
-            "image_url,oracle_id,color_identity,keywords,oracle_text,frame,frame_effects,full_art,lang,"
-            "artist,rarity,cmc,mana_cost,colors,border_color,layout,released_at,set_name,"
-            "prices,legalities,produced_mana,illustration_id,promo,textless,all_parts FROM prints WHERE "
+            f"SELECT {_entry_select(projection)} FROM prints WHERE "
             + " AND ".join(clauses)
         )
         if limit and limit > 0:
             sql += " LIMIT ?"
             params.append(limit)
         cur.execute(sql, tuple(params))
-        return [_row_to_entry(r) for r in cur.fetchall()]
-    finally:
-        conn.close()
+        return [_row_to_entry(r, projection) for r in cur.fetchall()]
 
 
 def verify_schema_compatibility(db_path: str = DB_PATH) -> None:
@@ -1771,15 +3142,31 @@ def main() -> None:
     parser = argparse.ArgumentParser(description="Bulk database management")
     sub = parser.add_subparsers(dest="cmd")
 
-    sub.add_parser("rebuild", help="Rebuild database from bulk JSON files")
+    rebuild = sub.add_parser("rebuild", help="Rebuild database from bulk JSON files")
+    update = sub.add_parser(
+        "update", help="Import only changed cards from bulk JSON files"
+    )
+    for cmd in (rebuild, update):
+        cmd.add_argument(
+            "--workers",
+            type=int,
+            default=0,
+            help="Worker processes for transforming cards (default: one per CPU)",
+        )
     sub.add_parser("vacuum", help="Optimize database (VACUUM + ANALYZE)")
     sub.add_parser("info", help="Show database statistics")
     sub.add_parser("verify", help="Verify database health (exit non-zero on failure)")
+    cache = sub.add_parser("cache", help="Show query cache statistics")
+    cache.add_argument(
+        "--clear", action="store_true", help="Remove every cached query result"
+    )
 
     args = parser.parse_args()
 
     if args.cmd == "rebuild":
-        build_db_from_bulk_json(DB_PATH)
+        build_db_from_bulk_json(DB_PATH, workers=args.workers)
+    elif args.cmd == "update":
+        update_db_from_bulk_json(DB_PATH, workers=args.workers)
     elif args.cmd == "vacuum":
         vacuum_db(DB_PATH)
     elif args.cmd == "info":
@@ -1787,6 +3174,11 @@ def main() -> None:
         info(DB_PATH)
     elif args.cmd == "verify":
         raise SystemExit(verify(DB_PATH))
+    elif args.cmd == "cache":
+        if args.clear:
+            removed = query_cache.clear()
+            print(f"Removed {removed:,} cached query results")
+        query_cache.print_stats()
     else:
         parser.print_help()
 
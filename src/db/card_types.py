@@ -44,6 +44,12 @@ class DBColumns:
     KEYWORDS = "keywords"
     COLOR_IDENTITY = "color_identity"
     COLORS = "colors"
+    COLOR_MASK = "color_mask"  # WUBRG bitmask of colors (see bulk_index.COLOR_BITS)
+
+    # Lowercased search copies (indexed by prints_trigram)
+    NAME_LOWER = "name_lower"
+    TYPE_LINE_LOWER = "type_line_lower"
+    ARTIST_LOWER = "artist_lower"
     PRODUCED_MANA = "produced_mana"
 
     # Card properties
@@ -72,6 +78,21 @@ class CardRelationshipColumns:
     RELATED_CARD_NAME = "related_card_name"
 
 
+class PrintKeywordColumns:
+    """Column names for the print_keywords table (keywords lowercased)."""
+
+    PRINT_ID = "print_id"
+    KEYWORD = "keyword"
+
+
+class PrintLegalityColumns:
+    """Column names for the print_legalities table ('not_legal' rows omitted)."""
+
+    PRINT_ID = "print_id"
+    FORMAT = "format"
+    STATUS = "status"
+
+
 # Relationship type constants
 class RelationshipType:
     """Valid relationship types in card_relationships table."""
@@ -118,8 +139,14 @@ class PrintRow(TypedDict, total=False):
     keywords: str
     color_identity: str
     colors: str
+    color_mask: int
     produced_mana: str
 
+    # Lowercased search copies
+    name_lower: str
+    type_line_lower: str
+    artist_lower: str
+
     # Card properties
     artist: str
     rarity: str
@@ -179,8 +206,18 @@ def get_column(row: PrintRow, column: str, default: Any = None) -> Any:
 
 
 # Schema version tracking
-SCHEMA_VERSION = 6
+SCHEMA_VERSION = 8
 SCHEMA_DESCRIPTION = """
+Schema v8 changes:
+- Added prints.name_lower, type_line_lower, artist_lower
+- Added prints_trigram (FTS5 trigram) over the lowercase columns
+- Substring name/type/artist filters use the trigram index when available
+
+Schema v7 changes:
+- Added prints.color_mask (WUBRG bitmask) with an index
+- Added print_keywords and print_legalities lookup tables
+- Color, keyword and format filters use these instead of LIKE on JSON
+
 Schema v6 changes:
 - Added card_relationships table
 - Tracks combo_piece, meld_part, meld_result, token relationships
@@ -0,0 +1,144 @@
+"""Pooled read-only SQLite connections for the bulk card database.
+
+Opening a connection costs a file open, schema parse and a PRAGMA round trip,
+and throws away the page cache and prepared statements from the previous
+query. The query helpers in `db.bulk_index` run one short statement each, so
+that setup used to dominate; the pool below keeps a few tuned connections per
+database and hands them out to any thread.
+"""
+
+from __future__ import annotations
+
+import atexit
+import os
+import sqlite3
+import threading
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Optional, Tuple
+
+from db.query_profile import ProfilingConnection, profiling_enabled
+
+DEFAULT_POOL_SIZE = 4
+# Prepared statements kept per connection by sqlite3 (keyed by SQL text)
+STATEMENT_CACHE_SIZE = 256
+READ_PRAGMAS = (
+    "PRAGMA query_only = ON;",
+    "PRAGMA foreign_keys = ON;",
+    "PRAGMA mmap_size = 268435456;",  # 256MB
+    "PRAGMA cache_size = -65536;",  # 64MB
+    "PRAGMA temp_store = MEMORY;",
+)
+
+
+class ReadConnectionPool:
+    """Thread-safe pool of read-only connections to one SQLite file.
+
+    Connections are created on demand and at most `max_idle` are kept
+    between uses. Idle connections are dropped when the process forks or
+    the database file is replaced (e.g. by a full rebuild), so readers never
+    keep serving a deleted file.
+    """
+
+    def __init__(self, db_path: str, max_idle: int = DEFAULT_POOL_SIZE):
+        self.db_path = db_path
+        self.max_idle = max_idle
+        self._lock = threading.Lock()
+        self._idle: List[sqlite3.Connection] = []
+        self._pid = os.getpid()
+        self._file_id: Optional[Tuple[int, int]] = None
+        self.opened = 0
+
+    def _current_file_id(self) -> Optional[Tuple[int, int]]:
+        try:
+            st = os.stat(self.db_path)
+        except OSError:
+            return None
+        return (st.st_dev, st.st_ino)
+
+    def _open(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(
+            self.db_path,
+            check_same_thread=False,
+            cached_statements=STATEMENT_CACHE_SIZE,
+            # PM_DB_PROFILE=1 records every statement (see db.query_profile)
+            factory=ProfilingConnection if profiling_enabled() else sqlite3.Connection,
+        )
+        for pragma in READ_PRAGMAS:
+            conn.execute(pragma)
+        self.opened += 1
+        return conn
+
+    def _take_idle(self) -> Optional[sqlite3.Connection]:
+        file_id = self._current_file_id()
+        with self._lock:
+            if self._pid != os.getpid():
+                # Inherited from the parent process; never reuse or close
+                self._idle = []
+                self._pid = os.getpid()
+            if file_id != self._file_id:
+                stale, self._idle = self._idle, []
+                self._file_id = file_id
+                for conn in stale:
+                    conn.close()
+            return self._idle.pop() if self._idle else None
+
+    def acquire(self) -> sqlite3.Connection:
+        return self._take_idle() or self._open()
+
+    def release(self, conn: sqlite3.Connection) -> None:
+        if isinstance(conn, ProfilingConnection):
+            conn.flush_profile()
+        if conn.in_transaction:
+            conn.rollback()
+        with self._lock:
+            if self._pid == os.getpid() and len(self._idle) < self.max_idle:
+                self._idle.append(conn)
+                return
+        conn.close()
+
+    @contextmanager
+    def connection(self) -> Iterator[sqlite3.Connection]:
+        conn = self.acquire()
+        broken = False
+        try:
+            yield conn
+        except sqlite3.Error:
+            # Don't return a connection in an unknown state to the pool
+            broken = True
+            raise
+        finally:
+            if broken:
+                conn.close()
+            else:
+                self.release(conn)
+
+    def close(self) -> None:
+        with self._lock:
+            idle, self._idle = self._idle, []
+        for conn in idle:
+            conn.close()
+
+
+_POOLS: Dict[str, ReadConnectionPool] = {}
+_POOLS_LOCK = threading.Lock()
+
+
+def get_read_pool(db_path: str) -> ReadConnectionPool:
+    """Return the shared pool for `db_path`, creating it on first use."""
+    key = os.path.abspath(db_path)
+    pool = _POOLS.get(key)
+    if pool is None:
+        with _POOLS_LOCK:
+            pool = _POOLS.setdefault(key, ReadConnectionPool(key))
+    return pool
+
+
+def close_all_pools() -> None:
+    with _POOLS_LOCK:
+        pools = list(_POOLS.values())
+        _POOLS.clear()
+    for pool in pools:
+        pool.close()
+
+
+atexit.register(close_all_pools)
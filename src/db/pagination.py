@@ -0,0 +1,93 @@
+"""Keyset (cursor) pagination helpers for the bulk card database.
+
+OFFSET pagination makes SQLite walk and discard every row before the page,
+so page N costs O(N * page_size). Keyset pagination instead remembers the
+sort key of the last row served and resumes with ``WHERE (k1, k2) > (?, ?)``
+over an index on the same columns, so every page costs O(page_size).
+
+Cursors are opaque to clients: the last row's sort key, JSON encoded and
+base64url wrapped. They are only ever bound as query parameters.
+"""
+
+from __future__ import annotations
+
+import base64
+import binascii
+import bisect
+import json
+from typing import Any, Optional, Sequence, Tuple
+
+DEFAULT_PAGE_SIZE = 50
+MAX_PAGE_SIZE = 200
+
+
+class InvalidCursor(ValueError):
+    """Raised for cursors that were not produced by `encode_cursor`."""
+
+
+def encode_cursor(key: Sequence[Any]) -> str:
+    """Wrap a row's sort key as an opaque, URL-safe cursor."""
+    raw = json.dumps(list(key), separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: Optional[str], width: int) -> Optional[Tuple[Any, ...]]:
+    """Unwrap a cursor into a sort key of `width` values (None for no cursor)."""
+    if not cursor:
+        return None
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        key = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+    except (binascii.Error, UnicodeError, ValueError) as exc:
+        raise InvalidCursor(f"Malformed cursor: {cursor!r}") from exc
+    if not isinstance(key, list) or len(key) != width:
+        raise InvalidCursor(f"Cursor does not match this listing: {cursor!r}")
+    if not all(value is None or isinstance(value, (str, int, float)) for value in key):
+        raise InvalidCursor(f"Cursor does not match this listing: {cursor!r}")
+    return tuple(key)
+
+
+def clamp_page_size(page_size: Optional[int], default: int = DEFAULT_PAGE_SIZE) -> int:
+    """Bound a client-supplied page size to 1..MAX_PAGE_SIZE."""
+    if not page_size or page_size < 1:
+        return default
+    return min(page_size, MAX_PAGE_SIZE)
+
+
+def keyset_clause(columns: Sequence[str]) -> str:
+    """SQL predicate selecting rows after a cursor ordered by `columns`."""
+    names = ", ".join(columns)
+    marks = ", ".join("?" for _ in columns)
+    return f"({names}) > ({marks})"
+
+
+def split_page(
+    rows: list, page_size: int, key: Any
+) -> Tuple[list, Optional[str]]:
+    """Trim a ``LIMIT page_size + 1`` result to one page plus its next cursor.
+
+    `key` maps a row to its sort key; the cursor is None on the last page.
+    """
+    if len(rows) <= page_size:
+        return rows, None
+    page = rows[:page_size]
+    return page, encode_cursor(key(page[-1]))
+
+
+def page_sorted(
+    keys: Sequence[Tuple[Any, ...]],
+    cursor: Optional[str],
+    page_size: int,
+) -> Tuple[int, int, Optional[str]]:
+    """Locate a page within an already sorted, in-memory listing.
+
+    `keys` are the rows' sort keys in ascending order. Returns
+    ``(start, end, next_cursor)`` for ``rows[start:end]``; the cursor is
+    found by bisection, so a page costs O(log n + page_size).
+    """
+    width = len(keys[0]) if keys else 0
+    after = decode_cursor(cursor, width) if keys else None
+    start = bisect.bisect_right(keys, after) if after is not None else 0
+    end = min(start + page_size, len(keys))
+    next_cursor = encode_cursor(keys[end - 1]) if end < len(keys) else None
+    return start, end, next_cursor
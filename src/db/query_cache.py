@@ -1,101 +1,231 @@
 #!/usr/bin/env python3
-"""Query result caching for database performance.
+"""Shared result cache for the bulk database query helpers.
 
-Implements LRU cache for frequently accessed queries.
+Results are keyed by the database's *generation*: a random stamp stored in
+the ``metadata`` table that every full build and incremental update replaces.
+A rebuild therefore invalidates every cached result at once, in every
+process, without waiting for a TTL; the TTL only bounds how long unused
+entries occupy disk.
+
+Entries live in a size-bounded diskcache under ``.cache/db_queries`` so they
+are shared between processes. When diskcache is unavailable an in-process
+LRU is used instead.
 """
 
-import hashlib
-import json
+import atexit
+import inspect
+import os
+import sqlite3
+import threading
 import time
-from typing import Any, Optional, Callable
+import uuid
 from collections import OrderedDict
+from functools import wraps
+from typing import Any, Callable, Dict, Optional, Tuple
+
+from db.connection_pool import get_read_pool
+
+try:
+    from diskcache import Cache  # pyright: ignore[reportMissingImports]
+except ImportError:  # pragma: no cover - optional
+    Cache = None  # type: ignore
+
+DEFAULT_CACHE_DIR = ".cache/db_queries"
+DEFAULT_SIZE_LIMIT = 100_000_000  # 100MB
+DEFAULT_MAX_ENTRIES = 1000  # in-process fallback only
+# Generation stamps make results exact, so the TTL only reclaims idle entries
+DEFAULT_EXPIRE = 7 * 24 * 3600
+
+GENERATION_KEY = "cache_generation"
+# Databases built before generation stamps fall back to their build stamp
+_LEGACY_GENERATION_KEY = "build_info"
+
+_STATS_PREFIX = "__stats__:"
+_MISSING = object()
+
+
+class _MemoryStore:
+    """In-process LRU with per-entry expiry and tags (diskcache subset)."""
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[Any, Optional[float], Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: str, default: Any = None) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            value, expires_at, _tag = entry
+            if expires_at is not None and time.time() > expires_at:
+                del self._entries[key]
+                return default
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, expire: Optional[float] = None, tag: Any = None) -> None:
+        expires_at = time.time() + expire if expire else None
+        with self._lock:
+            self._entries[key] = (value, expires_at, tag)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def evict(self, tag: Any) -> int:
+        with self._lock:
+            stale = [key for key, entry in self._entries.items() if entry[2] == tag]
+            for key in stale:
+                del self._entries[key]
+        return len(stale)
+
+    def clear(self) -> int:
+        with self._lock:
+            count = len(self._entries)
+            self._entries.clear()
+        return count
+
+    def volume(self) -> int:
+        return 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
 
 
 class QueryCache:
-    """LRU cache for database query results."""
+    """Generation-tagged result cache with hit/miss statistics.
+
+    Hit and miss counts are kept per process and added to totals stored in
+    the cache itself when the process exits, so `get_stats` reports both.
+    """
 
-    def __init__(self, max_size: int = 1000, ttl_seconds: int = 300):
-        """Initialize cache.
+    def __init__(
+        self,
+        directory: Optional[str] = DEFAULT_CACHE_DIR,
+        size_limit: int = DEFAULT_SIZE_LIMIT,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ):
+        """Open (or create) the cache.
 
         Args:
-            max_size: Maximum number of cached queries
-            ttl_seconds: Time-to-live for cache entries (default 5 minutes)
+            directory: diskcache directory (None for an in-process cache)
+            size_limit: Maximum on-disk size before entries are evicted
+            max_entries: Entry limit of the in-process fallback
         """
-        self.max_size = max_size
-        self.ttl_seconds = ttl_seconds
-        self.cache = OrderedDict()
+        self.size_limit = size_limit
+        if Cache is not None and directory:
+            self.directory: Optional[str] = directory
+            self._store: Any = Cache(directory, size_limit=size_limit)
+            # Generation invalidation evicts by tag
+            self._store.create_tag_index()
+        else:
+            self.directory = None
+            self._store = _MemoryStore(max_entries)
         self.hits = 0
         self.misses = 0
-
-    def _make_key(self, query: str, params: tuple) -> str:
-        """Generate cache key from query and parameters."""
-        key_data = json.dumps({"query": query, "params": params}, sort_keys=True)
-        return hashlib.md5(key_data.encode()).hexdigest()
-
-    def get(self, query: str, params: tuple = ()) -> Optional[Any]:
-        """Get cached result if available and not expired."""
-        key = self._make_key(query, params)
-
-        if key in self.cache:
-            entry = self.cache[key]
-
-            # Check if expired
-            if time.time() - entry["timestamp"] > self.ttl_seconds:
-                del self.cache[key]
+        self._flushed = (0, 0)
+        self._lock = threading.Lock()
+
+    @property
+    def persistent(self) -> bool:
+        return self.directory is not None
+
+    def get(self, key: str) -> Tuple[bool, Any]:
+        """Return ``(hit, value)`` for `key`."""
+        value = self._store.get(key, _MISSING)
+        with self._lock:
+            if value is _MISSING:
                 self.misses += 1
-                return None
-
-            # Move to end (most recently used)
-            self.cache.move_to_end(key)
+                return False, None
             self.hits += 1
-            return entry["result"]
-
-        self.misses += 1
-        return None
-
-    def set(self, query: str, params: tuple, result: Any):
-        """Cache query result."""
-        key = self._make_key(query, params)
-
-        # Remove oldest if at capacity
-        if len(self.cache) >= self.max_size:
-            self.cache.popitem(last=False)
-
-        self.cache[key] = {"result": result, "timestamp": time.time()}
-
-    def clear(self):
-        """Clear all cached entries."""
-        self.cache.clear()
-        self.hits = 0
-        self.misses = 0
-
-    def get_stats(self) -> dict:
-        """Get cache statistics."""
-        total = self.hits + self.misses
-        hit_rate = (self.hits / total * 100) if total > 0 else 0
-
+            return True, value
+
+    def set(self, key: str, value: Any, expire: Optional[float] = DEFAULT_EXPIRE, tag: Any = None) -> None:
+        self._store.set(key, value, expire=expire, tag=tag)
+
+    def evict_generation(self, generation: Optional[str]) -> int:
+        """Drop every result cached for a superseded database generation."""
+        if not generation:
+            return 0
+        return self._store.evict(generation)
+
+    def clear(self) -> int:
+        """Remove every cached result and reset the statistics."""
+        with self._lock:
+            self.hits = self.misses = 0
+            self._flushed = (0, 0)
+        return self._store.clear()
+
+    def volume(self) -> int:
+        """Approximate on-disk size in bytes (0 for the in-process cache)."""
+        return self._store.volume()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+    def flush_stats(self) -> None:
+        """Add this process's unflushed hit/miss counts to the shared totals."""
+        if not self.persistent:
+            return
+        with self._lock:
+            hits = self.hits - self._flushed[0]
+            misses = self.misses - self._flushed[1]
+            self._flushed = (self.hits, self.misses)
+        try:
+            if hits:
+                self._store.incr(_STATS_PREFIX + "hits", hits)
+            if misses:
+                self._store.incr(_STATS_PREFIX + "misses", misses)
+        except Exception:
+            # Statistics must never break the caller (or interpreter exit)
+            pass
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Return size and hit/miss counts (process and shared totals)."""
+        hits, misses = self.hits, self.misses
+        total_hits, total_misses = hits, misses
+        entries = len(self._store)
+        if self.persistent:
+            stored_hits = self._store.get(_STATS_PREFIX + "hits", 0)
+            stored_misses = self._store.get(_STATS_PREFIX + "misses", 0)
+            entries -= (_STATS_PREFIX + "hits" in self._store) + (
+                _STATS_PREFIX + "misses" in self._store
+            )
+            total_hits = stored_hits + hits - self._flushed[0]
+            total_misses = stored_misses + misses - self._flushed[1]
+        lookups = total_hits + total_misses
         return {
-            "size": len(self.cache),
-            "max_size": self.max_size,
-            "hits": self.hits,
-            "misses": self.misses,
-            "hit_rate": f"{hit_rate:.1f}%",
-            "ttl_seconds": self.ttl_seconds,
+            "persistent": self.persistent,
+            "directory": self.directory,
+            "entries": entries,
+            "volume_bytes": self.volume(),
+            "size_limit_bytes": self.size_limit,
+            "hits": hits,
+            "misses": misses,
+            "total_hits": total_hits,
+            "total_misses": total_misses,
+            "hit_rate": f"{(total_hits / lookups * 100) if lookups else 0:.1f}%",
         }
 
-    def print_stats(self):
+    def print_stats(self) -> None:
         """Print cache statistics."""
         stats = self.get_stats()
         print("\n[QUERY CACHE STATS]")
-        print(f"  Size: {stats['size']}/{stats['max_size']}")
-        print(f"  Hits: {stats['hits']}")
-        print(f"  Misses: {stats['misses']}")
+        print(f"  Location: {stats['directory'] or 'in-process'}")
+        print(f"  Entries: {stats['entries']:,}")
+        if stats["persistent"]:
+            print(
+                f"  Size: {stats['volume_bytes'] / (1024 * 1024):.1f} MB"
+                f" / {stats['size_limit_bytes'] / (1024 * 1024):.0f} MB"
+            )
+        print(f"  Hits: {stats['total_hits']:,}")
+        print(f"  Misses: {stats['total_misses']:,}")
         print(f"  Hit rate: {stats['hit_rate']}")
-        print(f"  TTL: {stats['ttl_seconds']}s")
 
 
 # Global cache instance
 _global_cache = QueryCache()
+atexit.register(_global_cache.flush_stats)
 
 
 def get_cache() -> QueryCache:
@@ -103,75 +233,90 @@ def get_cache() -> QueryCache:
     return _global_cache
 
 
-def cached_query(func: Callable) -> Callable:
-    """Decorator for caching query results."""
-
-    def wrapper(*args, **kwargs):
-        cache = get_cache()
-
-        # Create cache key from function name and arguments
-        key_data = f"{func.__name__}:{args}:{kwargs}"
-        cache_key = hashlib.md5(key_data.encode()).hexdigest()
-
-        # Try to get from cache
-        cached = cache.get(cache_key, ())
-        if cached is not None:
-            return cached
-
-        # Execute query
-        result = func(*args, **kwargs)
-
-        # Cache result
-        cache.set(cache_key, (), result)
-
-        return result
-
-    return wrapper
-
-
-# Example usage functions
-@cached_query
-def query_cards_by_set(set_code: str, limit: int = 100):
-    """Example cached query function."""
-    # This would normally query the database
-    return f"Results for set {set_code} (limit {limit})"
-
-
-@cached_query
-def query_tokens_by_type(token_type: str):
-    """Example cached query function."""
-    return f"Results for token type {token_type}"
-
-
-if __name__ == "__main__":
-    # Test the cache
-    cache = get_cache()
-
-    print("Testing query cache...")
-
-    # First query - cache miss
-    result1 = query_cards_by_set("znr", 50)
-    print(f"\n1st query: {result1}")
-    cache.print_stats()
-
-    # Second query - cache hit
-    result2 = query_cards_by_set("znr", 50)
-    print(f"\n2nd query: {result2}")
-    cache.print_stats()
-
-    # Different query - cache miss
-    result3 = query_cards_by_set("mh2", 100)
-    print(f"\n3rd query: {result3}")
-    cache.print_stats()
-
-    # Token query - cache miss
-    result4 = query_tokens_by_type("goblin")
-    print(f"\n4th query: {result4}")
-    cache.print_stats()
+def new_generation() -> str:
+    return uuid.uuid4().hex
+
+
+def read_generation(conn: sqlite3.Connection) -> Optional[str]:
+    """Return the database's cache generation, or None if it has none."""
+    rows = dict(
+        conn.execute(
+            "SELECT key, value FROM metadata WHERE key IN (?, ?)",
+            (GENERATION_KEY, _LEGACY_GENERATION_KEY),
+        ).fetchall()
+    )
+    return rows.get(GENERATION_KEY) or rows.get(_LEGACY_GENERATION_KEY)
+
+
+def stamp_generation(conn: sqlite3.Connection) -> Optional[str]:
+    """Give the database a new generation; returns the one it replaces.
+
+    Call inside the writer's transaction so readers see the new stamp and
+    the new rows together, then pass the returned value to
+    `QueryCache.evict_generation` once committed.
+    """
+    try:
+        previous = read_generation(conn)
+    except sqlite3.Error:
+        previous = None
+    conn.execute(
+        "INSERT OR REPLACE INTO metadata(key,value) VALUES(?,?)",
+        (GENERATION_KEY, new_generation()),
+    )
+    return previous
+
+
+def database_generation(
+    db_path: str, conn: Optional[sqlite3.Connection] = None
+) -> Optional[str]:
+    """Read the generation of `db_path` (via `conn` if given); None if unavailable."""
+    try:
+        if conn is not None:
+            return read_generation(conn)
+        if not os.path.exists(db_path):
+            return None
+        with get_read_pool(db_path).connection() as pooled:
+            return read_generation(pooled)
+    except sqlite3.Error:
+        return None
 
-    # Repeat token query - cache hit
-    result5 = query_tokens_by_type("goblin")
-    print(f"\n5th query: {result5}")
-    cache.print_stats()
 
-    print("\n[OK] Cache test complete")
+def cached_query(expire: Optional[float] = DEFAULT_EXPIRE) -> Callable:
+    """Cache a query function's results in the shared query cache.
+
+    Functions with a ``db_path`` parameter are keyed by that database's
+    generation, so results are recomputed after any rebuild or update; when
+    the database is missing or unstamped the call is not cached. A ``conn``
+    argument is used to read the generation but is not part of the key.
+    """
+
+    def decorator(func: Callable) -> Callable:
+        signature = inspect.signature(func)
+        tracks_db = "db_path" in signature.parameters
+        name = f"{func.__module__}.{func.__qualname__}"
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            arguments = dict(bound.arguments)
+            conn = arguments.pop("conn", None)
+            generation = None
+            if tracks_db:
+                generation = database_generation(arguments["db_path"], conn)
+                if generation is None:
+                    return func(*args, **kwargs)
+
+            cache = get_cache()
+            cache_key = f"{generation or '-'}:{name}:{arguments!r}"
+            hit, result = cache.get(cache_key)
+            if hit:
+                return result
+
+            result = func(*args, **kwargs)
+            cache.set(cache_key, result, expire=expire, tag=generation)
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,409 @@
+"""Query planner audit mode for the bulk card database.
+
+Set ``PM_DB_PROFILE=1`` and every statement run through the pooled read
+connections (i.e. every `db.bulk_index` query helper) is recorded to a JSONL
+log: the normalized SQL shape, parameter types, row count and wall time.
+The first time a shape is seen in a process its ``EXPLAIN QUERY PLAN`` is
+captured too, and plans that scan a whole table are flagged.
+
+`summarize` ranks the recorded shapes by total time and `suggest_indexes`
+derives candidate indexes from the scanned tables' WHERE/ORDER BY columns;
+`tools/optimize_db.py report` and `tools/optimize_db.py suggest` print both.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import re
+import sqlite3
+import threading
+import time
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+PROFILE_ENV = "PM_DB_PROFILE"
+PROFILE_LOG_ENV = "PM_DB_PROFILE_LOG"
+DEFAULT_PROFILE_LOG = os.path.join(".cache", "db_profile.jsonl")
+
+_TRUTHY = {"1", "true", "yes", "on"}
+
+_STRING_LITERAL = re.compile(r"'(?:[^']|'')*'")
+_NUMBER_LITERAL = re.compile(r"(?<![\w.])-?\d+(?:\.\d+)?\b")
+_PLACEHOLDER_LIST = re.compile(r"\(\s*\?(?:\s*,\s*\?)+\s*\)")
+_WHITESPACE = re.compile(r"\s+")
+_TABLE_REF = re.compile(
+    r"\b(?:FROM|JOIN)\s+(\w+)(?:\s+(?:AS\s+)?(?!WHERE\b|JOIN\b|ON\b|LEFT\b|INNER\b|"
+    r"CROSS\b|ORDER\b|GROUP\b|LIMIT\b|USING\b)(\w+))?",
+    re.IGNORECASE,
+)
+_FULL_SCAN = re.compile(r"^SCAN (\w+)(?: AS (\w+))?$")
+_INDEX_USE = re.compile(r"USING (?:COVERING )?INDEX (\w+)")
+
+
+def profiling_enabled() -> bool:
+    return os.environ.get(PROFILE_ENV, "0").strip().lower() in _TRUTHY
+
+
+def profile_log_path() -> str:
+    return os.environ.get(PROFILE_LOG_ENV) or DEFAULT_PROFILE_LOG
+
+
+def normalize_sql(sql: str) -> str:
+    """Reduce a statement to its shape: literals and IN lists become placeholders."""
+    shape = _STRING_LITERAL.sub("?", sql)
+    shape = _NUMBER_LITERAL.sub("?", shape)
+    shape = _PLACEHOLDER_LIST.sub("(?...)", shape)
+    return _WHITESPACE.sub(" ", shape).strip().rstrip(";").strip()
+
+
+def params_shape(params: Any) -> str:
+    """Describe bound parameters by type, e.g. ``str,int,str*3``."""
+    if isinstance(params, dict):
+        return ",".join(f"{k}:{type(v).__name__}" for k, v in sorted(params.items()))
+    parts: List[str] = []
+    for value in params or ():
+        name = type(value).__name__
+        if parts and parts[-1].split("*")[0] == name:
+            base, _, count = parts[-1].partition("*")
+            parts[-1] = f"{base}*{int(count or 1) + 1}"
+        else:
+            parts.append(name)
+    return ",".join(parts)
+
+
+def full_scans(sql: str, plan: Sequence[str]) -> List[str]:
+    """Return the tables an EXPLAIN QUERY PLAN scans without any index."""
+    aliases = {}
+    for table, alias in _TABLE_REF.findall(sql):
+        aliases[table.lower()] = table
+        if alias:
+            aliases[alias.lower()] = table
+    tables = []
+    for detail in plan:
+        match = _FULL_SCAN.match(detail.strip())
+        if match:
+            name = match.group(1)
+            table = aliases.get(name.lower(), name)
+            if table not in tables:
+                tables.append(table)
+    return tables
+
+
+def _explain(conn: sqlite3.Connection, sql: str, params: Any) -> List[str]:
+    try:
+        cur = sqlite3.Cursor(conn)
+        cur.execute(f"EXPLAIN QUERY PLAN {sql}", params)
+        return [row[-1] for row in cur.fetchall()]
+    except sqlite3.Error:
+        return []
+
+
+class QueryProfiler:
+    """Appends one JSON record per profiled statement to a log file."""
+
+    def __init__(self, path: Optional[str] = None):
+        self.path = path or profile_log_path()
+        self._lock = threading.Lock()
+        self._explained: set[str] = set()
+
+    def record(
+        self,
+        conn: sqlite3.Connection,
+        sql: str,
+        params: Any,
+        rows: int,
+        seconds: float,
+    ) -> None:
+        shape = normalize_sql(sql)
+        if shape.upper().startswith(("EXPLAIN", "PRAGMA")):
+            return
+        entry: Dict[str, Any] = {
+            "ts": round(time.time(), 3),
+            "shape": shape,
+            "params": params_shape(params),
+            "rows": rows,
+            "ms": round(seconds * 1000, 3),
+        }
+        with self._lock:
+            first = shape not in self._explained
+            self._explained.add(shape)
+        if first:
+            plan = _explain(conn, sql, params)
+            entry["plan"] = plan
+            entry["full_scans"] = full_scans(sql, plan)
+        line = json.dumps(entry, ensure_ascii=False)
+        with self._lock:
+            directory = os.path.dirname(self.path)
+            if directory:
+                os.makedirs(directory, exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as fh:
+                fh.write(line + "\n")
+
+
+_PROFILER: Optional[QueryProfiler] = None
+_PROFILER_LOCK = threading.Lock()
+
+
+def get_profiler() -> QueryProfiler:
+    global _PROFILER
+    path = profile_log_path()
+    with _PROFILER_LOCK:
+        if _PROFILER is None or _PROFILER.path != path:
+            _PROFILER = QueryProfiler(path)
+        return _PROFILER
+
+
+class ProfilingCursor(sqlite3.Cursor):
+    """Cursor that records each statement once its rows are consumed.
+
+    Wall time is the time spent inside execute and fetch calls, so a
+    statement flushed late (see `ProfilingConnection.flush_profile`) is not
+    charged for the caller's own work between fetches.
+    """
+
+    _pending: Optional[list] = None
+
+    def execute(self, sql, parameters=()):  # type: ignore[override]
+        self._finish()
+        started = time.perf_counter()
+        result = super().execute(sql, parameters)
+        self._pending = [sql, parameters, time.perf_counter() - started, 0]
+        unfinished = getattr(self.connection, "_unfinished_cursors", None)
+        if unfinished is not None:
+            unfinished.add(self)
+        return result
+
+    def fetchone(self):
+        started = time.perf_counter()
+        row = super().fetchone()
+        self._count(started, 0 if row is None else 1, done=row is None)
+        return row
+
+    def fetchmany(self, size=None):
+        started = time.perf_counter()
+        rows = super().fetchmany(self.arraysize if size is None else size)
+        self._count(started, len(rows), done=not rows)
+        return rows
+
+    def fetchall(self):
+        started = time.perf_counter()
+        rows = super().fetchall()
+        self._count(started, len(rows), done=True)
+        return rows
+
+    def __next__(self):
+        started = time.perf_counter()
+        try:
+            row = super().__next__()
+        except StopIteration:
+            self._count(started, 0, done=True)
+            raise
+        self._count(started, 1, done=False)
+        return row
+
+    def close(self):
+        self._finish()
+        super().close()
+
+    def _count(self, started: float, rows: int, done: bool) -> None:
+        pending = self._pending
+        if pending is not None:
+            pending[2] += time.perf_counter() - started
+            pending[3] += rows
+            if done:
+                self._finish()
+
+    def _finish(self) -> None:
+        pending, self._pending = self._pending, None
+        if pending is None:
+            return
+        unfinished = getattr(self.connection, "_unfinished_cursors", None)
+        if unfinished is not None:
+            unfinished.discard(self)
+        sql, params, elapsed, rows = pending
+        try:
+            get_profiler().record(self.connection, sql, params, rows, elapsed)
+        except OSError:
+            # Profiling must never break the query it observes
+            pass
+
+
+class ProfilingConnection(sqlite3.Connection):
+    """Connection whose cursors (including ``execute`` shortcuts) are profiled."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # Cursors holding a statement that has not been recorded yet
+        self._unfinished_cursors: set[ProfilingCursor] = set()
+
+    def cursor(self, factory=ProfilingCursor):  # type: ignore[override]
+        return super().cursor(factory)
+
+    def execute(self, sql, parameters=()):  # type: ignore[override]
+        return self.cursor().execute(sql, parameters)
+
+    def flush_profile(self) -> None:
+        """Record statements whose rows were only partly fetched (e.g. one fetchone)."""
+        for cur in list(self._unfinished_cursors):
+            cur._finish()
+
+
+# ---------------------------------------------------------------------------
+# Reporting
+# ---------------------------------------------------------------------------
+
+
+_SELECT_LIST = re.compile(r"^SELECT (.+?) FROM ", re.IGNORECASE)
+
+
+def abbreviate_shape(shape: str, width: int = 60) -> str:
+    """Shorten long SELECT lists for display (``SELECT <33 columns> FROM ...``)."""
+    match = _SELECT_LIST.match(shape)
+    if match and len(match.group(1)) > width:
+        count = match.group(1).count(",") + 1
+        shape = f"SELECT <{count} columns> FROM " + shape[match.end() :]
+    return shape
+
+
+def load_records(path: Optional[str] = None) -> List[Dict[str, Any]]:
+    path = path or profile_log_path()
+    records = []
+    if not os.path.exists(path):
+        return records
+    with open(path, encoding="utf-8") as fh:
+        for line in fh:
+            try:
+                records.append(json.loads(line))
+            except json.JSONDecodeError:
+                continue
+    return records
+
+
+def summarize(records: Iterable[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """Aggregate records per SQL shape, slowest total time first."""
+    shapes: Dict[str, Dict[str, Any]] = {}
+    for rec in records:
+        shape = rec.get("shape")
+        if not shape:
+            continue
+        agg = shapes.setdefault(
+            shape,
+            {
+                "shape": shape,
+                "calls": 0,
+                "total_ms": 0.0,
+                "max_ms": 0.0,
+                "rows": 0,
+                "params": set(),
+                "plan": [],
+                "full_scans": [],
+            },
+        )
+        ms = float(rec.get("ms") or 0.0)
+        agg["calls"] += 1
+        agg["total_ms"] += ms
+        agg["max_ms"] = max(agg["max_ms"], ms)
+        agg["rows"] += int(rec.get("rows") or 0)
+        agg["params"].add(rec.get("params") or "")
+        if rec.get("plan") and not agg["plan"]:
+            agg["plan"] = rec["plan"]
+            agg["full_scans"] = rec.get("full_scans") or []
+    summary = []
+    for agg in shapes.values():
+        agg["mean_ms"] = agg["total_ms"] / agg["calls"]
+        agg["mean_rows"] = agg["rows"] / agg["calls"]
+        agg["params"] = sorted(agg["params"])
+        summary.append(agg)
+    summary.sort(key=lambda a: a["total_ms"], reverse=True)
+    return summary
+
+
+def index_usage(summary: Iterable[Dict[str, Any]]) -> Dict[str, int]:
+    """Return {index name: calls} for every index seen in a captured plan."""
+    usage: Dict[str, int] = {}
+    for agg in summary:
+        for detail in agg["plan"]:
+            for name in _INDEX_USE.findall(detail):
+                usage[name] = usage.get(name, 0) + agg["calls"]
+    return usage
+
+
+def _table_columns(conn: sqlite3.Connection, table: str) -> List[str]:
+    return [row[1] for row in conn.execute(f'PRAGMA table_info("{table}")')]
+
+
+def _leading_index_columns(conn: sqlite3.Connection, table: str) -> List[tuple]:
+    indexes = []
+    for row in conn.execute(f'PRAGMA index_list("{table}")'):
+        cols = tuple(r[2] for r in conn.execute(f'PRAGMA index_info("{row[1]}")'))
+        indexes.append(cols)
+    return indexes
+
+
+def _predicate_columns(shape: str, columns: Sequence[str]) -> tuple[list, list, list]:
+    """Split a shape's bare-column predicates into equality, range and ORDER BY columns."""
+    where = re.split(r"\bWHERE\b", shape, maxsplit=1, flags=re.IGNORECASE)
+    body = where[1] if len(where) > 1 else ""
+    parts = re.split(r"\bORDER BY\b", body, maxsplit=1, flags=re.IGNORECASE)
+    body, order = parts[0], parts[1] if len(parts) > 1 else ""
+    known = {c.lower(): c for c in columns}
+    equality, ranges, ordering = [], [], []
+    for col, op in re.findall(
+        # Columns wrapped in a function call (lower(name) = ?) can't use an index
+        r"(?<![\w.])(?<!\w\()(?:\w+\.)?(\w+)\s*(=|IN\b|IS\b|>=|<=|>|<)",
+        body,
+        re.IGNORECASE,
+    ):
+        name = known.get(col.lower())
+        if not name:
+            continue
+        target = equality if op.upper() in {"=", "IN", "IS"} else ranges
+        if name not in equality and name not in ranges:
+            target.append(name)
+    order = re.split(r"\bLIMIT\b", order, flags=re.IGNORECASE)[0]
+    for col in re.findall(r"(?:\w+\.)?(\w+)", order):
+        name = known.get(col.lower())
+        if name and name not in ordering:
+            ordering.append(name)
+    return equality, ranges, ordering
+
+
+def suggest_indexes(
+    summary: Iterable[Dict[str, Any]], conn: sqlite3.Connection
+) -> List[Dict[str, Any]]:
+    """Suggest CREATE INDEX statements for shapes that scan whole tables.
+
+    Equality/IN columns come first, then one range or ORDER BY column, which
+    is the order SQLite can use them in. Suggestions an existing index
+    already covers (same leading columns) are dropped.
+    """
+    suggestions: Dict[str, Dict[str, Any]] = {}
+    for agg in summary:
+        for table in agg["full_scans"]:
+            columns = _table_columns(conn, table)
+            if not columns:
+                continue
+            equality, ranges, ordering = _predicate_columns(agg["shape"], columns)
+            key_cols = equality + (ranges or ordering)[:1]
+            if not key_cols:
+                continue
+            existing = _leading_index_columns(conn, table)
+            if any(cols[: len(key_cols)] == tuple(key_cols) for cols in existing):
+                continue
+            name = f"idx_{table}_{'_'.join(key_cols)}"
+            sugg = suggestions.setdefault(
+                name,
+                {
+                    "name": name,
+                    "sql": f"CREATE INDEX IF NOT EXISTS {name} ON {table}({', '.join(key_cols)});",
+                    "table": table,
+                    "columns": key_cols,
+                    "calls": 0,
+                    "total_ms": 0.0,
+                    "shapes": [],
+                },
+            )
+            sugg["calls"] += agg["calls"]
+            sugg["total_ms"] += agg["total_ms"]
+            sugg["shapes"].append(agg["shape"])
+    return sorted(suggestions.values(), key=lambda s: s["total_ms"], reverse=True)
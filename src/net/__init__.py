@@ -7,6 +7,10 @@
     fetch_with_etag,
     RetryConfig,
 )
+from .bulk_download import BulkDownloader, BulkDownloadError, download_bulk_file
+from .downloader import DownloadEngine
+from .http_cache import HttpCache, cached_get, get_http_cache
+from .ratelimit import HostRateLimiter, get_rate_limiter, rate_limited_get
 
 __all__ = [
     "fetch_bytes",
@@ -14,4 +18,14 @@
     "download_file",
     "fetch_with_etag",
     "RetryConfig",
+    "BulkDownloader",
+    "BulkDownloadError",
+    "download_bulk_file",
+    "DownloadEngine",
+    "HttpCache",
+    "cached_get",
+    "get_http_cache",
+    "HostRateLimiter",
+    "get_rate_limiter",
+    "rate_limited_get",
 ]
@@ -0,0 +1,372 @@
+"""Resumable, range-based parallel downloads for multi-GB bulk files.
+
+Scryfall's all-cards dump is several gigabytes; fetched as one sequential
+stream, throughput is capped by a single connection and any interruption
+means starting over. When the server supports byte ranges, the file is split
+into fixed-size parts that several connections fetch concurrently into a
+preallocated ``.part`` file. Each finished part is recorded in a
+``.part.json`` checkpoint, so a rerun only fetches what is missing, and
+``If-Range`` makes the server send the whole file instead of a range if it
+changed in between (which aborts the download rather than mixing versions).
+
+Once every part is in, the size and SHA-256 are verified and the file is
+renamed into place, so readers never see a partial dump. Servers without
+range support fall back to a single stream with the same verification and
+atomic publish.
+"""
+
+import base64
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .network import RetryConfig
+from .ratelimit import retry_after_seconds
+
+DEFAULT_CONNECTIONS = 4
+DEFAULT_PART_SIZE = 16 * 1024 * 1024
+STREAM_CHUNK_SIZE = 256 * 1024
+
+ProgressCallback = Callable[[int, Optional[int]], None]
+
+# Failures worth another attempt, including a body cut off mid-stream
+_TRANSIENT_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+class BulkDownloadError(IOError):
+    """The download could not be completed or failed verification."""
+
+
+@dataclass
+class BulkDownloadResult:
+    """A verified, published download."""
+
+    path: Path
+    size: int
+    sha256: str
+    resumed_bytes: int = 0
+
+
+@dataclass
+class _RemoteFile:
+    size: Optional[int]
+    ranges: bool
+    validator: Optional[str]
+    content_md5: Optional[str]
+
+
+def _checkpoint_path(part_path: Path) -> Path:
+    return part_path.with_name(part_path.name + ".json")
+
+
+def _file_digests(path: Path) -> tuple[str, str]:
+    sha256 = hashlib.sha256()
+    md5 = hashlib.md5(usedforsecurity=False)
+    with path.open("rb") as handle:
+        for block in iter(lambda: handle.read(1024 * 1024), b""):
+            sha256.update(block)
+            md5.update(block)
+    return sha256.hexdigest(), base64.b64encode(md5.digest()).decode("ascii")
+
+
+class BulkDownloader:
+    """Download one large file with parallel ranges, resume and verification."""
+
+    def __init__(
+        self,
+        *,
+        connections: int = DEFAULT_CONNECTIONS,
+        part_size: int = DEFAULT_PART_SIZE,
+        user_agent: str = "ProxyMachine/1.0 (bulk-fetch)",
+        config: Optional[RetryConfig] = None,
+    ):
+        """Create a downloader.
+
+        Args:
+            connections: Concurrent range requests
+            part_size: Bytes per range request and checkpoint unit
+            user_agent: User-Agent header sent with every request
+            config: Retry/backoff and timeout settings, applied per part;
+                `max_retries` counts retries after the first attempt
+        """
+        self.connections = max(1, connections)
+        self.part_size = max(STREAM_CHUNK_SIZE, part_size)
+        self.user_agent = user_agent
+        self.config = config or RetryConfig(max_retries=5)
+        self._local = threading.local()
+
+    def _session(self) -> requests.Session:
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = requests.Session()
+            session.headers.update({"User-Agent": self.user_agent, "Accept-Encoding": "identity"})
+            adapter = HTTPAdapter(pool_maxsize=self.connections, max_retries=0)
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            self._local.session = session
+        return session
+
+    def _retrying(self, action: Callable[[], requests.Response], url: str):
+        """Run `action`, retrying transport errors, 429 and 5xx per the config."""
+        attempts = max(0, self.config.max_retries) + 1
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            try:
+                response = action()
+            except _TRANSIENT_ERRORS:
+                if last_attempt:
+                    raise
+                time.sleep(self.config.get_delay(attempt))
+                continue
+            if response.status_code == 429 or response.status_code >= 500:
+                if not last_attempt:
+                    delay = retry_after_seconds(response.headers.get("Retry-After"))
+                    response.close()
+                    time.sleep(delay if delay is not None else self.config.get_delay(attempt))
+                    continue
+            response.raise_for_status()
+            return response
+        raise BulkDownloadError(f"Failed to download {url} after {attempts} attempts")
+
+    def _probe(self, url: str) -> _RemoteFile:
+        try:
+            response = self._retrying(
+                lambda: self._session().head(
+                    url, allow_redirects=True, timeout=self.config.timeout
+                ),
+                url,
+            )
+        except requests.HTTPError:
+            # Some servers refuse HEAD; a plain streamed GET still works
+            return _RemoteFile(size=None, ranges=False, validator=None, content_md5=None)
+        length = response.headers.get("Content-Length")
+        return _RemoteFile(
+            size=int(length) if length and length.isdigit() else None,
+            ranges=response.headers.get("Accept-Ranges", "").lower() == "bytes",
+            validator=response.headers.get("ETag") or response.headers.get("Last-Modified"),
+            content_md5=response.headers.get("Content-MD5"),
+        )
+
+    def download(
+        self,
+        url: str,
+        destination: Path,
+        *,
+        expected_size: Optional[int] = None,
+        expected_sha256: Optional[str] = None,
+        progress: Optional[ProgressCallback] = None,
+    ) -> BulkDownloadResult:
+        """Download `url` to `destination`, resuming any earlier partial run.
+
+        Args:
+            url: File to fetch
+            destination: Final path; only written once the file verifies
+            expected_size: Size to require, when known ahead of time
+            expected_sha256: Hex digest to require, when known ahead of time
+            progress: Called with (bytes done, total bytes or None)
+
+        Raises:
+            BulkDownloadError: On size/checksum mismatch or a changed remote file
+            requests.RequestException: When the server keeps failing
+        """
+        destination = Path(destination)
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        part_path = destination.with_name(destination.name + ".part")
+
+        remote = self._probe(url)
+        if expected_size is not None and remote.size not in (None, expected_size):
+            raise BulkDownloadError(
+                f"{url} is {remote.size} bytes, expected {expected_size}"
+            )
+        size = remote.size if remote.size is not None else expected_size
+
+        if remote.ranges and size:
+            resumed = self._download_ranges(url, part_path, size, remote.validator, progress)
+        else:
+            resumed = 0
+            self._download_single(url, part_path, size, progress)
+
+        sha256, content_md5 = _file_digests(part_path)
+        actual_size = part_path.stat().st_size
+        problem = None
+        if size is not None and actual_size != size:
+            problem = f"size {actual_size} != {size}"
+        elif expected_sha256 and sha256 != expected_sha256.lower():
+            problem = f"sha256 {sha256} != {expected_sha256}"
+        elif remote.content_md5 and content_md5 != remote.content_md5:
+            problem = f"Content-MD5 {content_md5} != {remote.content_md5}"
+        if problem:
+            # A corrupt assembly must not be resumed from on the next run
+            part_path.unlink(missing_ok=True)
+            _checkpoint_path(part_path).unlink(missing_ok=True)
+            raise BulkDownloadError(f"Verification failed for {url}: {problem}")
+
+        os.replace(part_path, destination)
+        _checkpoint_path(part_path).unlink(missing_ok=True)
+        return BulkDownloadResult(destination, actual_size, sha256, resumed)
+
+    def _load_checkpoint(
+        self, part_path: Path, url: str, size: int, validator: Optional[str]
+    ) -> set[int]:
+        checkpoint = _checkpoint_path(part_path)
+        try:
+            state = json.loads(checkpoint.read_text())
+        except (OSError, ValueError):
+            return set()
+        same_file = (
+            state.get("url") == url
+            and state.get("size") == size
+            and state.get("validator") == validator
+            and state.get("part_size") == self.part_size
+        )
+        if not same_file or not part_path.exists() or part_path.stat().st_size != size:
+            return set()
+        return {int(index) for index in state.get("done", [])}
+
+    def _save_checkpoint(
+        self, part_path: Path, url: str, size: int, validator: Optional[str], done: set[int]
+    ) -> None:
+        checkpoint = _checkpoint_path(part_path)
+        tmp_path = checkpoint.with_name(checkpoint.name + ".tmp")
+        tmp_path.write_text(
+            json.dumps(
+                {
+                    "url": url,
+                    "size": size,
+                    "validator": validator,
+                    "part_size": self.part_size,
+                    "done": sorted(done),
+                }
+            )
+        )
+        os.replace(tmp_path, checkpoint)
+
+    def _download_ranges(
+        self,
+        url: str,
+        part_path: Path,
+        size: int,
+        validator: Optional[str],
+        progress: Optional[ProgressCallback],
+    ) -> int:
+        """Fetch missing parts concurrently; returns bytes reused from a checkpoint."""
+        part_count = (size + self.part_size - 1) // self.part_size
+        done = self._load_checkpoint(part_path, url, size, validator)
+        if not done:
+            with part_path.open("wb") as handle:
+                handle.truncate(size)
+            self._save_checkpoint(part_path, url, size, validator, done)
+
+        def part_bounds(index: int) -> tuple[int, int]:
+            start = index * self.part_size
+            return start, min(size, start + self.part_size) - 1
+
+        resumed = sum(part_bounds(i)[1] - part_bounds(i)[0] + 1 for i in done)
+        completed = resumed
+        lock = threading.Lock()
+        if progress:
+            progress(completed, size)
+
+        def fetch_part(index: int) -> None:
+            nonlocal completed
+            start, end = part_bounds(index)
+            headers = {"Range": f"bytes={start}-{end}"}
+            if validator:
+                headers["If-Range"] = validator
+            attempts = max(0, self.config.max_retries) + 1
+            for attempt in range(attempts):
+                written = 0
+                try:
+                    response = self._retrying(
+                        lambda: self._session().get(
+                            url, headers=headers, stream=True, timeout=self.config.timeout
+                        ),
+                        url,
+                    )
+                    with response:
+                        if response.status_code != 206:
+                            raise BulkDownloadError(
+                                f"{url} changed or ignored the range request "
+                                f"(HTTP {response.status_code}); restart the download"
+                            )
+                        with part_path.open("r+b") as handle:
+                            handle.seek(start)
+                            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                                handle.write(chunk)
+                                written += len(chunk)
+                                if progress:
+                                    with lock:
+                                        completed += len(chunk)
+                                        progress(completed, size)
+                    if written != end - start + 1:
+                        raise requests.ConnectionError(
+                            f"range {start}-{end} returned {written} bytes"
+                        )
+                    break
+                except _TRANSIENT_ERRORS:
+                    with lock:
+                        completed -= written
+                    if attempt == attempts - 1:
+                        raise
+                    time.sleep(self.config.get_delay(attempt))
+            with lock:
+                done.add(index)
+                self._save_checkpoint(part_path, url, size, validator, done)
+
+        pending = [index for index in range(part_count) if index not in done]
+        with ThreadPoolExecutor(max_workers=self.connections) as executor:
+            for future in [executor.submit(fetch_part, index) for index in pending]:
+                future.result()
+        return resumed
+
+    def _download_single(
+        self,
+        url: str,
+        part_path: Path,
+        size: Optional[int],
+        progress: Optional[ProgressCallback],
+    ) -> None:
+        """Stream the whole file over one connection (no range support)."""
+        _checkpoint_path(part_path).unlink(missing_ok=True)
+        response = self._retrying(
+            lambda: self._session().get(url, stream=True, timeout=self.config.timeout), url
+        )
+        written = 0
+        with response, part_path.open("wb") as handle:
+            for chunk in response.iter_content(STREAM_CHUNK_SIZE):
+                handle.write(chunk)
+                written += len(chunk)
+                if progress:
+                    progress(written, size)
+
+
+def download_bulk_file(
+    url: str,
+    destination: Path,
+    *,
+    connections: int = DEFAULT_CONNECTIONS,
+    expected_size: Optional[int] = None,
+    expected_sha256: Optional[str] = None,
+    progress: Optional[ProgressCallback] = None,
+) -> BulkDownloadResult:
+    """Convenience wrapper around `BulkDownloader.download`."""
+    return BulkDownloader(connections=connections).download(
+        url,
+        destination,
+        expected_size=expected_size,
+        expected_sha256=expected_sha256,
+        progress=progress,
+    )
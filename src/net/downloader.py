@@ -0,0 +1,212 @@
+"""Pooled, streaming file downloads for bulk image syncs.
+
+Downloads check a ``requests.Session`` out of a pool of at most one per
+worker, so consecutive downloads from the same host reuse a keep-alive
+connection instead of paying a new TCP and TLS handshake per file, and a
+long-lived engine does not accumulate sessions as its caller's threads come
+and go. Bodies are streamed straight to a ``.part`` file
+beside the destination and renamed into place once complete, so memory use
+does not grow with image size. A per-host semaphore caps concurrent
+connections to any single host independently of the worker count.
+"""
+
+import threading
+import time
+from concurrent.futures import FIRST_COMPLETED, Future, ThreadPoolExecutor, wait
+from contextlib import contextmanager
+from itertools import islice
+from pathlib import Path
+from typing import Callable, Iterable, Iterator, Optional, Tuple, TypeVar
+from urllib.parse import urlsplit
+
+import requests
+from requests.adapters import HTTPAdapter
+
+from .network import RetryConfig
+from .ratelimit import retry_after_seconds
+
+T = TypeVar("T")
+
+DEFAULT_MAX_WORKERS = 8
+DEFAULT_PER_HOST = 8
+CHUNK_SIZE = 64 * 1024
+
+# Transport failures worth another attempt, including a body cut off mid-stream;
+# HTTP status codes are handled separately
+_RETRYABLE_ERRORS = (
+    requests.ConnectionError,
+    requests.Timeout,
+    requests.exceptions.ChunkedEncodingError,
+)
+
+
+class DownloadEngine:
+    """Thread pool of keep-alive sessions that streams URLs to files.
+
+    Use as a context manager, or call `close` when done, to release the
+    pooled connections.
+    """
+
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        *,
+        per_host: int = DEFAULT_PER_HOST,
+        user_agent: str = "ProxyMachine/1.0",
+        config: Optional[RetryConfig] = None,
+        before_request: Optional[Callable[[str], None]] = None,
+    ):
+        """Create an engine.
+
+        Args:
+            max_workers: Concurrent downloads in `download_many`, and the most
+                sessions the engine keeps open
+            per_host: Concurrent connections allowed to any one host
+            user_agent: User-Agent header sent with every request
+            config: Retry/backoff and timeout settings; `max_delay` also caps
+                how long a Retry-After header can hold a worker
+            before_request: Called with the URL before each attempt (e.g. a
+                rate limiter's wait)
+        """
+        self.max_workers = max(1, max_workers)
+        self.per_host = max(1, per_host)
+        self.user_agent = user_agent
+        self.config = config or RetryConfig()
+        self.before_request = before_request
+        self._idle_sessions: list[requests.Session] = []
+        self._open_sessions = 0
+        self._host_slots: dict[str, threading.BoundedSemaphore] = {}
+        self._lock = threading.Lock()
+        self._session_returned = threading.Condition(self._lock)
+
+    def __enter__(self) -> "DownloadEngine":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Close the engine's idle sessions and their pooled connections."""
+        with self._lock:
+            sessions, self._idle_sessions = self._idle_sessions, []
+            self._open_sessions -= len(sessions)
+        for session in sessions:
+            session.close()
+
+    def _new_session(self) -> requests.Session:
+        session = requests.Session()
+        session.headers["User-Agent"] = self.user_agent
+        # Retries are handled here so backoff can honor Retry-After
+        adapter = HTTPAdapter(pool_maxsize=self.per_host, max_retries=0)
+        session.mount("http://", adapter)
+        session.mount("https://", adapter)
+        return session
+
+    @contextmanager
+    def _session(self) -> Iterator[requests.Session]:
+        """Check a session out of the pool, waiting if all are in use."""
+        with self._lock:
+            while not self._idle_sessions and self._open_sessions >= self.max_workers:
+                self._session_returned.wait()
+            session = self._idle_sessions.pop() if self._idle_sessions else None
+            if session is None:
+                self._open_sessions += 1
+        if session is None:
+            session = self._new_session()
+        try:
+            yield session
+        finally:
+            with self._lock:
+                # Most recently used last, so the warmest connection is reused first
+                self._idle_sessions.append(session)
+                self._session_returned.notify()
+
+    def _host_slot(self, url: str) -> threading.BoundedSemaphore:
+        host = urlsplit(url).netloc
+        with self._lock:
+            slot = self._host_slots.get(host)
+            if slot is None:
+                slot = self._host_slots[host] = threading.BoundedSemaphore(self.per_host)
+            return slot
+
+    def download(self, url: str, destination: Path) -> int:
+        """Stream `url` to `destination` atomically; returns the bytes written.
+
+        Retries 429, 5xx, connection failures and truncated bodies up to
+        `max_retries` times after the first attempt.
+
+        Raises:
+            requests.HTTPError: On a non-retryable status or when retries run out
+            requests.RequestException: When the connection keeps failing
+        """
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        attempts = max(0, self.config.max_retries) + 1
+        for attempt in range(attempts):
+            last_attempt = attempt == attempts - 1
+            try:
+                if self.before_request is not None:
+                    self.before_request(url)
+                with self._host_slot(url), self._session() as session:
+                    with session.get(url, stream=True, timeout=self.config.timeout) as response:
+                        status = response.status_code
+                        retryable = (status == 429 and self.config.retry_on_429) or (
+                            status >= 500 and self.config.retry_on_5xx
+                        )
+                        if retryable and not last_attempt:
+                            delay = retry_after_seconds(response.headers.get("Retry-After"))
+                        else:
+                            response.raise_for_status()
+                            return self._stream_to(response, destination)
+            except _RETRYABLE_ERRORS:
+                if last_attempt:
+                    raise
+                delay = None
+            if delay is None:
+                delay = self.config.get_delay(attempt)
+            time.sleep(min(delay, self.config.max_delay))
+        raise RuntimeError(f"Failed to download {url} after {attempts} attempts")
+
+    @staticmethod
+    def _stream_to(response: requests.Response, destination: Path) -> int:
+        tmp_path = destination.with_suffix(destination.suffix + ".part")
+        written = 0
+        try:
+            with tmp_path.open("wb") as handle:
+                for chunk in response.iter_content(CHUNK_SIZE):
+                    handle.write(chunk)
+                    written += len(chunk)
+            tmp_path.replace(destination)
+        finally:
+            try:
+                if tmp_path.exists():
+                    tmp_path.unlink()
+            except OSError:
+                pass
+        return written
+
+    def download_many(
+        self, items: Iterable[Tuple[str, Path, T]]
+    ) -> Iterator[Tuple[T, Optional[Exception]]]:
+        """Download ``(url, destination, tag)`` items concurrently.
+
+        Items are pulled from `items` only as downloads finish, keeping at
+        most twice `max_workers` in flight, so a lazily generated stream of
+        items is never materialized. Yields ``(tag, error)`` as each download
+        finishes, with `error` None on success; a failed item never stops the
+        others.
+        """
+        items = iter(items)
+        window = 2 * self.max_workers
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            pending: dict[Future[int], T] = {}
+
+            def submit_more() -> None:
+                for url, destination, tag in islice(items, window - len(pending)):
+                    pending[executor.submit(self.download, url, destination)] = tag
+
+            submit_more()
+            while pending:
+                done, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield pending.pop(future), future.exception()
+                submit_more()
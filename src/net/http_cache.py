@@ -0,0 +1,395 @@
+"""Content-addressed HTTP cache with ETag/Last-Modified revalidation.
+
+Deck imports and re-fetches ask for the same API JSON and card images over
+and over. Responses are stored once per distinct body under
+``objects/<sha256>`` and an SQLite index maps each URL to its body digest
+and validators, so the same art served from several URLs is kept once.
+
+Modes (``PM_HTTP_CACHE``):
+
+- ``revalidate`` (default): send If-None-Match / If-Modified-Since and reuse
+  the cached body on 304; a cached body is also served when the network is
+  unreachable.
+- ``offline``: offline-first; serve any cached body without touching the
+  network and only fetch on a miss.
+- ``off``: bypass the cache entirely.
+
+With ``PM_HTTP_CACHE`` unset, ``PM_OFFLINE=1`` selects ``offline``.
+
+``PM_HTTP_CACHE_MAX_AGE`` (seconds) lets entries younger than that skip
+revalidation in ``revalidate`` mode.
+
+The blob store is bounded by ``PM_HTTP_CACHE_MAX_MB`` (default 1024): once it
+grows past that, the least recently fetched or revalidated entries are
+evicted and blobs no entry references any more are deleted. ``prune`` does
+the same on demand (``make http-cache-prune``).
+"""
+
+import hashlib
+import os
+import shutil
+import sqlite3
+import threading
+import time
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Iterable, Mapping, Optional
+
+import requests
+
+from .ratelimit import rate_limited_get
+
+MODES = ("revalidate", "offline", "off")
+_TRUTHY = {"1", "true", "yes", "on"}
+DEFAULT_CACHE_DIR = Path(__file__).resolve().parents[2] / ".cache" / "http"
+DEFAULT_SIZE_LIMIT_MB = 1024
+# Temp files younger than this may belong to a store still in progress
+_STALE_TEMP_SECONDS = 3600
+
+
+@dataclass
+class CachedResponse:
+    """A cached body and the validators it was served with."""
+
+    url: str
+    content: bytes
+    etag: Optional[str]
+    last_modified: Optional[str]
+    content_type: Optional[str]
+    fetched_at: float
+
+    def to_response(self) -> requests.Response:
+        """Rebuild a 200 `requests.Response` so callers can't tell it was cached."""
+        response = requests.Response()
+        response.status_code = 200
+        response.url = self.url
+        response._content = self.content
+        if self.content_type:
+            response.headers["Content-Type"] = self.content_type
+        if self.etag:
+            response.headers["ETag"] = self.etag
+        if self.last_modified:
+            response.headers["Last-Modified"] = self.last_modified
+        return response
+
+
+class HttpCache:
+    """URL-keyed index over a content-addressed blob store."""
+
+    def __init__(
+        self,
+        root: Optional[Path] = None,
+        *,
+        mode: Optional[str] = None,
+        max_age: Optional[float] = None,
+        size_limit_mb: Optional[int] = None,
+    ):
+        """Open (or create) a cache.
+
+        Args:
+            root: Cache directory; defaults to PM_HTTP_CACHE_DIR or .cache/http
+            mode: One of MODES; defaults to PM_HTTP_CACHE, then PM_OFFLINE
+            max_age: Seconds an entry is served without revalidation
+            size_limit_mb: Blob store size before least-recently-fetched
+                entries are evicted; defaults to PM_HTTP_CACHE_MAX_MB
+        """
+        self.root = Path(root or os.environ.get("PM_HTTP_CACHE_DIR") or DEFAULT_CACHE_DIR)
+        if mode is None:
+            offline = os.environ.get("PM_OFFLINE", "0").strip().lower() in _TRUTHY
+            mode = os.environ.get("PM_HTTP_CACHE") or ("offline" if offline else "revalidate")
+        self.mode = mode.strip().lower()
+        if self.mode not in MODES:
+            raise ValueError(f"Unknown HTTP cache mode {self.mode!r}; expected one of {MODES}")
+        if max_age is None:
+            max_age = float(os.environ.get("PM_HTTP_CACHE_MAX_AGE", "0"))
+        self.max_age = max_age
+        if size_limit_mb is None:
+            size_limit_mb = int(os.environ.get("PM_HTTP_CACHE_MAX_MB", DEFAULT_SIZE_LIMIT_MB))
+        self.size_limit_mb = size_limit_mb
+        self._local = threading.local()
+
+    @property
+    def enabled(self) -> bool:
+        return self.mode != "off"
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.root.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.root / "index.sqlite"), timeout=30)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS entries (
+                    url TEXT PRIMARY KEY,
+                    digest TEXT NOT NULL,
+                    etag TEXT,
+                    last_modified TEXT,
+                    content_type TEXT,
+                    fetched_at REAL NOT NULL,
+                    size INTEGER NOT NULL DEFAULT 0
+                )
+                """
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(entries)")}
+            if "size" not in columns:
+                self._add_size_column(conn)
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_fetched ON entries(fetched_at)")
+            conn.execute("CREATE INDEX IF NOT EXISTS idx_entries_digest ON entries(digest)")
+            conn.commit()
+            self._local.conn = conn
+        return conn
+
+    def _add_size_column(self, conn: sqlite3.Connection) -> None:
+        """Upgrade an index created before sizes were tracked."""
+        conn.execute("ALTER TABLE entries ADD COLUMN size INTEGER NOT NULL DEFAULT 0")
+        for (digest,) in conn.execute("SELECT DISTINCT digest FROM entries").fetchall():
+            try:
+                size = self._blob_path(digest).stat().st_size
+            except OSError:
+                continue
+            conn.execute("UPDATE entries SET size = ? WHERE digest = ?", (size, digest))
+
+    def _blob_path(self, digest: str) -> Path:
+        return self.root / "objects" / digest[:2] / digest
+
+    @staticmethod
+    def _volume(conn: sqlite3.Connection) -> int:
+        """Bytes held by distinct blobs; a blob shared by several URLs counts once."""
+        row = conn.execute(
+            "SELECT COALESCE(SUM(size), 0) FROM "
+            "(SELECT MAX(size) AS size FROM entries GROUP BY digest)"
+        ).fetchone()
+        return int(row[0])
+
+    def lookup(self, url: str) -> Optional[CachedResponse]:
+        """Cached response for `url`, or None on a miss or missing blob."""
+        row = (
+            self._connect()
+            .execute(
+                "SELECT digest, etag, last_modified, content_type, fetched_at "
+                "FROM entries WHERE url = ?",
+                (url,),
+            )
+            .fetchone()
+        )
+        if row is None:
+            return None
+        digest, etag, last_modified, content_type, fetched_at = row
+        try:
+            content = self._blob_path(digest).read_bytes()
+        except OSError:
+            return None
+        return CachedResponse(url, content, etag, last_modified, content_type, fetched_at)
+
+    def store(self, url: str, content: bytes, headers: Mapping[str, str]) -> str:
+        """Record a 200 response for `url`; returns the body's digest."""
+        digest = hashlib.sha256(content).hexdigest()
+        blob = self._blob_path(digest)
+        if not blob.exists():
+            blob.parent.mkdir(parents=True, exist_ok=True)
+            tmp_path = blob.with_name(f"{digest}.{os.getpid()}.{threading.get_ident()}.part")
+            tmp_path.write_bytes(content)
+            tmp_path.replace(blob)
+        conn = self._connect()
+        previous = conn.execute("SELECT digest FROM entries WHERE url = ?", (url,)).fetchone()
+        conn.execute(
+            "INSERT OR REPLACE INTO entries "
+            "(url, digest, etag, last_modified, content_type, fetched_at, size) "
+            "VALUES (?, ?, ?, ?, ?, ?, ?)",
+            (
+                url,
+                digest,
+                headers.get("ETag"),
+                headers.get("Last-Modified"),
+                headers.get("Content-Type"),
+                time.time(),
+                len(content),
+            ),
+        )
+        conn.commit()
+        if previous is not None and previous[0] != digest:
+            # The URL's body changed; drop the old blob unless another URL shares it
+            self._remove_unreferenced([previous[0]])
+        self._evict(self.size_limit_mb * 1024 * 1024)
+        return digest
+
+    def _remove_unreferenced(self, digests: Iterable[str]) -> int:
+        """Delete the blobs among `digests` that no entry points at."""
+        conn = self._connect()
+        removed = 0
+        for digest in set(digests):
+            referenced = conn.execute(
+                "SELECT 1 FROM entries WHERE digest = ? LIMIT 1", (digest,)
+            ).fetchone()
+            if referenced is None:
+                try:
+                    self._blob_path(digest).unlink()
+                    removed += 1
+                except FileNotFoundError:
+                    pass
+        return removed
+
+    def _evict(self, size_limit_bytes: int) -> int:
+        """Drop least-recently-fetched entries until the blobs fit the limit.
+
+        Returns:
+            Number of entries evicted
+        """
+        conn = self._connect()
+        volume = self._volume(conn)
+        if volume <= size_limit_bytes:
+            return 0
+
+        references = dict(
+            conn.execute("SELECT digest, COUNT(*) FROM entries GROUP BY digest").fetchall()
+        )
+        evicted_urls = []
+        orphaned = []
+        for url, digest, size in conn.execute(
+            "SELECT url, digest, size FROM entries ORDER BY fetched_at"
+        ).fetchall():
+            if volume <= size_limit_bytes:
+                break
+            evicted_urls.append((url,))
+            references[digest] -= 1
+            if references[digest] == 0:
+                volume -= size
+                orphaned.append(digest)
+        conn.executemany("DELETE FROM entries WHERE url = ?", evicted_urls)
+        conn.commit()
+        self._remove_unreferenced(orphaned)
+        return len(evicted_urls)
+
+    def touch(self, url: str) -> None:
+        """Mark `url` as freshly revalidated after a 304."""
+        conn = self._connect()
+        conn.execute("UPDATE entries SET fetched_at = ? WHERE url = ?", (time.time(), url))
+        conn.commit()
+
+    def stats(self) -> dict[str, Any]:
+        """Return entry and blob counts and disk usage."""
+        conn = self._connect()
+        entries, blobs = conn.execute(
+            "SELECT COUNT(*), COUNT(DISTINCT digest) FROM entries"
+        ).fetchone()
+        return {
+            "directory": str(self.root),
+            "mode": self.mode,
+            "entries": entries,
+            "blobs": blobs,
+            "volume_bytes": self._volume(conn),
+            "size_limit_bytes": self.size_limit_mb * 1024 * 1024,
+        }
+
+    def prune(self, size_limit_mb: Optional[int] = None) -> int:
+        """Evict down to the size limit and delete every unreferenced blob.
+
+        Besides least-recently-fetched eviction, this sweeps ``objects/`` for
+        blobs left behind by interrupted stores or by older versions of the
+        index, and for stale temp files.
+
+        Args:
+            size_limit_mb: Temporary target size; defaults to the configured limit
+
+        Returns:
+            Number of entries evicted
+        """
+        if size_limit_mb is None:
+            size_limit_mb = self.size_limit_mb
+        evicted = self._evict(size_limit_mb * 1024 * 1024)
+
+        objects = self.root / "objects"
+        if not objects.is_dir():
+            return evicted
+        referenced = {
+            digest for (digest,) in self._connect().execute("SELECT DISTINCT digest FROM entries")
+        }
+        cutoff = time.time() - _STALE_TEMP_SECONDS
+        for path in objects.rglob("*"):
+            if not path.is_file() or path.name in referenced:
+                continue
+            try:
+                if path.suffix == ".part" and path.stat().st_mtime > cutoff:
+                    continue
+                path.unlink()
+            except FileNotFoundError:
+                pass
+        return evicted
+
+    def clear(self) -> int:
+        """Remove every entry and blob and return the number of entries removed."""
+        conn = self._connect()
+        removed = conn.execute("DELETE FROM entries").rowcount
+        conn.commit()
+        shutil.rmtree(self.root / "objects", ignore_errors=True)
+        return removed
+
+    def is_fresh(self, entry: CachedResponse) -> bool:
+        """Whether `entry` may be served without asking the server."""
+        if self.mode == "offline":
+            return True
+        return self.max_age > 0 and time.time() - entry.fetched_at < self.max_age
+
+    @staticmethod
+    def validators(entry: Optional[CachedResponse]) -> dict[str, str]:
+        """Conditional request headers for revalidating `entry`."""
+        headers: dict[str, str] = {}
+        if entry is None:
+            return headers
+        if entry.etag:
+            headers["If-None-Match"] = entry.etag
+        if entry.last_modified:
+            headers["If-Modified-Since"] = entry.last_modified
+        return headers
+
+
+_shared_cache: Optional[HttpCache] = None
+_shared_lock = threading.Lock()
+
+
+def get_http_cache() -> HttpCache:
+    """Process-wide cache configured from the environment."""
+    global _shared_cache
+    with _shared_lock:
+        if _shared_cache is None:
+            _shared_cache = HttpCache()
+        return _shared_cache
+
+
+def cached_get(
+    url: str,
+    *,
+    cache: Optional[HttpCache] = None,
+    headers: Optional[dict[str, str]] = None,
+    **kwargs,
+) -> requests.Response:
+    """Rate-limited GET that revalidates against, and fills, the HTTP cache.
+
+    Extra keyword arguments go to `rate_limited_get`. A 304 and, when the
+    network is unreachable, a connection error are both answered from the
+    cache as a plain 200 response.
+    """
+    cache = cache or get_http_cache()
+    if not cache.enabled:
+        return rate_limited_get(url, headers=headers, **kwargs)
+
+    entry = cache.lookup(url)
+    if entry is not None and cache.is_fresh(entry):
+        return entry.to_response()
+
+    request_headers = dict(headers or {})
+    request_headers.update(cache.validators(entry))
+    try:
+        response = rate_limited_get(url, headers=request_headers, **kwargs)
+    except (requests.ConnectionError, requests.Timeout):
+        if entry is None:
+            raise
+        return entry.to_response()
+
+    if response.status_code == 304 and entry is not None:
+        cache.touch(url)
+        return entry.to_response()
+    if response.status_code == 200:
+        cache.store(url, response.content, response.headers)
+    return response
@@ -0,0 +1,224 @@
+"""Per-host token-bucket rate limiting shared across processes.
+
+The dashboard, cron syncs and CLI fetches often run at the same time and hit
+the same APIs. A per-process sleep either over-throttles (every process waits
+its own interval) or under-throttles (their requests interleave and trip
+429s). Bucket state therefore lives in a small SQLite file that every process
+opens, and each request reserves a slot inside an IMMEDIATE transaction so
+concurrent callers queue behind one another instead of racing.
+
+Rates adapt to server feedback: a 429 halves the host's rate and holds the
+bucket until Retry-After has passed, and each success afterwards steps the
+rate back toward its configured ceiling.
+"""
+
+import os
+import sqlite3
+import tempfile
+import threading
+import time
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+from typing import Optional
+from urllib.parse import urlsplit
+
+import requests
+
+# Requests per second; Scryfall asks for 50-100ms between API calls
+HOST_RATES = {
+    "api.scryfall.com": 1 / 0.11,
+}
+DEFAULT_RATE = 1 / 0.15
+DEFAULT_BURST = 2.0
+MIN_RATE = 0.2
+BACKOFF_FACTOR = 0.5
+# Fraction of the ceiling regained per successful request after a backoff
+RECOVERY_STEP = 0.1
+
+DEFAULT_STATE_PATH = Path(tempfile.gettempdir()) / "proxy-machine-ratelimit.sqlite"
+
+
+def retry_after_seconds(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP date)."""
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        return max(0.0, parsedate_to_datetime(value).timestamp() - time.time())
+    except (TypeError, ValueError):
+        return None
+
+
+def _host(url_or_host: str) -> str:
+    return (urlsplit(url_or_host).netloc or url_or_host).lower()
+
+
+class HostRateLimiter:
+    """Token bucket per host, persisted in SQLite so processes share it."""
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        *,
+        default_rate: float = DEFAULT_RATE,
+        host_rates: Optional[dict[str, float]] = None,
+        burst: float = DEFAULT_BURST,
+    ):
+        """Create a limiter.
+
+        Args:
+            path: State file; defaults to PM_RATE_LIMIT_DB or a shared temp file
+            default_rate: Requests per second for hosts not in `host_rates`
+            host_rates: Per-host ceilings in requests per second
+            burst: Requests a host may make back to back after idling
+        """
+        self.path = Path(path or os.environ.get("PM_RATE_LIMIT_DB") or DEFAULT_STATE_PATH)
+        self.default_rate = default_rate
+        self.host_rates = dict(HOST_RATES if host_rates is None else host_rates)
+        self.burst = max(1.0, burst)
+        self._local = threading.local()
+
+    def ceiling(self, host: str) -> float:
+        return self.host_rates.get(host, self.default_rate)
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            conn = sqlite3.connect(str(self.path), timeout=30, isolation_level=None)
+            conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS buckets (
+                    host TEXT PRIMARY KEY,
+                    tokens REAL NOT NULL,
+                    updated REAL NOT NULL,
+                    rate REAL NOT NULL
+                )
+                """
+            )
+            self._local.conn = conn
+        return conn
+
+    def _load(
+        self, conn: sqlite3.Connection, host: str, now: float
+    ) -> tuple[float, float, bool]:
+        """Current (tokens, rate, held) for `host`.
+
+        Tokens go negative while slots are reserved; `held` is true while a
+        Retry-After hold is still in force.
+        """
+        ceiling = self.ceiling(host)
+        row = conn.execute(
+            "SELECT tokens, updated, rate FROM buckets WHERE host = ?", (host,)
+        ).fetchone()
+        if row is None:
+            return self.burst, ceiling, False
+        tokens, updated, rate = row
+        rate = min(rate, ceiling)
+        return min(self.burst, tokens + (now - updated) * rate), rate, updated > now
+
+    def _store(
+        self, conn: sqlite3.Connection, host: str, tokens: float, updated: float, rate: float
+    ) -> None:
+        conn.execute(
+            "INSERT OR REPLACE INTO buckets (host, tokens, updated, rate) VALUES (?, ?, ?, ?)",
+            (host, tokens, updated, rate),
+        )
+
+    def acquire(self, url_or_host: str) -> float:
+        """Reserve the next request slot for a host and sleep until it opens.
+
+        Returns:
+            Seconds spent waiting
+        """
+        host = _host(url_or_host)
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = time.time()
+            tokens, rate, _ = self._load(conn, host, now)
+            tokens -= 1
+            self._store(conn, host, tokens, now, rate)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        wait = -tokens / rate if tokens < 0 else 0.0
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    def penalize(self, url_or_host: str, retry_after: Optional[float] = None) -> None:
+        """Record a 429: halve the host's rate and hold it for `retry_after` seconds."""
+        host = _host(url_or_host)
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            now = time.time()
+            tokens, rate, held = self._load(conn, host, now)
+            # Callers already waiting on the same backoff must not halve it again
+            if not held:
+                rate = max(MIN_RATE, rate * BACKOFF_FACTOR)
+            delay = retry_after if retry_after is not None else 1 / rate
+            # One token at the end of the hold lets the first caller go right then
+            self._store(conn, host, min(tokens, 0.0) + 1, now + delay, rate)
+            conn.execute("COMMIT")
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+
+    def reward(self, url_or_host: str) -> None:
+        """Record a success: step a backed-off rate back toward its ceiling."""
+        host = _host(url_or_host)
+        ceiling = self.ceiling(host)
+        self._connect().execute(
+            "UPDATE buckets SET rate = min(?, rate + ?) WHERE host = ? AND rate < ?",
+            (ceiling, ceiling * RECOVERY_STEP, host, ceiling),
+        )
+
+    def rate(self, url_or_host: str) -> float:
+        """Current requests per second allowed for a host."""
+        host = _host(url_or_host)
+        return self._load(self._connect(), host, time.time())[1]
+
+
+_shared_limiter: Optional[HostRateLimiter] = None
+_shared_lock = threading.Lock()
+
+
+def get_rate_limiter() -> HostRateLimiter:
+    """Process-wide limiter backed by the shared state file."""
+    global _shared_limiter
+    with _shared_lock:
+        if _shared_limiter is None:
+            _shared_limiter = HostRateLimiter()
+        return _shared_limiter
+
+
+def rate_limited_get(
+    url: str,
+    *,
+    limiter: Optional[HostRateLimiter] = None,
+    session: Optional[requests.Session] = None,
+    max_retries: int = 3,
+    **kwargs,
+) -> requests.Response:
+    """GET through the shared limiter, retrying 429 responses after Retry-After.
+
+    Extra keyword arguments go to `requests.get`. The final response is
+    returned as-is; callers decide whether to `raise_for_status`.
+    """
+    limiter = limiter or get_rate_limiter()
+    get = session.get if session is not None else requests.get
+    kwargs.setdefault("timeout", 30)
+    for _ in range(max_retries + 1):
+        limiter.acquire(url)
+        response = get(url, **kwargs)
+        if response.status_code != 429:
+            limiter.reward(url)
+            break
+        limiter.penalize(url, retry_after_seconds(response.headers.get("Retry-After")))
+    return response
@@ -0,0 +1,207 @@
+"""Persistent cache of pre-scaled card tiles for PDF generation.
+
+A tile is a card image after rotation, bleed crop, resize and corner
+extension - ready to paste onto a sheet. Tiles are keyed by the source
+file's content hash plus every layout parameter that affects them, so the
+same token or basic land shared by many decks is only scaled once.
+
+Entries are stored in a size-bounded diskcache with least-recently-used
+eviction. When diskcache is unavailable the cache is disabled and every
+tile is rebuilt. Within a run, CardTilePool keeps recently used tiles in
+memory so repeated cards are decoded once.
+"""
+
+import hashlib
+import io
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from PIL import Image  # pyright: ignore[reportMissingImports]
+
+try:
+    from diskcache import Cache  # pyright: ignore[reportMissingImports]
+except ImportError:  # pragma: no cover - optional
+    Cache = None  # type: ignore
+
+DEFAULT_CACHE_DIR = ".cache/card_tiles"
+DEFAULT_SIZE_LIMIT_MB = 2048
+DEFAULT_POOL_SIZE_MB = 512
+
+# Bump when the tile pipeline changes so stale tiles are never reused
+TILE_VERSION = 1
+
+# Modes PNG stores losslessly
+CACHEABLE_MODES = {"1", "L", "LA", "P", "RGB", "RGBA", "I;16"}
+
+
+def file_digest(path: str) -> str:
+    """Return the SHA-256 hex digest of a file's contents."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def tile_key(
+    source_hash: str,
+    card_size: Tuple[int, int],
+    ppi_ratio: float,
+    crop: Tuple[float, float],
+    extend_corners: int,
+    flip: bool,
+) -> str:
+    """Build the cache key for a tile rendered with the given layout parameters."""
+    width, height = card_size
+    return (
+        f"v{TILE_VERSION}:{source_hash}:{width}x{height}:{ppi_ratio!r}:"
+        f"{crop[0]!r},{crop[1]!r}:{extend_corners}:{int(flip)}"
+    )
+
+
+class CardTileCache:
+    """Size-bounded LRU cache of ready-to-paste card tiles."""
+
+    def __init__(
+        self,
+        directory: str = DEFAULT_CACHE_DIR,
+        size_limit_mb: int = DEFAULT_SIZE_LIMIT_MB,
+    ):
+        """Open (or create) the cache.
+
+        Args:
+            directory: Cache directory
+            size_limit_mb: Maximum cache size before least-recently-used tiles are evicted
+        """
+        self.directory = directory
+        self.size_limit_mb = size_limit_mb
+        self._cache = None
+        if Cache is not None:
+            self._cache = Cache(
+                directory,
+                size_limit=size_limit_mb * 1024 * 1024,
+                eviction_policy="least-recently-used",
+            )
+
+    @property
+    def enabled(self) -> bool:
+        return self._cache is not None
+
+    def get(self, key: str) -> Optional[Image.Image]:
+        """Return the cached tile for `key`, or None on a miss."""
+        if self._cache is None:
+            return None
+
+        data = self._cache.get(key)
+        if data is None:
+            return None
+
+        with Image.open(io.BytesIO(data)) as tile:
+            tile.load()
+            return tile
+
+    def set(self, key: str, tile: Image.Image) -> None:
+        """Store a tile. Images in modes PNG cannot round-trip are skipped."""
+        if self._cache is None or tile.mode not in CACHEABLE_MODES:
+            return
+
+        buffer = io.BytesIO()
+        tile.save(buffer, format="PNG", compress_level=1)
+        self._cache.set(key, buffer.getvalue())
+
+    def stats(self) -> Dict[str, Any]:
+        """Return entry count and disk usage."""
+        if self._cache is None:
+            return {"enabled": False, "directory": self.directory}
+
+        return {
+            "enabled": True,
+            "directory": self.directory,
+            "entries": len(self._cache),
+            "volume_bytes": self._cache.volume(),
+            "size_limit_bytes": self._cache.size_limit,
+        }
+
+    def prune(self, size_limit_mb: Optional[int] = None) -> int:
+        """Evict least-recently-used tiles until the cache fits the size limit.
+
+        Args:
+            size_limit_mb: Temporary target size; defaults to the configured limit
+
+        Returns:
+            Number of tiles evicted
+        """
+        if self._cache is None:
+            return 0
+
+        if size_limit_mb is None:
+            return self._cache.cull()
+
+        configured = self._cache.size_limit
+        self._cache.reset("size_limit", size_limit_mb * 1024 * 1024)
+        try:
+            return self._cache.cull()
+        finally:
+            self._cache.reset("size_limit", configured)
+
+    def clear(self) -> int:
+        """Remove every tile and return the number removed."""
+        if self._cache is None:
+            return 0
+        return self._cache.clear()
+
+    def close(self) -> None:
+        if self._cache is not None:
+            self._cache.close()
+
+
+class CardTilePool:
+    """In-memory LRU pool of tiles decoded during a single PDF run.
+
+    Repeated cards (30 copies of a basic land, a stack of identical tokens)
+    share one decoded and scaled tile across every slot and sheet. The pool
+    is bounded by the uncompressed size of the tiles it holds.
+    """
+
+    def __init__(self, max_size_mb: int = DEFAULT_POOL_SIZE_MB):
+        """Initialize pool.
+
+        Args:
+            max_size_mb: Maximum uncompressed size of pooled tiles
+        """
+        self.max_bytes = max_size_mb * 1024 * 1024
+        self.tiles: "OrderedDict[str, Image.Image]" = OrderedDict()
+        self.size_bytes = 0
+        self._digests: Dict[str, str] = {}
+
+    @staticmethod
+    def _tile_bytes(tile: Image.Image) -> int:
+        return tile.width * tile.height * len(tile.getbands())
+
+    def digest(self, path: str) -> str:
+        """Return the content hash for a path, hashing each path once per run."""
+        source_hash = self._digests.get(path)
+        if source_hash is None:
+            source_hash = file_digest(path)
+            self._digests[path] = source_hash
+        return source_hash
+
+    def get(self, key: str) -> Optional[Image.Image]:
+        tile = self.tiles.get(key)
+        if tile is not None:
+            # Move to end (most recently used)
+            self.tiles.move_to_end(key)
+        return tile
+
+    def put(self, key: str, tile: Image.Image) -> None:
+        tile_bytes = self._tile_bytes(tile)
+        if key in self.tiles or tile_bytes > self.max_bytes:
+            return
+
+        # Remove least recently used tiles until the new one fits
+        while self.tiles and self.size_bytes + tile_bytes > self.max_bytes:
+            _, evicted = self.tiles.popitem(last=False)
+            self.size_bytes -= self._tile_bytes(evicted)
+
+        self.tiles[key] = tile
+        self.size_bytes += tile_bytes
@@ -1,13 +1,14 @@
 from os import path
-from requests import Response, get
-from time import sleep
+from requests import Response
+from net.http_cache import cached_get
 
 
 def request_altered(query: str) -> Response:
-    r = get(query, headers={"user-agent": "silhouette-card-maker/0.1", "accept": "*/*"})
+    r = cached_get(
+        query, headers={"user-agent": "silhouette-card-maker/0.1", "accept": "*/*"}
+    )
 
     r.raise_for_status()
-    sleep(0.15)
 
     return r
 
@@ -0,0 +1,88 @@
+"""Batch card fetching for the plugin fetch scripts.
+
+Each game's ``parse_deck`` calls its ``handle_card`` callback once per deck
+line, and the callbacks fetch art over the network. Called inline, a
+100-card deck runs one request at a time. `BatchFetch` stands in for
+``handle_card``: it records every call while the deck is parsed, then `run`
+submits them all to one shared thread pool and reports results in deck order.
+
+Politeness per API comes from the shared per-host limiter that every plugin
+``request_*`` helper goes through (see net/ratelimit.py), so widening the pool
+does not raise the request rate to any single host beyond its limit.
+"""
+
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+DEFAULT_MAX_WORKERS = int(os.environ.get("PM_MAX_WORKERS", "8"))
+
+_executor: Optional[ThreadPoolExecutor] = None
+_executor_lock = threading.Lock()
+
+
+def get_fetch_executor() -> ThreadPoolExecutor:
+    """Thread pool shared by every batch in this process."""
+    global _executor
+    with _executor_lock:
+        if _executor is None:
+            _executor = ThreadPoolExecutor(
+                max_workers=max(1, DEFAULT_MAX_WORKERS), thread_name_prefix="card-fetch"
+            )
+        return _executor
+
+
+@dataclass
+class CardFetch:
+    """One recorded ``handle_card`` call and its outcome."""
+
+    position: int
+    args: Tuple[Any, ...]
+    kwargs: Dict[str, Any] = field(default_factory=dict)
+    result: Any = None
+    error: Optional[Exception] = None
+
+
+class BatchFetch:
+    """Callable stand-in for ``handle_card`` that defers fetches to `run`."""
+
+    def __init__(
+        self, handle_card: Callable, *, executor: Optional[ThreadPoolExecutor] = None
+    ):
+        self.handle_card = handle_card
+        self.executor = executor
+        self.fetches: List[CardFetch] = []
+
+    def __call__(self, *args, **kwargs) -> None:
+        self.fetches.append(CardFetch(len(self.fetches), args, kwargs))
+
+    def __len__(self) -> int:
+        return len(self.fetches)
+
+    def run(self) -> List[CardFetch]:
+        """Fetch every recorded card concurrently; returns them in deck order.
+
+        Failures are printed and recorded on their `CardFetch` rather than
+        raised, matching how ``parse_deck`` reports per-line errors.
+        """
+        executor = self.executor or get_fetch_executor()
+        futures = [
+            executor.submit(self.handle_card, *fetch.args, **fetch.kwargs)
+            for fetch in self.fetches
+        ]
+
+        errors = []
+        for fetch, future in zip(self.fetches, futures):
+            try:
+                fetch.result = future.result()
+            except Exception as e:
+                fetch.error = e
+                print(f"Error: {e}")
+                errors.append((fetch.args, e))
+
+        if len(errors) > 0:
+            print(f"Errors: {errors}")
+
+        return self.fetches
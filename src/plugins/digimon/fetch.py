@@ -1,8 +1,15 @@
+import sys
 from os import path
 from click import command, argument, Choice
 
-from deck_formats import DeckFormat, parse_deck
-from digimoncard import get_handle_card
+# Run as a script, only this plugin's folder is on sys.path; add src/ for plugins.*
+SRC_DIR = path.dirname(path.dirname(path.dirname(path.abspath(__file__))))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from deck_formats import DeckFormat, parse_deck  # noqa: E402
+from digimoncard import get_handle_card  # noqa: E402
+from plugins.batch import BatchFetch  # noqa: E402
 
 front_directory = path.join("game", "front")
 double_sided_directory = path.join("game", "double_sided")
@@ -19,7 +26,9 @@ def cli(deck_path: str, format: DeckFormat):
     with open(deck_path, "r") as deck_file:
         deck_text = deck_file.read()
 
-        parse_deck(deck_text, format, get_handle_card(front_directory))
+        batch = BatchFetch(get_handle_card(front_directory))
+        parse_deck(deck_text, format, batch)
+        batch.run()
 
 
 if __name__ == "__main__":
@@ -1,8 +1,9 @@
 from os import path
-from requests import Response, get
-from time import sleep
+from requests import Response
 from re import sub
 from deck_formats import Pitch
+from net.http_cache import cached_get
+
 
 CARD_URL_TEMPLATE = (
     "https://cards.fabtcg.com/api/search/v1/cards/?name={card_name}{pitch}"
@@ -12,14 +13,13 @@
 
 
 def request_fabtcg(query: str) -> Response:
-    r = get(query, headers={"user-agent": "silhouette-card-maker/0.1", "accept": "*/*"})
+    r = cached_get(
+        query, headers={"user-agent": "silhouette-card-maker/0.1", "accept": "*/*"}
+    )
 
     # Check for 2XX response code
     r.raise_for_status()
 
-    # Sleep for 150 milliseconds
-    sleep(0.15)
-
     return r
 
 
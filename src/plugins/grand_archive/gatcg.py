@@ -1,7 +1,8 @@
 from re import sub
 from os import path
-from requests import Response, get
-from time import sleep
+from requests import Response
+from net.http_cache import cached_get
+
 
 CARD_URL_TEMPLATE = "https://api.gatcg.com/cards/{name}"
 CARD_ART_URL_TEMPLATE = "https://api.gatcg.com/{card_art_suffix}"
@@ -10,10 +11,11 @@
 
 
 def request_gatcg(query: str) -> Response:
-    r = get(query, headers={"user-agent": "silhouette-card-maker/0.1", "accept": "*/*"})
+    r = cached_get(
+        query, headers={"user-agent": "silhouette-card-maker/0.1", "accept": "*/*"}
+    )
 
     r.raise_for_status()
-    sleep(0.15)
 
     return r
 
@@ -1,6 +1,7 @@
 from os import path
-from requests import Response, get
-from time import sleep
+from requests import Response
+from net.http_cache import cached_get
+
 
 CARD_ART_URL_TEMPLATE = (
     "https://www.gundam-gcg.com/en/images/cards/card/{card_number}.webp"
@@ -10,10 +11,11 @@
 
 
 def request_bandai(query: str) -> Response:
-    r = get(query, headers={"user-agent": "silhouette-card-maker/0.1", "accept": "*/*"})
+    r = cached_get(
+        query, headers={"user-agent": "silhouette-card-maker/0.1", "accept": "*/*"}
+    )
 
     r.raise_for_status()
-    sleep(0.15)
 
     return r
 
@@ -1,8 +1,16 @@
 import os
+import sys
 
 import click
-from deck_formats import DeckFormat, parse_deck
-from lorcast import get_handle_card
+
+# Run as a script, only this plugin's folder is on sys.path; add src/ for plugins.*
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from deck_formats import DeckFormat, parse_deck  # noqa: E402
+from lorcast import get_handle_card  # noqa: E402
+from plugins.batch import BatchFetch  # noqa: E402
 
 front_directory = os.path.join("game", "front")
 
@@ -23,7 +31,9 @@ def cli(
     with open(deck_path, "r") as deck_file:
         deck_text = deck_file.read()
 
-        parse_deck(deck_text, format, get_handle_card(front_directory))
+        batch = BatchFetch(get_handle_card(front_directory))
+        parse_deck(deck_text, format, batch)
+        batch.run()
 
 
 if __name__ == "__main__":
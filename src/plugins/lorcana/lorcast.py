@@ -1,25 +1,22 @@
 import os
 import re
 import requests
-import time
 from io import BytesIO
 
 from PIL import Image
+from net.http_cache import cached_get
 
 
 def request_lorcast(
     query: str,
 ) -> requests.Response:
-    r = requests.get(
+    r = cached_get(
         query, headers={"user-agent": "silhouette-card-maker/0.1", "accept": "*/*"}
     )
 
     # Check for 2XX response code
     r.raise_for_status()
 
-    # Sleep for 150 milliseconds, greater than the 100ms requested by Lorcast API documentation
-    time.sleep(0.15)
-
     return r
 
 
@@ -1,10 +1,17 @@
 import os
+import sys
+from typing import Set
 
 import click
-from deck_formats import DeckFormat, parse_deck
-from scryfall import get_handle_card
 
-from typing import Set
+# Run as a script, only this plugin's folder is on sys.path; add src/ for plugins.*
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from deck_formats import DeckFormat, parse_deck  # noqa: E402
+from scryfall import get_handle_card  # noqa: E402
+from plugins.batch import BatchFetch  # noqa: E402
 
 front_directory = os.path.join("game", "front")
 double_sided_directory = os.path.join("game", "double_sided")
@@ -66,9 +73,7 @@ def cli(
     with open(deck_path, "r") as deck_file:
         deck_text = deck_file.read()
 
-        parse_deck(
-            deck_text,
-            format,
+        batch = BatchFetch(
             get_handle_card(
                 ignore_set_and_collector_number,
                 prefer_older_sets,
@@ -77,8 +82,10 @@ def cli(
                 prefer_extra_art,
                 front_directory,
                 double_sided_directory,
-            ),
+            )
         )
+        parse_deck(deck_text, format, batch)
+        batch.run()
 
 
 if __name__ == "__main__":
@@ -2,22 +2,20 @@
 from typing import Any, Callable, Iterable, List, Optional, Sequence, Set, Tuple
 import re
 import requests
-import time
+from net.http_cache import cached_get
+
 
 double_sided_layouts: Set[str] = {"transform", "modal_dfc"}
 
 
 def request_scryfall(query: str) -> requests.Response:
-    r = requests.get(
+    r = cached_get(
         query, headers={"user-agent": "silhouette-card-maker/0.1", "accept": "*/*"}
     )
 
     # Check for 2XX response code
     r.raise_for_status()
 
-    # Sleep for 150 milliseconds, greater than the 100ms requested by Scryfall API documentation
-    time.sleep(0.15)
-
     return r
 
 
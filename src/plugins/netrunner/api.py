@@ -1,8 +1,9 @@
 from os import path
-from requests import Response, get
-from time import sleep
+from requests import Response
 from re import sub
 from unicodedata import normalize, category
+from net.http_cache import cached_get
+
 
 NETRUNNERDB_URL_TEMPLATE = (
     "https://api-preview.netrunnerdb.com/api/v3/public/cards/{card_name}"
@@ -13,10 +14,11 @@
 
 
 def request_api(query: str) -> Response:
-    r = get(query, headers={"user-agent": "silhouette-card-maker/0.1", "accept": "*/*"})
+    r = cached_get(
+        query, headers={"user-agent": "silhouette-card-maker/0.1", "accept": "*/*"}
+    )
 
     r.raise_for_status()
-    sleep(0.15)
 
     return r
 
@@ -1,6 +1,7 @@
 from os import path
-from requests import Response, get
-from time import sleep
+from requests import Response
+from net.http_cache import cached_get
+
 
 CARD_ART_URL_TEMPLATE = (
     "https://en.onepiece-cardgame.com/images/cardlist/card/{card_number}.png"
@@ -10,10 +11,11 @@
 
 
 def request_bandai(query: str) -> Response:
-    r = get(query, headers={"user-agent": "silhouette-card-maker/0.1", "accept": "*/*"})
+    r = cached_get(
+        query, headers={"user-agent": "silhouette-card-maker/0.1", "accept": "*/*"}
+    )
 
     r.raise_for_status()
-    sleep(0.15)
 
     return r
 
@@ -11,6 +11,8 @@
 from dataclasses import dataclass
 import logging
 
+from .batch import BatchFetch
+
 logger = logging.getLogger(__name__)
 
 
@@ -65,6 +67,15 @@ def get_fetcher(self, game: str) -> Optional[Callable]:
         """Get fetcher for a specific game."""
         return self.fetchers.get(game.lower())
 
+    def get_batch_fetcher(self, game: str) -> Optional[BatchFetch]:
+        """Get a batch wrapper around the fetcher for a specific game.
+
+        Pass the result to the game's parser in place of the fetcher, then call
+        its ``run()`` to fetch every card concurrently in deck order.
+        """
+        fetcher = self.get_fetcher(game)
+        return BatchFetch(fetcher) if fetcher else None
+
     def list_parsers(self) -> List[str]:
         """List all available parsers."""
         return list(self.parsers.keys())
@@ -219,6 +230,16 @@ def get_fetcher(game: str) -> Optional[Callable]:
     return registry.get_fetcher(game)
 
 
+def get_batch_fetcher(game: str) -> Optional[BatchFetch]:
+    """Get a batch fetcher for a specific game."""
+    return registry.get_batch_fetcher(game)
+
+
+def batch_fetch(handle_card: Callable) -> BatchFetch:
+    """Wrap any ``handle_card`` callback so a deck's cards are fetched as a batch."""
+    return BatchFetch(handle_card)
+
+
 def list_available_games() -> Dict[str, Dict[str, bool]]:
     """List all games with their available functionality."""
     games = {}
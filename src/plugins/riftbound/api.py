@@ -1,8 +1,9 @@
 from os import path
 from re import compile, search, sub
 from enum import Enum
-import time
 import requests
+from net.http_cache import cached_get
+
 
 PILTOVER_URL_TEMPLATE = "https://piltoverarchive.com/_next/image?url=https://cdn.piltoverarchive.com/cards/{card_number}.webp&w=1920&q=75"
 RIFTMANA_URL_TEMPLATE = (
@@ -16,11 +17,10 @@ class ImageServer(str, Enum):
 
 
 def request_api(query: str) -> requests.Response:
-    r = requests.get(
+    r = cached_get(
         query, headers={"user-agent": "silhouette-card-maker/0.1", "accept": "*/*"}
     )
     r.raise_for_status()
-    time.sleep(0.15)
 
     return r
 
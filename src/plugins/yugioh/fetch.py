@@ -1,8 +1,15 @@
 import os
+import sys
 import click
 
-from deck_formats import DeckFormat, parse_deck
-from ygoprodeck import fetch_card_art
+# Run as a script, only this plugin's folder is on sys.path; add src/ for plugins.*
+SRC_DIR = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+from deck_formats import DeckFormat, parse_deck  # noqa: E402
+from ygoprodeck import fetch_card_art  # noqa: E402
+from plugins.batch import BatchFetch  # noqa: E402
 
 front_directory = os.path.join("game", "front")
 double_sided_directory = os.path.join("game", "double_sided")
@@ -20,8 +27,10 @@ def cli(deck_path: str, format: DeckFormat):
 
     cards = parse_deck(deck_path, format)
 
+    batch = BatchFetch(fetch_card_art)
     for passcode, quantity in cards.items():
-        fetch_card_art(passcode, quantity, front_directory)
+        batch(passcode, quantity, front_directory)
+    batch.run()
 
 
 if __name__ == "__main__":
@@ -1,14 +1,13 @@
 import os
 import requests
-import time
+from net.http_cache import cached_get
 
 
 def request_api(query: str) -> requests.Response:
-    r = requests.get(
+    r = cached_get(
         query, headers={"user-agent": "silhouette-card-maker/0.1", "accept": "*/*"}
     )
     r.raise_for_status()
-    time.sleep(0.15)
 
     return r
 
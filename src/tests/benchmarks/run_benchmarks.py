@@ -202,6 +202,47 @@ def execute(self):
             raise ValueError(f"Expected {cards} positions, got {len(positions)}")
 
 
+class PrintBleedBenchmark(Benchmark):
+    """Benchmark print bleed for a standard card at 600 PPI."""
+
+    def __init__(self, cards: int = 16):
+        super().__init__(
+            "print_bleed",
+            f"Draw {cards} standard cards with bleed at 600 PPI (extend_corners=10)",
+        )
+        self.cards = cards
+
+    def execute(self):
+        import math
+
+        from PIL import Image
+
+        from utilities import calculate_max_print_bleed, draw_card_with_bleed
+
+        ppi_ratio = 2
+        extend_corners_ppi = 10 * ppi_ratio
+        max_print_bleed = calculate_max_print_bleed(
+            [140, 899, 1658, 2417], [231, 1280], 743, 1038
+        )
+        print_bleed = (
+            math.ceil(max_print_bleed[0] * ppi_ratio) + extend_corners_ppi,
+            math.ceil(max_print_bleed[1] * ppi_ratio) + extend_corners_ppi,
+        )
+        card = Image.effect_noise(
+            (743 * ppi_ratio - 2 * extend_corners_ppi, 1038 * ppi_ratio - 2 * extend_corners_ppi),
+            64,
+        ).convert("RGB")
+        sheet = Image.new("RGB", (5100, 6600), "white")
+        origin = (140 * ppi_ratio + extend_corners_ppi, 231 * ppi_ratio + extend_corners_ppi)
+
+        start = time.time()
+        for _ in range(self.cards):
+            draw_card_with_bleed(card, sheet, (*origin, card.width, card.height), print_bleed)
+        per_card = (time.time() - start) / self.cards
+
+        print(f"  Per card: {format_duration(per_card)}")
+
+
 class ImageFetchBenchmark(Benchmark):
     """Benchmark image download simulation."""
 
@@ -272,6 +313,7 @@ def run_all_benchmarks() -> Dict[str, Any]:
         DeckImportBenchmark(),
         TokenExpansionBenchmark(),
         PDFGenerationBenchmark(),
+        PrintBleedBenchmark(),
         ImageFetchBenchmark(),
         MemoryUsageBenchmark(),
     ]
@@ -0,0 +1,29 @@
+"""Shared fixtures for the unit tests."""
+
+import threading
+from http.server import ThreadingHTTPServer
+
+import pytest
+
+
+@pytest.fixture
+def http_server(http_handler):
+    """Serve `http_handler` on a free local port for the duration of a test.
+
+    Modules provide the handler class through an ``http_handler`` fixture.
+    The server carries a ``lock``, its ``base_url`` and any attributes the
+    handler's ``server_state()`` returns, which handlers record requests in
+    and tests use to steer responses.
+    """
+    server = ThreadingHTTPServer(("127.0.0.1", 0), http_handler)
+    server.daemon_threads = True
+    server.lock = threading.Lock()
+    server.base_url = f"http://127.0.0.1:{server.server_address[1]}"
+    state = getattr(http_handler, "server_state", None)
+    for name, value in (state() if state else {}).items():
+        setattr(server, name, value)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
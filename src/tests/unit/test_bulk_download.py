@@ -0,0 +1,175 @@
+"""Unit tests for net/bulk_download.py against a local range-capable server"""
+
+import hashlib
+import json
+import sys
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+
+import pytest
+import requests
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from net.bulk_download import (  # noqa: E402
+    STREAM_CHUNK_SIZE,
+    BulkDownloader,
+    BulkDownloadError,
+)
+from net.network import RetryConfig  # noqa: E402
+
+PART = STREAM_CHUNK_SIZE
+PAYLOAD = bytes(range(256)) * (PART * 5 // 256 + 7)
+
+
+class _RangeHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    @staticmethod
+    def server_state():
+        return {
+            "payload": PAYLOAD,
+            "etag": '"v1"',
+            "ranges": True,
+            "fail_starts": set(),
+            "ranges_served": [],
+            "full_gets": 0,
+        }
+
+    def log_message(self, *args):
+        pass
+
+    def _headers(self, status, length, extra=None):
+        self.send_response(status)
+        self.send_header("Content-Length", str(length))
+        if self.server.ranges:
+            self.send_header("Accept-Ranges", "bytes")
+        self.send_header("ETag", self.server.etag)
+        for key, value in (extra or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+
+    def do_HEAD(self):
+        self._headers(200, len(self.server.payload))
+
+    def do_GET(self):
+        server = self.server
+        payload = server.payload
+        range_header = self.headers.get("Range")
+        if_range = self.headers.get("If-Range")
+        if not server.ranges or not range_header or (if_range and if_range != server.etag):
+            with server.lock:
+                server.full_gets += 1
+            self._headers(200, len(payload))
+            self.wfile.write(payload)
+            return
+        start, end = (int(x) for x in range_header.split("=")[1].split("-"))
+        with server.lock:
+            server.ranges_served.append(start)
+        if start in server.fail_starts:
+            self._headers(503, 0)
+            return
+        body = payload[start : end + 1]
+        self._headers(206, len(body), {"Content-Range": f"bytes {start}-{end}/{len(payload)}"})
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def http_handler():
+    return _RangeHandler
+
+
+@pytest.fixture
+def server(http_server):
+    http_server.url = f"{http_server.base_url}/all-cards.json.gz"
+    return http_server
+
+
+def _downloader():
+    config = RetryConfig(max_retries=2, base_delay=0.01, max_delay=0.01, jitter=False)
+    return BulkDownloader(connections=3, part_size=PART, config=config)
+
+
+def test_parallel_ranges_assemble_file(server, tmp_path):
+    destination = tmp_path / "all-cards.json.gz"
+    seen = []
+
+    result = _downloader().download(
+        server.url,
+        destination,
+        expected_sha256=hashlib.sha256(PAYLOAD).hexdigest(),
+        progress=lambda done, total: seen.append((done, total)),
+    )
+
+    assert destination.read_bytes() == PAYLOAD
+    assert result.size == len(PAYLOAD)
+    assert len(server.ranges_served) == 6
+    assert server.full_gets == 0
+    assert seen[-1] == (len(PAYLOAD), len(PAYLOAD))
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["all-cards.json.gz"]
+
+
+def test_interrupted_download_resumes_missing_parts(server, tmp_path):
+    destination = tmp_path / "all-cards.json.gz"
+    server.fail_starts = {PART * 2, PART * 4}
+
+    with pytest.raises(requests.HTTPError):
+        _downloader().download(server.url, destination)
+
+    assert not destination.exists()
+    # max_retries=2 means one attempt plus two retries per part
+    assert server.ranges_served.count(PART * 2) == 3
+    checkpoint = json.loads((tmp_path / "all-cards.json.gz.part.json").read_text())
+    assert 2 not in checkpoint["done"] and 4 not in checkpoint["done"]
+
+    server.fail_starts = set()
+    server.ranges_served = []
+    result = _downloader().download(server.url, destination)
+
+    assert destination.read_bytes() == PAYLOAD
+    assert sorted(server.ranges_served) == [PART * 2, PART * 4]
+    assert result.resumed_bytes == 4 * PART - (6 * PART - len(PAYLOAD))
+
+
+def test_changed_remote_discards_checkpoint(server, tmp_path):
+    destination = tmp_path / "all-cards.json.gz"
+    server.fail_starts = {PART}
+    with pytest.raises(requests.HTTPError):
+        _downloader().download(server.url, destination)
+
+    server.fail_starts = set()
+    server.payload = PAYLOAD[::-1]
+    server.etag = '"v2"'
+    server.ranges_served = []
+    _downloader().download(server.url, destination)
+
+    assert destination.read_bytes() == PAYLOAD[::-1]
+    assert len(server.ranges_served) == 6
+
+
+def test_checksum_mismatch_is_not_published(server, tmp_path):
+    destination = tmp_path / "all-cards.json.gz"
+
+    with pytest.raises(BulkDownloadError):
+        _downloader().download(server.url, destination, expected_sha256="0" * 64)
+
+    assert list(tmp_path.iterdir()) == []
+
+
+def test_size_mismatch_rejected_before_download(server, tmp_path):
+    with pytest.raises(BulkDownloadError):
+        _downloader().download(server.url, tmp_path / "x.gz", expected_size=1)
+
+    assert server.ranges_served == []
+
+
+def test_server_without_ranges_streams_once(server, tmp_path):
+    server.ranges = False
+    destination = tmp_path / "all-cards.json.gz"
+
+    result = _downloader().download(server.url, destination)
+
+    assert destination.read_bytes() == PAYLOAD
+    assert server.full_gets == 1
+    assert result.sha256 == hashlib.sha256(PAYLOAD).hexdigest()
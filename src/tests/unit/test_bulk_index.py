@@ -0,0 +1,580 @@
+"""Unit tests for the bulk database builder in db/bulk_index.py"""
+
+import gzip
+import importlib
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).parent.parent.parent
+
+
+@pytest.fixture
+def bulk_index(monkeypatch):
+    """Import db.bulk_index even when the tests/unit/db package shadows `db`."""
+    for name in list(sys.modules):
+        if name == "db" or name.startswith("db."):
+            monkeypatch.delitem(sys.modules, name)
+    monkeypatch.syspath_prepend(str(SRC_DIR))
+    return importlib.import_module("db.bulk_index")
+
+
+def _card(i: int) -> dict:
+    card = {
+        "object": "card",
+        "id": f"card-{i:05d}",
+        "oracle_id": f"oracle-{i % 7}",
+        "name": f"Test Card {i}",
+        "set": "TST" if i % 2 else "ABC",
+        "collector_number": str(i),
+        "type_line": "Basic Land — Forest" if i % 5 == 0 else "Creature — Elf",
+        "layout": "token" if i % 11 == 0 else "normal",
+        "lang": "en",
+        "colors": ["G"],
+        "prices": {"usd": f"{i}.00"},
+        "image_uris": {"png": f"https://example.test/{i}.png"},
+        "all_parts": [{"id": f"card-{i + 1:05d}", "component": "token", "name": "Elf"}],
+    }
+    if i % 13 == 0:
+        card["card_faces"] = [
+            {"name": "Front Face", "type_line": "Creature"},
+            {
+                "name": "Land Face",
+                "type_line": "Land",
+                "image_uris": {"png": f"https://example.test/{i}-land.png"},
+            },
+        ]
+    return card
+
+
+def _write_bulk(directory: Path, cards: list, layout: str = "scryfall") -> Path:
+    path = directory / "all-cards.json.gz"
+    with gzip.open(path, "wt", encoding="utf-8") as f:
+        if layout == "scryfall":
+            # One card per line inside an array, as Scryfall ships it
+            f.write("[\n" + ",\n".join(json.dumps(c) for c in cards) + "\n]\n")
+        else:
+            json.dump(cards, f, indent=2)
+    return path
+
+
+def _build(bulk_index, monkeypatch, tmp_path, cards, layout="scryfall", workers=1):
+    bulk_dir = tmp_path / f"bulk_{layout}_{workers}"
+    bulk_dir.mkdir()
+    all_cards = _write_bulk(bulk_dir, cards, layout)
+    oracle = bulk_dir / "oracle-cards.json"
+    oracle.write_text(
+        json.dumps(
+            [
+                {"oracle_id": f"oracle-{i}", "oracle_text": f"Text {i}", "keywords": ["Reach"]}
+                for i in range(7)
+            ]
+        )
+    )
+    monkeypatch.setattr(bulk_index, "BULK_DIR", str(bulk_dir))
+    monkeypatch.setattr(bulk_index, "_get_all_cards_path", lambda: str(all_cards))
+    monkeypatch.setattr(bulk_index, "_get_oracle_path", lambda: str(oracle))
+
+    db_path = bulk_dir / "bulk.db"
+    bulk_index.build_db_from_bulk_json(str(db_path), workers=workers)
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute("SELECT * FROM prints ORDER BY id").fetchall()
+        indexes = conn.execute(
+            "SELECT name FROM sqlite_master WHERE type='index' AND tbl_name='prints' "
+            "AND sql IS NOT NULL ORDER BY name"
+        ).fetchall()
+        relationships = conn.execute("SELECT COUNT(*) FROM card_relationships").fetchone()
+    finally:
+        conn.close()
+    return rows, indexes, relationships[0]
+
+
+def test_card_to_row_matches_schema(bulk_index):
+    """A transformed card fills every prints column in insert order."""
+    oracle_map = {"oracle-3": {"oracle_text": "Text", "keywords": ["Reach"], "color_identity": ["G"]}}
+    row = bulk_index._card_to_row(_card(3), oracle_map)
+
+    assert len(row) == bulk_index._PRINTS_INSERT_SQL.count("?")
+    assert row[:4] == ("card-00003", "Test Card 3", "test_card_3", "tst")
+    assert row[10:13] == ('["G"]', '["Reach"]', "Text")
+    assert bulk_index._card_to_row({"name": "No id"}, oracle_map) is None
+
+
+def test_card_batches_fall_back_for_pretty_printed_dumps(bulk_index, tmp_path):
+    """Dumps that are not one card per line are still read in full."""
+    cards = [_card(i) for i in range(5)]
+    path = _write_bulk(tmp_path, cards, layout="pretty")
+
+    batches = list(bulk_index._iter_card_batches(str(path), 2))
+
+    assert [len(b) for b in batches] == [2, 2, 1]
+    assert all(isinstance(card, dict) for batch in batches for card in batch)
+
+
+def test_parallel_build_matches_serial(bulk_index, monkeypatch, tmp_path, capsys):
+    """Worker processes and the in-process path produce identical tables."""
+    cards = [_card(i) for i in range(1, 60)]
+    cards.append({"name": "Missing id"})
+    cards.append(dict(_card(7), name="Reprinted"))  # later duplicate wins
+
+    serial = _build(bulk_index, monkeypatch, tmp_path, cards, workers=1)
+    parallel = _build(bulk_index, monkeypatch, tmp_path, cards, workers=2)
+    pretty = _build(bulk_index, monkeypatch, tmp_path, cards, layout="pretty")
+
+    rows, indexes, relationships = serial
+    assert len(rows) == 59
+    assert next(r for r in rows if r[0] == "card-00007")[1] == "Reprinted"
+    assert next(r for r in rows if r[0] == "card-00013")[1] == "Land Face"
+    assert len(indexes) >= 10  # secondary indexes rebuilt after the load
+    assert relationships == 59
+    assert parallel == serial
+    assert pretty == serial
+    assert "cards/s" in capsys.readouterr().out
+
+
+def _table(db_path, sql):
+    conn = sqlite3.connect(db_path)
+    try:
+        return sorted(conn.execute(sql).fetchall())
+    finally:
+        conn.close()
+
+
+def test_incremental_update_matches_full_rebuild(bulk_index, monkeypatch, tmp_path, capsys):
+    """Only changed prints are rewritten, and the result matches a fresh build."""
+    cards = [_card(i) for i in range(1, 40)]
+    _build(bulk_index, monkeypatch, tmp_path, cards)
+    db_path = str(tmp_path / "bulk_scryfall_1" / "bulk.db")
+    all_cards = Path(bulk_index._get_all_cards_path())
+
+    cards[4] = dict(cards[4], name="Renamed Card", all_parts=[])
+    del cards[10]
+    cards.append(_card(99))
+    _write_bulk(all_cards.parent, cards)
+    capsys.readouterr()
+
+    bulk_index.update_db_from_bulk_json(db_path, workers=1)
+    out = capsys.readouterr().out
+    assert "Added: 1" in out
+    assert "Changed: 1" in out
+    assert "Removed: 1" in out
+
+    expected_dir = tmp_path / "expected"
+    expected_dir.mkdir()
+    expected_db = expected_dir / "bulk.db"
+    bulk_index.build_db_from_bulk_json(str(expected_db), workers=1)
+
+    fts_sql = (
+        "SELECT prints.id FROM prints_fts JOIN prints ON prints.rowid = prints_fts.rowid "
+        "WHERE prints_fts MATCH 'renamed OR forest'"
+    )
+    trigram_sql = (
+        "SELECT prints.id FROM prints_trigram JOIN prints ON prints.rowid = prints_trigram.rowid "
+        "WHERE prints_trigram.name_lower LIKE '%amed car%'"
+    )
+    for sql in (
+        "SELECT * FROM prints",
+        "SELECT * FROM card_relationships",
+        "SELECT * FROM print_keywords",
+        "SELECT * FROM print_legalities",
+        "SELECT * FROM print_stats",
+        fts_sql,
+        trigram_sql,
+    ):
+        assert _table(db_path, sql) == _table(str(expected_db), sql)
+    assert ("card-00005",) in _table(db_path, fts_sql)
+    assert _table(db_path, trigram_sql) == [("card-00005",)]
+
+    bulk_index.update_db_from_bulk_json(db_path, workers=1)
+    assert "nothing to do" in capsys.readouterr().out
+
+
+def test_incremental_update_keeps_rows_when_dump_is_empty(bulk_index, monkeypatch, tmp_path):
+    """An empty dump must not delete every stored print."""
+    rows, _indexes, _relationships = _build(
+        bulk_index, monkeypatch, tmp_path, [_card(i) for i in range(1, 6)]
+    )
+    db_path = str(tmp_path / "bulk_scryfall_1" / "bulk.db")
+    Path(bulk_index._get_all_cards_path()).write_bytes(gzip.compress(b"[]"))
+
+    bulk_index.update_db_from_bulk_json(db_path, workers=1)
+
+    assert len(_table(db_path, "SELECT id FROM prints")) == len(rows)
+
+
+@pytest.mark.parametrize(
+    "damage",
+    ["cut mid-card", "cut after a card", "garbled line"],
+)
+def test_incremental_update_keeps_rows_when_dump_is_damaged(
+    bulk_index, monkeypatch, tmp_path, capsys, damage
+):
+    """A truncated or garbled dump only adds prints; deletions wait for a clean dump."""
+    cards = [_card(i) for i in range(1, 30)]
+    _build(bulk_index, monkeypatch, tmp_path, cards)
+    db_path = str(tmp_path / "bulk_scryfall_1" / "bulk.db")
+    stored = _table(db_path, "SELECT id FROM prints")
+    all_cards = Path(bulk_index._get_all_cards_path())
+
+    lines = [json.dumps(c) for c in cards[:10]] + [json.dumps(_card(99))]
+    if damage == "cut mid-card":
+        text = "[\n" + ",\n".join(lines)[:-25]
+    elif damage == "cut after a card":
+        text = "[\n" + ",\n".join(lines) + ",\n"
+    else:
+        lines[3] = lines[3][:40]
+        text = "[\n" + ",\n".join(lines) + "\n]\n"
+    all_cards.write_bytes(gzip.compress(text.encode()))
+    capsys.readouterr()
+
+    bulk_index.update_db_from_bulk_json(db_path, workers=1)
+
+    assert "damaged" in capsys.readouterr().out
+    ids = _table(db_path, "SELECT id FROM prints")
+    assert set(stored) <= set(ids)
+    assert (("card-00099",) in ids) == (damage != "cut mid-card")
+
+    # The damaged dump was not recorded as imported, so a clean one is applied
+    _write_bulk(all_cards.parent, cards[:10])
+    bulk_index.update_db_from_bulk_json(db_path, workers=1)
+    assert _table(db_path, "SELECT id FROM prints") == [(c["id"],) for c in cards[:10]]
+
+
+def test_queries_reuse_pooled_read_connections(bulk_index, monkeypatch, tmp_path):
+    """Repeated queries share tuned, read-only connections from one pool."""
+    _build(bulk_index, monkeypatch, tmp_path, [_card(i) for i in range(1, 30)])
+    db_path = str(tmp_path / "bulk_scryfall_1" / "bulk.db")
+    pool_module = importlib.import_module("db.connection_pool")
+    pool = pool_module.get_read_pool(db_path)
+
+    for _ in range(50):
+        assert bulk_index.count_unique_artworks(oracle_id="oracle-1", db_path=db_path) == 0
+        assert len(bulk_index.query_tokens(db_path=db_path)) == 2
+    assert pool.opened == 1
+
+    with bulk_index.read_session(db_path) as conn:
+        assert conn.execute("PRAGMA query_only").fetchone() == (1,)
+        with pytest.raises(sqlite3.OperationalError):
+            conn.execute("DELETE FROM prints")
+    with bulk_index.read_session(db_path) as conn:
+        lands = bulk_index.query_basic_lands(db_path=db_path, conn=conn)
+        assert sorted(land["id"] for land in lands) == [f"card-{i:05d}" for i in (5, 10, 15, 20, 25)]
+
+    # A rebuilt (replaced) database file is not served from stale connections
+    replacement = tmp_path / "replacement.db"
+    conn = sqlite3.connect(replacement)
+    conn.execute("CREATE TABLE unique_artworks (oracle_id TEXT)")
+    conn.execute("INSERT INTO unique_artworks VALUES ('oracle-1')")
+    conn.commit()
+    conn.close()
+    replacement.replace(db_path)
+    assert bulk_index.count_unique_artworks(oracle_id="oracle-1", db_path=db_path) == 1
+    pool_module.close_all_pools()
+
+
+def test_query_cache_is_invalidated_by_rebuilds(bulk_index, monkeypatch, tmp_path):
+    """Cached results are keyed by the database generation each import stamps."""
+    query_cache = importlib.import_module("db.query_cache")
+    cache = query_cache.QueryCache(directory=None)
+    monkeypatch.setattr(query_cache, "_global_cache", cache)
+    cards = [_card(i) for i in range(1, 30)]
+    _build(bulk_index, monkeypatch, tmp_path, cards)
+    db_path = str(tmp_path / "bulk_scryfall_1" / "bulk.db")
+    first_generation = query_cache.database_generation(db_path)
+
+    assert len(bulk_index.query_tokens(db_path=db_path)) == 2
+    assert len(bulk_index.query_tokens(None, None, None, None, db_path)) == 2
+    assert (cache.hits, cache.misses, len(cache)) == (1, 1, 1)
+
+    cards.append(_card(33))
+    _write_bulk(Path(bulk_index._get_all_cards_path()).parent, cards)
+    bulk_index.update_db_from_bulk_json(db_path, workers=1)
+
+    assert query_cache.database_generation(db_path) != first_generation
+    assert len(cache) == 0  # superseded generation evicted
+    assert len(bulk_index.query_tokens(db_path=db_path)) == 3
+    assert cache.get_stats()["total_misses"] == 2
+
+    # Nothing is cached for a database that does not exist
+    assert bulk_index.query_tokens(db_path=str(tmp_path / "missing.db")) == []
+    assert len(cache) == 1
+    importlib.import_module("db.connection_pool").close_all_pools()
+
+
+def test_streaming_queries_fetch_in_batches(bulk_index, monkeypatch, tmp_path):
+    """iter_* variants yield the list queries' rows without materializing them."""
+    _build(bulk_index, monkeypatch, tmp_path, [_card(i) for i in range(1, 60)])
+    db_path = str(tmp_path / "bulk_scryfall_1" / "bulk.db")
+    fetched = []
+    stream = bulk_index._stream
+
+    def recording_stream(cur, batch_size):
+        fetched.append(batch_size)
+        return stream(cur, batch_size)
+
+    monkeypatch.setattr(bulk_index, "_stream", recording_stream)
+
+    rows = bulk_index.iter_cards_optimized(db_path=db_path, card_type="any", batch_size=7)
+    first = next(rows)
+    assert first["id"].startswith("card-")
+    assert set(first) == set(bulk_index._PRINTS_PUBLIC_COLUMNS)
+    assert [first, *rows] == bulk_index.query_cards_optimized(db_path=db_path, card_type="any")
+    assert fetched[0] == 7
+
+    lands = list(bulk_index.iter_basic_lands(db_path=db_path, batch_size=2))
+    assert sorted(land["id"] for land in lands) == [f"card-{i:05d}" for i in range(5, 60, 5)]
+    assert list(bulk_index.iter_tokens(db_path=db_path, batch_size=1)) == bulk_index.query_tokens(
+        db_path=db_path
+    )
+    assert list(bulk_index.iter_non_basic_lands(db_path=str(tmp_path / "missing.db"))) == []
+    importlib.import_module("db.connection_pool").close_all_pools()
+
+
+class _TrackingConnection(sqlite3.Connection):
+    def cursor(self, *args, **kwargs):
+        cur = super().cursor(*args, **kwargs)
+        self.cursors.append(cur)
+        return cur
+
+
+def test_abandoned_streams_close_their_cursor(bulk_index, monkeypatch, tmp_path):
+    """Closing an iter_* generator partway closes its cursor right away."""
+    _build(bulk_index, monkeypatch, tmp_path, [_card(i) for i in range(1, 60)])
+    db_path = str(tmp_path / "bulk_scryfall_1" / "bulk.db")
+    conn = sqlite3.connect(db_path, factory=_TrackingConnection)
+    conn.cursors = []
+    try:
+        for stream in (
+            bulk_index.iter_cards_optimized(db_path=db_path, conn=conn, batch_size=2),
+            bulk_index.iter_basic_lands(db_path=db_path, conn=conn, batch_size=2),
+            bulk_index.iter_tokens(db_path=db_path, conn=conn, batch_size=1),
+        ):
+            next(stream)
+            stream.close()
+            with pytest.raises(sqlite3.ProgrammingError):
+                conn.cursors[-1].fetchone()
+    finally:
+        conn.close()
+
+
+def test_entries_decode_json_columns_lazily(bulk_index, monkeypatch, tmp_path):
+    """Entries act like plain dicts but only parse the JSON columns they touch."""
+    import pickle
+
+    _build(bulk_index, monkeypatch, tmp_path, [_card(i) for i in range(1, 30)])
+    db_path = str(tmp_path / "bulk_scryfall_1" / "bulk.db")
+
+    entry = bulk_index.query_cards(db_path=db_path, card_ids=["card-00011"])[0]
+    assert isinstance(entry, dict)
+    assert entry["colors"] == ["G"]
+    assert "prices" in entry._pending and "all_parts" in entry._pending
+    assert entry.get("prices") == {"usd": "11.00"}
+    assert entry["token_subtype"] == "Elf"
+    assert entry["keywords"] is entry["oracle_keywords"]
+    assert entry["keywords"] == ["Reach"]
+    assert "oracle_keywords" not in entry._pending
+
+    decoded = json.loads(json.dumps(entry))
+    assert decoded["all_parts"][0]["id"] == "card-00012"
+    assert dict(entry) == decoded == {**entry} == pickle.loads(pickle.dumps(entry))
+    assert type(pickle.loads(pickle.dumps(entry))) is dict
+
+
+def test_column_projection_selects_only_requested_fields(bulk_index, monkeypatch, tmp_path):
+    _build(bulk_index, monkeypatch, tmp_path, [_card(i) for i in range(1, 30)])
+    db_path = str(tmp_path / "bulk_scryfall_1" / "bulk.db")
+
+    rows = bulk_index.query_cards(db_path=db_path, columns=("name", "image_url", "set"))
+    assert len(rows) == 29
+    assert set(rows[0]) == {"id", "name", "image_url", "set", "set_code"}
+
+    tokens = bulk_index.query_tokens(db_path=db_path, columns=["token_subtype_slug"])
+    assert {t["token_subtype_slug"] for t in tokens} == {"elf"}
+
+    raw = bulk_index.query_cards_optimized(db_path=db_path, columns=["id", "prices"], limit=1)
+    assert raw == [{"id": "card-00001", "prices": '{"usd": "1.00"}'}]
+
+    fts = bulk_index.query_oracle_fts("forest", db_path=db_path, columns=["name"])
+    assert {row["id"] for row in fts} == {f"card-{i:05d}" for i in (5, 10, 15, 20, 25)}
+
+    with pytest.raises(ValueError):
+        bulk_index.query_cards(db_path=db_path, columns=["no_such_field"])
+
+
+def test_color_keyword_and_format_filters_use_side_tables(bulk_index, monkeypatch, tmp_path):
+    """Filters resolve through color_mask and the keyword/legality tables."""
+    palette = [["G"], ["W", "U"], [], ["U", "B", "G"], ["R"]]
+    cards = []
+    for i in range(1, 21):
+        card = dict(_card(i), colors=palette[i % 5])
+        card["legalities"] = {
+            "commander": "legal" if i % 2 else "banned",
+            "modern": "restricted" if i % 3 == 0 else "not_legal",
+        }
+        cards.append(card)
+    _build(bulk_index, monkeypatch, tmp_path, cards)
+    db_path = str(tmp_path / "bulk_scryfall_1" / "bulk.db")
+
+    def ids(rows):
+        return sorted(int(row["id"][-5:]) for row in rows)
+
+    def expected(predicate):
+        return [i for i in range(1, 21) if predicate(i)]
+
+    assert bulk_index.color_mask(["W", "U"]) == 3
+    assert ids(bulk_index.query_cards(db_path=db_path, colors_filter=["G"])) == expected(
+        lambda i: "G" in palette[i % 5]
+    )
+    assert ids(bulk_index.query_cards(db_path=db_path, colors_filter=["U", "G"])) == expected(
+        lambda i: i % 5 == 3
+    )
+    assert ids(bulk_index.query_cards(db_path=db_path, colors_filter=["C"])) == expected(
+        lambda i: i % 5 == 2
+    )
+    assert bulk_index.query_cards(db_path=db_path, colors_filter=["C", "G"]) == []
+    assert ids(bulk_index.query_cards_optimized(db_path=db_path, colors_filter="wu")) == expected(
+        lambda i: i % 5 == 1
+    )
+
+    assert ids(bulk_index.query_cards(db_path=db_path, format_filter="commander")) == expected(
+        lambda i: i % 2
+    )
+    assert ids(bulk_index.query_cards(db_path=db_path, format_filter="modern")) == expected(
+        lambda i: i % 3 == 0
+    )
+    assert len(bulk_index.query_cards(db_path=db_path, keyword_filter="REACH")) == 20
+    assert bulk_index.query_cards(db_path=db_path, keyword_filter=["reach", "flying"]) == []
+
+    tokens = bulk_index.query_tokens_by_keyword("Reach", db_path=db_path)
+    assert ids(tokens) == [11]
+
+    conn = sqlite3.connect(db_path)
+    try:
+        plan = " ".join(
+            row[-1]
+            for row in conn.execute(
+                "EXPLAIN QUERY PLAN SELECT id FROM prints WHERE color_mask IN (16, 17) "
+                "AND id IN (SELECT print_id FROM print_keywords WHERE keyword='reach')"
+            )
+        )
+    finally:
+        conn.close()
+    assert "idx_prints_color_mask" in plan or "print_keywords" in plan
+    assert "SCAN prints" not in plan
+
+
+def test_substring_filters_use_trigram_index_with_fallback(bulk_index, monkeypatch, tmp_path):
+    """Case-insensitive substring filters match the same rows with or without trigrams."""
+    cards = [_card(i) for i in range(1, 25)]
+    cards[2] = dict(cards[2], name="Æther Vial", artist="Ævar Ölsen")
+    cards[3] = dict(cards[3], type_line="Legendary Land")
+    _build(bulk_index, monkeypatch, tmp_path, cards)
+    db_path = str(tmp_path / "bulk_scryfall_1" / "bulk.db")
+
+    def run():
+        return (
+            [r["id"] for r in bulk_index.query_cards_optimized(db_path=db_path, name_filter="æTHER")],
+            [r["id"] for r in bulk_index.query_cards_optimized(db_path=db_path, artist_filter="ölsen")],
+            [r["id"] for r in bulk_index.query_cards_optimized(db_path=db_path, card_type="nonbasic_land")],
+            len(bulk_index.query_cards(db_path=db_path, type_filter="ELF")),
+            len(bulk_index.query_cards(db_path=db_path, name_filter="1")),
+            len(bulk_index.query_cards(db_path=db_path, exclude_lands=True)),
+        )
+
+    expected = (["card-00003"], ["card-00003"], ["card-00004"], 19, 11, 19)
+    with bulk_index.read_session(db_path) as conn:
+        clause, _param = bulk_index._contains_clause(conn, "name", "Vial")
+    assert "prints_trigram" in clause
+    assert run() == expected
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("DROP TABLE prints_trigram")
+    conn.commit()
+    conn.close()
+    importlib.import_module("db.connection_pool").close_all_pools()
+    with bulk_index.read_session(db_path) as conn:
+        clause, _param = bulk_index._contains_clause(conn, "name", "Vial")
+    assert clause == "name_lower LIKE ?"
+    assert run() == expected
+
+
+def test_keyset_pages_cover_results_in_order(bulk_index, monkeypatch, tmp_path):
+    """Cursor pages of cards and unique artworks concatenate to the sorted result."""
+    cards = [_card(i) for i in range(1, 30)]
+    _build(bulk_index, monkeypatch, tmp_path, cards)
+    db_path = str(tmp_path / "bulk_scryfall_1" / "bulk.db")
+    conn = sqlite3.connect(db_path)
+    conn.executemany(
+        "INSERT INTO unique_artworks(id, oracle_id, name) VALUES (?, ?, ?)",
+        [(f"art-{i:02d}", f"oracle-{i % 3}", None if i == 4 else f"Art {i % 5}") for i in range(20)],
+    )
+    conn.commit()
+    conn.close()
+
+    def collect(page, **kwargs):
+        seen, cursor = [], None
+        while True:
+            rows, cursor = page(4, cursor, db_path, **kwargs)
+            assert len(rows) <= 4
+            seen.extend(rows)
+            if cursor is None:
+                return seen
+
+    elves = bulk_index.query_cards(db_path=db_path, type_filter="elf")
+    paged = collect(bulk_index.page_cards, type_filter="elf", columns=("set",))
+    assert [r["id"] for r in paged] == [
+        r["id"] for r in sorted(elves, key=lambda r: (r["name"], r["id"]))
+    ]
+    assert all(set(r) >= {"id", "name", "set"} for r in paged)
+
+    arts = collect(bulk_index.page_unique_artworks, oracle_ids=["oracle-0", "oracle-1"])
+    conn = sqlite3.connect(db_path)
+    expected = [
+        row[0]
+        for row in conn.execute(
+            "SELECT id FROM unique_artworks WHERE oracle_id IN ('oracle-0','oracle-1') "
+            "ORDER BY coalesce(name,''), id"
+        )
+    ]
+    conn.close()
+    assert [a["id"] for a in arts] == expected
+
+    pagination = importlib.import_module("db.pagination")
+    with pytest.raises(pagination.InvalidCursor):
+        bulk_index.page_cards(4, "not-a-cursor", db_path)
+    with pytest.raises(pagination.InvalidCursor):
+        bulk_index.page_cards(4, pagination.encode_cursor(["only-one"]), db_path)
+
+
+def test_print_stats_match_live_aggregates(bulk_index, monkeypatch, tmp_path):
+    """print_stats serves the counts the stats pages used to GROUP BY live."""
+    cards = [_card(i) for i in range(1, 40)]
+    cards[1] = dict(cards[1], lang="ja", rarity="rare")
+    cards[2] = dict(cards[2], name=cards[3]["name"])
+    _build(bulk_index, monkeypatch, tmp_path, cards)
+    db_path = str(tmp_path / "bulk_scryfall_1" / "bulk.db")
+
+    def live(sql):
+        return dict(_table(db_path, sql))
+
+    stats = bulk_index.print_stats(db_path)
+    assert stats["total"] == len(cards)
+    assert stats["distinct_names"] == len(_table(db_path, "SELECT DISTINCT name FROM prints"))
+    assert stats["distinct_sets"] == 2
+    assert stats["by_lang"] == live("SELECT lang, COUNT(*) FROM prints GROUP BY lang")
+    assert stats["by_set"] == live("SELECT set_code, COUNT(*) FROM prints GROUP BY set_code")
+    assert stats["by_rarity"] == live(
+        "SELECT coalesce(rarity,''), COUNT(*) FROM prints GROUP BY 1"
+    )
+    assert stats["by_type"] == {"token": 3, "basic_land": 7, "creature": 29}
+    assert stats["by_token_subtype"] == {"Elf": 3}
+
+    conn = sqlite3.connect(db_path)
+    conn.execute("DROP TABLE print_stats")
+    conn.commit()
+    conn.close()
+    assert bulk_index.print_stats(db_path) == stats
@@ -0,0 +1,96 @@
+"""Unit tests for the streaming bulk JSON reader"""
+
+import gzip
+import io
+import json
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from bulk_json import iter_bulk_json, iter_json_objects  # noqa: E402
+
+CARDS = [
+    {
+        "id": f"card-{i}",
+        "name": "Line\nBreak",
+        "cmc": 2.5e-1 * i,
+        "power": -i,
+        "promo": i % 2 == 0,
+        "watermark": None,
+        "all_parts": [{"id": "x", "component": "token"}],
+    }
+    for i in range(200)
+]
+
+LAYOUTS = {
+    "scryfall": "[\n" + ",\n".join(json.dumps(c) for c in CARDS) + "\n]\n",
+    "pretty": "\ufeff" + json.dumps(CARDS, indent=2),
+    "compact": json.dumps(CARDS),
+    "wrapper": json.dumps({"object": "list", "data": CARDS, "total_cards": 200}),
+    "ndjson": "\n".join(json.dumps(c) for c in CARDS) + "\n",
+}
+
+
+@pytest.mark.parametrize("layout", sorted(LAYOUTS))
+@pytest.mark.parametrize("chunk_size", [1, 3, 64, 1 << 20])
+def test_layouts_round_trip_at_any_chunk_boundary(layout, chunk_size):
+    """Values split across reads (numbers, escapes, literals) decode intact."""
+    cards = list(iter_json_objects(io.StringIO(LAYOUTS[layout]), chunk_size))
+
+    assert cards == CARDS
+
+
+def test_malformed_lines_are_skipped():
+    """A broken NDJSON line is dropped without losing its neighbours."""
+    lines = [json.dumps(c) for c in CARDS[:5]]
+    lines[2] = lines[2][:-5] + " oops"
+    text = "[\n" + ",\n".join(lines) + "\n]\n"
+
+    for chunk_size in (2, 1 << 20):
+        ids = [c["id"] for c in iter_json_objects(io.StringIO(text), chunk_size)]
+        assert ids == ["card-0", "card-1", "card-3", "card-4"]
+
+
+def test_single_object_and_empty_input():
+    assert list(iter_json_objects(io.StringIO('{"id": "solo", "cmc": 3}'))) == [
+        {"id": "solo", "cmc": 3}
+    ]
+    assert list(iter_json_objects(io.StringIO(""))) == []
+
+
+class _CountingHandle(io.StringIO):
+    def __init__(self, text):
+        super().__init__(text)
+        self.chars_read = 0
+
+    def read(self, size=-1):
+        chunk = super().read(size)
+        self.chars_read += len(chunk)
+        return chunk
+
+
+def test_first_card_is_yielded_before_the_file_is_read():
+    """Cards stream out as they are decoded instead of after a full load."""
+    text = LAYOUTS["scryfall"]
+    handle = _CountingHandle(text)
+
+    first = next(iter_json_objects(handle, 256))
+
+    assert first == CARDS[0]
+    assert handle.chars_read < len(text) // 10
+
+
+def test_iter_bulk_json_reads_gzip_and_plain(tmp_path):
+    gz_path = tmp_path / "all-cards.json.gz"
+    with gzip.open(gz_path, "wt", encoding="utf-8") as f:
+        f.write(LAYOUTS["scryfall"])
+    plain_path = tmp_path / "oracle-cards.json"
+    plain_path.write_text(LAYOUTS["pretty"], encoding="utf-8")
+
+    assert list(iter_bulk_json(str(gz_path))) == CARDS
+    assert list(iter_bulk_json(str(plain_path))) == CARDS
+    assert list(iter_bulk_json(str(tmp_path / "missing.json"))) == []
@@ -0,0 +1,172 @@
+"""Unit tests for the memory-mapped card index"""
+
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from card_index import (  # noqa: E402
+    ENTRY_FIELDS,
+    CardIndex,
+    CardIndexError,
+    CardIndexWriter,
+)
+
+
+def _entry(i: int, **overrides) -> dict:
+    entry = {field: None for field in ENTRY_FIELDS}
+    is_token = i % 4 == 0
+    entry.update(
+        id=f"id-{i:03d}",
+        name=f"Card {i % 5}",
+        name_slug=f"card-{i % 5}",
+        set="abc" if i % 2 else "xyz",
+        collector_number=str(i),
+        type_line="Token Creature — Elf" if is_token else "Basic Land — Forest",
+        mana_value=float(i % 3) if i % 7 else None,
+        all_parts=[{"id": f"id-{i + 1:03d}", "component": "token"}],
+        is_basic_land=not is_token,
+        is_token=is_token,
+        token_subtype="Elf" if is_token else None,
+        token_subtype_slug="elf" if is_token else None,
+        legalities={"commander": "legal", "modern": "not_legal"},
+        lang="en",
+        full_art=i % 3 == 0,
+        colors=["G"],
+        power="*" if i % 2 else "2",
+        oracle_id=f"oracle-{i % 3}",
+        flavor_text="Ünïcode “quotes”" if i == 3 else None,
+        card_faces=[],
+    )
+    entry.update(overrides)
+    return entry
+
+
+def _expected(entries: list) -> dict:
+    """The document the JSON index builder produced for the same entries."""
+    doc = {
+        "entries": {},
+        "cards_by_key": {},
+        "cards_by_name": {},
+        "basic_land_ids": [],
+        "token_ids": [],
+        "tokens_by_subtype": {},
+        "tokens_by_name": {},
+    }
+    for entry in entries:
+        card_id = entry["id"]
+        doc["entries"][card_id] = entry
+        key = f"{entry['name_slug']}|{entry['set']}|{entry['collector_number']}"
+        doc["cards_by_key"][key] = card_id
+        doc["cards_by_name"].setdefault(entry["name_slug"], []).append(card_id)
+        if entry["is_basic_land"]:
+            doc["basic_land_ids"].append(card_id)
+        if entry["is_token"]:
+            doc["token_ids"].append(card_id)
+            doc["tokens_by_subtype"].setdefault(entry["token_subtype_slug"], []).append(card_id)
+            doc["tokens_by_name"].setdefault(entry["name_slug"], []).append(card_id)
+    return doc
+
+
+@pytest.fixture
+def built(tmp_path):
+    entries = [_entry(i) for i in range(40, 0, -1)]
+    entries.append(_entry(7, name="Reprinted"))  # later duplicate wins in place
+    writer = CardIndexWriter()
+    for entry in entries:
+        writer.add(entry)
+    path = tmp_path / "all-cards_index.bin"
+    writer.write(str(path), {"schema_version": 5})
+    with CardIndex.open(str(path)) as index:
+        yield index, _expected(entries)
+
+
+def test_sections_match_the_json_document(built):
+    index, expected = built
+
+    assert index.get("metadata") == {"schema_version": 5}
+    assert list(index["entries"]) == list(expected["entries"])
+    assert dict(index["entries"].items()) == expected["entries"]
+    assert list(index["entries"].values()) == list(expected["entries"].values())
+    for name in ("cards_by_key", "cards_by_name", "tokens_by_subtype", "tokens_by_name"):
+        assert dict(index[name]) == expected[name], name
+        assert sorted(index[name]) == sorted(expected[name])
+    assert list(index.get("basic_land_ids", [])) == expected["basic_land_ids"]
+    assert list(index.get("token_ids", [])) == expected["token_ids"]
+
+
+def test_lookups_use_binary_search(built):
+    index, _expected_doc = built
+    entries = index["entries"]
+
+    assert entries["id-007"]["name"] == "Reprinted"
+    assert entries.get("id-003")["flavor_text"] == "Ünïcode “quotes”"
+    assert entries.get("id-000") is None
+    assert entries.get(None) is None
+    assert "id-040" in entries and "id-041" not in entries
+    assert index["cards_by_key"].get("card-2|abc|7") == "id-007"
+    assert index.get("cards_by_name", {}).get("no-such-card", []) == []
+    assert len(index["cards_by_name"]) == 5
+
+
+def test_decoded_values_are_independent_copies(built):
+    index, _expected_doc = built
+    first = index["entries"]["id-001"]
+    first["colors"].append("U")
+    first["legalities"]["commander"] = "banned"
+
+    second = index["entries"]["id-001"]
+    assert second["colors"] == ["G"]
+    assert second["legalities"]["commander"] == "legal"
+    assert index["entries"]["id-002"]["colors"] == ["G"]
+
+
+def test_attach_oracle_overlays_entries(built):
+    index, _expected_doc = built
+    oracle = {"oracle-1": {"oracle_text": "Reach", "keywords": ["Reach"], "mana_cost": "{G}"}}
+
+    index.attach_oracle(oracle, "2024-01-01")
+
+    assert index["metadata"]["oracle_attached"] == "2024-01-01"
+    entry = index["entries"]["id-001"]
+    assert entry["oracle_text"] == "Reach"
+    assert entry["oracle_keywords"] == ["Reach"]
+    assert entry["oracle_mana_cost"] == "{G}"
+    assert "oracle_keywords" not in index["entries"]["id-003"]
+
+
+def test_damaged_files_raise(tmp_path):
+    empty = tmp_path / "empty.bin"
+    empty.write_bytes(b"")
+    legacy = tmp_path / "legacy.bin"
+    legacy.write_text('{"entries": {}}' * 20)
+
+    writer = CardIndexWriter()
+    writer.add(_entry(1))
+    truncated = tmp_path / "truncated.bin"
+    writer.write(str(truncated))
+    truncated.write_bytes(truncated.read_bytes()[:-8])
+
+    for path in (empty, legacy, truncated):
+        with pytest.raises(CardIndexError):
+            CardIndex.open(str(path))
+
+
+def test_writes_leave_no_temp_files(tmp_path, monkeypatch):
+    writer = CardIndexWriter()
+    writer.add(_entry(1))
+    path = tmp_path / "all-cards_index.bin"
+    writer.write(str(path))
+    assert [p.name for p in tmp_path.iterdir()] == [path.name]
+
+    def fail(tmp_name, *args):
+        Path(tmp_name).write_bytes(b"partial")
+        raise OSError("disk full")
+
+    monkeypatch.setattr(CardIndexWriter, "_write_sections", staticmethod(fail))
+    with pytest.raises(OSError):
+        writer.write(str(path))
+    assert [p.name for p in tmp_path.iterdir()] == [path.name]
@@ -0,0 +1,213 @@
+"""Unit tests for net/downloader.py against a local stub HTTP server"""
+
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+
+import pytest
+import requests
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from net.downloader import DownloadEngine  # noqa: E402
+from net.network import RetryConfig  # noqa: E402
+
+BODY = b"x" * 200_000
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    @staticmethod
+    def server_state():
+        return {"client_ports": set(), "hits": {}, "active": 0, "peak": 0}
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.client_ports.add(self.client_address[1])
+            server.active += 1
+            server.peak = max(server.peak, server.active)
+            server.hits[self.path] = server.hits.get(self.path, 0) + 1
+            hits = server.hits[self.path]
+        try:
+            if self.path.startswith("/slow"):
+                time.sleep(0.05)
+            if self.path == "/missing":
+                self._reply(404, b"not found")
+            elif self.path == "/unavailable":
+                self._reply(503, b"down")
+            elif self.path == "/throttled" and hits == 1:
+                self._reply(429, b"slow down", {"Retry-After": "0"})
+            elif self.path == "/stalled" and hits == 1:
+                self._reply(429, b"come back tomorrow", {"Retry-After": "86400"})
+            elif self.path == "/truncated" and hits == 1:
+                # Promise the whole body, send part of it and hang up
+                self.close_connection = True
+                self.send_response(200)
+                self.send_header("Content-Length", str(len(BODY)))
+                self.end_headers()
+                self.wfile.write(BODY[:1000])
+            else:
+                self._reply(200, BODY)
+        finally:
+            with server.lock:
+                server.active -= 1
+
+    def _reply(self, status, body, headers=None):
+        self.send_response(status)
+        self.send_header("Content-Length", str(len(body)))
+        for key, value in (headers or {}).items():
+            self.send_header(key, value)
+        self.end_headers()
+        self.wfile.write(body)
+
+
+@pytest.fixture
+def http_handler():
+    return _StubHandler
+
+
+def _fast_config():
+    return RetryConfig(max_retries=3, base_delay=0.01, max_delay=0.01, jitter=False)
+
+
+def test_download_streams_to_destination(http_server, tmp_path):
+    base = http_server.base_url
+    destination = tmp_path / "nested" / "card.png"
+
+    with DownloadEngine(1) as engine:
+        written = engine.download(f"{base}/card", destination)
+
+    assert written == len(BODY)
+    assert destination.read_bytes() == BODY
+    assert not list(tmp_path.rglob("*.part"))
+
+
+def test_sequential_downloads_reuse_connection(http_server, tmp_path):
+    server, base = http_server, http_server.base_url
+
+    with DownloadEngine(1) as engine:
+        for index in range(5):
+            engine.download(f"{base}/card{index}", tmp_path / f"{index}.png")
+
+    assert len(server.client_ports) == 1
+
+
+def test_per_host_limit_caps_concurrency(http_server, tmp_path):
+    server, base = http_server, http_server.base_url
+    items = [(f"{base}/slow{i}", tmp_path / f"{i}.png", i) for i in range(12)]
+
+    with DownloadEngine(8, per_host=2) as engine:
+        results = list(engine.download_many(items))
+
+    assert sorted(tag for tag, error in results if error is None) == list(range(12))
+    assert server.peak <= 2
+    # Keep-alive sessions mean far fewer connections than requests
+    assert len(server.client_ports) <= 8
+
+
+def test_download_many_pulls_items_as_workers_free_up(http_server, tmp_path):
+    base = http_server.base_url
+    pulled = 0
+
+    def items():
+        nonlocal pulled
+        for i in range(20):
+            pulled += 1
+            yield f"{base}/card{i}", tmp_path / f"{i}.png", i
+
+    with DownloadEngine(2) as engine:
+        results = engine.download_many(items())
+        next(results)
+        assert pulled <= 4
+        assert len(list(results)) == 19
+
+    assert pulled == 20
+
+
+def test_retry_after_is_honored(http_server, tmp_path):
+    server, base = http_server, http_server.base_url
+
+    with DownloadEngine(1, config=_fast_config()) as engine:
+        engine.download(f"{base}/throttled", tmp_path / "throttled.png")
+
+    assert server.hits["/throttled"] == 2
+    assert (tmp_path / "throttled.png").read_bytes() == BODY
+
+
+def test_retry_after_is_capped_by_max_delay(http_server, tmp_path):
+    server, base = http_server, http_server.base_url
+    config = RetryConfig(max_retries=1, base_delay=0.01, max_delay=0.05, jitter=False)
+
+    started = time.monotonic()
+    with DownloadEngine(1, config=config) as engine:
+        engine.download(f"{base}/stalled", tmp_path / "stalled.png")
+
+    assert time.monotonic() - started < 5
+    assert server.hits["/stalled"] == 2
+
+
+def test_truncated_body_is_retried(http_server, tmp_path):
+    server, base = http_server, http_server.base_url
+
+    with DownloadEngine(1, config=_fast_config()) as engine:
+        engine.download(f"{base}/truncated", tmp_path / "truncated.png")
+
+    assert server.hits["/truncated"] == 2
+    assert (tmp_path / "truncated.png").read_bytes() == BODY
+
+
+def test_sessions_are_bounded_across_caller_threads(http_server, tmp_path):
+    server, base = http_server, http_server.base_url
+    engine = DownloadEngine(2)
+
+    # Fresh caller threads each time, as in a long-running dashboard
+    for batch in range(3):
+        threads = [
+            threading.Thread(
+                target=engine.download, args=(f"{base}/slow{i}", tmp_path / f"{batch}-{i}.png")
+            )
+            for i in range(4)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+    engine.close()
+
+    assert len(list(tmp_path.glob("*.png"))) == 12
+    assert len(server.client_ports) <= 2
+
+
+def test_max_retries_counts_retries_after_first_attempt(http_server, tmp_path):
+    server, base = http_server, http_server.base_url
+    config = RetryConfig(max_retries=2, base_delay=0.01, max_delay=0.01, jitter=False)
+
+    with DownloadEngine(1, config=config) as engine:
+        with pytest.raises(requests.HTTPError):
+            engine.download(f"{base}/unavailable", tmp_path / "down.png")
+
+    assert server.hits["/unavailable"] == 3
+
+
+def test_missing_file_reports_error(http_server, tmp_path):
+    server, base = http_server, http_server.base_url
+    items = [
+        (f"{base}/missing", tmp_path / "missing.png", "missing"),
+        (f"{base}/card", tmp_path / "card.png", "card"),
+    ]
+
+    with DownloadEngine(2, config=_fast_config()) as engine:
+        results = dict(engine.download_many(items))
+
+    assert isinstance(results["missing"], requests.HTTPError)
+    assert results["card"] is None
+    assert server.hits["/missing"] == 1
+    assert not (tmp_path / "missing.png").exists()
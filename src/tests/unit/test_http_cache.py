@@ -0,0 +1,168 @@
+"""Unit tests for the conditional HTTP cache in net/http_cache.py"""
+
+import sys
+from http.server import BaseHTTPRequestHandler
+from pathlib import Path
+
+import pytest
+import requests
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from net.http_cache import HttpCache, cached_get  # noqa: E402
+from net.ratelimit import HostRateLimiter  # noqa: E402
+
+ART = b"\x89PNG fake card art"
+
+
+class _EtagHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    @staticmethod
+    def server_state():
+        return {"hits": []}
+
+    def log_message(self, *args):
+        pass
+
+    def do_GET(self):
+        server = self.server
+        with server.lock:
+            server.hits.append(self.path)
+        if self.headers.get("If-None-Match") == '"art-v1"':
+            self.send_response(304)
+            self.send_header("Content-Length", "0")
+            self.end_headers()
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "image/png")
+        self.send_header("ETag", '"art-v1"')
+        self.send_header("Content-Length", str(len(ART)))
+        self.end_headers()
+        self.wfile.write(ART)
+
+
+@pytest.fixture
+def http_handler():
+    return _EtagHandler
+
+
+@pytest.fixture
+def limiter(tmp_path):
+    return HostRateLimiter(tmp_path / "ratelimit.sqlite", default_rate=1000.0, host_rates={})
+
+
+def test_revalidation_reuses_cached_body(http_server, limiter, tmp_path):
+    server, base = http_server, http_server.base_url
+    cache = HttpCache(tmp_path / "http", mode="revalidate", max_age=0)
+
+    first = cached_get(f"{base}/art", cache=cache, limiter=limiter)
+    second = cached_get(f"{base}/art", cache=cache, limiter=limiter)
+
+    assert first.content == second.content == ART
+    assert second.status_code == 200
+    assert second.headers["Content-Type"] == "image/png"
+    assert len(server.hits) == 2
+    assert cache.lookup(f"{base}/art").etag == '"art-v1"'
+
+
+def test_identical_bodies_share_one_blob(http_server, limiter, tmp_path):
+    base = http_server.base_url
+    cache = HttpCache(tmp_path / "http", mode="revalidate", max_age=0)
+
+    cached_get(f"{base}/front", cache=cache, limiter=limiter)
+    cached_get(f"{base}/alternate", cache=cache, limiter=limiter)
+
+    blobs = [path for path in (tmp_path / "http" / "objects").rglob("*") if path.is_file()]
+    assert len(blobs) == 1
+
+
+def test_offline_mode_skips_network_for_cached_urls(http_server, limiter, tmp_path):
+    server, base = http_server, http_server.base_url
+    online = HttpCache(tmp_path / "http", mode="revalidate")
+    cached_get(f"{base}/art", cache=online, limiter=limiter)
+    offline = HttpCache(tmp_path / "http", mode="offline")
+
+    response = cached_get(f"{base}/art", cache=offline, limiter=limiter)
+
+    assert response.content == ART
+    assert len(server.hits) == 1
+
+
+def test_cached_body_served_when_unreachable(http_server, limiter, tmp_path):
+    server, base = http_server, http_server.base_url
+    cache = HttpCache(tmp_path / "http", mode="revalidate", max_age=0)
+    cached_get(f"{base}/art", cache=cache, limiter=limiter)
+    server.shutdown()
+    server.server_close()
+
+    response = cached_get(f"{base}/art", cache=cache, limiter=limiter, timeout=2)
+
+    assert response.content == ART
+    with pytest.raises(requests.ConnectionError):
+        cached_get(f"{base}/never-fetched", cache=cache, limiter=limiter, timeout=2)
+
+
+def test_off_mode_bypasses_cache(http_server, limiter, tmp_path):
+    server, base = http_server, http_server.base_url
+    cache = HttpCache(tmp_path / "http", mode="off")
+
+    cached_get(f"{base}/art", cache=cache, limiter=limiter)
+    cached_get(f"{base}/art", cache=cache, limiter=limiter)
+
+    assert len(server.hits) == 2
+    assert not (tmp_path / "http").exists()
+
+
+def test_unknown_mode_rejected(tmp_path):
+    with pytest.raises(ValueError):
+        HttpCache(tmp_path, mode="sometimes")
+
+
+def _blobs(root):
+    return [path for path in (root / "objects").rglob("*") if path.is_file()]
+
+
+def test_changed_body_drops_old_blob(tmp_path):
+    cache = HttpCache(tmp_path / "http", mode="revalidate")
+
+    cache.store("https://example.test/card", b"old art", {})
+    cache.store("https://example.test/shared", b"old art", {})
+    cache.store("https://example.test/card", b"new art", {})
+    assert len(_blobs(tmp_path / "http")) == 2
+
+    cache.store("https://example.test/shared", b"new art", {})
+    assert len(_blobs(tmp_path / "http")) == 1
+    assert cache.lookup("https://example.test/card").content == b"new art"
+
+
+def test_size_limit_evicts_least_recently_fetched(tmp_path):
+    cache = HttpCache(tmp_path / "http", mode="revalidate", size_limit_mb=1)
+    body = 400 * 1024
+
+    cache.store("https://example.test/a", b"a" * body, {})
+    cache.store("https://example.test/b", b"b" * body, {})
+    cache.touch("https://example.test/a")
+    cache.store("https://example.test/c", b"c" * body, {})
+
+    assert cache.lookup("https://example.test/b") is None
+    assert cache.lookup("https://example.test/a") is not None
+    assert cache.lookup("https://example.test/c") is not None
+    assert len(_blobs(tmp_path / "http")) == 2
+    assert cache.stats()["volume_bytes"] == 2 * body
+
+
+def test_prune_sweeps_unreferenced_blobs(tmp_path):
+    cache = HttpCache(tmp_path / "http", mode="revalidate")
+    cache.store("https://example.test/card", b"art", {})
+    stray = tmp_path / "http" / "objects" / "ab" / ("ab" + "0" * 62)
+    stray.parent.mkdir(parents=True)
+    stray.write_bytes(b"left behind")
+
+    assert cache.prune() == 0
+    assert not stray.exists()
+    assert cache.lookup("https://example.test/card").content == b"art"
+
+    assert cache.prune(0) == 1
+    assert _blobs(tmp_path / "http") == []
@@ -0,0 +1,58 @@
+"""Unit tests for the keyset pagination helpers in db/pagination.py"""
+
+import importlib
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).parent.parent.parent
+
+
+@pytest.fixture
+def pagination(monkeypatch):
+    """Import db.pagination even when the tests/unit/db package shadows `db`."""
+    for name in list(sys.modules):
+        if name == "db" or name.startswith("db."):
+            monkeypatch.delitem(sys.modules, name)
+    monkeypatch.syspath_prepend(str(SRC_DIR))
+    return importlib.import_module("db.pagination")
+
+
+def test_cursor_round_trip(pagination):
+    key = ("Æther Vial", "card-00003", 4.5, None)
+    cursor = pagination.encode_cursor(key)
+    assert "=" not in cursor
+    assert pagination.decode_cursor(cursor, len(key)) == key
+    assert pagination.decode_cursor(None, 2) is None
+
+
+@pytest.mark.parametrize("cursor", ["%%%", "bm90IGpzb24", "W1tdXQ"])
+def test_malformed_cursors_are_rejected(pagination, cursor):
+    with pytest.raises(pagination.InvalidCursor):
+        pagination.decode_cursor(cursor, 1)
+
+
+def test_cursor_width_must_match_listing(pagination):
+    with pytest.raises(pagination.InvalidCursor):
+        pagination.decode_cursor(pagination.encode_cursor(["a", "b"]), 3)
+
+
+def test_page_size_is_clamped(pagination):
+    assert pagination.clamp_page_size(None) == pagination.DEFAULT_PAGE_SIZE
+    assert pagination.clamp_page_size(0) == pagination.DEFAULT_PAGE_SIZE
+    assert pagination.clamp_page_size(10_000) == pagination.MAX_PAGE_SIZE
+    assert pagination.clamp_page_size(7) == 7
+
+
+def test_page_sorted_walks_a_listing(pagination):
+    keys = [(name, str(i)) for i, name in enumerate("aabbbcdde")]
+    keys.sort()
+    seen, cursor = [], None
+    while True:
+        start, end, cursor = pagination.page_sorted(keys, cursor, 4)
+        seen.extend(keys[start:end])
+        if cursor is None:
+            break
+    assert seen == keys
+    assert pagination.page_sorted([], "garbage", 4) == (0, 0, None)
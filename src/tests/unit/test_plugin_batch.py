@@ -0,0 +1,83 @@
+"""Unit tests for batched plugin card fetching in plugins/batch.py"""
+
+import sys
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from plugins.batch import BatchFetch  # noqa: E402
+from plugins.registry import PluginRegistry  # noqa: E402
+
+
+def test_calls_are_deferred_until_run():
+    calls = []
+    batch = BatchFetch(lambda *args: calls.append(args))
+
+    batch(1, "Island", "ltr", "262", 4)
+    batch(2, "Sol Ring")
+
+    assert calls == []
+    assert len(batch) == 2
+    batch.run()
+    assert sorted(calls) == [(1, "Island", "ltr", "262", 4), (2, "Sol Ring")]
+
+
+def test_run_is_concurrent_and_reports_in_deck_order():
+    active = 0
+    peak = 0
+    lock = threading.Lock()
+
+    def handle_card(index, name, quantity=1):
+        nonlocal active, peak
+        with lock:
+            active += 1
+            peak = max(peak, active)
+        # Later cards finish first so completion order differs from deck order
+        time.sleep(0.02 * (10 - index))
+        with lock:
+            active -= 1
+        return f"{index}:{name}x{quantity}"
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        batch = BatchFetch(handle_card, executor=executor)
+        for index in range(1, 9):
+            batch(index, f"card{index}", quantity=index % 3 + 1)
+        fetches = batch.run()
+
+    assert [fetch.position for fetch in fetches] == list(range(8))
+    assert [fetch.result for fetch in fetches] == [
+        f"{i}:card{i}x{i % 3 + 1}" for i in range(1, 9)
+    ]
+    assert peak > 1
+
+
+def test_failures_are_recorded_not_raised(capsys):
+    def handle_card(index, name):
+        if name == "Missing":
+            raise ValueError("no such card")
+
+    batch = BatchFetch(handle_card)
+    batch(1, "Island")
+    batch(2, "Missing")
+    fetches = batch.run()
+
+    assert fetches[0].error is None
+    assert isinstance(fetches[1].error, ValueError)
+    assert "Error: no such card" in capsys.readouterr().out
+
+
+def test_registry_wraps_registered_fetcher():
+    registry = PluginRegistry()
+    fetched = []
+    registry.register_fetcher("lorcana", lambda index, name: fetched.append(name))
+
+    batch = registry.get_batch_fetcher("Lorcana")
+    batch(1, "Elsa")
+    batch.run()
+
+    assert fetched == ["Elsa"]
+    assert registry.get_batch_fetcher("unknown") is None
@@ -0,0 +1,96 @@
+"""Unit tests for the PM_DB_PROFILE query planner audit mode"""
+
+import importlib
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+SRC_DIR = Path(__file__).parent.parent.parent
+
+
+@pytest.fixture
+def profile(monkeypatch, tmp_path):
+    """Import db.query_profile even when the tests/unit/db package shadows `db`."""
+    for name in list(sys.modules):
+        if name == "db" or name.startswith("db."):
+            monkeypatch.delitem(sys.modules, name)
+    monkeypatch.syspath_prepend(str(SRC_DIR))
+    monkeypatch.setenv("PM_DB_PROFILE", "1")
+    monkeypatch.setenv("PM_DB_PROFILE_LOG", str(tmp_path / "profile.jsonl"))
+    return importlib.import_module("db.query_profile")
+
+
+def _make_db(path: Path) -> None:
+    conn = sqlite3.connect(path)
+    conn.execute(
+        "CREATE TABLE prints (id TEXT PRIMARY KEY, name TEXT, set_code TEXT, "
+        "border_color TEXT, cmc REAL)"
+    )
+    conn.execute("CREATE INDEX idx_prints_set ON prints(set_code)")
+    conn.executemany(
+        "INSERT INTO prints VALUES (?,?,?,?,?)",
+        [(f"id-{i}", f"Card {i}", "abc" if i % 2 else "xyz", "black", i % 5) for i in range(50)],
+    )
+    conn.commit()
+    conn.close()
+
+
+def test_shapes_normalize_literals_and_in_lists(profile):
+    assert (
+        profile.normalize_sql("SELECT *  FROM prints\n WHERE id IN (?, ?,?) AND cmc=3 AND x='it''s';")
+        == "SELECT * FROM prints WHERE id IN (?...) AND cmc=? AND x=?"
+    )
+    assert profile.params_shape(("a", "b", 1, 2.0, "c")) == "str*2,int,float,str"
+    plan = ["SCAN p", "SEARCH j USING INDEX idx_x (a=?)", "SCAN prints_fts VIRTUAL TABLE INDEX 0:"]
+    assert profile.full_scans("SELECT p.id FROM prints p JOIN other j ON 1", plan) == ["prints"]
+
+
+def test_pooled_queries_are_recorded_with_plans(profile, tmp_path):
+    db_path = tmp_path / "bulk.db"
+    _make_db(db_path)
+    pool = importlib.import_module("db.connection_pool").ReadConnectionPool(str(db_path))
+
+    for border in ("black", "white"):
+        with pool.connection() as conn:
+            cur = conn.cursor()
+            cur.execute("SELECT id FROM prints WHERE border_color=? AND cmc > ?", (border, 1))
+            cur.fetchall()
+    with pool.connection() as conn:
+        # Only one fetchone: recorded when the connection goes back to the pool
+        assert conn.execute("SELECT COUNT(*) FROM prints WHERE set_code=?", ("abc",)).fetchone() == (25,)
+    pool.close()
+
+    records = profile.load_records()
+    assert [r["rows"] for r in records] == [30, 0, 1]
+    assert records[0]["full_scans"] == ["prints"] and "plan" not in records[1]
+
+    summary = profile.summarize(records)
+    scan = next(agg for agg in summary if agg["full_scans"])
+    assert scan["calls"] == 2
+    assert scan["shape"] == "SELECT id FROM prints WHERE border_color=? AND cmc > ?"
+    assert profile.index_usage(summary) == {"idx_prints_set": 1}
+
+    conn = sqlite3.connect(db_path)
+    try:
+        suggestions = profile.suggest_indexes(summary, conn)
+        assert [s["sql"] for s in suggestions] == [
+            "CREATE INDEX IF NOT EXISTS idx_prints_border_color_cmc ON prints(border_color, cmc);"
+        ]
+        conn.execute(suggestions[0]["sql"])
+        assert profile.suggest_indexes(summary, conn) == []
+    finally:
+        conn.close()
+
+
+def test_profiling_is_off_by_default(profile, monkeypatch, tmp_path):
+    monkeypatch.delenv("PM_DB_PROFILE")
+    db_path = tmp_path / "bulk.db"
+    _make_db(db_path)
+    pool = importlib.import_module("db.connection_pool").ReadConnectionPool(str(db_path))
+    with pool.connection() as conn:
+        conn.execute("SELECT * FROM prints").fetchall()
+        assert type(conn) is sqlite3.Connection
+    pool.close()
+    assert profile.load_records() == []
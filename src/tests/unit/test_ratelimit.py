@@ -0,0 +1,121 @@
+"""Unit tests for the shared per-host rate limiter in net/ratelimit.py"""
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from net.ratelimit import (  # noqa: E402
+    HostRateLimiter,
+    rate_limited_get,
+    retry_after_seconds,
+)
+
+HOST = "https://api.example.test/cards"
+
+
+@pytest.fixture
+def state_path(tmp_path):
+    return tmp_path / "ratelimit.sqlite"
+
+
+def _limiter(path, rate=20.0, burst=1.0):
+    return HostRateLimiter(path, default_rate=rate, host_rates={}, burst=burst)
+
+
+def test_first_request_is_immediate(state_path):
+    assert _limiter(state_path).acquire(HOST) == 0
+
+
+def test_instances_share_one_bucket(state_path):
+    # Separate instances open their own connections, like separate processes
+    limiters = [_limiter(state_path) for _ in range(2)]
+    start = time.monotonic()
+
+    def worker(limiter):
+        for _ in range(3):
+            limiter.acquire(HOST)
+
+    threads = [threading.Thread(target=worker, args=(lim,)) for lim in limiters]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    # Six requests at 20/s with no burst need at least five intervals
+    assert time.monotonic() - start >= 5 / 20 - 0.02
+
+
+def test_hosts_are_limited_independently(state_path):
+    limiter = _limiter(state_path, rate=1.0)
+    limiter.acquire("https://one.example.test/")
+
+    assert limiter.acquire("https://two.example.test/") == 0
+
+
+def test_penalize_backs_off_and_holds(state_path):
+    limiter = _limiter(state_path)
+    limiter.acquire(HOST)
+
+    limiter.penalize(HOST, retry_after=0.2)
+
+    assert limiter.rate(HOST) == pytest.approx(10.0)
+    assert limiter.acquire(HOST) == pytest.approx(0.2, abs=0.05)
+
+
+def test_repeat_429s_during_hold_do_not_compound(state_path):
+    limiter = _limiter(state_path)
+    limiter.penalize(HOST, retry_after=0.2)
+    limiter.penalize(HOST, retry_after=0.2)
+
+    assert limiter.rate(HOST) == pytest.approx(10.0)
+
+
+def test_reward_recovers_to_ceiling(state_path):
+    limiter = _limiter(state_path)
+    limiter.penalize(HOST, retry_after=0)
+
+    for _ in range(20):
+        limiter.reward(HOST)
+
+    assert limiter.rate(HOST) == pytest.approx(20.0)
+
+
+def test_retry_after_parsing():
+    assert retry_after_seconds("2") == 2.0
+    assert retry_after_seconds(None) is None
+    assert retry_after_seconds("soon") is None
+    assert retry_after_seconds("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+
+
+class _Response:
+    def __init__(self, status_code, headers=None):
+        self.status_code = status_code
+        self.headers = headers or {}
+
+
+class _Session:
+    def __init__(self, statuses):
+        self.statuses = list(statuses)
+        self.calls = 0
+
+    def get(self, url, **kwargs):
+        self.calls += 1
+        status = self.statuses.pop(0)
+        return _Response(status, {"Retry-After": "0"} if status == 429 else {})
+
+
+def test_rate_limited_get_retries_429(state_path):
+    limiter = _limiter(state_path)
+    session = _Session([429, 200])
+
+    response = rate_limited_get(HOST, limiter=limiter, session=session)
+
+    assert response.status_code == 200
+    assert session.calls == 2
+    assert limiter.rate(HOST) == pytest.approx(12.0)
@@ -0,0 +1,98 @@
+"""Unit tests for the batched relationship resolver in tools/resolve_card_relationships.py"""
+
+import json
+import sqlite3
+import sys
+from pathlib import Path
+
+import pytest
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent.parent))
+
+from tools import resolve_card_relationships as resolver  # noqa: E402
+
+# card -> [(related, component)]; "goblin" and "treasure" make each other
+PARTS = {
+    "maker": [("goblin", "token"), ("maker", "combo_piece")],
+    "goblin": [("treasure", "token"), ("maker", "combo_piece")],
+    "treasure": [("goblin", "token"), ("other-maker", "combo_piece")],
+    "bruna": [("gisela", "meld_part"), ("brisela", "meld_result")],
+    "gisela": [("bruna", "meld_part"), ("brisela", "meld_result")],
+    "brisela": [("bruna", "meld_part"), ("gisela", "meld_part")],
+    "plain": [],
+}
+
+
+def _all_parts(card_id):
+    return [{"id": rel, "component": comp, "name": rel.title()} for rel, comp in PARTS[card_id]]
+
+
+@pytest.fixture(params=["card_relationships", "all_parts"])
+def db_path(request, tmp_path, monkeypatch):
+    """A tiny bulk.db, with and without the exploded card_relationships table."""
+    monkeypatch.setattr(resolver, "RESOLVE_CHUNK_SIZE", 2)
+    path = tmp_path / "bulk.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE prints (id TEXT PRIMARY KEY, all_parts TEXT)")
+    conn.executemany(
+        "INSERT INTO prints VALUES (?, ?)",
+        [(card_id, json.dumps(_all_parts(card_id))) for card_id in PARTS],
+    )
+    if request.param == "card_relationships":
+        conn.execute(
+            "CREATE TABLE card_relationships (source_card_id TEXT, related_card_id TEXT, "
+            "relationship_type TEXT, related_card_name TEXT)"
+        )
+        conn.executemany(
+            "INSERT INTO card_relationships VALUES (?, ?, ?, ?)",
+            [
+                (card_id, rel, comp, rel.title())
+                for card_id in PARTS
+                for rel, comp in PARTS[card_id]
+                if rel != card_id
+            ],
+        )
+    conn.commit()
+    conn.close()
+    return path
+
+
+def test_direct_relationships(db_path):
+    result = resolver.resolve_all_parts(["maker", "bruna", "plain", "missing"], db_path)
+
+    # maker only lists itself and a token
+    assert set(result) == {"bruna"}
+    assert sorted(r["id"] for r in result["bruna"]) == ["brisela", "gisela"]
+    assert {r["depth"] for r in result["bruna"]} == {1}
+    assert result["bruna"][0]["uri"].startswith("https://api.scryfall.com/cards/")
+
+    with_tokens = resolver.resolve_all_parts(["maker"], db_path, include_tokens=True)
+    assert [r["id"] for r in with_tokens["maker"]] == ["goblin"]
+
+
+def test_transitive_expansion_stops_at_cycles(db_path):
+    result = resolver.resolve_all_parts(["maker"], db_path, include_tokens=True, transitive=True)
+
+    # maker -> goblin -> treasure -> goblin (cycle); combo pieces are not followed
+    by_id = {r["id"]: r for r in result["maker"]}
+    assert set(by_id) == {"goblin", "treasure"}
+    assert (by_id["treasure"]["depth"], by_id["treasure"]["via"]) == (2, "goblin")
+
+    shallow = resolver.resolve_all_parts(
+        ["maker"], db_path, include_tokens=True, transitive=True, max_depth=1
+    )
+    assert [r["id"] for r in shallow["maker"]] == ["goblin"]
+
+
+def test_expand_card_list(db_path):
+    assert resolver.expand_card_list_with_relationships(["bruna", "plain"], db_path) == {
+        "bruna",
+        "gisela",
+        "brisela",
+        "plain",
+    }
+    assert resolver.expand_card_list_with_relationships(
+        ["maker"], db_path, include_tokens=True
+    ) == {"maker", "goblin", "treasure"}
+    assert resolver.expand_card_list_with_relationships(["x"], db_path.parent / "nope.db") == {"x"}
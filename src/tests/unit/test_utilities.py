@@ -0,0 +1,289 @@
+"""Unit tests for utilities.py sheet generation"""
+
+import math
+import sys
+from pathlib import Path
+
+import pytest
+from PIL import Image
+
+# Add project root to path for imports
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+REPO_ROOT = Path(__file__).parent.parent.parent.parent
+
+
+def _make_deck(tmp_path: Path, count: int, double_sided: int = 0):
+    front = tmp_path / "front"
+    back = tmp_path / "back"
+    double = tmp_path / "double_sided"
+    for directory in (front, back, double):
+        directory.mkdir()
+
+    colors = ["red", "green", "blue", "yellow", "purple", "orange"]
+    for i in range(count):
+        image = Image.new("RGB", (75, 104), colors[i % len(colors)])
+        image.putpixel((i % 75, 0), (0, 0, 0))
+        image.save(front / f"card{i:03d}.png")
+        if i < double_sided:
+            Image.new("RGB", (75, 104), "white").save(double / f"card{i:03d}.png")
+
+    Image.new("RGB", (75, 104), "black").save(back / "back.png")
+    return front, back, double
+
+
+def _generate(front, back, double, output_path, output_images=False, **overrides):
+    from utilities import generate_pdf
+
+    # The CLI passes plain strings (click.Choice values)
+    options = {
+        "card_size": "standard",
+        "paper_size": "letter",
+        "only_fronts": False,
+        "crop_string": None,
+        "extend_corners": 0,
+        "ppi": 60,
+        "quality": 75,
+        "skip_indices": [],
+        "load_offset": False,
+        "name": None,
+        "card_cache_dir": None,
+    }
+    options.update(overrides)
+    generate_pdf(
+        str(front), str(back), str(double), str(output_path), output_images, **options
+    )
+
+
+def _legacy_draw_card_with_bleed(card_image, base_image, origin, print_bleed):
+    """Per-pixel paste loop the bleed engine replaced, kept as a reference."""
+    origin_x, origin_y = origin
+    x_bleed, y_bleed = print_bleed
+    width, height = card_image.size
+    base_image.paste(card_image, (origin_x, origin_y))
+
+    for i in range(y_bleed):
+        base_image.paste(card_image.crop((0, 0, width, 1)), (origin_x, origin_y - y_bleed + i))
+        base_image.paste(
+            card_image.crop((0, height - 1, width, height)), (origin_x, origin_y + height + i)
+        )
+    for i in range(x_bleed):
+        base_image.paste(card_image.crop((0, 0, 1, height)), (origin_x - x_bleed + i, origin_y))
+        base_image.paste(
+            card_image.crop((width - 1, 0, width, height)), (origin_x + width + i, origin_y)
+        )
+    for crop_x, pos_x in [(0, origin_x - x_bleed), (width - 1, origin_x + width)]:
+        for crop_y, pos_y in [(0, origin_y - y_bleed), (height - 1, origin_y + height)]:
+            for x_i in range(x_bleed):
+                for y_i in range(y_bleed):
+                    base_image.paste(
+                        card_image.crop((crop_x, crop_y, crop_x + 1, crop_y + 1)),
+                        (pos_x + x_i, pos_y + y_i),
+                    )
+    return base_image
+
+
+def _noise_card(mode: str, size=(37, 52)) -> Image.Image:
+    image = Image.effect_noise(size, 64).convert("RGB")
+    if mode == "P":
+        return image.quantize(16)
+    return image.convert(mode)
+
+
+@pytest.mark.parametrize("mode", ["RGB", "RGBA", "L", "P", "1"])
+@pytest.mark.parametrize("origin", [(20, 15), (3, 2), (70, 60)])
+def test_bleed_engine_matches_legacy_paste_loop(mode, origin):
+    """The NumPy bleed must be byte-identical to the per-pixel loop, clipping included."""
+    from utilities import draw_card_with_bleed
+
+    card = _noise_card(mode)
+    print_bleed = (9, 7)
+    expected = _legacy_draw_card_with_bleed(
+        card, Image.new("RGB", (100, 90), "white"), origin, print_bleed
+    )
+    actual = draw_card_with_bleed(
+        card, Image.new("RGB", (100, 90), "white"), (*origin, 0, 0), print_bleed
+    )
+
+    assert actual.tobytes() == expected.tobytes()
+
+
+def test_bleed_engine_matches_legacy_on_letter_layout():
+    """Byte-identical output for a real layout slot at 600 PPI with extend_corners."""
+    from utilities import calculate_max_print_bleed, draw_card_with_bleed
+
+    ppi_ratio = 2
+    extend_corners_ppi = 10 * ppi_ratio
+    max_print_bleed = calculate_max_print_bleed([140, 899, 1658, 2417], [231, 1280], 743, 1038)
+    print_bleed = (
+        math.ceil(max_print_bleed[0] * ppi_ratio) + extend_corners_ppi,
+        math.ceil(max_print_bleed[1] * ppi_ratio) + extend_corners_ppi,
+    )
+    card = _noise_card("RGB", (743 * ppi_ratio - 40, 1038 * ppi_ratio - 40))
+    origin = (140 * ppi_ratio + extend_corners_ppi, 231 * ppi_ratio + extend_corners_ppi)
+
+    expected = _legacy_draw_card_with_bleed(
+        card, Image.new("RGB", (1900, 2300), "white"), origin, print_bleed
+    )
+    actual = draw_card_with_bleed(
+        card, Image.new("RGB", (1900, 2300), "white"), (*origin, 0, 0), print_bleed
+    )
+
+    assert actual.tobytes() == expected.tobytes()
+
+
+def test_bleed_engine_mirror():
+    """Mirrored bleed should reflect the card edge rather than repeat it."""
+    from utilities import draw_card_with_bleed
+
+    card = Image.new("L", (4, 3))
+    card.putdata([0, 1, 2, 3, 10, 11, 12, 13, 20, 21, 22, 23])
+
+    sheet = draw_card_with_bleed(card, Image.new("L", (8, 5), 255), (2, 1, 4, 3), (2, 1), True)
+
+    assert list(sheet.getdata())[:8] == [1, 0, 0, 1, 2, 3, 3, 2]
+    assert list(sheet.getdata())[8:16] == [1, 0, 0, 1, 2, 3, 3, 2]
+    assert list(sheet.getdata())[32:40] == [21, 20, 20, 21, 22, 23, 23, 22]
+
+
+def test_page_writer_counts_pages(tmp_path):
+    """PageWriter should behave like the page list for add_front_back_pages."""
+    from utilities import PageWriter
+
+    writer = PageWriter(str(tmp_path), True, 60, 75)
+    page = Image.new("RGB", (20, 20), "white")
+    writer.append(page)
+    writer.append(page)
+
+    assert len(writer) == 2
+    assert writer.close() == 2
+    assert (tmp_path / "page1.png").exists()
+    assert (tmp_path / "page2.png").exists()
+
+
+def test_generate_pdf_streams_pages(tmp_path, monkeypatch):
+    """Every sheet should land in the PDF without a leftover partial file."""
+    import pypdfium2 as pdfium
+
+    monkeypatch.chdir(REPO_ROOT)
+    front, back, double = _make_deck(tmp_path, 12, double_sided=2)
+    output_path = tmp_path / "deck.pdf"
+
+    _generate(front, back, double, output_path)
+
+    assert output_path.exists()
+    assert not Path(f"{output_path}.part").exists()
+    # 10 single-sided cards -> 2 sheets, 2 double-sided cards -> 1 sheet
+    assert len(pdfium.PdfDocument(str(output_path))) == 6
+
+
+def test_generate_images_streams_pages(tmp_path, monkeypatch):
+    """--output_images mode should write one PNG per page."""
+    monkeypatch.chdir(REPO_ROOT)
+    front, back, double = _make_deck(tmp_path, 8)
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+
+    _generate(front, back, double, output_dir, output_images=True)
+
+    assert sorted(p.name for p in output_dir.iterdir()) == ["page1.png", "page2.png"]
+
+
+def test_parallel_composition_matches_serial(tmp_path, monkeypatch):
+    """Sheets composed in worker processes must match the serial path exactly."""
+    monkeypatch.chdir(REPO_ROOT)
+    front, back, double = _make_deck(tmp_path, 21, double_sided=5)
+
+    outputs = {}
+    for workers in (1, 3):
+        output_dir = tmp_path / f"output_{workers}"
+        output_dir.mkdir()
+        _generate(
+            front,
+            back,
+            double,
+            output_dir,
+            output_images=True,
+            skip_indices=[2],
+            name="deck",
+            workers=workers,
+        )
+        outputs[workers] = {
+            p.name: Image.open(p).tobytes() for p in sorted(output_dir.iterdir())
+        }
+
+    assert len(outputs[1]) == 8
+    assert outputs[1] == outputs[3]
+
+
+def test_card_tile_cache_reuses_unchanged_cards(tmp_path, monkeypatch):
+    """A second run only prepares the cards that changed since the first."""
+    import utilities
+
+    monkeypatch.chdir(REPO_ROOT)
+    front, back, double = _make_deck(tmp_path, 8, double_sided=1)
+    cache_dir = str(tmp_path / "card_tiles")
+
+    prepared = []
+    original_prepare = utilities.prepare_card_tile
+
+    def counting_prepare(card_image, *args):
+        prepared.append(card_image.size)
+        return original_prepare(card_image, *args)
+
+    monkeypatch.setattr(utilities, "prepare_card_tile", counting_prepare)
+
+    outputs = []
+    for run in range(3):
+        if run == 2:
+            # Swap one card's art
+            Image.new("RGB", (75, 104), "teal").save(front / "card005.png")
+        output_dir = tmp_path / f"output_{run}"
+        output_dir.mkdir()
+        prepared.clear()
+        _generate(front, back, double, output_dir, True, card_cache_dir=cache_dir)
+        outputs.append(
+            {p.name: Image.open(p).tobytes() for p in sorted(output_dir.iterdir())}
+        )
+        if run == 0:
+            # 8 fronts + 1 double-sided back, plus the shared back image
+            assert len(prepared) == 9 + 1
+        elif run == 1:
+            assert len(prepared) == 0
+            assert outputs[1] == outputs[0]
+        else:
+            assert len(prepared) == 1
+            assert outputs[2] != outputs[0]
+
+
+def test_repeated_cards_are_decoded_once(tmp_path, monkeypatch, capsys):
+    """Copies of the same art (by path or by content) share one decoded tile."""
+    monkeypatch.chdir(REPO_ROOT)
+    front, back, double = _make_deck(tmp_path, 3)
+    for i in range(3, 12):
+        # Nine more copies of the first card under different names
+        (front / f"card{i:03d}.png").write_bytes((front / "card000.png").read_bytes())
+
+    output_dir = tmp_path / "output"
+    output_dir.mkdir()
+    _generate(front, back, double, output_dir, output_images=True)
+
+    assert "Card images: 4 decoded, 0 from cache, 9 reused" in capsys.readouterr().out
+
+
+def test_card_tile_cache_round_trip_and_prune(tmp_path):
+    """Tiles round-trip losslessly and prune evicts down to the target size."""
+    from pdf.card_cache import CardTileCache, tile_key
+
+    cache = CardTileCache(str(tmp_path / "tiles"))
+    tile = _noise_card("RGB", (60, 80))
+    key = tile_key("abc", (743, 1038), 2.0, (1.5, 1.0), 0, False)
+
+    assert cache.get(key) is None
+    cache.set(key, tile)
+    assert cache.get(key).tobytes() == tile.tobytes()
+    assert cache.stats()["entries"] == 1
+
+    assert cache.prune(0) == 1
+    assert cache.get(key) is None
+    cache.close()
@@ -1,13 +1,17 @@
+from collections import Counter, deque
+from concurrent.futures import Future, ProcessPoolExecutor
 from enum import Enum
 import itertools
 import json
 import math
+import multiprocessing
 import os
 import re
 from pathlib import Path
-from typing import Dict, List, Optional, Sequence, Tuple
+from typing import Deque, Dict, Iterable, Iterator, List, Optional, Sequence, Tuple
 from xml.dom import ValidationErr
 
+import numpy as np  # pyright: ignore[reportMissingImports]
 from natsort import natsorted  # pyright: ignore[reportMissingImports]
 from PIL import (
     Image,
@@ -18,6 +22,8 @@
 )  # pyright: ignore[reportMissingImports]
 from pydantic import BaseModel  # pyright: ignore[reportMissingImports]
 
+from pdf.card_cache import DEFAULT_CACHE_DIR, CardTileCache, CardTilePool, tile_key
+
 # Specify directory locations
 asset_directory = "assets"
 
@@ -198,68 +204,265 @@ def get_back_card_image_path(back_dir_path) -> Optional[str]:
     return os.path.join(back_dir_path, files[index])
 
 
+def _image_from_array(pixels: np.ndarray, like: Image.Image) -> Image.Image:
+    """Wrap an array sliced from `like` back into an image of the same mode."""
+    if like.mode == "1":
+        # Bilevel images expose unpacked booleans rather than their raw bytes
+        return Image.fromarray(pixels)
+
+    image = Image.frombytes(
+        like.mode, (pixels.shape[1], pixels.shape[0]), pixels.tobytes()
+    )
+    if like.palette is not None:
+        palette_mode = like.palette.mode
+        image.putpalette(like.getpalette(palette_mode), palette_mode)
+
+    return image
+
+
+def bleed_strips(
+    card_image: Image.Image,
+    print_bleed: Tuple[int, int],
+    mirror: bool = False,
+) -> List[Tuple[Image.Image, Tuple[int, int]]]:
+    """
+    Builds the print bleed around a card as four strips.
+
+    Returns (strip, offset) pairs where the offset is relative to the card's
+    top-left corner. The top and bottom strips include the corner blocks. Only
+    the card edges are read, so the cost scales with the bleed rather than the
+    card area. By default the outermost row/column is replicated (and the
+    corner pixel fills each corner block); with `mirror` the edge is reflected.
+    """
+    x_bleed, y_bleed = max(print_bleed[0], 0), max(print_bleed[1], 0)
+    width, height = card_image.size
+    pad_mode = "symmetric" if mirror else "edge"
+
+    # Mirroring needs as many edge rows/columns as there is bleed; replicating needs one
+    band_x = min(x_bleed, width) if mirror else 1
+    band_y = min(y_bleed, height) if mirror else 1
+
+    def strip(crop_box, pad_width, keep) -> Image.Image:
+        pixels = np.asarray(card_image.crop(crop_box))
+        pad_width = list(pad_width) + [(0, 0)] * (pixels.ndim - 2)
+        return _image_from_array(np.pad(pixels, pad_width, mode=pad_mode)[keep], card_image)
+
+    strips = []
+    if y_bleed > 0:
+        strips.append(
+            (
+                strip(
+                    (0, 0, width, band_y),
+                    [(y_bleed, 0), (x_bleed, x_bleed)],
+                    np.s_[:y_bleed],
+                ),
+                (-x_bleed, -y_bleed),
+            )
+        )
+        strips.append(
+            (
+                strip(
+                    (0, height - band_y, width, height),
+                    [(0, y_bleed), (x_bleed, x_bleed)],
+                    np.s_[band_y:],
+                ),
+                (-x_bleed, height),
+            )
+        )
+    if x_bleed > 0:
+        strips.append(
+            (
+                strip((0, 0, band_x, height), [(0, 0), (x_bleed, 0)], np.s_[:, :x_bleed]),
+                (-x_bleed, 0),
+            )
+        )
+        strips.append(
+            (
+                strip(
+                    (width - band_x, 0, width, height),
+                    [(0, 0), (0, x_bleed)],
+                    np.s_[:, band_x:],
+                ),
+                (width, 0),
+            )
+        )
+
+    return strips
+
+
 def draw_card_with_bleed(
     card_image: Image.Image,
     base_image: Image.Image,
     box: Tuple[int, int, int, int],
     print_bleed: Tuple[int, int],
+    mirror_bleed: bool = False,
 ) -> Image.Image:
     origin_x, origin_y, _, _ = box
 
-    x_bleed = print_bleed[0]
-    y_bleed = print_bleed[1]
-
-    width, height = card_image.size
     base_image.paste(card_image, (origin_x, origin_y))
 
-    class Axis(int, Enum):
-        X = 0
-        Y = 1
-
-    def extend_edge(
-        crop_box: Tuple[int, int, int, int],
-        start: Tuple[int, int],
-        bleed: int,
-        axis: Axis,
+    # Extend the edges of the cards to create print bleed
+    for strip, (offset_x, offset_y) in bleed_strips(
+        card_image, print_bleed, mirror_bleed
     ):
-        for bleed_i in range(bleed):
-            pos = (
-                start[0] + (bleed_i if axis == Axis.X else 0),
-                start[1] + (bleed_i if axis == Axis.Y else 0),
-            )
+        base_image.paste(strip, (origin_x + offset_x, origin_y + offset_y))
 
-            base_image.paste(card_image.crop(crop_box), pos)
+    return base_image
 
-    # Extend the edges of the cards to create print bleed
-    # Top and bottom
-    extend_edge((0, 0, width, 1), (origin_x, origin_y - y_bleed), y_bleed, Axis.Y)
-    extend_edge(
-        (0, height - 1, width, height), (origin_x, origin_y + height), y_bleed, Axis.Y
+
+def bleed_tile(
+    card_tile: Image.Image,
+    print_bleed: Tuple[int, int],
+    mirror_bleed: bool = False,
+) -> Image.Image:
+    """
+    Returns the card tile with its print bleed attached, as one image.
+
+    Pasting it at the slot origin minus the bleed gives the same pixels as
+    `draw_card_with_bleed`, but the bleed is only built once per tile.
+    """
+    x_bleed = max(print_bleed[0], 0)
+    y_bleed = max(print_bleed[1], 0)
+    if x_bleed == 0 and y_bleed == 0:
+        return card_tile
+
+    finished = Image.new(
+        card_tile.mode,
+        (card_tile.width + 2 * x_bleed, card_tile.height + 2 * y_bleed),
+    )
+    if card_tile.palette is not None:
+        palette_mode = card_tile.palette.mode
+        finished.putpalette(card_tile.getpalette(palette_mode), palette_mode)
+
+    draw_card_with_bleed(
+        card_tile,
+        finished,
+        (x_bleed, y_bleed, card_tile.width, card_tile.height),
+        (x_bleed, y_bleed),
+        mirror_bleed,
+    )
+    return finished
+
+
+def prepare_card_tile(
+    card_image: Image.Image,
+    width: int,
+    height: int,
+    crop: Tuple[float, float],
+    ppi_ratio: float,
+    extend_corners: int,
+    flip: bool,
+) -> Image.Image:
+    """
+    Turns a source card image into a tile that is ready to paste onto a sheet.
+
+    The tile depends only on the image and the layout parameters, not on the
+    slot it lands in, which is what makes it cacheable (see `pdf.card_cache`).
+    """
+    if flip:
+        # Rotate the back image to account for orientation
+        card_image = card_image.rotate(180)
+
+    # Crop the outer portion of a card to remove preexisting print bleed
+    crop_x_percent, crop_y_percent = crop
+    if crop_x_percent > 0 or crop_y_percent > 0:
+        card_width, card_height = card_image.size
+        card_width_crop = math.floor(card_width / 2 * (crop_x_percent / 100))
+        card_height_crop = math.floor(card_height / 2 * (crop_y_percent / 100))
+
+        card_image = card_image.crop(
+            (
+                card_width_crop,
+                card_height_crop,
+                card_width - card_width_crop,
+                card_height - card_height_crop,
+            )
+        )
+
+    # Resize the image to normalize extend_corners
+    card_image = card_image.resize(
+        (math.floor(width * ppi_ratio), math.floor(height * ppi_ratio))
     )
 
-    # Left and right
-    extend_edge((0, 0, 1, height), (origin_x - x_bleed, origin_y), x_bleed, Axis.X)
-    extend_edge(
-        (width - 1, 0, width, height), (origin_x + width, origin_y), x_bleed, Axis.X
+    extend_corners_ppi = math.floor(extend_corners * ppi_ratio)
+    return card_image.crop(
+        (
+            extend_corners_ppi,
+            extend_corners_ppi,
+            card_image.width - extend_corners_ppi,
+            card_image.height - extend_corners_ppi,
+        )
     )
 
-    # Corners
-    for x_bleed_val, crop_x, pos_x in [
-        (x_bleed, 0, origin_x - x_bleed),
-        (x_bleed, width - 1, origin_x + width),
-    ]:
-        for y_bleed_val, crop_y, pos_y in [
-            (y_bleed, 0, origin_y - y_bleed),
-            (y_bleed, height - 1, origin_y + height),
-        ]:
-            for x_bleed_i in range(x_bleed_val):
-                for y_bleed_i in range(y_bleed_val):
-                    base_image.paste(
-                        card_image.crop((crop_x, crop_y, crop_x + 1, crop_y + 1)),
-                        (pos_x + x_bleed_i, pos_y + y_bleed_i),
-                    )
 
-    return base_image
+class SheetLayout:
+    """
+    Slot geometry for one (paper, card size, PPI) combination.
+
+    Computed once per run: the tile size, the print bleed in pixels and where
+    each finished (bled) tile lands on the front and on the flipped back of a
+    sheet. Composing a sheet is then one paste per slot.
+    """
+
+    def __init__(
+        self,
+        num_rows: int,
+        num_cols: int,
+        x_pos: Sequence[int],
+        y_pos: Sequence[int],
+        width: int,
+        height: int,
+        print_bleed: Tuple[int, int],
+        ppi_ratio: float,
+        extend_corners: int,
+    ):
+        self.num_cards = num_rows * num_cols
+        extend_corners_ppi = math.floor(extend_corners * ppi_ratio)
+
+        self.tile_size = (
+            math.floor(width * ppi_ratio) - (2 * extend_corners_ppi),
+            math.floor(height * ppi_ratio) - (2 * extend_corners_ppi),
+        )
+        self.print_bleed: Tuple[int, int] = (
+            math.ceil(print_bleed[0] * ppi_ratio) + extend_corners_ppi,
+            math.ceil(print_bleed[1] * ppi_ratio) + extend_corners_ppi,
+        )
+
+        def slot_origin(i: int, flip: bool) -> Tuple[int, int]:
+            # Calculate the location of the new card based on what number the card is
+            row = i // num_cols
+            if flip:
+                row = num_rows - row - 1
+
+            return (
+                math.floor(x_pos[i % num_cols] * ppi_ratio)
+                + extend_corners_ppi
+                - self.print_bleed[0],
+                math.floor(y_pos[row] * ppi_ratio)
+                + extend_corners_ppi
+                - self.print_bleed[1],
+            )
+
+        self.front_origins = [slot_origin(i, False) for i in range(self.num_cards)]
+        self.back_origins = [slot_origin(i, True) for i in range(self.num_cards)]
+
+    def origins(self, flip: bool) -> List[Tuple[int, int]]:
+        return self.back_origins if flip else self.front_origins
+
+
+def blit_tiles(
+    finished_tiles: List[Optional[Image.Image]],
+    base_image: Image.Image,
+    layout: SheetLayout,
+    flip: bool,
+) -> None:
+    """Pastes finished (bled) tiles into their slots, in slot order."""
+    origins = layout.origins(flip)
+    for i, finished_tile in enumerate(finished_tiles):
+        if finished_tile is None:
+            continue
+
+        base_image.paste(finished_tile, origins[i % layout.num_cards])
 
 
 def draw_card_layout(
@@ -276,79 +479,109 @@ def draw_card_layout(
     ppi_ratio: float,
     extend_corners: int,
     flip: bool,
+    mirror_bleed: bool = False,
 ) -> None:
-    num_cards = num_rows * num_cols
+    layout = SheetLayout(
+        num_rows,
+        num_cols,
+        x_pos,
+        y_pos,
+        width,
+        height,
+        print_bleed,
+        ppi_ratio,
+        extend_corners,
+    )
 
-    # Fill all the spaces with the card back
-    for i, card_image in enumerate(card_images):
-        if card_image is None:
-            continue
+    finished_tiles: List[Optional[Image.Image]] = [
+        None
+        if card_image is None
+        else bleed_tile(
+            prepare_card_tile(
+                card_image, width, height, crop, ppi_ratio, extend_corners, flip
+            ),
+            layout.print_bleed,
+            mirror_bleed,
+        )
+        for card_image in card_images
+    ]
 
-        # Calculate the location of the new card based on what number the card is
-        new_origin_x = math.floor(x_pos[i % num_cards % num_cols] * ppi_ratio)
-        new_origin_y = math.floor(y_pos[(i % num_cards) // num_cols] * ppi_ratio)
+    blit_tiles(finished_tiles, base_image, layout, flip)
 
-        if flip:
-            new_origin_y = math.floor(
-                y_pos[num_rows - ((i % num_cards) // num_cols) - 1] * ppi_ratio
-            )
 
-            # Rotate the back image to account for orientation
-            card_image = card_image.rotate(180)
-
-        # Crop the outer portion of a card to remove preexisting print bleed
-        crop_x_percent, crop_y_percent = crop
-        if crop_x_percent > 0 or crop_y_percent > 0:
-            card_width, card_height = card_image.size
-            card_width_crop = math.floor(card_width / 2 * (crop_x_percent / 100))
-            card_height_crop = math.floor(card_height / 2 * (crop_y_percent / 100))
-
-            card_image = card_image.crop(
-                (
-                    card_width_crop,
-                    card_height_crop,
-                    card_width - card_width_crop,
-                    card_height - card_height_crop,
-                )
-            )
+class PageWriter:
+    """
+    Writes each finished sheet to disk as soon as it is appended.
 
-        # Resize the image to normalize extend_corners
-        card_image = card_image.resize(
-            (math.floor(width * ppi_ratio), math.floor(height * ppi_ratio))
-        )
+    Acts like the list of pages that `add_front_back_pages` fills, but only
+    keeps a page count, so peak memory stays flat no matter how many sheets a
+    deck produces. PDF pages are appended to a `.part` file (restarted on the
+    next run if generation fails) which `close()` moves into place;
+    `--output_images` mode writes `page{n}.png` directly.
+    """
 
-        extend_corners_ppi = math.floor(extend_corners * ppi_ratio)
-        card_image = card_image.crop(
-            (
-                extend_corners_ppi,
-                extend_corners_ppi,
-                card_image.width - extend_corners_ppi,
-                card_image.height - extend_corners_ppi,
+    def __init__(
+        self,
+        output_path: str,
+        output_images: bool,
+        ppi: int,
+        quality: int,
+        offset: Optional["OffsetData"] = None,
+    ):
+        self.output_path = output_path
+        self.output_images = output_images
+        self.ppi = ppi
+        self.quality = quality
+        self.offset = offset
+        self.partial_path = f"{output_path}.part"
+        self._count = 0
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, page: Image.Image) -> None:
+        # Saved offsets only apply to the back of each sheet
+        if self.offset is not None and self._count % 2 == 1:
+            page = ImageChops.offset(
+                page,
+                math.floor(self.offset.x_offset * self.ppi / 300),
+                math.floor(self.offset.y_offset * self.ppi / 300),
             )
-        )
 
-        adjusted_print_bleed: tuple[int, int] = (
-            math.ceil(print_bleed[0] * ppi_ratio) + extend_corners_ppi,
-            math.ceil(print_bleed[1] * ppi_ratio) + extend_corners_ppi,
-        )
+        ppi_ratio = self.ppi / 300
+        save_options = {
+            "resolution": math.floor(300 * ppi_ratio),
+            "speed": 0,
+            "subsampling": 0,
+            "quality": self.quality,
+        }
+
+        if self.output_images:
+            page.save(
+                os.path.join(self.output_path, f"page{self._count + 1}.png"),
+                **save_options,
+            )
+        else:
+            page.save(
+                self.partial_path,
+                format="PDF",
+                append=self._count > 0,
+                **save_options,
+            )
 
-        draw_card_with_bleed(
-            card_image,
-            base_image,
-            (
-                new_origin_x + extend_corners_ppi,
-                new_origin_y + extend_corners_ppi,
-                math.floor(width * ppi_ratio) - (2 * extend_corners_ppi),
-                math.floor(height * ppi_ratio) - (2 * extend_corners_ppi),
-            ),
-            adjusted_print_bleed,
-        )
+        self._count += 1
+
+    def close(self) -> int:
+        """Publish the finished PDF and return the number of pages written."""
+        if not self.output_images and self._count > 0:
+            os.replace(self.partial_path, self.output_path)
+        return self._count
 
 
 def add_front_back_pages(
     front_page: Image.Image,
     back_page: Image.Image,
-    pages: List[Image.Image],
+    pages: "List[Image.Image] | PageWriter",
     page_width: int,
     page_height: int,
     ppi_ratio: float,
@@ -388,6 +621,218 @@ def add_front_back_pages(
         pages.append(back_page)
 
 
+# Card image paths for each slot of a sheet's front, plus the double-sided
+# backs (None for single-sided sheets, which share one back page)
+SheetJob = Tuple[List[Optional[str]], Optional[List[Optional[str]]]]
+
+
+def open_card_image(path: str) -> Image.Image:
+    with Image.open(path) as image:
+        return ImageOps.exif_transpose(image)
+
+
+class SheetComposer:
+    """
+    Composes card images onto copies of the registration template.
+
+    Everything except the per-sheet card paths is fixed for a run, so the
+    constructor options are all a worker process needs to build its own
+    composer (see `compose_sheets`).
+    """
+
+    def __init__(
+        self,
+        registration_path: str,
+        num_rows: int,
+        num_cols: int,
+        x_pos: Sequence[int],
+        y_pos: Sequence[int],
+        width: int,
+        height: int,
+        print_bleed: Tuple[int, int],
+        crop: Tuple[float, float],
+        ppi_ratio: float,
+        extend_corners: int,
+        mirror_bleed: bool = False,
+        tile_cache_dir: Optional[str] = None,
+    ):
+        self.options = {
+            "registration_path": registration_path,
+            "num_rows": num_rows,
+            "num_cols": num_cols,
+            "x_pos": list(x_pos),
+            "y_pos": list(y_pos),
+            "width": width,
+            "height": height,
+            "print_bleed": print_bleed,
+            "crop": crop,
+            "ppi_ratio": ppi_ratio,
+            "extend_corners": extend_corners,
+            "mirror_bleed": mirror_bleed,
+            "tile_cache_dir": tile_cache_dir,
+        }
+
+        self.tile_cache: Optional[CardTileCache] = None
+        if tile_cache_dir is not None:
+            self.tile_cache = CardTileCache(tile_cache_dir)
+
+        # Slot geometry and bleed are the same for every sheet in the run
+        self.layout = SheetLayout(
+            num_rows,
+            num_cols,
+            x_pos,
+            y_pos,
+            width,
+            height,
+            print_bleed,
+            ppi_ratio,
+            extend_corners,
+        )
+
+        # Card images are decoded and scaled once per run, however often they repeat
+        self.tile_pool = CardTilePool()
+        self.stats: Counter = Counter()
+
+        with Image.open(registration_path) as reg_im:
+            self.registration = reg_im.resize(
+                [
+                    math.floor(reg_im.width * ppi_ratio),
+                    math.floor(reg_im.height * ppi_ratio),
+                ]
+            )
+
+    def card_tile(
+        self, path: str, flip: bool, crop: Optional[Tuple[float, float]] = None
+    ) -> Image.Image:
+        """
+        Returns the finished tile (card plus print bleed) for a card image.
+
+        Finished tiles are looked up in the in-run pool first, then the
+        unbled tile in the on-disk tile cache; only on a miss in both is the
+        source image decoded and scaled. `crop` overrides the run's crop (the
+        shared card back is never cropped).
+        """
+        options = self.options
+        if crop is None:
+            crop = options["crop"]
+
+        key = tile_key(
+            self.tile_pool.digest(path),
+            (options["width"], options["height"]),
+            options["ppi_ratio"],
+            crop,
+            options["extend_corners"],
+            flip,
+        )
+
+        tile = self.tile_pool.get(key)
+        if tile is not None:
+            self.stats["reused"] += 1
+            return tile
+
+        if self.tile_cache is not None:
+            tile = self.tile_cache.get(key)
+
+        if tile is not None:
+            self.stats["cached"] += 1
+        else:
+            self.stats["decoded"] += 1
+            tile = prepare_card_tile(
+                open_card_image(path),
+                options["width"],
+                options["height"],
+                crop,
+                options["ppi_ratio"],
+                options["extend_corners"],
+                flip,
+            )
+            if self.tile_cache is not None:
+                self.tile_cache.set(key, tile)
+
+        finished_tile = bleed_tile(tile, self.layout.print_bleed, options["mirror_bleed"])
+        self.tile_pool.put(key, finished_tile)
+        return finished_tile
+
+    def compose_tiles(
+        self, finished_tiles: List[Optional[Image.Image]], flip: bool
+    ) -> Image.Image:
+        page = self.registration.copy()
+        blit_tiles(finished_tiles, page, self.layout, flip)
+        return page
+
+    def compose_job(self, job: SheetJob) -> Tuple[Image.Image, Optional[Image.Image]]:
+        front_paths, back_paths = job
+
+        front_tiles = [None if p is None else self.card_tile(p, False) for p in front_paths]
+        front_page = self.compose_tiles(front_tiles, flip=False)
+
+        back_page = None
+        if back_paths is not None:
+            back_tiles = [None if p is None else self.card_tile(p, True) for p in back_paths]
+            back_page = self.compose_tiles(back_tiles, flip=True)
+
+        return front_page, back_page
+
+
+# Per-process composer used by sheet composition workers
+_worker_composer: Optional[SheetComposer] = None
+
+
+def _init_sheet_worker(options: Dict) -> None:
+    global _worker_composer
+    _worker_composer = SheetComposer(**options)
+
+
+def _compose_job_in_worker(
+    job: SheetJob,
+) -> Tuple[Tuple[Image.Image, Optional[Image.Image]], Counter]:
+    assert _worker_composer is not None
+    pages = _worker_composer.compose_job(job)
+
+    # Hand this job's pool counts back so the parent can report run totals
+    stats = _worker_composer.stats.copy()
+    _worker_composer.stats.clear()
+    return pages, stats
+
+
+def compose_sheets(
+    composer: SheetComposer, jobs: Iterable[SheetJob], workers: int = 1
+) -> Iterator[Tuple[Image.Image, Optional[Image.Image]]]:
+    """
+    Yields (front, back) pages for each job, in job order.
+
+    With more than one worker, sheets are composed in a process pool. Only a
+    small window of jobs is in flight at a time so finished sheets don't pile up
+    ahead of the page writer. `workers=0` uses every CPU core.
+    """
+    if workers <= 0:
+        workers = os.cpu_count() or 1
+
+    if workers == 1:
+        yield from map(composer.compose_job, jobs)
+        return
+
+    # Spawn rather than fork: the dashboard generates PDFs from a worker thread
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_init_sheet_worker,
+        initargs=(composer.options,),
+    ) as executor:
+        pending: Deque[Future] = deque()
+        for job in jobs:
+            pending.append(executor.submit(_compose_job_in_worker, job))
+            if len(pending) >= 2 * workers:
+                pages, stats = pending.popleft().result()
+                composer.stats.update(stats)
+                yield pages
+
+        while pending:
+            pages, stats = pending.popleft().result()
+            composer.stats.update(stats)
+            yield pages
+
+
 def generate_pdf(
     front_dir_path,
     back_dir_path,
@@ -404,6 +849,9 @@ def generate_pdf(
     skip_indices: List[int],
     load_offset: bool,
     name: str,
+    mirror_bleed: bool = False,
+    workers: int = 1,
+    card_cache_dir: Optional[str] = DEFAULT_CACHE_DIR,
 ) -> None:
     # Sanity checks for the different directories
     f_path = Path(front_dir_path)
@@ -516,244 +964,125 @@ def generate_pdf(
         # The baseline PPI is 300
         ppi_ratio = ppi / 300
 
-        # Load an image with the registration marks
-        with Image.open(registration_path) as reg_im:
-            reg_im = reg_im.resize(
-                [
-                    math.floor(reg_im.width * ppi_ratio),
-                    math.floor(reg_im.height * ppi_ratio),
-                ]
-            )
+        # Load saved offset if available
+        saved_offset = None
+        if load_offset:
+            saved_offset = load_saved_offset()
 
-            # Create the array that will store the filled templates
-            pages: List[Image.Image] = []
-
-            max_print_bleed = calculate_max_print_bleed(
-                card_layout.x_pos,
-                card_layout.y_pos,
-                card_layout_size.width,
-                card_layout_size.height,
-            )
-
-            # Create reusable back page for single-sided cards
-            single_sided_back_page = reg_im.copy()
-            if not use_default_back_page and back_card_image_path:
-                # Load the card back image
-                with Image.open(back_card_image_path) as back_im:
-                    back_im = ImageOps.exif_transpose(back_im)
-
-                    back_images: List[Optional[Image.Image]] = [back_im] * num_cards
-                    for s in clean_skip_indices:
-                        back_images[s] = None
-
-                    draw_card_layout(
-                        back_images,
-                        single_sided_back_page,
-                        num_rows,
-                        num_cols,
-                        card_layout.x_pos,
-                        card_layout.y_pos,
-                        card_layout_size.width,
-                        card_layout_size.height,
-                        max_print_bleed,
-                        (0, 0),
-                        ppi_ratio,
-                        extend_corners,
-                        flip=True,
-                    )
-
-            # Create single-sided card layout
-            num_image = 1
-            it = iter(natsorted(list(front_set - ds_set)))
-            while True:
-                file_group = list(
-                    itertools.islice(it, num_cards - len(clean_skip_indices))
-                )
-                if not file_group:
-                    break
-
-                # Fetch card art
-                front_card_images: List[Optional[Image.Image]] = []
-                file_group_iterator = iter(file_group)
-                for i in range(num_cards):
-                    if i in clean_skip_indices:
-                        front_card_images.append(None)
-                        continue
-
-                    try:
-                        file = next(file_group_iterator)
-                    except StopIteration:
-                        break
-
-                    print(f"Image {num_image}: {file}")
-                    num_image = num_image + 1
-
-                    front_image_path = os.path.join(front_dir_path, file)
-                    front_image = Image.open(front_image_path)
-                    front_image = ImageOps.exif_transpose(front_image)
-                    front_card_images.append(front_image)
-
-                single_sided_front_page = reg_im.copy()
-
-                # Create front layout for single-sided cards
-                draw_card_layout(
-                    front_card_images,
-                    single_sided_front_page,
-                    num_rows,
-                    num_cols,
-                    card_layout.x_pos,
-                    card_layout.y_pos,
-                    card_layout_size.width,
-                    card_layout_size.height,
-                    max_print_bleed,
-                    crop,
-                    ppi_ratio,
-                    extend_corners,
-                    flip=False,
-                )
-
-                add_front_back_pages(
-                    single_sided_front_page,
-                    single_sided_back_page,
-                    pages,
-                    paper_layout.width,
-                    paper_layout.height,
-                    ppi_ratio,
-                    card_layout.template,
-                    only_fronts,
-                    name,
+            if saved_offset is None:
+                print("Offset cannot be applied")
+            else:
+                print(
+                    f"Loaded x offset: {saved_offset.x_offset}, y offset: {saved_offset.y_offset}"
                 )
 
-            # Create double-sided card layout
-            it = iter(natsorted(list(ds_set)))
-            while True:
-                file_group = list(
-                    itertools.islice(it, num_cards - len(clean_skip_indices))
-                )
-                if not file_group:
-                    break
-
-                # Fetch card art
-                front_card_images = []
-                back_card_images: List[Optional[Image.Image]] = []
-                file_group_iterator = iter(file_group)
-                for i in range(num_cards):
-                    if i in clean_skip_indices:
-                        front_card_images.append(None)
-                        back_card_images.append(None)
-                        continue
-
-                    try:
-                        file = next(file_group_iterator)
-                    except StopIteration:
-                        break
+        # Each filled template is written out as soon as it is composed
+        pages = PageWriter(output_path, output_images, ppi, quality, saved_offset)
 
-                    print(f"Image {num_image} (double-sided): {file}")
-                    num_image = num_image + 1
-
-                    front_image_path = os.path.join(front_dir_path, file)
-                    front_image = Image.open(front_image_path)
-                    front_image = ImageOps.exif_transpose(front_image)
-                    front_card_images.append(front_image)
-
-                    ds_image_path = os.path.join(double_sided_dir_path, file)
-                    ds_image = Image.open(ds_image_path)
-                    ds_image = ImageOps.exif_transpose(ds_image)
-                    back_card_images.append(ds_image)
-
-                double_sided_front_page = reg_im.copy()
-                double_sided_back_page = reg_im.copy()
-
-                # Create front layout for double-sided cards
-                draw_card_layout(
-                    front_card_images,
-                    double_sided_front_page,
-                    num_rows,
-                    num_cols,
-                    card_layout.x_pos,
-                    card_layout.y_pos,
-                    card_layout_size.width,
-                    card_layout_size.height,
-                    max_print_bleed,
-                    crop,
-                    ppi_ratio,
-                    extend_corners,
-                    flip=False,
-                )
+        max_print_bleed = calculate_max_print_bleed(
+            card_layout.x_pos,
+            card_layout.y_pos,
+            card_layout_size.width,
+            card_layout_size.height,
+        )
 
-                # Create back layout for double-sided cards
-                draw_card_layout(
-                    back_card_images,
-                    double_sided_back_page,
-                    num_rows,
-                    num_cols,
-                    card_layout.x_pos,
-                    card_layout.y_pos,
-                    card_layout_size.width,
-                    card_layout_size.height,
-                    max_print_bleed,
-                    crop,
-                    ppi_ratio,
-                    extend_corners,
-                    flip=True,
-                )
+        # Load an image with the registration marks
+        composer = SheetComposer(
+            registration_path=registration_path,
+            num_rows=num_rows,
+            num_cols=num_cols,
+            x_pos=card_layout.x_pos,
+            y_pos=card_layout.y_pos,
+            width=card_layout_size.width,
+            height=card_layout_size.height,
+            print_bleed=max_print_bleed,
+            crop=crop,
+            ppi_ratio=ppi_ratio,
+            extend_corners=extend_corners,
+            mirror_bleed=mirror_bleed,
+            tile_cache_dir=card_cache_dir,
+        )
 
-                # Add the front and back layouts
-                add_front_back_pages(
-                    double_sided_front_page,
-                    double_sided_back_page,
-                    pages,
-                    paper_layout.width,
-                    paper_layout.height,
-                    ppi_ratio,
-                    card_layout.template,
-                    False,
-                    name,
-                )
+        # Create reusable back page for single-sided cards
+        single_sided_back_page = composer.registration.copy()
+        if not use_default_back_page and back_card_image_path:
+            # Load the card back image
+            back_tile = composer.card_tile(back_card_image_path, True, crop=(0, 0))
 
-            if len(pages) == 0:
-                print("No pages were generated")
-                return
+            back_tiles: List[Optional[Image.Image]] = [back_tile] * num_cards
+            for s in clean_skip_indices:
+                back_tiles[s] = None
 
-            # Load saved offset if available
-            if load_offset:
-                saved_offset = load_saved_offset()
+            single_sided_back_page = composer.compose_tiles(back_tiles, flip=True)
 
-                if saved_offset is None:
-                    print("Offset cannot be applied")
-                else:
-                    print(
-                        f"Loaded x offset: {saved_offset.x_offset}, y offset: {saved_offset.y_offset}"
-                    )
-                    pages = offset_images(
-                        pages, saved_offset.x_offset, saved_offset.y_offset, ppi
+        def sheet_jobs() -> Iterator[SheetJob]:
+            # Single-sided sheets first, then double-sided sheets
+            num_image = 1
+            for file_names, double_sided in [
+                (natsorted(list(front_set - ds_set)), False),
+                (natsorted(list(ds_set)), True),
+            ]:
+                it = iter(file_names)
+                while True:
+                    file_group = list(
+                        itertools.islice(it, num_cards - len(clean_skip_indices))
                     )
+                    if not file_group:
+                        break
 
-            # Save the pages array as a PDF
-            if output_images:
-                for index, page in enumerate(pages):
-                    page.save(
-                        os.path.join(output_path, f"page{index + 1}.png"),
-                        resolution=math.floor(300 * ppi_ratio),
-                        speed=0,
-                        subsampling=0,
-                        quality=quality,
-                    )
+                    # Resolve card art for every slot
+                    front_paths: List[Optional[str]] = []
+                    back_paths: List[Optional[str]] = []
+                    file_group_iterator = iter(file_group)
+                    for i in range(num_cards):
+                        if i in clean_skip_indices:
+                            front_paths.append(None)
+                            back_paths.append(None)
+                            continue
+
+                        try:
+                            file = next(file_group_iterator)
+                        except StopIteration:
+                            break
+
+                        if double_sided:
+                            print(f"Image {num_image} (double-sided): {file}")
+                        else:
+                            print(f"Image {num_image}: {file}")
+                        num_image = num_image + 1
+
+                        front_paths.append(os.path.join(front_dir_path, file))
+                        back_paths.append(os.path.join(double_sided_dir_path, file))
+
+                    yield front_paths, back_paths if double_sided else None
+
+        for front_page, back_page in compose_sheets(composer, sheet_jobs(), workers):
+            # Single-sided sheets share the reusable back page
+            add_front_back_pages(
+                front_page,
+                single_sided_back_page if back_page is None else back_page,
+                pages,
+                paper_layout.width,
+                paper_layout.height,
+                ppi_ratio,
+                card_layout.template,
+                only_fronts if back_page is None else False,
+                name,
+            )
 
-                print(f"Generated images: {output_path}")
+        print(
+            f"Card images: {composer.stats['decoded']} decoded, "
+            f"{composer.stats['cached']} from cache, {composer.stats['reused']} reused"
+        )
 
-            else:
-                pages[0].save(
-                    output_path,
-                    format="PDF",
-                    save_all=True,
-                    append_images=pages[1:],
-                    resolution=math.floor(300 * ppi_ratio),
-                    speed=0,
-                    subsampling=0,
-                    quality=quality,
-                )
-                print(f"Generated PDF: {output_path}")
+        if pages.close() == 0:
+            print("No pages were generated")
+            return
+
+        if output_images:
+            print(f"Generated images: {output_path}")
+        else:
+            print(f"Generated PDF: {output_path}")
 
 
 class OffsetData(BaseModel):
@@ -0,0 +1,91 @@
+#!/usr/bin/env python3
+"""Inspect and prune the pre-scaled card tile cache used for PDF generation."""
+
+import os
+import sys
+from typing import Optional
+
+# Add src directory to path for imports
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(SCRIPT_DIR), "src"))
+
+from pdf.card_cache import DEFAULT_CACHE_DIR, CardTileCache
+
+
+def show_cache_info(directory: str = DEFAULT_CACHE_DIR) -> None:
+    """Show tile count and disk usage."""
+    cache = CardTileCache(directory)
+    try:
+        stats = cache.stats()
+    finally:
+        cache.close()
+
+    if not stats["enabled"]:
+        print("⚠️  diskcache is not installed; the card tile cache is disabled.")
+        return
+
+    print(f"\n📦 Card tile cache: {stats['directory']}\n")
+    print(f"  Tiles: {stats['entries']:,}")
+    print(f"  Size: {stats['volume_bytes'] / (1024 * 1024):.1f} MB")
+    print(f"  Limit: {stats['size_limit_bytes'] / (1024 * 1024):.0f} MB")
+
+
+def prune_cache(directory: str = DEFAULT_CACHE_DIR, max_mb: Optional[int] = None) -> None:
+    """Evict least-recently-used tiles down to max_mb (or the configured limit)."""
+    cache = CardTileCache(directory)
+    try:
+        before = cache.stats().get("volume_bytes", 0)
+        evicted = cache.prune(max_mb)
+        after = cache.stats().get("volume_bytes", 0)
+    finally:
+        cache.close()
+
+    print("✓ Prune complete!")
+    print(f"  Evicted: {evicted:,} tiles")
+    print(f"  Before: {before / (1024 * 1024):.1f} MB")
+    print(f"  After: {after / (1024 * 1024):.1f} MB")
+
+
+def clear_cache(directory: str = DEFAULT_CACHE_DIR) -> None:
+    """Remove every cached tile."""
+    cache = CardTileCache(directory)
+    try:
+        removed = cache.clear()
+    finally:
+        cache.close()
+
+    print(f"✓ Removed {removed:,} tiles")
+
+
+if __name__ == "__main__":
+    import click
+
+    @click.group()
+    def cli():
+        """Card tile cache utilities."""
+        pass
+
+    @cli.command()
+    @click.option("--dir", "directory", default=DEFAULT_CACHE_DIR, show_default=True)
+    def info(directory):
+        """Show card tile cache size."""
+        show_cache_info(directory)
+
+    @cli.command()
+    @click.option("--dir", "directory", default=DEFAULT_CACHE_DIR, show_default=True)
+    @click.option(
+        "--max_mb",
+        type=click.IntRange(min=0),
+        help="Target size in MB (defaults to the configured limit).",
+    )
+    def prune(directory, max_mb):
+        """Evict least-recently-used tiles."""
+        prune_cache(directory, max_mb)
+
+    @cli.command()
+    @click.option("--dir", "directory", default=DEFAULT_CACHE_DIR, show_default=True)
+    def clear(directory):
+        """Remove every cached tile."""
+        clear_cache(directory)
+
+    cli()
@@ -6,8 +6,9 @@
   python tools/fetch_bulk.py --id all-cards
   python tools/fetch_bulk.py --id unique-artwork
   python tools/fetch_bulk.py --id oracle-cards
+  python tools/fetch_bulk.py --id all-cards --verify
 
-This script uses only the Python standard library.
+Downloads use parallel HTTP Range requests and resume after an interruption.
 """
 
 from __future__ import annotations
@@ -18,12 +19,17 @@
 import sys
 import time
 import urllib.request
+from pathlib import Path
 
-# Add parent directory to path for imports
+# Add parent and src directories to path for imports
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
 sys.path.insert(0, os.path.dirname(SCRIPT_DIR))
+sys.path.insert(0, os.path.join(os.path.dirname(SCRIPT_DIR), "src"))
 
+from bulk_json import iter_bulk_json
 from bulk_paths import ensure_bulk_data_directory
+from net.bulk_download import BulkDownloader
+from net.network import RetryConfig
 
 # Resolve bulk directory via centralized helpers
 BULK_DIR = str(ensure_bulk_data_directory(prefer_primary=True))
@@ -50,91 +56,65 @@ def download_with_progress(
     label: str = "download",
     retries: int = 3,
     backoff: float = 0.5,
-    chunk_size: int = 1024 * 256,
+    connections: int = 4,
 ) -> None:
-    """Download a URL to a file, streaming with a single-line progress indicator.
+    """Download a URL to a file with a single-line progress indicator.
 
-    Standard library only. Writes to out_path + ".part" and atomically replaces on success.
+    Parts are fetched in parallel with HTTP Range requests and checkpointed next
+    to out_path, so rerunning after an interruption resumes. The file is size-
+    and checksum-verified, then atomically moved to out_path.
     """
-    tmp_path = out_path + ".part"
-
-    # Ensure previous partial download or incorrect file is removed
-    def _cleanup_existing() -> None:
-        for path in (out_path, tmp_path):
-            try:
-                if os.path.exists(path):
-                    os.remove(path)
-            except Exception:
-                pass
-
-    _cleanup_existing()
-    for attempt in range(retries):
-        try:
-            req = urllib.request.Request(
-                url,
-                headers={
-                    "User-Agent": "ProxyMachine/1.0 (bulk-fetch)",
-                    "Accept-Encoding": "identity",
-                },
+    last_update = 0.0
+    announced = False
+
+    def report(written: int, total_bytes: int | None) -> None:
+        nonlocal last_update, announced
+        if not announced:
+            announced = True
+            if total_bytes:
+                approx_mb = total_bytes / (1024 * 1024)
+                print(f"Downloading {label} to {out_path} (~{approx_mb:.1f} MB)...")
+            else:
+                print(f"Downloading {label} to {out_path} (size unknown)...")
+        # Throttle UI updates to ~20 Hz
+        now = time.time()
+        if now - last_update < 0.05:
+            return
+        last_update = now
+        if total_bytes:
+            pct = min(written * 100.0 / total_bytes, 100.0)
+            print(
+                f"\r{label}: {written // (1024*1024)}MB/{total_bytes // (1024*1024)}MB ({pct:.1f}%)",
+                end="",
+                flush=True,
             )
-            with urllib.request.urlopen(req) as resp:
-                total_header = resp.info().get("Content-Length")
-                total_bytes = int(total_header) if total_header else None
-                # Print header line once with approximate size
-                if total_bytes:
-                    approx_mb = total_bytes / (1024 * 1024)
-                    print(f"Downloading {label} to {out_path} (~{approx_mb:.1f} MB)...")
-                else:
-                    print(f"Downloading {label} to {out_path} (size unknown)...")
-
-                written = 0
-                last_update = 0.0
-                with open(tmp_path, "wb") as fh:
-                    while True:
-                        chunk = resp.read(chunk_size)
-                        if not chunk:
-                            break
-                        fh.write(chunk)
-                        written += len(chunk)
-                        # Throttle UI updates to ~20 Hz
-                        now = time.time()
-                        if now - last_update >= 0.05:
-                            last_update = now
-                            if total_bytes:
-                                pct = min(written * 100.0 / total_bytes, 100.0)
-                                print(
-                                    f"\r{label}: {written // (1024*1024)}MB/{total_bytes // (1024*1024)}MB ({pct:.1f}%)",
-                                    end="",
-                                    flush=True,
-                                )
-                            else:
-                                print(
-                                    f"\r{label}: {written // (1024*1024)}MB",
-                                    end="",
-                                    flush=True,
-                                )
-                if total_bytes and written < total_bytes:
-                    print(
-                        f"\n{label}: download incomplete ({written // (1024*1024)}MB/{total_bytes // (1024*1024)}MB). Retrying...",
-                        flush=True,
-                    )
-                    raise IOError("download truncated")
-                if total_bytes:
-                    total_mb = total_bytes // (1024 * 1024)
-                    print(
-                        f"\r{label}: {written // (1024*1024)}MB/{total_mb}MB (100.0%)"
-                    )
-                else:
-                    print(f"\r{label}: {written // (1024*1024)}MB (done)")
-                os.replace(tmp_path, out_path)
-                print("Done.")
-                return
-        except Exception:
-            # Cleanup partial file on failure
-            _cleanup_existing()
-            if attempt == retries - 1:
-                raise
-            time.sleep(backoff * (2**attempt))
+        else:
+            print(f"\r{label}: {written // (1024*1024)}MB", end="", flush=True)
+
+    downloader = BulkDownloader(
+        connections=connections,
+        config=RetryConfig(max_retries=retries, base_delay=backoff),
+    )
+    result = downloader.download(url, Path(out_path), progress=report)
+    if result.resumed_bytes:
+        print(f"\n{label}: resumed {result.resumed_bytes // (1024*1024)}MB from a previous run")
+    print(f"\r{label}: {result.size // (1024*1024)}MB (done, sha256 {result.sha256[:12]})")
+    print("Done.")
+
+
+def verify_bulk_file(path: str, *, label: str = "bulk") -> int:
+    """Stream-parse a downloaded bulk file and return its card count.
+
+    Uses the constant-memory reader, so even all-cards verifies without
+    loading the dump into memory.
+    """
+    count = 0
+    for _card in iter_bulk_json(path):
+        count += 1
+        if count % 100000 == 0:
+            print(f"\r{label}: verified {count:,} cards", end="", flush=True)
+    print(f"\r{label}: verified {count:,} cards")
+    return count
 
 
 def main() -> None:
@@ -144,6 +124,11 @@ def main() -> None:
         required=True,
         help="Bulk id: all-cards | oracle-cards | unique-artwork",
     )
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Parse the downloaded file and fail if it holds no cards",
+    )
     args = parser.parse_args()
 
     bulk_id = args.id.strip()
@@ -221,6 +206,16 @@ def main() -> None:
         print(f"Download failed: {e}")
         sys.exit(1)
 
+    if args.verify:
+        try:
+            count = verify_bulk_file(out_path, label=bulk_id)
+        except (OSError, EOFError, UnicodeDecodeError) as e:
+            print(f"Verification failed: {e}")
+            sys.exit(1)
+        if count == 0:
+            print(f"Verification failed: no cards found in {out_path}")
+            sys.exit(1)
+
 
 if __name__ == "__main__":
     main()
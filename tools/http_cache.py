@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""Inspect and prune the conditional HTTP cache for API JSON and plugin images."""
+
+import os
+import sys
+from typing import Optional
+
+# Add src directory to path for imports
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(SCRIPT_DIR), "src"))
+
+from net.http_cache import HttpCache
+
+
+def show_cache_info(directory: Optional[str] = None) -> None:
+    """Show entry and blob counts and disk usage."""
+    stats = HttpCache(directory).stats()
+
+    print(f"\n📦 HTTP cache: {stats['directory']} (mode: {stats['mode']})\n")
+    print(f"  URLs: {stats['entries']:,}")
+    print(f"  Blobs: {stats['blobs']:,}")
+    print(f"  Size: {stats['volume_bytes'] / (1024 * 1024):.1f} MB")
+    print(f"  Limit: {stats['size_limit_bytes'] / (1024 * 1024):.0f} MB")
+
+
+def prune_cache(directory: Optional[str] = None, max_mb: Optional[int] = None) -> None:
+    """Evict least-recently-fetched entries down to max_mb and delete orphaned blobs."""
+    cache = HttpCache(directory)
+    before = cache.stats()["volume_bytes"]
+    evicted = cache.prune(max_mb)
+    after = cache.stats()["volume_bytes"]
+
+    print("✓ Prune complete!")
+    print(f"  Evicted: {evicted:,} URLs")
+    print(f"  Before: {before / (1024 * 1024):.1f} MB")
+    print(f"  After: {after / (1024 * 1024):.1f} MB")
+
+
+def clear_cache(directory: Optional[str] = None) -> None:
+    """Remove every cached response."""
+    removed = HttpCache(directory).clear()
+    print(f"✓ Removed {removed:,} URLs")
+
+
+if __name__ == "__main__":
+    import click
+
+    @click.group()
+    def cli():
+        """HTTP cache utilities."""
+        pass
+
+    @cli.command()
+    @click.option("--dir", "directory", help="Cache directory (defaults to PM_HTTP_CACHE_DIR).")
+    def info(directory):
+        """Show HTTP cache size."""
+        show_cache_info(directory)
+
+    @cli.command()
+    @click.option("--dir", "directory", help="Cache directory (defaults to PM_HTTP_CACHE_DIR).")
+    @click.option(
+        "--max_mb",
+        type=click.IntRange(min=0),
+        help="Target size in MB (defaults to PM_HTTP_CACHE_MAX_MB).",
+    )
+    def prune(directory, max_mb):
+        """Evict least-recently-fetched responses and orphaned blobs."""
+        prune_cache(directory, max_mb)
+
+    @cli.command()
+    @click.option("--dir", "directory", help="Cache directory (defaults to PM_HTTP_CACHE_DIR).")
+    def clear(directory):
+        """Remove every cached response."""
+        clear_cache(directory)
+
+    cli()
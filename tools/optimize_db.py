@@ -11,11 +11,19 @@
 if PARENT_DIR not in sys.path:
     sys.path.insert(0, PARENT_DIR)
 
-# Add parent directory to path for imports
+# Add src directory to path for imports
 SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, os.path.dirname(SCRIPT_DIR))
+sys.path.insert(0, os.path.join(os.path.dirname(SCRIPT_DIR), "src"))
 
 from bulk_paths import bulk_db_path, get_bulk_data_directory
+from db.query_profile import (
+    abbreviate_shape,
+    index_usage,
+    load_records,
+    profile_log_path,
+    suggest_indexes,
+    summarize,
+)
 
 # Paths
 BULK_DIR = str(get_bulk_data_directory())
@@ -189,6 +197,88 @@ def vacuum_db(db_path: str = DB_PATH) -> None:
     print(f"  Time: {elapsed:.1f}s")
 
 
+def show_profile_report(log_path: str | None = None, limit: int = 20) -> None:
+    """Rank the query shapes recorded with PM_DB_PROFILE=1 by total time."""
+    log_path = log_path or profile_log_path()
+    summary = summarize(load_records(log_path))
+    if not summary:
+        print(f"⚠️  No profiled queries in {log_path}")
+        print("   Run a workload with PM_DB_PROFILE=1 first.")
+        return
+
+    total_calls = sum(agg["calls"] for agg in summary)
+    print(f"\n🔎 Query profile: {total_calls:,} calls, {len(summary)} shapes ({log_path})\n")
+    for rank, agg in enumerate(summary[:limit], 1):
+        flag = f"  ⚠️  FULL SCAN: {', '.join(agg['full_scans'])}" if agg["full_scans"] else ""
+        print(
+            f"{rank:>3}. {agg['total_ms']:>10.1f} ms total  {agg['calls']:>6,} calls  "
+            f"{agg['mean_ms']:>8.2f} ms avg  {agg['max_ms']:>8.2f} ms max  "
+            f"{agg['mean_rows']:>9.1f} rows avg{flag}"
+        )
+        print(f"     {abbreviate_shape(agg['shape'])}")
+        print(f"     params: {' | '.join(agg['params']) or '-'}")
+        for detail in agg["plan"]:
+            print(f"       plan: {detail}")
+
+    usage = index_usage(summary)
+    if usage:
+        print("\n📈 Index usage (calls):\n")
+        for name, calls in sorted(usage.items(), key=lambda item: -item[1]):
+            print(f"  • {name}: {calls:,}")
+
+
+def show_index_suggestions(
+    db_path: str = DB_PATH, log_path: str | None = None, apply: bool = False
+) -> None:
+    """Suggest (and optionally create) indexes for profiled full table scans."""
+    if not os.path.exists(db_path):
+        print(f"⚠️  Database not found at {db_path}")
+        return
+    log_path = log_path or profile_log_path()
+    summary = summarize(load_records(log_path))
+    if not summary:
+        print(f"⚠️  No profiled queries in {log_path}")
+        print("   Run a workload with PM_DB_PROFILE=1 first.")
+        return
+
+    conn = sqlite3.connect(db_path)
+    try:
+        suggestions = suggest_indexes(summary, conn)
+        used = set(index_usage(summary))
+        cur = conn.cursor()
+        cur.execute(
+            "SELECT name FROM sqlite_master "
+            "WHERE type='index' AND sql IS NOT NULL ORDER BY name"
+        )
+        unused = [row[0] for row in cur.fetchall() if row[0] not in used]
+
+        if not suggestions:
+            print("✓ No missing indexes: profiled full scans have no indexable predicates.")
+        else:
+            print(f"\n💡 Suggested indexes ({len(suggestions)}):\n")
+            for sugg in suggestions:
+                print(
+                    f"  {sugg['sql']}\n"
+                    f"    -- {sugg['calls']:,} calls, {sugg['total_ms']:.1f} ms in full scans "
+                    f"over {len(sugg['shapes'])} shape(s)"
+                )
+                for shape in sugg["shapes"][:3]:
+                    print(f"    -- {abbreviate_shape(shape)[:160]}")
+                if apply:
+                    cur.execute(sugg["sql"])
+            if apply:
+                cur.execute("ANALYZE;")
+                conn.commit()
+                print(f"\n✓ Created {len(suggestions)} indexes and refreshed statistics")
+
+        if unused:
+            print("\n🗑  Indexes not used by any profiled query:\n")
+            for name in unused:
+                print(f"  • {name}")
+    finally:
+        conn.close()
+
+
 if __name__ == "__main__":
     import click
 
@@ -212,6 +302,20 @@ def vacuum():
         """Vacuum and optimize the database."""
         vacuum_db()
 
+    @cli.command()
+    @click.option("--log", "log_path", default=None, help="Profile log (default: PM_DB_PROFILE_LOG)")
+    @click.option("--limit", default=20, show_default=True, help="Query shapes to show")
+    def report(log_path, limit):
+        """Rank query shapes recorded with PM_DB_PROFILE=1."""
+        show_profile_report(log_path, limit)
+
+    @cli.command()
+    @click.option("--log", "log_path", default=None, help="Profile log (default: PM_DB_PROFILE_LOG)")
+    @click.option("--apply", is_flag=True, help="Create the suggested indexes")
+    def suggest(log_path, apply):
+        """Suggest indexes for full table scans seen while profiling."""
+        show_index_suggestions(DB_PATH, log_path, apply)
+
     @cli.command()
     def all():
         """Run all optimizations (indexes + vacuum)."""
@@ -8,8 +8,9 @@
 import json
 import sqlite3
 import sys
+from collections import deque
 from pathlib import Path
-from typing import Dict, List, Set
+from typing import Dict, List, Optional, Set, Tuple
 
 # Color codes
 GREEN = "\033[92m"
@@ -25,75 +26,163 @@ def get_database_path() -> Path:
     return db_path
 
 
+# Ids are staged in a temp table and joined in chunks of this size
+RESOLVE_CHUNK_SIZE = 5000
+
+# Relationship types followed when expanding transitively. Beyond the
+# requested cards only these are reported: a token's combo pieces are every
+# card that makes it, which would pull in much of the database.
+TRANSITIVE_COMPONENTS = frozenset({"meld_part", "meld_result", "token"})
+
+_EDGES_SQL = """
+    SELECT r.source_card_id, r.related_card_id, r.relationship_type, r.related_card_name
+    FROM resolve_ids f
+    JOIN card_relationships r ON r.source_card_id = f.id
+"""
+
+# Databases without card_relationships: explode all_parts in SQL instead
+_EDGES_FROM_ALL_PARTS_SQL = """
+    SELECT p.id, json_extract(j.value, '$.id'), json_extract(j.value, '$.component'),
+           json_extract(j.value, '$.name')
+    FROM resolve_ids f
+    JOIN prints p ON p.id = f.id, json_each(p.all_parts) j
+    WHERE json_valid(p.all_parts) AND j.type = 'object'
+"""
+
+
+def _fetch_edges(
+    conn: sqlite3.Connection, card_ids: List[str], include_tokens: bool
+) -> Dict[str, List[Tuple[str, str, str]]]:
+    """Return {source id: [(related id, component, name), ...]} for card_ids."""
+    edges: Dict[str, List[Tuple[str, str, str]]] = {card_id: [] for card_id in card_ids}
+    cur = conn.cursor()
+    cur.execute("CREATE TEMP TABLE IF NOT EXISTS resolve_ids (id TEXT PRIMARY KEY) WITHOUT ROWID")
+    try:
+        cur.execute("SELECT 1 FROM card_relationships LIMIT 1")
+        sql = _EDGES_SQL
+    except sqlite3.OperationalError:
+        sql = _EDGES_FROM_ALL_PARTS_SQL
+    for start in range(0, len(card_ids), RESOLVE_CHUNK_SIZE):
+        cur.execute("DELETE FROM resolve_ids")
+        cur.executemany(
+            "INSERT OR IGNORE INTO resolve_ids(id) VALUES (?)",
+            ((card_id,) for card_id in card_ids[start : start + RESOLVE_CHUNK_SIZE]),
+        )
+        for source, related, component, name in cur.execute(sql):
+            if not related or not component or related == source:
+                continue
+            if component == "token" and not include_tokens:
+                continue
+            edges[source].append((related, component, name or ""))
+    cur.execute("DELETE FROM resolve_ids")
+    return edges
+
+
+def _related_card(part_id: str, component: str, name: str, depth: int, via: str) -> Dict:
+    return {
+        "id": part_id,
+        "name": name,
+        "component": component,
+        "uri": f"https://api.scryfall.com/cards/{part_id}",
+        "depth": depth,
+        "via": via,
+    }
+
+
+def _collect_edges(
+    card_ids: List[str],
+    db_path: Path,
+    include_tokens: bool,
+    transitive: bool,
+    max_depth: Optional[int],
+) -> Dict[str, List[Tuple[str, str, str]]]:
+    """Fetch edges for the roots and, if transitive, everything reachable from them.
+
+    One pass per level: only cards not fetched before are queried, so
+    cycles end the walk.
+    """
+    edges: Dict[str, List[Tuple[str, str, str]]] = {}
+    conn = sqlite3.connect(str(db_path))
+    try:
+        frontier = card_ids
+        depth = 0
+        while frontier:
+            edges.update(_fetch_edges(conn, frontier, include_tokens))
+            depth += 1
+            if not transitive or (max_depth is not None and depth >= max_depth):
+                break
+            frontier = list(
+                dict.fromkeys(
+                    related
+                    for card_id in frontier
+                    for related, component, _name in edges[card_id]
+                    if component in TRANSITIVE_COMPONENTS and related not in edges
+                )
+            )
+    finally:
+        conn.close()
+    return edges
+
+
 def resolve_all_parts(
-    card_ids: List[str], db_path: Path, include_tokens: bool = False
+    card_ids: List[str],
+    db_path: Path,
+    include_tokens: bool = False,
+    transitive: bool = False,
+    max_depth: Optional[int] = None,
 ) -> Dict[str, List[Dict]]:
     """
-    Resolve all related cards from all_parts field.
+    Resolve all related cards from the card_relationships table.
+
+    Ids are resolved a level at a time with chunked temp-table joins, so a
+    list of any size costs a handful of queries rather than one per card.
 
     Args:
         card_ids: List of card IDs to resolve
         db_path: Path to database
         include_tokens: Whether to include token components
+        transitive: Also follow meld and token relationships of related cards
+            (e.g. a token that makes another token); cycles are skipped
+        max_depth: Limit on transitive hops (None = until nothing new is found)
 
     Returns:
-        Dict mapping card_id -> list of related card dicts
+        Dict mapping card_id -> list of related card dicts. Each dict has
+        id, name, component, uri, depth (1 = direct) and via (the card whose
+        all_parts listed it).
     """
     if not db_path.exists():
         return {}
 
-    conn = sqlite3.connect(str(db_path))
-    cursor = conn.cursor()
+    roots = list(dict.fromkeys(str(card_id) for card_id in card_ids if card_id))
+    edges = _collect_edges(roots, db_path, include_tokens, transitive, max_depth)
 
     relationships = {}
-
-    for card_id in card_ids:
-        # Get the card's all_parts field
-        cursor.execute("SELECT all_parts FROM prints WHERE id = ?", (card_id,))
-        result = cursor.fetchone()
-
-        if not result or not result[0]:
-            continue
-
-        try:
-            all_parts = json.loads(result[0])
-        except json.JSONDecodeError:
-            continue
-
-        if not isinstance(all_parts, list):
-            continue
-
-        related_cards = []
-
-        for part in all_parts:
-            if not isinstance(part, dict):
-                continue
-
-            component = part.get("component", "")
-            part_id = part.get("id")
-            part_name = part.get("name", "")
-
-            # Skip tokens unless explicitly requested
-            if component == "token" and not include_tokens:
-                continue
-
-            # Skip the card itself
-            if part_id == card_id:
-                continue
-
-            related_cards.append(
-                {
-                    "id": part_id,
-                    "name": part_name,
-                    "component": component,
-                    "uri": part.get("uri", ""),
-                }
+    for root in roots:
+        related_cards = [
+            _related_card(related, component, name, 1, root)
+            for related, component, name in edges.get(root, ())
+        ]
+        if transitive:
+            # Breadth-first over the fetched edges; `seen` breaks cycles
+            seen = {root} | {rel["id"] for rel in related_cards}
+            queue = deque(
+                (rel["id"], 1) for rel in related_cards if rel["component"] in TRANSITIVE_COMPONENTS
             )
-
+            while queue:
+                card_id, card_depth = queue.popleft()
+                if max_depth is not None and card_depth >= max_depth:
+                    continue
+                for related, component, name in edges.get(card_id, ()):
+                    if related in seen or component not in TRANSITIVE_COMPONENTS:
+                        continue
+                    seen.add(related)
+                    related_cards.append(
+                        _related_card(related, component, name, card_depth + 1, card_id)
+                    )
+                    queue.append((related, card_depth + 1))
         if related_cards:
-            relationships[card_id] = related_cards
+            relationships[root] = related_cards
 
-    conn.close()
     return relationships
 
 
@@ -106,6 +195,8 @@ def expand_card_list_with_relationships(
     """
     Expand a list of card IDs to include all related cards.
 
+    Meld results and tokens made by tokens are followed transitively.
+
     Args:
         card_ids: Initial list of card IDs
         db_path: Path to database
@@ -116,13 +207,21 @@ def expand_card_list_with_relationships(
         Set of all card IDs (original + related)
     """
     expanded = set(card_ids)
-    relationships = resolve_all_parts(card_ids, db_path, include_tokens)
-
-    for card_id, related in relationships.items():
-        for rel in related:
-            expanded.add(rel["id"])
+    if not db_path.exists():
+        return expanded
+
+    roots = list(dict.fromkeys(str(card_id) for card_id in card_ids if card_id))
+    # Everything fetched is reachable from some root; no per-root walk needed
+    edges = _collect_edges(roots, db_path, include_tokens, True, None)
+    root_ids = set(roots)
+    for card_id, related in edges.items():
+        expanded.update(
+            rel_id
+            for rel_id, component, _name in related
+            if card_id in root_ids or component in TRANSITIVE_COMPONENTS
+        )
 
-    if verbose and relationships:
+    if verbose and len(expanded) > len(card_ids):
         print(
             f"Expanded from {len(card_ids)} to {len(expanded)} cards (+{len(expanded) - len(card_ids)})"
         )
@@ -1,11 +1,20 @@
 #!/usr/bin/env python3
 """Enhanced Scryfall API client with retry-after logic and polite rate limiting."""
 
+import os
+import sys
 import time
 import requests
 from typing import Optional, Dict, Any
 from urllib.parse import urlencode
 
+# Add src directory to path for imports
+SCRIPT_DIR = os.path.dirname(os.path.abspath(__file__))
+sys.path.insert(0, os.path.join(os.path.dirname(SCRIPT_DIR), "src"))
+
+from net.http_cache import HttpCache, cached_get  # noqa: E402
+from net.ratelimit import HostRateLimiter, get_rate_limiter, retry_after_seconds  # noqa: E402
+
 
 class ScryfallClient:
     """
@@ -13,7 +22,8 @@ class ScryfallClient:
 
     Features:
     - Respects Retry-After headers
-    - Automatic rate limiting (100ms between requests)
+    - Conditional requests against the local HTTP cache
+    - Rate limiting shared with every other proxy-machine process
     - Exponential backoff for errors
     - User-agent compliance
     """
@@ -23,19 +33,24 @@ def __init__(
         user_agent: str = "ProxyMachine/1.0 (patrick)",
         base_delay: float = 0.11,  # Scryfall recommends 50-100ms
         max_retries: int = 3,
+        limiter: Optional[HostRateLimiter] = None,
+        cache: Optional[HttpCache] = None,
     ):
         """
         Initialize the Scryfall client.
 
         Args:
             user_agent: User-Agent string for API requests
-            base_delay: Minimum delay between requests in seconds
+            base_delay: Base delay for exponential backoff on errors, in seconds
             max_retries: Maximum number of retry attempts
+            limiter: Per-host rate limiter (defaults to the shared one)
+            cache: HTTP cache (defaults to the shared one)
         """
         self.user_agent = user_agent
         self.base_delay = base_delay
         self.max_retries = max_retries
-        self.last_request_time = 0
+        self.limiter = limiter or get_rate_limiter()
+        self.cache = cache
         self.api_base = "https://api.scryfall.com"
 
         # Track statistics
@@ -46,13 +61,6 @@ def __init__(
             "errors": 0,
         }
 
-    def _wait_for_rate_limit(self) -> None:
-        """Ensure we respect the rate limit between requests."""
-        elapsed = time.time() - self.last_request_time
-        if elapsed < self.base_delay:
-            time.sleep(self.base_delay - elapsed)
-        self.last_request_time = time.time()
-
     def get(
         self,
         path: str,
@@ -73,8 +81,6 @@ def get(
         Raises:
             requests.HTTPError: If the request fails after all retries
         """
-        self._wait_for_rate_limit()
-
         # Build URL
         if path.startswith("http"):
             url = path
@@ -87,19 +93,26 @@ def get(
 
         try:
             self.stats["requests"] += 1
-            response = requests.get(url, headers=headers, timeout=30)
+            # The limiter backs off on 429 for every process sharing it; retries stay here
+            response = cached_get(
+                url,
+                cache=self.cache,
+                headers=headers,
+                limiter=self.limiter,
+                max_retries=0,
+                timeout=30,
+            )
 
             # Check for rate limiting (429 Too Many Requests)
             if response.status_code == 429:
                 self.stats["rate_limited"] += 1
-                retry_after = int(response.headers.get("Retry-After", 1))
+                retry_after = retry_after_seconds(response.headers.get("Retry-After"))
 
                 if retry_count < self.max_retries:
                     print(
-                        f"\n⏳ Scryfall is busy, waiting {retry_after}s before retry "
+                        f"\n⏳ Scryfall is busy, waiting {retry_after or 1:g}s before retry "
                         f"(attempt {retry_count + 1}/{self.max_retries})..."
                     )
-                    time.sleep(retry_after)
                     self.stats["retries"] += 1
                     return self.get(path, params, retry_count + 1)
                 else: